@@ -0,0 +1,182 @@
+"""Benchmark of the FFT-based homogenization stress divergence criterion.
+
+This module compares the broadcast implementation of the convergence criterion
+based on the divergence of the stress tensor
+(FFTBasicScheme._stress_div_conv_criterion) with the reference loop over the
+discrete frequencies, both in terms of the discrete error and of the
+computational time, for 2D and 3D regular grids. The broadcast implementation
+operates on the stress DFT half spectrum (real-to-complex FFT). It can be
+executed with the command:
+
+| python3 run_fft_conv_criterion_benchmark.py
+
+Note that this module works even if CRATE Python package 'cratepy' is not
+installed from the Python Package Index (e.g., with pip). However, note that
+CRATE third-party package dependencies (e.g., 'numpy') must be installed and
+accessible to the Python interpreter.
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Standard
+import sys
+import pathlib
+import time
+import itertools as it
+# Third-party
+import numpy as np
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+# Add project root directory to sys.path
+root_dir = str(pathlib.Path(__file__).parents[1]) + '/src'
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+import cratepy.tensor.tensoroperations as top
+import cratepy.tensor.matrixoperations as mop
+from cratepy.clustering.solution.ffthombasicscheme import FFTBasicScheme
+# =============================================================================
+#
+# =============================================================================
+def reference_stress_div_conv_criterion(n_dim, comp_order, n_voxels_dims,
+                                        freqs_dims, stress_DFT_vox):
+    """Reference stress divergence criterion (loop over frequencies).
+
+    Parameters
+    ----------
+    n_dim : int
+        Problem number of spatial dimensions.
+    comp_order : list[str]
+        Strain/Stress components (str) order.
+    n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid.
+    freqs_dims : list[numpy.ndarray (1d)]
+        List of discrete frequencies (numpy.ndarray (1d)) associated to
+        each spatial dimension.
+    stress_DFT_vox : dict
+        Discrete Fourier Transform of local stress response (item,
+        numpy.ndarray of shape equal to RVE regular grid discretization)
+        for each stress component (key, str).
+
+    Returns
+    -------
+    discrete_error : float
+        Discrete error associated to the convergence criterion.
+    """
+    # Compute total number of voxels
+    n_voxels = np.prod(n_voxels_dims)
+    # Initialize discrete error sum
+    error_sum = 0.0
+    # Initialize stress DFT at the zero-frequency
+    stress_DFT_0_mf = np.zeros(len(comp_order), dtype=complex)
+    # Loop over discrete frequencies
+    for freq_coord in it.product(*freqs_dims):
+        # Get discrete frequency index
+        freq_idx = tuple([list(freqs_dims[x]).index(freq_coord[x])
+                          for x in range(n_dim)])
+        # Build stress tensor DFT matricial form
+        stress_DFT_mf = np.zeros(len(comp_order), dtype=complex)
+        for i in range(len(comp_order)):
+            stress_DFT_mf[i] = mop.kelvin_factor(i, comp_order) \
+                * stress_DFT_vox[comp_order[i]][freq_idx]
+            if freq_idx == n_dim*(0,):
+                stress_DFT_0_mf[i] = stress_DFT_mf[i]
+        # Build stress tensor DFT
+        stress_DFT = mop.get_tensor_from_mf(stress_DFT_mf, n_dim, comp_order)
+        # Add discrete frequency contribution to discrete error sum
+        error_sum = error_sum + np.linalg.norm(
+            top.dot12_1(1j*np.asarray(freq_coord), stress_DFT))**2
+    # Compute discrete error
+    discrete_error = \
+        np.sqrt(error_sum/n_voxels)/np.linalg.norm(stress_DFT_0_mf)
+    # Return
+    return discrete_error
+# =============================================================================
+def run_benchmark(strain_formulation, problem_type, n_voxels_dims,
+                  is_reference=True):
+    """Run stress divergence criterion benchmark for a given regular grid.
+
+    Parameters
+    ----------
+    strain_formulation: {'infinitesimal', 'finite'}
+        Problem strain formulation.
+    problem_type : int
+        Problem type: 2D plane strain (1), 2D plane stress (2),
+        2D axisymmetric (3) and 3D (4).
+    n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid.
+    is_reference : bool, default=True
+        If True, then the reference loop over the discrete frequencies is
+        also evaluated.
+    """
+    # Get problem type parameters
+    n_dim, comp_order_sym, comp_order_nsym = \
+        mop.get_problem_type_parameters(problem_type)
+    if strain_formulation == 'infinitesimal':
+        comp_order = comp_order_sym
+    else:
+        comp_order = comp_order_nsym
+    # Set RVE dimensions and regular grid
+    rve_dims = n_dim*[1.0, ]
+    regular_grid = np.ones(n_voxels_dims, dtype=int)
+    # Set FFT-based homogenization basic scheme
+    homogenization_method = FFTBasicScheme(
+        strain_formulation, problem_type, rve_dims, n_voxels_dims,
+        regular_grid, ['1', ], {'1': {'E': 100.0, 'v': 0.3}})
+    # Set discrete frequencies (rad/m) for each dimension
+    freqs_dims = [2*np.pi*np.fft.fftfreq(n_voxels_dims[i],
+                                         rve_dims[i]/n_voxels_dims[i])
+                  for i in range(n_dim)]
+    # Set random local stress response
+    rng = np.random.default_rng(seed=0)
+    stress_field = 1.0 + rng.random((len(comp_order), *n_voxels_dims))
+    # Compute local stress response DFT (half spectrum)
+    stress_DFT_field = np.fft.rfftn(stress_field,
+                                    axes=tuple(range(1, n_dim + 1)))
+    # Compute local stress response DFT (full spectrum)
+    stress_DFT_vox = {comp: np.fft.fftn(stress_field[k])
+                      for k, comp in enumerate(comp_order)}
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Evaluate broadcast stress divergence criterion
+    init_time = time.time()
+    discrete_error = homogenization_method._stress_div_conv_criterion(
+        freqs_dims, stress_DFT_field)
+    bcast_time = time.time() - init_time
+    # Evaluate reference stress divergence criterion
+    if is_reference:
+        init_time = time.time()
+        ref_discrete_error = reference_stress_div_conv_criterion(
+            n_dim, comp_order, n_voxels_dims, freqs_dims, stress_DFT_vox)
+        ref_time = time.time() - init_time
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Display benchmark results
+    grid = 'x'.join([str(n) for n in n_voxels_dims])
+    if is_reference:
+        print('{:<14s}{:>14s}{:>12.4e}{:>12.4e}{:>12.2e}{:>10.1f}'.format(
+            strain_formulation, grid, ref_time, bcast_time,
+            abs(discrete_error - ref_discrete_error)/ref_discrete_error,
+            ref_time/bcast_time))
+    else:
+        print('{:<14s}{:>14s}{:>12s}{:>12.4e}{:>12s}{:>10s}'.format(
+            strain_formulation, grid, '-', bcast_time, '-', '-'))
+# =============================================================================
+if __name__ == '__main__':
+    # Display benchmark header
+    print('{:<14s}{:>14s}{:>12s}{:>12s}{:>12s}{:>10s}'.format(
+        'Formulation', 'Grid', 'Loop (s)', 'Bcast (s)', 'Rel. diff.',
+        'Speedup'))
+    # Run benchmarks (2D and 3D regular grids)
+    for strain_formulation in ('infinitesimal', 'finite'):
+        for n_voxels_dims in ([64, 64], [63, 65], [256, 256]):
+            run_benchmark(strain_formulation, 1, n_voxels_dims)
+        for n_voxels_dims in ([16, 16, 16], [15, 16, 17], [32, 32, 32]):
+            run_benchmark(strain_formulation, 4, n_voxels_dims)
+        run_benchmark(strain_formulation, 4, [128, 128, 128],
+                      is_reference=False)
@@ -3,10 +3,15 @@
 #                                                                       Modules
 # =============================================================================
 from clustering import citoperations
+from clustering import citparallel
 from clustering import clusteringalgs
+from clustering import clusteringcache
 from clustering import clusteringdata
+from clustering import clusteringgraph
 from clustering import clusteringphase
 from clustering import crve
+from clustering import greenoperator
 from clustering import rveelasticdatabase
+from clustering import rvedatabasecache
 from clustering import adaptivity
 from clustering import solution
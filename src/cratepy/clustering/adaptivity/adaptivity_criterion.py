@@ -536,6 +536,8 @@ class SpatialDiscontinuities(AdaptivityCriterion):
     _swipe_dimension(self, adapt_data_matrix, voxels_clusters, \
                      target_clusters, target_clusters_data, dim_loops)
         Evaluate spatial discontinuities along a given dimension.
+    _get_phase_clusters_idxs(labels, sorted_clusters, sort_idxs)
+        *staticmethod*: Get material phase clusters indexes of cluster labels.
     _update_swipe_dims_init_idx(self)
         Randomly update the dimensions swipe frequency initial index.
     """
@@ -777,6 +779,12 @@ class SpatialDiscontinuities(AdaptivityCriterion):
         dimensions j and k). During this process, both the list of target
         clusters and the dictionary containing associated data are updated.
 
+        The cluster labels of all the swiped voxels and associated next voxels
+        along dimension i are compared at once (shifted regular grid), such
+        that only the first voxels pair associated with each ordered pair of
+        clusters that satisfies the adaptivity trigger condition is evaluated
+        sequentially.
+
         ----
 
         Parameters
@@ -801,55 +809,19 @@ class SpatialDiscontinuities(AdaptivityCriterion):
             Ordered specification of dimension cycles, being the spatial
             discontinuities evaluated along dimension `dim_loops[0]`.
         """
-        # Get material phase clusters
-        phase_clusters = adapt_data_matrix[:, 0]
         # Get number of voxels in each dimension
         n_voxels_dims = [voxels_clusters.shape[i] for i in
                          range(len(voxels_clusters.shape))]
-        # Set numbers of voxels associated with dimension cycles
+        # Set cycling dimensions map (ordered as i, j [, k])
         if len(n_voxels_dims) == 2:
             if dim_loops not in ('12', '21'):
                 raise RuntimeError('Invalid dimension cycles code.')
-            else:
-                # Set cycling dimensions map (ordered as i, j)
-                cycle_spatial_map = [int(dim_loops[0]) - 1,
-                                     int(dim_loops[1]) - 1]
-                # Set cycling dimensions numbers of voxels
-                n_voxels_i = n_voxels_dims[0]
-                n_voxels_j = n_voxels_dims[1]
-                n_voxels_k = 1
         elif len(n_voxels_dims) == 3:
             if dim_loops not in ('123', '132', '213', '231', '312', '321'):
                 raise RuntimeError('Invalid dimension cycles code.')
-            else:
-                # Set cycling dimensions map (ordered as i, j, k)
-                cycle_spatial_map = [int(dim_loops[0]) - 1,
-                                     int(dim_loops[1]) - 1,
-                                     int(dim_loops[2]) - 1]
-                # Set cycling dimensions numbers of voxels
-                n_voxels_i = n_voxels_dims[0]
-                n_voxels_j = n_voxels_dims[1]
-                n_voxels_k = n_voxels_dims[2]
         else:
             raise RuntimeError('Invalid number of dimensions.')
-        # Set spatial dimensions map (ordered as 1, 2 [, 3])
-        spatial_cycle_map = [cycle_spatial_map.index(i)
-                             for i in range(len(n_voxels_dims))]
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Set cycling dimensions swipe frequencies
-        swipe_dim_i_every = self._swipe_dims_every[cycle_spatial_map[0]]
-        swipe_dim_j_every = self._swipe_dims_every[cycle_spatial_map[1]]
-        if len(cycle_spatial_map) == 3:
-            swipe_dim_k_every = self._swipe_dims_every[cycle_spatial_map[2]]
-        else:
-            swipe_dim_k_every = 1
-        # Set cycling dimensions swipe frequency initial index
-        swipe_dim_i_init = self._swipe_dims_init_idx[cycle_spatial_map[0]]
-        swipe_dim_j_init = self._swipe_dims_init_idx[cycle_spatial_map[1]]
-        if len(cycle_spatial_map) == 3:
-            swipe_dim_k_init = self._swipe_dims_init_idx[2]
-        else:
-            swipe_dim_k_init = 0
+        cycle_spatial_map = [int(dim) - 1 for dim in dim_loops]
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Get minimum and maximum value of adaptivity feature
         min_feature_val = min(adapt_data_matrix[:, 1])
@@ -861,197 +833,209 @@ class SpatialDiscontinuities(AdaptivityCriterion):
         if abs(norm_factor) < 1e-10:
             return
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Loop over voxels of dimension k
-        for voxel_k in range(n_voxels_k):
-            # Proceed according swiping frequency of dimension k. First and
-            # last voxels are always considered
-            if voxel_k == 0 or voxel_k == n_voxels_k - 1:
-                pass
-            elif (voxel_k - swipe_dim_k_init) % swipe_dim_k_every != 0:
+        # Get material phase clusters labels and adaptivity feature values
+        phase_clusters = adapt_data_matrix[:, 0].astype(int)
+        phase_values = adapt_data_matrix[:, 1]
+        # Get number of material phase clusters
+        n_phase_clusters = len(phase_clusters)
+        # Get material phase clusters sorting indexes (first occurrence of
+        # each cluster label is kept)
+        sort_idxs = np.argsort(phase_clusters, kind='stable')
+        sorted_clusters = phase_clusters[sort_idxs]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get clusters adaptive level
+        phase_adapt_levels = np.array(
+            [self._clusters_adapt_level[str(cluster)]
+             for cluster in phase_clusters], dtype=int)
+        # Evaluate clusters adaptive level
+        is_phase_targetable = phase_adapt_levels < self._adapt_max_level
+        # Evaluate clusters number of voxels (per-cluster voxel count table)
+        if self._adapt_min_voxels > 1:
+            voxels_idxs, is_voxels_phase = self._get_phase_clusters_idxs(
+                voxels_clusters.ravel(), sorted_clusters, sort_idxs)
+            phase_n_voxels = np.bincount(voxels_idxs[is_voxels_phase],
+                                         minlength=n_phase_clusters)
+            is_phase_targetable &= phase_n_voxels > self._adapt_min_voxels
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set regular grid of voxels ordered according with dimension cycles
+        # (ordered as [k, ] j, i)
+        cycle_voxels_clusters = \
+            np.transpose(voxels_clusters, cycle_spatial_map[::-1])
+        # Set regular grid of voxels cluster labels of next voxel (i+1) along
+        # dimension i. If voxel (i) is the last one, then the next voxel (i+1)
+        # is the first one
+        cycle_voxels_clusters_next = np.roll(cycle_voxels_clusters, -1,
+                                             axis=-1)
+        # Set swiped voxels of each cycling dimension (ordered as [k, ] j, i)
+        # according to the associated swiping frequency. First and last
+        # voxels are always considered
+        swiped_voxels = []
+        for dim in cycle_spatial_map[::-1]:
+            # Get dimension number of voxels
+            n_voxels = n_voxels_dims[dim]
+            # Get dimension swiped voxels
+            voxels = np.arange(n_voxels)
+            is_swiped = (voxels - self._swipe_dims_init_idx[dim]) \
+                % self._swipe_dims_every[dim] == 0
+            is_swiped[[0, n_voxels - 1]] = True
+            swiped_voxels.append(voxels[is_swiped])
+        # Get cluster labels of swiped voxels (i) and next voxels (i+1),
+        # ordered as the dimension cycles
+        clusters = cycle_voxels_clusters[np.ix_(*swiped_voxels)].ravel()
+        clusters_next = \
+            cycle_voxels_clusters_next[np.ix_(*swiped_voxels)].ravel()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get material phase clusters indexes
+        idxs, is_phase = self._get_phase_clusters_idxs(
+            clusters, sorted_clusters, sort_idxs)
+        idxs_next, is_phase_next = self._get_phase_clusters_idxs(
+            clusters_next, sorted_clusters, sort_idxs)
+        # Skip voxels pairs if at least one of the clusters does not belong to
+        # the adaptive material phase associated with the criterion instance
+        # or if voxels belong to the same cluster
+        is_pair = is_phase & is_phase_next & (clusters != clusters_next)
+        # Skip voxels pairs if both clusters are untargetable
+        is_pair &= is_phase_targetable[idxs] | is_phase_targetable[idxs_next]
+        # Compute normalized spatial discontinuity along dimension i
+        ratios = np.abs(phase_values[idxs_next] - phase_values[idxs]) \
+            / norm_factor
+        # Skip voxels pairs if normalized spatial discontinuity is lower than
+        # prescribed threshold
+        is_pair &= ratios >= self._adapt_trigger_ratio
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get voxels pairs
+        pairs = np.flatnonzero(is_pair)
+        # Get first and last voxels pairs associated with each ordered pair of
+        # clusters. The target clusters only depend on the first voxels pair
+        # of each ordered pair of clusters, while the maximum magnitude of a
+        # target cluster depends on the ordered pairs of clusters evaluated
+        # after the cluster is targeted
+        if len(pairs) > 0:
+            clusters_pairs = np.stack((idxs[pairs], idxs_next[pairs]), axis=1)
+            _, first_idxs = np.unique(clusters_pairs, axis=0,
+                                      return_index=True)
+            _, last_idxs = np.unique(clusters_pairs[::-1], axis=0,
+                                     return_index=True)
+            first_pairs = pairs[first_idxs]
+            last_pairs = pairs[len(pairs) - 1 - last_idxs]
+            # Sort ordered pairs of clusters according to first voxels pair
+            sort_pairs = np.argsort(first_pairs)
+            first_pairs = first_pairs[sort_pairs]
+            last_pairs = last_pairs[sort_pairs]
+        else:
+            first_pairs = pairs
+            last_pairs = pairs
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize voxels pair where each cluster is targeted (previously
+        # targeted clusters are assigned before the first voxels pair)
+        targeted_pairs = {cluster: -1 for cluster in target_clusters}
+        # Loop over ordered pairs of clusters (update target clusters list)
+        for pair in first_pairs:
+            # Get clusters labels
+            cluster = int(clusters[pair])
+            cluster_next = int(clusters_next[pair])
+            # Get clusters feature values
+            value = phase_values[idxs[pair]]
+            value_next = phase_values[idxs_next[pair]]
+            # Compute normalized spatial discontinuity magnitude
+            magnitude = abs(ratios[pair] - self._adapt_trigger_ratio)
+            # Get clusters targetable condition
+            is_cluster_targetable = is_phase_targetable[idxs[pair]]
+            is_cluster_next_targetable = is_phase_targetable[idxs_next[pair]]
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Evaluate if clusters have already been targeted
+            is_cluster_targeted = cluster in targeted_pairs
+            is_cluster_next_targeted = cluster_next in targeted_pairs
+            # Skip computations if both clusters have already been targeted
+            if is_cluster_targeted and is_cluster_next_targeted:
                 continue
-            # Loop over voxels of dimension j
-            for voxel_j in range(n_voxels_j):
-                # Proceed according swiping frequency of dimension j. First and
-                # last voxels are always considered
-                if voxel_j == 0 or voxel_j == n_voxels_j - 1:
-                    pass
-                elif (voxel_j - swipe_dim_j_init) % swipe_dim_j_every != 0:
-                    continue
-                # Loop over voxels of dimension i (evaluation of spatial
-                # discontinuities)
-                for voxel_i in range(n_voxels_i):
-                    # Proceed according swiping frequency of dimension i. First
-                    # and last voxels are always considered
-                    if voxel_i == 0 or voxel_i == n_voxels_i - 1:
-                        pass
-                    elif (voxel_i - swipe_dim_i_init) % swipe_dim_i_every != 0:
-                        continue
-                    # Get voxel (i) ordered spatial indexes
-                    idxs = [(voxel_i, voxel_j, voxel_k)[i]
-                            for i in spatial_cycle_map]
-                    # Get cluster label of voxel (i)
-                    cluster = voxels_clusters[tuple(idxs)]
-                    # Get next voxel (i+1) ordered spatial indexes. If voxel
-                    # (i) is the last one, then the next voxel (i+1) is the
-                    # first one
-                    if voxel_i == n_voxels_i - 1:
-                        idxs[cycle_spatial_map[0]] = 0
-                    else:
-                        idxs[cycle_spatial_map[0]] += 1
-                    # Get cluster labels of next voxel (i+1)
-                    cluster_next = voxels_clusters[tuple(idxs)]
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Skip computations if at least one of the clusters does
-                    # not belong to the adaptive material phase associated with
-                    # the criterion instance
-                    if cluster not in phase_clusters \
-                            or cluster_next not in phase_clusters:
-                        continue
-                    # Skip computations if voxels belong to the same cluster
-                    if cluster == cluster_next:
-                        continue
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Get clusters number of voxels
-                    if self._adapt_min_voxels > 1:
-                        n_cluster_voxels = \
-                            np.count_nonzero(voxels_clusters == cluster)
-                        n_cluster_next_voxels = \
-                            np.count_nonzero(voxels_clusters == cluster_next)
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Evaluate clusters adaptive level
-                    is_cond_1 = self._clusters_adapt_level[str(cluster)] \
-                        < self._adapt_max_level
-                    is_cond_next_1 = \
-                        self._clusters_adapt_level[str(cluster_next)] \
-                        < self._adapt_max_level
-                    # Evaluate clusters number of voxels
-                    if self._adapt_min_voxels > 1:
-                        is_cond_2 = n_cluster_voxels > self._adapt_min_voxels
-                        is_cond_next_2 = n_cluster_next_voxels \
-                            > self._adapt_min_voxels
-                    else:
-                        is_cond_2 = True
-                        is_cond_next_2 = True
-                    # Evaluate target conditions
-                    is_cluster_targetable = is_cond_1 and is_cond_2
-                    is_cluster_next_targetable = is_cond_next_1 \
-                        and is_cond_next_2
-                    # Skip computations if both clusters are untargetable
-                    if not is_cluster_targetable \
-                            and not is_cluster_next_targetable:
-                        continue
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Get cluster index and feature value
-                    cluster_idx = list(adapt_data_matrix[:, 0]).index(cluster)
-                    value = adapt_data_matrix[cluster_idx, 1]
-                    # Get cluster of next voxel and feature value
-                    cluster_next_idx = list(
-                        adapt_data_matrix[:, 0]).index(cluster_next)
-                    value_next = adapt_data_matrix[cluster_next_idx, 1]
-                    # Compute normalized spatial discontinuity along
-                    # dimension i
-                    ratio = abs(value_next - value)/norm_factor
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Skip computations if normalized spatial discontinuity is
-                    # lower than prescribed threshold. Otherwise, compute
-                    # associated magnitude
-                    if ratio < self._adapt_trigger_ratio:
-                        continue
-                    else:
-                        magnitude = abs(ratio - self._adapt_trigger_ratio)
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Evaluate if clusters have already been targeted
-                    is_cluster_targeted = cluster in target_clusters
-                    is_cluster_next_targeted = cluster_next in target_clusters
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Update previously targeted clusters data
-                    if is_cluster_targeted:
-                        max_magn = \
-                            target_clusters_data[str(cluster)]['max_magnitude']
-                        if value >= value_next:
-                            if magnitude > max_magn:
-                                target_clusters_data[str(cluster)][
-                                    'max_magnitude'] = magnitude
-                        else:
-                            if self._magnitude_lower_factor*magnitude \
-                                    > max_magn:
-                                target_clusters_data[str(cluster)][
-                                    'max_magnitude'] = \
-                                    self._magnitude_lower_factor*magnitude
-                    if is_cluster_next_targeted:
-                        max_magn = target_clusters_data[str(cluster_next)][
-                            'max_magnitude']
-                        if value_next > value:
-                            if magnitude > max_magn:
-                                target_clusters_data[str(cluster_next)][
-                                    'max_magnitude'] = magnitude
-                        else:
-                            if self._magnitude_lower_factor*magnitude \
-                                    > max_magn:
-                                target_clusters_data[str(cluster_next)][
-                                    'max_magnitude'] = \
-                                    self._magnitude_lower_factor*magnitude
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Update target clusters list and associated data
-                    if not (is_cluster_targeted and is_cluster_next_targeted):
-                        # Evaluate clusters adaptive level
-                        cluster_adapt_level = \
-                            self._clusters_adapt_level[str(cluster)]
-                        cluster_next_adapt_level = \
-                            self._clusters_adapt_level[str(cluster_next)]
-                        # Compute differences of clusters adaptive level
-                        diff_1 = cluster_next_adapt_level - cluster_adapt_level
-                        diff_2 = cluster_adapt_level - cluster_next_adapt_level
-                        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                        # Update target clusters list according to associated
-                        # adaptive and update data of new targeted clusters
-                        if diff_1 > self._adapt_level_max_diff:
-                            if not is_cluster_targeted \
-                                    and is_cluster_targetable:
-                                target_clusters.append(cluster)
-                                target_clusters_data[str(cluster)] = {}
-                                if value > value_next:
-                                    target_clusters_data[str(cluster)][
-                                        'max_magnitude'] = magnitude
-                                else:
-                                    target_clusters_data[str(cluster)][
-                                        'max_magnitude'] = \
-                                        self._magnitude_lower_factor*magnitude
-                        elif diff_2 > self._adapt_level_max_diff:
-                            if not is_cluster_next_targeted \
-                                    and is_cluster_next_targetable:
-                                target_clusters.append(cluster_next)
-                                target_clusters_data[str(cluster_next)] = {}
-                                if value_next > value:
-                                    target_clusters_data[str(cluster_next)][
-                                        'max_magnitude'] = magnitude
-                                else:
-                                    target_clusters_data[str(cluster_next)][
-                                        'max_magnitude'] = \
-                                        self._magnitude_lower_factor*magnitude
-                        else:
-                            if not is_cluster_targeted \
-                                    and is_cluster_targetable:
-                                target_clusters.append(cluster)
-                                target_clusters_data[str(cluster)] = {}
-                                if value > value_next:
-                                    target_clusters_data[str(cluster)][
-                                        'max_magnitude'] = magnitude
-                                else:
-                                    target_clusters_data[str(cluster)][
-                                        'max_magnitude'] = \
-                                        self._magnitude_lower_factor*magnitude
-                            if not is_cluster_next_targeted \
-                                    and is_cluster_next_targetable:
-                                target_clusters.append(cluster_next)
-                                target_clusters_data[str(cluster_next)] = {}
-                                if value_next > value:
-                                    target_clusters_data[str(cluster_next)][
-                                        'max_magnitude'] = magnitude
-                                else:
-                                    target_clusters_data[str(cluster_next)][
-                                        'max_magnitude'] = \
-                                        self._magnitude_lower_factor*magnitude
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Evaluate clusters adaptive level
+            cluster_adapt_level = self._clusters_adapt_level[str(cluster)]
+            cluster_next_adapt_level = \
+                self._clusters_adapt_level[str(cluster_next)]
+            # Compute differences of clusters adaptive level
+            diff_1 = cluster_next_adapt_level - cluster_adapt_level
+            diff_2 = cluster_adapt_level - cluster_next_adapt_level
+            # Set clusters to be targeted according to associated adaptive
+            # level
+            if diff_1 > self._adapt_level_max_diff:
+                is_target_cluster = True
+                is_target_cluster_next = False
+            elif diff_2 > self._adapt_level_max_diff:
+                is_target_cluster = False
+                is_target_cluster_next = True
+            else:
+                is_target_cluster = True
+                is_target_cluster_next = True
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Update target clusters list and data of new targeted clusters
+            if is_target_cluster and not is_cluster_targeted \
+                    and is_cluster_targetable:
+                target_clusters.append(cluster)
+                targeted_pairs[cluster] = pair
+                target_clusters_data[str(cluster)] = {}
+                if value > value_next:
+                    target_clusters_data[str(cluster)]['max_magnitude'] = \
+                        magnitude
+                else:
+                    target_clusters_data[str(cluster)]['max_magnitude'] = \
+                        self._magnitude_lower_factor*magnitude
+            if is_target_cluster_next and not is_cluster_next_targeted \
+                    and is_cluster_next_targetable:
+                target_clusters.append(cluster_next)
+                targeted_pairs[cluster_next] = pair
+                target_clusters_data[str(cluster_next)] = {}
+                if value_next > value:
+                    target_clusters_data[str(cluster_next)][
+                        'max_magnitude'] = magnitude
+                else:
+                    target_clusters_data[str(cluster_next)][
+                        'max_magnitude'] = \
+                        self._magnitude_lower_factor*magnitude
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Loop over ordered pairs of clusters (update target clusters data)
+        for pair, last_pair in zip(first_pairs, last_pairs):
+            # Get clusters labels
+            cluster = int(clusters[pair])
+            cluster_next = int(clusters_next[pair])
+            # Get clusters feature values
+            value = phase_values[idxs[pair]]
+            value_next = phase_values[idxs_next[pair]]
+            # Compute normalized spatial discontinuity magnitude
+            magnitude = abs(ratios[pair] - self._adapt_trigger_ratio)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Evaluate if clusters have been targeted before the last voxels
+            # pair
+            is_cluster_targeted = \
+                targeted_pairs.get(cluster, last_pair) < last_pair
+            is_cluster_next_targeted = \
+                targeted_pairs.get(cluster_next, last_pair) < last_pair
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Update previously targeted clusters data
+            if is_cluster_targeted:
+                max_magn = target_clusters_data[str(cluster)]['max_magnitude']
+                if value >= value_next:
+                    if magnitude > max_magn:
+                        target_clusters_data[str(cluster)][
+                            'max_magnitude'] = magnitude
+                else:
+                    if self._magnitude_lower_factor*magnitude > max_magn:
+                        target_clusters_data[str(cluster)][
+                            'max_magnitude'] = \
+                            self._magnitude_lower_factor*magnitude
+            if is_cluster_next_targeted:
+                max_magn = \
+                    target_clusters_data[str(cluster_next)]['max_magnitude']
+                if value_next > value:
+                    if magnitude > max_magn:
+                        target_clusters_data[str(cluster_next)][
+                            'max_magnitude'] = magnitude
+                else:
+                    if self._magnitude_lower_factor*magnitude > max_magn:
+                        target_clusters_data[str(cluster_next)][
+                            'max_magnitude'] = \
+                            self._magnitude_lower_factor*magnitude
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Loop over target clusters
         for cluster in target_clusters:
@@ -1062,6 +1046,40 @@ class SpatialDiscontinuities(AdaptivityCriterion):
             target_clusters_data[str(cluster)]['is_dynamic_split_factor'] = \
                 True
     # -------------------------------------------------------------------------
+    @staticmethod
+    def _get_phase_clusters_idxs(labels, sorted_clusters, sort_idxs):
+        """Get material phase clusters indexes of cluster labels.
+
+        Parameters
+        ----------
+        labels : numpy.ndarray (1d)
+            Cluster labels (int).
+        sorted_clusters : numpy.ndarray (1d)
+            Material phase clusters labels (int) sorted in ascending order.
+        sort_idxs : numpy.ndarray (1d)
+            Indexes that sort the material phase clusters labels (stored
+            order).
+
+        Returns
+        -------
+        idxs : numpy.ndarray (1d)
+            Material phase cluster index (int) of each cluster label (stored
+            order). Set to 0 if the cluster does not belong to the material
+            phase.
+        is_phase : numpy.ndarray (1d)
+            True if the cluster belongs to the material phase, False
+            otherwise.
+        """
+        # Get sorted material phase clusters position of each cluster label
+        pos = np.searchsorted(sorted_clusters, labels)
+        pos[pos == len(sorted_clusters)] = 0
+        # Evaluate if cluster belongs to material phase
+        is_phase = sorted_clusters[pos] == labels
+        # Get material phase cluster index of each cluster label
+        idxs = np.where(is_phase, sort_idxs[pos], 0)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return idxs, is_phase
+    # -------------------------------------------------------------------------
     def _update_swipe_dims_init_idx(self):
         """Randomly update the dimensions swipe frequency initial index.
 
@@ -38,6 +38,7 @@ from material.materialoperations import compute_spatial_log_strain, \
                                         MaterialQuantitiesComputer
 from clustering.adaptivity.adaptivity_criterion import \
     AdaptiveClusterGrouping, SpatialDiscontinuities
+from clustering.clusteringgraph import ClusterAdjacencyGraph
 #
 #                                                          Authorship & Credits
 # =============================================================================
@@ -108,7 +109,7 @@ class AdaptivityManager:
         Check if material phase adaptivity procedures are activated.
     reset_adapt_activation_parameters(self)
         Reset parameters associated with clustering adaptivity activation.
-    get_adapt_vtk_array(self, voxels_clusters)
+    get_adapt_vtk_array(self, voxels_clusters, cluster_graph=None)
         Get regular grid array with the adaptive level of each cluster.
     """
     def __init__(self, strain_formulation, problem_type, adapt_material_phases,
@@ -1103,12 +1104,16 @@ class AdaptivityManager:
         self._adapt_feature_min_trigger = \
             {mat_phase: False for mat_phase in self._adapt_material_phases}
     # -------------------------------------------------------------------------
-    def get_adapt_vtk_array(self, voxels_clusters):
+    def get_adapt_vtk_array(self, voxels_clusters, cluster_graph=None):
         """Get regular grid array with the adaptive level of each cluster.
 
         A cluster adaptive level of 0 is associated with the base clustering
         and is increased by one whenever the cluster is refined.
 
+        The adaptive level of each cluster is only assembled over the cluster
+        bounding box provided by the cluster adjacency graph instead of the
+        whole regular grid of voxels.
+
         ----
 
         Parameters
@@ -1117,47 +1122,52 @@ class AdaptivityManager:
             Regular grid of voxels (spatial discretization of the RVE), where
             each entry contains the cluster label (int) assigned to the
             corresponding pixel/voxel.
+        cluster_graph : ClusterAdjacencyGraph, default=None
+            Cluster adjacency graph associated with voxels_clusters. If None,
+            then it is computed from voxels_clusters.
         """
-        # Initialize flattened regular grid array
-        rg_array = np.zeros(voxels_clusters.shape).flatten('F')
+        # Initialize regular grid array
+        rg_array = np.zeros(voxels_clusters.shape)
+        # Set cluster adjacency graph
+        if cluster_graph is None:
+            cluster_graph = ClusterAdjacencyGraph(voxels_clusters)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize clusters adaptive level
+        clusters_level = {}
         # Loop over adaptive material phases
         for mat_phase in self._adapt_material_phases:
             # Get adaptive material phase clustering adaptivity criterion
             adapt_criterion = self._adapt_phase_criterions[mat_phase]
-            # Assemble flattened regular grid array
+            # Get adaptive level of adaptive material phase clusters
             if isinstance(adapt_criterion, AdaptiveClusterGrouping):
                 # Get adaptive cluster groups and associated adaptive level
                 adapt_groups = adapt_criterion.get_adapt_groups()
                 groups_adapt_level = adapt_criterion.get_groups_adapt_level()
-                # Get adaptive material phase cluster groups
-                adapt_groups_ids = list(adapt_groups.keys())
                 # Loop over adaptive cluster groups
-                for group_id in adapt_groups_ids:
-                    # Get adaptive cluster group adaptive level
-                    adapt_level = groups_adapt_level[group_id]
-                    # Get adaptive cluster group clusters
-                    adapt_group = adapt_groups[group_id]
-                    # Get flat indexes associated with the adaptive cluster
-                    # group clusters
-                    flat_idxs = np.in1d(voxels_clusters.flatten('F'),
-                                        adapt_group)
-                    # Store adaptive cluster group adaptive level
-                    rg_array[flat_idxs] = adapt_level
+                for group_id in adapt_groups.keys():
+                    # Loop over adaptive cluster group clusters
+                    for cluster in adapt_groups[group_id]:
+                        clusters_level[int(cluster)] = \
+                            groups_adapt_level[group_id]
             elif isinstance(adapt_criterion, SpatialDiscontinuities):
                 # Get cluster adaptive level
                 clusters_adapt_level = \
                     adapt_criterion.get_clusters_adapt_level()
                 # Loop over clusters
                 for cluster in clusters_adapt_level.keys():
-                    # Get cluster flat indexes
-                    flat_idxs = np.in1d(voxels_clusters.flatten('F'),
-                                        int(cluster))
-                    # Store cluster adaptive level
-                    rg_array[flat_idxs] = clusters_adapt_level[str(cluster)]
+                    clusters_level[int(cluster)] = \
+                        clusters_adapt_level[str(cluster)]
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Build regular grid array
-        rg_array = rg_array.reshape(voxels_clusters.shape, order='F')
+        # Loop over clusters
+        for cluster, adapt_level in clusters_level.items():
+            # Skip unexistent cluster
+            if cluster_graph.get_cluster_n_voxels(cluster) == 0:
+                continue
+            # Get cluster bounding box slices
+            slices = cluster_graph.get_cluster_slices(cluster)
+            # Store cluster adaptive level
+            rg_array[slices][voxels_clusters[slices] == cluster] = \
+                adapt_level
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Return
         return rg_array
@@ -2,8 +2,9 @@
 
 This module includes several procedures required to compute the cluster
 interaction tensors, namely (1) the frequency discretization of the spatial
-domain and (2) the computation of the Green operator, as well as the assembly
-of the global cluster interaction matrix.
+domain, (2) the computation of the Green operator and (3) the discrete
+convolutions and integrals of the clusters characteristic functions, as well
+as the assembly of the global cluster interaction matrix.
 
 Functions
 ---------
@@ -11,6 +12,16 @@ set_discrete_freqs
     Perform frequency discretization of the spatial domain.
 gop_material_independent_terms
     Compute Green operator material independent terms in frequency domain.
+gop_half_spectrum_stack
+    Stack Green operator material independent terms in half spectrum.
+clusters_filter_rdft
+    Compute clusters discrete characteristic functions DFT (batched).
+gop_convolution
+    Convolution of cluster characteristic function and Green operator.
+discrete_cit_integral
+    Discrete integral over the spatial domain of all material clusters.
+compute_cit_integrals
+    Compute cluster interaction tensors discrete integrals (clusters J).
 assemble_cit
     Assemble global cluster interaction matrix.
 """
@@ -22,7 +33,7 @@ import copy
 import itertools as it
 # Third-party
 import numpy as np
-import numpy.matlib
+import scipy.fft
 # Local
 import tensor.matrixoperations as mop
 #
@@ -307,22 +318,406 @@ def gop_material_independent_terms(strain_formulation, problem_type, rve_dims,
             if var4[j]:
                 first_term = np.add(first_term, var2[var5[j]])
         first_term = np.divide(first_term, np.square(var3),
+                               out=np.zeros_like(first_term),
                                where=abs(var3) > 1e-10)
         gop_1_dft_vox[comp] = copy.copy(first_term)
         # Compute second material independent term of Green operator
         gop_2_dft_vox[comp] = -1.0*np.divide(
             var2[''.join([str(x) for x in fo_idx])],
-            np.square(np.square(var3)), where=abs(var3) > 1e-10)
+            np.square(np.square(var3)), out=np.zeros_like(var3),
+            where=abs(var3) > 1e-10)
         # Compute Green operator zero-frequency term
         gop_0_freq_dft_vox[comp][tuple(n_dim*(0,))] = 1.0
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     return gop_1_dft_vox, gop_2_dft_vox, gop_0_freq_dft_vox
+# =============================================================================
+def gop_half_spectrum_stack(comp_order, n_voxels_dims, gop_1_dft_vox,
+                            gop_2_dft_vox, gop_0_freq_dft_vox):
+    """Stack Green operator material independent terms in half spectrum.
+
+    The Green operator material independent terms are stacked in a single
+    contiguous array suitable to perform batched real-to-complex discrete
+    Fourier transforms (see `scipy.fft.irfftn`). Given that the cluster
+    characteristic functions are real, only the Hermitian part of each Green
+    operator component contributes to the real part of the associated discrete
+    convolution,
+
+    .. math::
+
+       \\mathrm{Re} \\left[ \\mathscr{F}^{-1} \\left( \\breve{\\chi}
+       \\, \\breve{\\Phi} \\right) \\right] = \\mathscr{F}^{-1} \\left(
+       \\breve{\\chi} \\, \\dfrac{1}{2} \\left( \\breve{\\Phi}(
+       \\boldsymbol{\\zeta}) + \\overline{\\breve{\\Phi}(
+       -\\boldsymbol{\\zeta})} \\right) \\right) \\, ,
+
+    such that the Hermitian part is stored and truncated to the
+    non-negative frequencies of the last dimension (half spectrum).
+
+    ----
+
+    Parameters
+    ----------
+    comp_order : list[str]
+        Strain/Stress components order associated to matricial form.
+    n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid (spatial
+        discretization of the RVE).
+    gop_1_dft_vox : dict
+        Regular grid shaped matrix (item, numpy.ndarray) containing each
+        fourth-order matricial form component (key, str) of the first Green
+        operator material independent term in the frequency domain (discrete
+        Fourier transform).
+    gop_2_dft_vox : dict
+        Regular grid shaped matrix (item, numpy.ndarray) containing each
+        fourth-order matricial form component (key, str) of the second Green
+        operator material independent term in the frequency domain (discrete
+        Fourier transform).
+    gop_0_freq_dft_vox : dict
+        Regular grid shaped matrix (item, numpy.ndarray) containing each
+        fourth-order matricial form component (key, str) of the Green operator
+        zero-frequency (material independent) term in the frequency domain
+        (discrete Fourier transform).
+
+    Returns
+    -------
+    gop_X_rdft_vox : numpy.ndarray
+        Green operator material independent terms in the frequency domain
+        (half spectrum) stored in a numpy.ndarray of shape
+        (3, n_comps, n_comps, n_voxels_1, ..., n_voxels_d//2 + 1). The first
+        index is associated with the first, second and zero-frequency terms,
+        respectively.
+    """
+    # Set half spectrum dimensions
+    rdft_dims = tuple(n_voxels_dims[:-1]) + (n_voxels_dims[-1]//2 + 1,)
+    # Set symmetric frequencies indexes
+    sym_idxs = np.ix_(*[(-np.arange(n)) % n for n in n_voxels_dims])
+    # Set half spectrum indexes
+    half_idxs = (Ellipsis, slice(0, rdft_dims[-1]))
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Initialize stacked Green operator material independent terms
+    gop_X_rdft_vox = np.zeros((3, len(comp_order), len(comp_order),
+                               *rdft_dims))
+    # Loop over Green operator material independent terms
+    for k, gop_dft_vox in enumerate((gop_1_dft_vox, gop_2_dft_vox,
+                                     gop_0_freq_dft_vox)):
+        # Loop over Green operator components
+        for i, compi in enumerate(comp_order):
+            for j, compj in enumerate(comp_order):
+                # Get Green operator component
+                gop_comp = gop_dft_vox[compi + compj]
+                # Store Green operator component Hermitian part (half
+                # spectrum)
+                gop_X_rdft_vox[k, i, j] = \
+                    0.5*(gop_comp + gop_comp[sym_idxs])[half_idxs]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return gop_X_rdft_vox
+#
+#                        Cluster interaction tensors convolutions and integrals
+# =============================================================================
+def clusters_filter_rdft(voxels_segments, segments, n_voxels_dims,
+                         dtype=np.float64, fft_workers=None):
+    """Compute clusters discrete characteristic functions DFT (batched).
+
+    .. math::
+
+       \\chi^{(I)} (\\boldsymbol{Y}) = \\begin{cases} 1 \\quad \\text{if}
+       \\; \\; \\; \\boldsymbol{Y}\\in \\Omega^{(I)}_{\\mu, \\, 0} \\\\ 0
+       \\quad \\text{otherwise} \\end{cases}
+
+    where :math:`\\chi^{(I)}` is the characteristic function of the :math:`I`
+    th material cluster and :math:`\\boldsymbol{Y}` is a point of the
+    microscale reference configuration (:math:`\\Omega_{\\mu,\\,0}`).
+
+    The detailed description of the cluster characteristic function can
+    be found in Section 4.3.1 of Ferreira (2022) [#]_.
+
+    .. [#] Ferreira, B.P. (2022). *Towards Data-driven Multi-scale
+           Optimization of Thermoplastic Blends: Microstructural
+           Generation, Constitutive Development and Clustering-based
+           Reduced-Order Modeling.* PhD Thesis, University of Porto
+           (see `here <https://repositorio-aberto.up.pt/handle/10216/
+           146900?locale=en>`_)
+
+    The clusters discrete characteristic functions are stacked and
+    transformed to the frequency domain through a single batched
+    real-to-complex discrete Fourier transform (half spectrum).
+
+    ----
+
+    Parameters
+    ----------
+    voxels_segments : numpy.ndarray (1d)
+        Segment index (cluster) associated with each voxel (flattened regular
+        grid).
+    segments : list[int]
+        Segments indexes (clusters).
+    n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid (spatial
+        discretization of the RVE).
+    dtype : numpy.dtype, default=numpy.float64
+        Clusters discrete characteristic functions floating-point data type.
+    fft_workers : int, default=None
+        Maximum number of workers used to perform the batched discrete
+        Fourier transform (see scipy.fft).
+
+    Returns
+    -------
+    clusters_filter_rdft : numpy.ndarray
+        Clusters discrete characteristic functions in the frequency domain
+        (half spectrum) stored in a numpy.ndarray of shape
+        (n_clusters, n_voxels_1, ..., n_voxels_d//2 + 1).
+    """
+    # Build stacked clusters filters (spatial domain)
+    clusters_filter = np.equal.outer(
+        np.asarray(segments), voxels_segments).astype(dtype).reshape(
+            len(segments), *n_voxels_dims)
+    # Perform batched real-to-complex Discrete Fourier Transform (DFT) by
+    # means of Fast Fourier Transform (FFT)
+    clusters_filter_rdft = scipy.fft.rfftn(
+        clusters_filter, axes=tuple(range(1, len(n_voxels_dims) + 1)),
+        overwrite_x=True, workers=fft_workers)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return clusters_filter_rdft
+# =============================================================================
+def gop_convolution(gop_terms, cluster_filter_rdft, n_voxels_dims,
+                    terms_idxs=None, fft_workers=None):
+    """Convolution of cluster characteristic function and Green operator.
+
+    .. math::
+
+       \\int_{\\Omega_{\\mu, \\, 0}} \\chi^{(J)} (\\boldsymbol{Y}') \\,
+       \\boldsymbol{\\mathsf{\\Phi}}^{0} (\\boldsymbol{Y} -
+       \\boldsymbol{Y}') \\, \\mathrm{d} v' = \\mathscr{F}^{-1} \\left(
+       \\breve{\\chi}^{(J)}(\\boldsymbol{\\zeta}) \\,
+       \\breve{\\boldsymbol{\\mathsf{\\Phi}}}^{0} (\\boldsymbol{\\zeta})
+       \\right) \\, ,
+
+    where :math:`\\chi^{(J)}` is the characteristic function of the
+    :math:`J` th material cluster,
+    :math:`\\boldsymbol{\\mathsf{\\Phi}}^{0}` is the reference material
+    Green operator (fourth-order tensor), :math:`\\boldsymbol{Y}` and
+    :math:`\\boldsymbol{Y'}` are points of the microscale reference
+    configuration (:math:`\\Omega_{\\mu,\\,0}`), and
+    :math:`\\boldsymbol{\\zeta}` is the frequency wave vector. The operator
+    :math:`\\mathscr{F}^{-1}(\\cdot)` denotes the inverse Fourier transform
+    and :math:`\\breve{(\\cdot)}` denotes a field defined in the frequency
+    domain.
+
+    Such a computation is required to compute the cluster interaction
+    tensors. More information can be found in Ferreira (2022) [#]_
+    (see Equations (4.111) and surrounding text).
+
+    .. [#] Ferreira, B.P. (2022). *Towards Data-driven Multi-scale
+           Optimization of Thermoplastic Blends: Microstructural
+           Generation, Constitutive Development and Clustering-based
+           Reduced-Order Modeling.* PhD Thesis, University of Porto
+           (see `here <https://repositorio-aberto.up.pt/handle/10216/
+           146900?locale=en>`_)
+
+    Given that each Green operator material independent term component is
+    a linear combination of the Green operator unique terms (see
+    :py:class:`clustering.greenoperator.CompactGreenOperator`), only the
+    convolutions associated with the unique terms are performed, through
+    a single batched complex-to-real inverse discrete Fourier transform.
+    In order to bound the memory footprint, the convolutions can be
+    restricted to a chunk of unique terms.
+
+    ----
+
+    Parameters
+    ----------
+    gop_terms : CompactGreenOperator
+        Compact Green operator material independent terms (half spectrum).
+    cluster_filter_rdft : numpy.ndarray
+        Cluster discrete characteristic function in frequency domain
+        (half spectrum discrete Fourier transform).
+    n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid (spatial
+        discretization of the RVE).
+    terms_idxs : range, default=None
+        Indexes of the Green operator unique terms. If None, then all the
+        unique terms are considered.
+    fft_workers : int, default=None
+        Maximum number of workers used to perform the batched inverse
+        discrete Fourier transform (see scipy.fft).
+
+    Returns
+    -------
+    gop_X_filt_vox : numpy.ndarray
+        Convolution between the material cluster characteristic function
+        and each Green operator unique term in the spatial domain (inverse
+        discrete Fourier transform), stored in a numpy.ndarray of shape
+        (n_terms, n_voxels_1, ..., n_voxels_d).
+    """
+    # Set Green operator unique terms
+    if terms_idxs is None:
+        terms_idxs = range(gop_terms.get_n_unique_terms())
+    # Initialize discrete convolution in the frequency domain
+    gop_X_filt_rdft_vox = np.empty(
+        (len(terms_idxs), *cluster_filter_rdft.shape),
+        dtype=cluster_filter_rdft.dtype)
+    # Perform discrete convolution in the frequency domain (unique terms
+    # are computed on the fly if not stored)
+    for i, k in enumerate(terms_idxs):
+        np.multiply(gop_terms.get_unique_term(k), cluster_filter_rdft,
+                    out=gop_X_filt_rdft_vox[i])
+    # Perform batched Inverse Discrete Fourier Transform (IDFT) by means of
+    # Fast Fourier Transform (FFT)
+    gop_X_filt_vox = scipy.fft.irfftn(
+        gop_X_filt_rdft_vox, s=n_voxels_dims,
+        axes=tuple(range(1, len(n_voxels_dims) + 1)), overwrite_x=True,
+        workers=fft_workers)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return gop_X_filt_vox
+# =============================================================================
+def discrete_cit_integral(gop_X_filt_vox, voxels_segments, n_segments):
+    """Discrete integral over the spatial domain of all material clusters.
+
+    .. math::
+
+       \\int_{\\Omega_{\\mu, 0}} \\chi^{(I)}(\\boldsymbol{Y}) \\left(
+       \\int_{\\Omega_{\\mu, 0}}  \\, \\chi^{(J)}(\\boldsymbol{Y}) \\,
+       \\boldsymbol{\\Phi}^{0}(\\boldsymbol{Y}-\\boldsymbol{Y}') \\,
+       \\mathrm{d}v' \\right) \\mathrm{d}v \\, ,
+
+    where :math:`\\chi^{(I)}` is the characteristic function of the
+    :math:`I` th material cluster,
+    :math:`\\boldsymbol{\\mathsf{\\Phi}}^{0}` is the reference material
+    Green operator (fourth-order tensor), and :math:`\\boldsymbol{Y}` and
+    :math:`\\boldsymbol{Y'}` are points of the microscale reference
+    configuration (:math:`\\Omega_{\\mu,\\,0}`).
+
+    Such a computation is required to compute the cluster interaction
+    tensors. More information can be found in Ferreira (2022) [#]_
+    (see Equations (4.112) and surrounding text).
+
+    .. [#] Ferreira, B.P. (2022). *Towards Data-driven Multi-scale
+           Optimization of Thermoplastic Blends: Microstructural
+           Generation, Constitutive Development and Clustering-based
+           Reduced-Order Modeling.* PhD Thesis, University of Porto
+           (see `here <https://repositorio-aberto.up.pt/handle/10216/
+           146900?locale=en>`_)
+
+    ----
+
+    Parameters
+    ----------
+    gop_X_filt_vox : numpy.ndarray
+        Convolution between the material cluster characteristic function
+        and each Green operator unique term in the spatial domain (inverse
+        discrete Fourier transform), stored in a numpy.ndarray of shape
+        (n_terms, n_voxels_1, ..., n_voxels_d).
+    voxels_segments : numpy.ndarray (1d)
+        Segment index of the cluster associated with each voxel (flattened
+        regular grid).
+    n_segments : int
+        Number of segments (clusters).
+
+    Returns
+    -------
+    cit_X_integral_mf : numpy.ndarray (2d)
+        Discrete integral over the spatial domain of each material cluster
+        I of the discrete convolution between the material cluster J
+        characteristic function and each Green operator unique term in the
+        spatial domain (numpy.ndarray of shape (n_segments, n_terms)).
+        Clusters are sorted according with the segment index.
+    """
+    # Get flattened spatial fields
+    gop_X_filt_flat = gop_X_filt_vox.reshape(-1, voxels_segments.size)
+    # Initialize discrete integral
+    cit_X_integral_mf = np.zeros((gop_X_filt_flat.shape[0], n_segments))
+    # Perform discrete integral over the spatial domain of all material
+    # clusters I (segment-sum over all voxels)
+    for k, field in enumerate(gop_X_filt_flat):
+        cit_X_integral_mf[k, :] = np.bincount(
+            voxels_segments, weights=field, minlength=n_segments)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return cit_X_integral_mf.T
+# =============================================================================
+def compute_cit_integrals(gop_terms, voxels_segments, n_voxels_dims,
+                          segments_J, n_segments, n_chunk=None,
+                          fft_workers=None):
+    """Compute cluster interaction tensors discrete integrals (clusters J).
+
+    For each cluster J, the discrete convolutions between the cluster J
+    characteristic function and each Green operator unique term are
+    integrated over the spatial domain of all clusters I. The clusters J
+    characteristic functions are transformed in batches and the discrete
+    convolutions are performed in chunks of unique terms, both of size
+    `n_chunk`. The cluster interaction tensors associated with each cluster J
+    (global cluster interaction matrices columns) follow from the linear
+    combination of the discrete integrals (see
+    :py:class:`clustering.greenoperator.CompactGreenOperator`).
+
+    Parameters
+    ----------
+    gop_terms : CompactGreenOperator
+        Compact Green operator material independent terms (half spectrum).
+    voxels_segments : numpy.ndarray (1d)
+        Segment index (cluster) associated with each voxel (flattened regular
+        grid).
+    n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid (spatial
+        discretization of the RVE).
+    segments_J : list[int]
+        Segments indexes of clusters J.
+    n_segments : int
+        Number of segments (clusters).
+    n_chunk : int, default=None
+        Batch size of clusters J characteristic functions and chunk size of
+        Green operator unique terms. If None, then the number of Green operator
+        unique terms is adopted.
+    fft_workers : int, default=None
+        Maximum number of workers used to perform the batched discrete
+        Fourier transforms (see scipy.fft).
+
+    Returns
+    -------
+    cit_X_integrals_mf : numpy.ndarray (3d)
+        Discrete integrals over the spatial domain of each cluster I of the
+        discrete convolution between each cluster J characteristic function
+        and each Green operator unique term, stored in a numpy.ndarray of
+        shape (n_clusters_J, n_segments, n_unique_terms).
+    """
+    # Get number of Green operator unique terms
+    n_terms = gop_terms.get_n_unique_terms()
+    # Set batch and chunk size
+    if n_chunk is None:
+        n_chunk = n_terms
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Initialize discrete integrals
+    cit_X_integrals_mf = np.zeros((len(segments_J), n_segments, n_terms))
+    # Loop over clusters J
+    for k in range(len(segments_J)):
+        # Set clusters characteristic functions in the frequency domain
+        # (batched discrete Fourier transform)
+        if k % n_chunk == 0:
+            batch_filter_rdft = clusters_filter_rdft(
+                voxels_segments, segments_J[k:k + n_chunk], n_voxels_dims,
+                dtype=gop_terms.get_dtype(), fft_workers=fft_workers)
+        # Get cluster J characteristic function
+        cluster_J_filter_rdft = batch_filter_rdft[k % n_chunk]
+        # Loop over chunks of Green operator unique terms
+        for i_init in range(0, n_terms, n_chunk):
+            terms_idxs = range(i_init, min(i_init + n_chunk, n_terms))
+            # Perform discrete convolution between the cluster J
+            # characteristic function and each of Green operator unique terms
+            gop_X_filt_vox = gop_convolution(
+                gop_terms, cluster_J_filter_rdft, n_voxels_dims,
+                terms_idxs=terms_idxs, fft_workers=fft_workers)
+            # Perform discrete integral over the spatial domain of all
+            # clusters
+            cit_X_integrals_mf[k, :, i_init:terms_idxs.stop] = \
+                discrete_cit_integral(gop_X_filt_vox, voxels_segments,
+                                      n_segments)
+            # Release discrete convolution before the next chunk
+            del gop_X_filt_vox
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return cit_X_integrals_mf
 #
 #                                    Global cluster interaction matrix assembly
 # =============================================================================
-def assemble_cit(strain_formulation, problem_type, mat_prop_ref,
-                 material_phases, phase_n_clusters, phase_clusters, cit_1_mf,
-                 cit_2_mf, cit_0_freq_mf):
+def assemble_cit(strain_formulation, mat_prop_ref, cit_x_mf):
     """Assemble global cluster interaction matrix.
 
     Update the cluster interaction tensors by taking into account the material
@@ -382,37 +777,13 @@ def assemble_cit(strain_formulation, problem_type, mat_prop_ref,
     ----------
     strain_formulation: {'infinitesimal', 'finite'}
         Problem strain formulation.
-    problem_type : int
-        Problem type: 2D plane strain (1), 2D plane stress (2),
-        2D axisymmetric (3) and 3D (4).
     mat_prop_ref : dict
         Reference material properties.
-    material_phases : list[str]
-        RVE material phases labels (str).
-    phase_n_clusters : dict
-        Number of clusters (item, int) prescribed for each material phase
-        (key, str).
-    phase_clusters : dict
-        Clusters labels (item, list[int]) associated to each material phase
-        (key, str).
-    cit_1_mf : dict
-        Cluster interaction tensors associated with the first Green operator
-        material independent term. Each tensor is stored in a dictionary
-        (item, dict) for each pair of material phases (key, str), which in turn
-        contains the corresponding matricial form (item, numpy.ndarray)
-        associated to each pair of clusters (key, str).
-    cit_2_mf : dict
-        Cluster interaction tensors associated with the second Green operator
-        material independent term. Each tensor is stored in a dictionary
-        (item, dict) for each pair of material phases (key, str), which in turn
-        contains the corresponding matricial form (item, numpy.ndarray)
-        associated to each pair of clusters (key, str).
-    cit_0_freq_mf : dict
-        Cluster interaction tensors associated with the zero-frequency Green
-        operator (material independent) term. Each tensor is stored in a
-        dictionary (item, dict) for each pair of material phases (key, str),
-        which in turn contains the corresponding matricial form
-        (item, numpy.ndarray) associated to each pair of clusters (key, str).
+    cit_x_mf : numpy.ndarray (3d)
+        Global cluster interaction matrices associated with the Green operator
+        material independent terms (first, second and zero-frequency terms),
+        stored in a numpy.ndarray of shape
+        (3, n_total_clusters*n_comps, n_total_clusters*n_comps).
 
     Returns
     -------
@@ -421,22 +792,6 @@ def assemble_cit(strain_formulation, problem_type, mat_prop_ref,
         according to the order of material_phases (1st) and phase_clusters
         (2nd).
     """
-    # Get problem type parameters
-    _, comp_order_sym, comp_order_nsym = \
-        mop.get_problem_type_parameters(problem_type)
-    # Set strain/stress components order according to problem strain
-    # formulation
-    if strain_formulation == 'infinitesimal':
-        comp_order = comp_order_sym
-    elif strain_formulation == 'finite':
-        comp_order = comp_order_nsym
-    else:
-        raise RuntimeError('Unknown problem strain formulation.')
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Get total number of clusters
-    n_total_clusters = sum([phase_n_clusters[mat_phase]
-                            for mat_phase in material_phases])
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # Get reference material Young modulus and Poisson ratio
     E_ref = mat_prop_ref['E']
     v_ref = mat_prop_ref['v']
@@ -447,55 +802,17 @@ def assemble_cit(strain_formulation, problem_type, mat_prop_ref,
     if strain_formulation == 'infinitesimal':
         gop_factor_1 = 1.0/(4.0*miu_ref)
         gop_factor_2 = (lam_ref + miu_ref)/(miu_ref*(lam_ref + 2.0*miu_ref))
-    else:
+    elif strain_formulation == 'finite':
         gop_factor_1 = 1.0/(2.0*miu_ref)
         gop_factor_2 = lam_ref/(2.0*miu_ref*(lam_ref + 2.0*miu_ref))
-    gop_factor_0_freq = numpy.matlib.repmat(
-        np.zeros((len(comp_order), len(comp_order))), n_total_clusters,
-        n_total_clusters)
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Initialize global clustering interaction matrices
-    dims = (n_total_clusters*len(comp_order), n_total_clusters*len(comp_order))
-    global_cit_1_mf = np.zeros(dims)
-    global_cit_2_mf = np.zeros(dims)
-    global_cit_0_freq_mf = np.zeros(dims)
-    # Initialize column cluster index
-    jclst = 0
-    # Loop over material phases
-    for mat_phase_B in material_phases:
-        # Loop over material phase B clusters
-        for cluster_J in phase_clusters[mat_phase_B]:
-            # Initialize row cluster index
-            iclst = 0
-            # Loop over material phases
-            for mat_phase_A in material_phases:
-                # Set material phase pair
-                mat_phase_pair = mat_phase_A + '_' + mat_phase_B
-                # Loop over material phase A clusters
-                for cluster_I in phase_clusters[mat_phase_A]:
-                    # Set cluster pair
-                    cluster_pair = str(cluster_I) + '_' + str(cluster_J)
-                    # Set assembling ranges
-                    i_init = iclst*len(comp_order)
-                    i_end = i_init + len(comp_order)
-                    j_init = jclst*len(comp_order)
-                    j_end = j_init + len(comp_order)
-                    # Assemble cluster interaction tensors
-                    global_cit_1_mf[i_init:i_end, j_init:j_end] = \
-                        cit_1_mf[mat_phase_pair][cluster_pair]
-                    global_cit_2_mf[i_init:i_end, j_init:j_end] = \
-                        cit_2_mf[mat_phase_pair][cluster_pair]
-                    global_cit_0_freq_mf[i_init:i_end, j_init:j_end] = \
-                        cit_0_freq_mf[mat_phase_pair][cluster_pair]
-                    # Increment row cluster index
-                    iclst = iclst + 1
-            # Increment column cluster index
-            jclst = jclst + 1
+    else:
+        raise RuntimeError('Unknown problem strain formulation.')
+    gop_factor_0_freq = 0.0
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Assemble global cluster interaction matrix
-    global_cit_mf = np.add(
-        np.add(np.multiply(gop_factor_1, global_cit_1_mf),
-               np.multiply(gop_factor_2, global_cit_2_mf)),
-        np.multiply(gop_factor_0_freq, global_cit_0_freq_mf))
+    # Assemble global cluster interaction matrix (linear combination of the
+    # global cluster interaction matrices)
+    global_cit_mf = np.tensordot(
+        np.array([gop_factor_1, gop_factor_2, gop_factor_0_freq]), cit_x_mf,
+        axes=1)
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     return global_cit_mf
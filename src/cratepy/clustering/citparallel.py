@@ -0,0 +1,272 @@
+"""Parallel computation of cluster interaction tensors.
+
+This module includes the process pool that computes the cluster interaction
+tensors discrete integrals associated with different clusters J (global
+cluster interaction matrices columns) in parallel. Given that the computations
+associated with each cluster J are independent, each worker process receives
+a set of clusters J and performs the associated discrete convolutions and
+integrals (see :py:func:`clustering.citoperations.compute_cit_integrals`).
+The voxels clusters labels (segments) and the stored Green operator unique
+terms are placed in shared memory blocks, such that they are accessed by all
+the worker processes without being copied.
+
+Classes
+-------
+CITProcessPool
+    Process pool to compute cluster interaction tensors discrete integrals.
+
+Functions
+---------
+_init_cit_worker
+    Initialize cluster interaction tensors worker process.
+_compute_cit_integrals_worker
+    Compute cluster interaction tensors discrete integrals (worker process).
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Standard
+import concurrent.futures
+import multiprocessing.shared_memory
+# Third-party
+import numpy as np
+# Local
+import clustering.citoperations as citop
+from clustering.greenoperator import CompactGreenOperator
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+# Worker process data (set when the worker process is initialized)
+_worker_data = {}
+# =============================================================================
+class CITProcessPool:
+    """Process pool to compute cluster interaction tensors discrete integrals.
+
+    The voxels clusters labels (segments) and, if stored in memory, the Green
+    operator unique terms are copied once to shared memory blocks, which are
+    attached by each worker process when it is initialized. If the Green
+    operator unique terms are not stored in memory (out-of-core storage or
+    computed on the fly), then each worker process computes them on the fly.
+    The shared memory blocks are released when the process pool is shut down.
+
+    Attributes
+    ----------
+    _n_workers : int
+        Number of worker processes.
+    _shared_blocks : list[multiprocessing.shared_memory.SharedMemory]
+        Shared memory blocks.
+    _executor : concurrent.futures.ProcessPoolExecutor
+        Pool of worker processes.
+
+    Methods
+    -------
+    get_n_workers(self)
+        Get number of worker processes.
+    submit(self, segments_J)
+        Submit cluster interaction tensors discrete integrals computation.
+    shutdown(self)
+        Shut down process pool and release shared memory blocks.
+    _share_array(self, array)
+        Copy array to shared memory block.
+    """
+    def __init__(self, n_workers, gop_terms, gop_parameters, voxels_segments,
+                 n_voxels_dims, n_segments, n_chunk=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        n_workers : int
+            Number of worker processes.
+        gop_terms : CompactGreenOperator
+            Compact Green operator material independent terms (half
+            spectrum).
+        gop_parameters : dict
+            Compact Green operator constructor parameters (key, str), namely
+            the problem strain formulation ('strain_formulation'), the problem
+            type ('problem_type'), the RVE size in each dimension
+            ('rve_dims'), the number of voxels in each dimension
+            ('n_voxels_dims') and the floating-point precision
+            ('precision').
+        voxels_segments : numpy.ndarray (1d)
+            Segment index (cluster) associated with each voxel (flattened
+            regular grid).
+        n_voxels_dims : list[int]
+            Number of voxels in each dimension of the regular grid (spatial
+            discretization of the RVE).
+        n_segments : int
+            Number of segments (clusters).
+        n_chunk : int, default=None
+            Batch size of clusters J characteristic functions and chunk size
+            of Green operator unique terms. If None, then the number of Green
+            operator unique terms is adopted.
+        """
+        self._n_workers = n_workers
+        self._shared_blocks = []
+        # Copy voxels segments to shared memory
+        segments_block = self._share_array(voxels_segments)
+        # Copy Green operator unique terms to shared memory (only if stored in
+        # memory)
+        if gop_terms.get_memory_footprint() > 0:
+            terms_block = self._share_array(gop_terms.get_unique_terms())
+        else:
+            terms_block = None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set pool of worker processes
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_cit_worker,
+            initargs=(gop_parameters, terms_block, segments_block,
+                      list(n_voxels_dims), n_segments, n_chunk))
+    # -------------------------------------------------------------------------
+    def __enter__(self):
+        """Enter process pool runtime context."""
+        return self
+    # -------------------------------------------------------------------------
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit process pool runtime context."""
+        self.shutdown()
+        return False
+    # -------------------------------------------------------------------------
+    def get_n_workers(self):
+        """Get number of worker processes.
+
+        Returns
+        -------
+        n_workers : int
+            Number of worker processes.
+        """
+        return self._n_workers
+    # -------------------------------------------------------------------------
+    def submit(self, segments_J):
+        """Submit cluster interaction tensors discrete integrals computation.
+
+        Parameters
+        ----------
+        segments_J : list[int]
+            Segments indexes of clusters J.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future of the discrete integrals over the spatial domain of each
+            cluster I of the discrete convolution between each cluster J
+            characteristic function and each Green operator unique term,
+            stored in a numpy.ndarray of shape
+            (n_clusters_J, n_segments, n_unique_terms).
+        """
+        return self._executor.submit(_compute_cit_integrals_worker,
+                                     list(segments_J))
+    # -------------------------------------------------------------------------
+    def shutdown(self):
+        """Shut down process pool and release shared memory blocks."""
+        # Shut down pool of worker processes
+        self._executor.shutdown(wait=True)
+        # Release shared memory blocks
+        for shared_block in self._shared_blocks:
+            shared_block.close()
+            shared_block.unlink()
+        self._shared_blocks = []
+    # -------------------------------------------------------------------------
+    def _share_array(self, array):
+        """Copy array to shared memory block.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Array.
+
+        Returns
+        -------
+        block_spec : tuple
+            Shared memory block name (str), array shape (tuple[int]) and
+            array data type (str).
+        """
+        # Create shared memory block
+        shared_block = multiprocessing.shared_memory.SharedMemory(
+            create=True, size=max(array.nbytes, 1))
+        self._shared_blocks.append(shared_block)
+        # Copy array to shared memory block
+        shared_array = np.ndarray(array.shape, dtype=array.dtype,
+                                  buffer=shared_block.buf)
+        shared_array[...] = array
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return shared_block.name, array.shape, array.dtype.str
+# =============================================================================
+def _init_cit_worker(gop_parameters, terms_block, segments_block,
+                     n_voxels_dims, n_segments, n_chunk):
+    """Initialize cluster interaction tensors worker process.
+
+    Parameters
+    ----------
+    gop_parameters : dict
+        Compact Green operator constructor parameters (key, str).
+    terms_block : {tuple, None}
+        Shared memory block name (str), shape (tuple[int]) and data type (str)
+        of the Green operator unique terms. If None, then the unique terms are
+        computed on the fly.
+    segments_block : tuple
+        Shared memory block name (str), shape (tuple[int]) and data type (str)
+        of the voxels segments.
+    n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid (spatial
+        discretization of the RVE).
+    n_segments : int
+        Number of segments (clusters).
+    n_chunk : {int, None}
+        Batch size of clusters J characteristic functions and chunk size of
+        Green operator unique terms.
+    """
+    # Set compact Green operator (unique terms computed on the fly)
+    gop_terms = CompactGreenOperator(
+        gop_parameters['strain_formulation'], gop_parameters['problem_type'],
+        gop_parameters['rve_dims'], gop_parameters['n_voxels_dims'],
+        storage='on_the_fly', precision=gop_parameters['precision'])
+    # Initialize shared memory blocks
+    shared_blocks = []
+    # Attach Green operator unique terms (shared memory)
+    if terms_block is not None:
+        name, shape, dtype = terms_block
+        shared_blocks.append(
+            multiprocessing.shared_memory.SharedMemory(name=name))
+        gop_terms.attach_unique_terms(
+            np.ndarray(shape, dtype=dtype, buffer=shared_blocks[-1].buf))
+    # Attach voxels segments (shared memory)
+    name, shape, dtype = segments_block
+    shared_blocks.append(multiprocessing.shared_memory.SharedMemory(name=name))
+    voxels_segments = np.ndarray(shape, dtype=dtype,
+                                 buffer=shared_blocks[-1].buf)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Store worker process data (shared memory blocks are kept referenced
+    # during the worker process lifetime)
+    _worker_data['gop_terms'] = gop_terms
+    _worker_data['voxels_segments'] = voxels_segments
+    _worker_data['n_voxels_dims'] = n_voxels_dims
+    _worker_data['n_segments'] = n_segments
+    _worker_data['n_chunk'] = n_chunk
+    _worker_data['shared_blocks'] = shared_blocks
+# =============================================================================
+def _compute_cit_integrals_worker(segments_J):
+    """Compute cluster interaction tensors discrete integrals (worker process).
+
+    Parameters
+    ----------
+    segments_J : list[int]
+        Segments indexes of clusters J.
+
+    Returns
+    -------
+    cit_X_integrals_mf : numpy.ndarray (3d)
+        Discrete integrals over the spatial domain of each cluster I of the
+        discrete convolution between each cluster J characteristic function
+        and each Green operator unique term, stored in a numpy.ndarray of
+        shape (n_clusters_J, n_segments, n_unique_terms).
+    """
+    return citop.compute_cit_integrals(
+        _worker_data['gop_terms'], _worker_data['voxels_segments'],
+        _worker_data['n_voxels_dims'], segments_J,
+        _worker_data['n_segments'], n_chunk=_worker_data['n_chunk'])
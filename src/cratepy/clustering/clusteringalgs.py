@@ -20,6 +20,14 @@ MiniBatchKMeansSK
     Mini-Batch K-Means clustering algorithm (wrapper).
 AgglomerativeSP
     Agglomerative clustering algorithm (wrapper).
+SubsampledAgglomerativeSP
+    Sub-sampled agglomerative clustering algorithm (wrapper).
+StreamingMiniBatchKMeansSK
+    Streaming Mini-Batch K-Means clustering algorithm (wrapper).
+BisectingKMeansSK
+    Bisecting K-Means clustering algorithm (wrapper).
+HierarchicalTreeCut
+    Flat clustering from a given hierarchical agglomerative clustering tree.
 """
 #
 #                                                                       Modules
@@ -29,7 +37,9 @@ from abc import ABC, abstractmethod
 # Third-party
 import numpy as np
 import sklearn.cluster as skclst
+import sklearn.metrics
 import scipy.cluster.hierarchy as sciclst
+import threadpoolctl
 #
 #                                                          Authorship & Credits
 # =============================================================================
@@ -50,19 +60,85 @@ class ClusterAnalysis:
     available_clust_alg : dict
         Available clustering algorithms (item, str) and associated identifiers
         (key, str).
+    weighted_clustering_alg : tuple[str]
+        Identifiers (str) of the clustering algorithms that perform the
+        cluster analysis of weighted unique dataset items (full batch
+        clustering algorithms that accept dataset items weights).
+    _n_init : int
+        Number of times the K-Means based clustering algorithms are run with
+        different centroid seeds. If None, then the default number of each
+        clustering algorithm is adopted.
+    _n_threads : int
+        Maximum number of threads used by the clustering algorithms native
+        thread pools (e.g., OpenMP, BLAS). If None, then the number of threads
+        is not limited.
+    _quantization_tol : float
+        Quantization tolerance (relative to the range of each feature) to
+        collapse duplicated or near-duplicated dataset items into weighted
+        unique dataset items before performing the cluster analysis. If 0,
+        then only duplicated dataset items are collapsed. If None, then
+        dataset items are not collapsed.
+    _hierarchy_cache : ClusteringHierarchyCache
+        Persistent cache of hierarchical agglomerative clustering trees. If
+        None, then the hierarchical agglomerative clustering trees are not
+        cached.
 
     Methods
     -------
     get_fitted_estimator(self, data_matrix, clust_alg_id, n_clusters):
         Get cluster labels and clustering fitted estimator.
+    get_unique_data_matrix(data_matrix, quantization_tol=0.0)
+        Collapse duplicated or near-duplicated dataset items.
+    get_clustering_algorithm(self, clust_alg_id, n_clusters)
+        Get clustering algorithm.
+    get_resources_estimate(self, clust_alg_id, n_items, n_features, \
+                           n_clusters)
+        Get clustering algorithm memory and computational cost estimates.
     """
     available_clustering_alg = {'1': 'K-Means (scikit-learn)',
                                 '2': 'Mini-Batch K-Means (scikit-learn)',
-                                '3': 'Agglomerative (scipy)', }
+                                '3': 'Agglomerative (scipy)',
+                                '4': 'Sub-sampled Agglomerative (scipy)',
+                                '5': 'Streaming Mini-Batch K-Means '
+                                     '(scikit-learn)',
+                                '6': 'Elkan K-Means (scikit-learn)',
+                                '7': 'Bisecting K-Means (scikit-learn)', }
+    weighted_clustering_alg = ('1', '6', '7')
     # -------------------------------------------------------------------------
-    def __init__(self):
-        """Constructor."""
-        pass
+    def __init__(self, n_init=None, n_threads=None, quantization_tol=None,
+                 hierarchy_cache=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        n_init : int, default=None
+            Number of times the K-Means based clustering algorithms are run
+            with different centroid seeds. If None, then the default number of
+            each clustering algorithm is adopted.
+        n_threads : int, default=None
+            Maximum number of threads used by the clustering algorithms native
+            thread pools (e.g., OpenMP, BLAS). If None, then the number of
+            threads is not limited.
+        quantization_tol : float, default=None
+            Quantization tolerance (relative to the range of each feature) to
+            collapse duplicated or near-duplicated dataset items into weighted
+            unique dataset items before performing the cluster analysis (only
+            full batch K-Means based clustering algorithms). If 0, then only
+            duplicated dataset items are collapsed. If None, then dataset
+            items are not collapsed.
+        hierarchy_cache : ClusteringHierarchyCache, default=None
+            Persistent cache of hierarchical agglomerative clustering trees
+            (only hierarchical agglomerative clustering algorithms). If the
+            hierarchical tree associated with the data matrix and clustering
+            algorithm is cached, then the flat clustering is obtained from an
+            horizontal cut of the cached tree. Otherwise, the hierarchical
+            tree is computed and stored in the cache. If None, then the
+            hierarchical agglomerative clustering trees are not cached.
+        """
+        self._n_init = n_init
+        self._n_threads = n_threads
+        self._quantization_tol = quantization_tol
+        self._hierarchy_cache = hierarchy_cache
     # -------------------------------------------------------------------------
     def get_fitted_estimator(self, data_matrix, clust_alg_id, n_clusters):
         """Get cluster labels and clustering fitted estimator.
@@ -93,20 +169,102 @@ class ClusterAnalysis:
         cluster_labels = np.full(n_items, -1, dtype=int)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Instantiate clustering algorithm
-        if clust_alg_id == '1':
+        clust_alg = self.get_clustering_algorithm(clust_alg_id, n_clusters)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Load hierarchical agglomerative clustering tree from cache
+        is_store_tree = False
+        if self._hierarchy_cache is not None \
+                and isinstance(clust_alg, AgglomerativeAlgorithm):
+            # Get hierarchical tree content-addressed key
+            tree_key = self._hierarchy_cache.get_key(data_matrix,
+                                                     clust_alg_id)
+            # Load hierarchical tree
+            linkage_matrix, items_leaves = self._hierarchy_cache.load(tree_key)
+            # Set horizontal cut of cached hierarchical tree as clustering
+            # algorithm
+            if linkage_matrix is not None:
+                clust_alg = HierarchicalTreeCut(linkage_matrix,
+                                                items_leaves=items_leaves,
+                                                n_clusters=n_clusters)
+            else:
+                is_store_tree = True
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Perform cluster analysis (limiting the number of threads of the
+        # native thread pools)
+        with threadpoolctl.threadpool_limits(limits=self._n_threads):
+            # Collapse duplicated or near-duplicated dataset items into
+            # weighted unique dataset items
+            if self._quantization_tol is not None \
+                    and clust_alg_id in self.weighted_clustering_alg:
+                unique_data_matrix, sample_weight, items_unique = \
+                    self.get_unique_data_matrix(
+                        data_matrix, quantization_tol=self._quantization_tol)
+                # Skip collapse if there are less unique dataset items than
+                # clusters
+                if unique_data_matrix.shape[0] < n_clusters:
+                    items_unique = None
+            else:
+                items_unique = None
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            if items_unique is not None:
+                # Perform cluster analysis of weighted unique dataset items
+                unique_labels = clust_alg.perform_clustering(
+                    unique_data_matrix, sample_weight=sample_weight)
+                # Expand cluster labels to dataset items
+                cluster_labels = unique_labels[items_unique]
+            else:
+                cluster_labels = clust_alg.perform_clustering(data_matrix)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Store hierarchical agglomerative clustering tree in cache
+        if is_store_tree:
+            self._hierarchy_cache.store(tree_key,
+                                        clust_alg.get_linkage_matrix(),
+                                        clust_alg.get_items_leaves())
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Check if all the dataset items have been labeled
+        if np.any(cluster_labels == -1):
+            raise RuntimeError('At least one dataset item has not been '
+                               'labeled during the cluster analysis.')
+        # Check number of clusters formed
+        if len(set(cluster_labels)) != n_clusters:
+            is_n_clusters_satisfied = False
+        else:
+            is_n_clusters_satisfied = True
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return cluster_labels, clust_alg, is_n_clusters_satisfied
+    # -------------------------------------------------------------------------
+    def get_clustering_algorithm(self, clust_alg_id, n_clusters):
+        """Get clustering algorithm.
+
+        Parameters
+        ----------
+        clust_alg_id : str
+            Clustering algorithm identifier.
+        n_clusters : int
+            The number of clusters to find.
+
+        Returns
+        -------
+        clust_alg : ClusteringAlgorithm
+            Clustering algorithm.
+        """
+        if clust_alg_id in ('1', '6'):
             # Set number of full batch K-Means clusterings (with different
             # initializations)
-            n_init = 10
+            n_init = 10 if self._n_init is None else self._n_init
+            # Set K-Means algorithm (Elkan algorithm exploits the triangle
+            # inequality to avoid most distance computations)
+            algorithm = 'lloyd' if clust_alg_id == '1' else 'elkan'
             # Instantiate K-Means
             clust_alg = KMeansSK(init='k-means++', n_init=n_init, max_iter=300,
                                  tol=1e-4, random_state=None,
-                                 algorithm='lloyd', n_clusters=n_clusters)
+                                 algorithm=algorithm, n_clusters=n_clusters)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         elif clust_alg_id == '2':
             # Set size of the mini-batches
             batch_size = 100
             # Set number of random initializations
-            n_init = 3
+            n_init = 3 if self._n_init is None else self._n_init
             # Intantiate Mini-Batch K-Means
             clust_alg = MiniBatchKMeansSK(init='k-means++', max_iter=100,
                                           tol=0.0, random_state=None,
@@ -122,23 +280,134 @@ class ClusterAnalysis:
                                         criterion='maxclust',
                                         n_clusters=n_clusters)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        elif clust_alg_id == '4':
+            # Set maximum number of sub-sampled dataset items
+            n_subsample = 5000
+            # Instantiate sub-sampled Agglomerative clustering
+            clust_alg = SubsampledAgglomerativeSP(
+                0, n_subsample=n_subsample, method='ward', metric='euclidean',
+                criterion='maxclust', random_state=None,
+                n_clusters=n_clusters)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        elif clust_alg_id == '5':
+            # Set size of the data matrix chunks
+            chunk_size = 2**14
+            # Instantiate streaming Mini-Batch K-Means
+            clust_alg = StreamingMiniBatchKMeansSK(
+                init='k-means++', chunk_size=chunk_size, n_epochs=10, tol=1e-4,
+                random_state=None, reassignment_ratio=0.01,
+                n_clusters=n_clusters)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        elif clust_alg_id == '7':
+            # Set number of K-Means clusterings performed at each bisection
+            n_init = 1 if self._n_init is None else self._n_init
+            # Instantiate Bisecting K-Means
+            clust_alg = BisectingKMeansSK(
+                init='k-means++', n_init=n_init, max_iter=300, tol=1e-4,
+                random_state=None, algorithm='elkan',
+                bisecting_strategy='biggest_inertia', n_clusters=n_clusters)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         else:
             raise RuntimeError('Unknown clustering algorithm.')
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Perform cluster analysis
-        cluster_labels = clust_alg.perform_clustering(data_matrix)
+        return clust_alg
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, clust_alg_id, n_items, n_features,
+                               n_clusters):
+        """Get clustering algorithm memory and computational cost estimates.
+
+        Parameters
+        ----------
+        clust_alg_id : str
+            Clustering algorithm identifier.
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+        n_clusters : int
+            The number of clusters to find.
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix. Set to None if not available.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude). Set
+            to None if not available.
+        """
+        # Instantiate clustering algorithm
+        clust_alg = self.get_clustering_algorithm(clust_alg_id, n_clusters)
+        # Get clustering algorithm memory and computational cost estimates
+        memory, n_flops = clust_alg.get_resources_estimate(n_items,
+                                                           n_features)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Check if all the dataset items have been labeled
-        if np.any(cluster_labels == -1):
-            raise RuntimeError('At least one dataset item has not been '
-                               'labeled during the cluster analysis.')
-        # Check number of clusters formed
-        if len(set(cluster_labels)) != n_clusters:
-            is_n_clusters_satisfied = False
+        return memory, n_flops
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def get_unique_data_matrix(data_matrix, quantization_tol=0.0):
+        """Collapse duplicated or near-duplicated dataset items.
+
+        Each feature is quantized with a step equal to the quantization
+        tolerance times the feature range, such that dataset items whose
+        quantized features coincide are collapsed into a single unique dataset
+        item. The unique dataset item is the centroid of the collapsed
+        dataset items and is weighted by their number.
+
+        Parameters
+        ----------
+        data_matrix : numpy.ndarray (2d)
+            Data matrix containing the required data to perform the cluster
+            analysis (numpy.ndarray of shape (n_items, n_features)).
+        quantization_tol : float, default=0.0
+            Quantization tolerance (relative to the range of each feature). If
+            0, then only duplicated dataset items are collapsed.
+
+        Returns
+        -------
+        unique_data_matrix : numpy.ndarray (2d)
+            Data matrix of unique dataset items (numpy.ndarray of shape
+            (n_unique_items, n_features)).
+        sample_weight : numpy.ndarray (1d)
+            Weight of each unique dataset item, i.e., number of collapsed
+            dataset items (numpy.ndarray[float] of shape (n_unique_items,)).
+        items_unique : numpy.ndarray (1d)
+            Unique dataset item index (int) associated with each dataset item
+            (numpy.ndarray of shape (n_items,)).
+        """
+        # Get number of features
+        n_features = data_matrix.shape[1]
+        # Set dataset items hashing keys
+        if quantization_tol > 0:
+            # Set quantization step of each feature
+            features_range = np.ptp(data_matrix, axis=0)
+            step = np.where(features_range > 0,
+                            quantization_tol*features_range, 1.0)
+            # Quantize features
+            keys = np.floor((data_matrix - np.min(data_matrix, axis=0))/step)
+            keys = np.ascontiguousarray(keys, dtype=np.int64)
         else:
-            is_n_clusters_satisfied = True
+            # Set features as keys (avoid distinguishing signed zeros)
+            keys = np.ascontiguousarray(data_matrix + 0.0, dtype=float)
+        # Hash dataset items (view each dataset item as a single raw bytes
+        # element)
+        keys = keys.view(np.dtype((np.void, keys.dtype.itemsize*n_features)))
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        return cluster_labels, clust_alg, is_n_clusters_satisfied
+        # Get unique dataset items
+        _, items_unique, counts = np.unique(keys.ravel(), return_inverse=True,
+                                            return_counts=True)
+        items_unique = items_unique.ravel()
+        # Set unique dataset items weights
+        sample_weight = counts.astype(float)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute unique dataset items (centroids of collapsed dataset items)
+        unique_data_matrix = np.zeros((len(counts), n_features))
+        for j in range(n_features):
+            unique_data_matrix[:, j] = np.bincount(
+                items_unique, weights=data_matrix[:, j])/sample_weight
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return unique_data_matrix, sample_weight, items_unique
 #
 #                                               Interface: Clustering algorithm
 # =============================================================================
@@ -150,6 +419,8 @@ class ClusteringAlgorithm(ABC):
     perform_clustering(self, data_matrix):
         *abstract*: Perform cluster analysis and get cluster label of each
         dataset item.
+    get_resources_estimate(self, n_items, n_features)
+        Get memory and computational cost estimates.
     """
     @abstractmethod
     def __init__(self):
@@ -172,6 +443,28 @@ class ClusteringAlgorithm(ABC):
             Cluster label (int) assigned to each dataset item.
         """
         pass
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, n_items, n_features):
+        """Get memory and computational cost estimates.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix. Set to None if not available.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude). Set
+            to None if not available.
+        """
+        return None, None
 # -----------------------------------------------------------------------------
 class AgglomerativeAlgorithm(ClusteringAlgorithm):
     """Hierarchical agglomerative interface.
@@ -180,6 +473,8 @@ class AgglomerativeAlgorithm(ClusteringAlgorithm):
     -------
     get_linkage_matrix(self):
         *abstract*: Get hierarchical agglomerative clustering linkage matrix.
+    get_items_leaves(self)
+        Get hierarchical tree leaf associated with each dataset item.
     """
     @abstractmethod
     def get_linkage_matrix(self):
@@ -204,6 +499,19 @@ class AgglomerativeAlgorithm(ClusteringAlgorithm):
         cluster.hierarchy.linkage>`_).
         """
         pass
+    # -------------------------------------------------------------------------
+    def get_items_leaves(self):
+        """Get hierarchical tree leaf associated with each dataset item.
+
+        Returns
+        -------
+        items_leaves : numpy.ndarray (1d)
+            Hierarchical tree leaf index (int) associated with each dataset
+            item. If None, then each dataset item is a leaf of the
+            hierarchical tree, i.e., the i-th dataset item is associated with
+            the i-th leaf.
+        """
+        return None
 #
 #                                                         Clustering algorithms
 # =============================================================================
@@ -215,8 +523,10 @@ class KMeansSK(ClusteringAlgorithm):
 
     Methods
     -------
-    perform_clustering(self, data_matrix):
+    perform_clustering(self, data_matrix, sample_weight=None):
         Perform cluster analysis and get cluster label of each dataset item.
+    get_resources_estimate(self, n_items, n_features)
+        Get memory and computational cost estimates.
     """
     def __init__(self, init='k-means++', n_init=10, max_iter=300, tol=1e-4,
                  random_state=None, algorithm='lloyd', n_clusters=None):
@@ -251,7 +561,7 @@ class KMeansSK(ClusteringAlgorithm):
         self._random_state = random_state
         self._algorithm = algorithm
     # -------------------------------------------------------------------------
-    def perform_clustering(self, data_matrix):
+    def perform_clustering(self, data_matrix, sample_weight=None):
         """Perform cluster analysis and get cluster label of each dataset item.
 
         Parameters
@@ -259,6 +569,9 @@ class KMeansSK(ClusteringAlgorithm):
         data_matrix : numpy.ndarray (2d)
             Data matrix containing the required data to perform the cluster
             analysis (numpy.ndarray of shape (n_items, n_features)).
+        sample_weight : numpy.ndarray (1d), default=None
+            Weight of each dataset item (numpy.ndarray of shape (n_items,)).
+            If None, then all dataset items are equally weighted.
 
         Returns
         -------
@@ -274,10 +587,46 @@ class KMeansSK(ClusteringAlgorithm):
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Compute cluster centers (fitted estimator) and predict cluster label
         # (prediction) for each dataset item
-        cluster_labels = self._clst_alg.fit_predict(data_matrix,
-                                                    sample_weight=None)
+        cluster_labels = self._clst_alg.fit_predict(
+            data_matrix, sample_weight=sample_weight)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         return cluster_labels
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, n_items, n_features):
+        """Get memory and computational cost estimates.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude).
+        """
+        # Get number of clusters
+        n_clusters = self.n_clusters
+        # Estimate memory (cluster labels, cluster centers and chunked
+        # distances between dataset items and cluster centers)
+        memory = 8*(n_items + 2*n_clusters*n_features + 256*n_clusters)
+        # Estimate memory of Elkan algorithm distance bounds and distances
+        # between cluster centers
+        if self._algorithm == 'elkan':
+            memory += 8*(n_items*n_clusters + n_items + n_clusters**2)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Estimate number of floating-point operations (distances between
+        # dataset items and cluster centers at each iteration)
+        n_flops = \
+            3.0*self._n_init*self._max_iter*n_items*n_clusters*n_features
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return memory, n_flops
 # =============================================================================
 class MiniBatchKMeansSK(ClusteringAlgorithm):
     """Mini-Batch K-Means clustering algorithm (wrapper).
@@ -288,8 +637,10 @@ class MiniBatchKMeansSK(ClusteringAlgorithm):
 
     Methods
     -------
-    perform_clustering(self, data_matrix):
+    perform_clustering(self, data_matrix, sample_weight=None):
         Perform cluster analysis and get cluster label of each dataset item.
+    get_resources_estimate(self, n_items, n_features)
+        Get memory and computational cost estimates.
 
     Notes
     -----
@@ -340,7 +691,7 @@ class MiniBatchKMeansSK(ClusteringAlgorithm):
         self._init_size = init_size
         self._reassignment_ratio = reassignment_ratio
     # -------------------------------------------------------------------------
-    def perform_clustering(self, data_matrix):
+    def perform_clustering(self, data_matrix, sample_weight=None):
         """Perform cluster analysis and get cluster label of each dataset item.
 
         Parameters
@@ -348,6 +699,9 @@ class MiniBatchKMeansSK(ClusteringAlgorithm):
         data_matrix : numpy.ndarray (2d)
             Data matrix containing the required data to perform the cluster
             analysis (numpy.ndarray of shape (n_items, n_features)).
+        sample_weight : numpy.ndarray (1d), default=None
+            Weight of each dataset item (numpy.ndarray of shape (n_items,)).
+            If None, then all dataset items are equally weighted.
 
         Returns
         -------
@@ -363,10 +717,44 @@ class MiniBatchKMeansSK(ClusteringAlgorithm):
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Compute cluster centers (fitted estimator) and predict cluster label
         # (prediction) for each dataset item
-        cluster_labels = self._clst_alg.fit_predict(data_matrix,
-                                                    sample_weight=None)
+        cluster_labels = self._clst_alg.fit_predict(
+            data_matrix, sample_weight=sample_weight)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         return cluster_labels
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, n_items, n_features):
+        """Get memory and computational cost estimates.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude).
+        """
+        # Get number of clusters
+        n_clusters = self.n_clusters
+        # Set scikit-learn default size of the mini-batches
+        batch_size = 1024
+        # Estimate memory (cluster labels, cluster centers and distances
+        # between mini-batch dataset items and cluster centers)
+        memory = 8*(n_items + 2*n_clusters*n_features + batch_size*n_clusters)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Estimate number of floating-point operations (distances between
+        # dataset items and cluster centers at each pass over the dataset and
+        # final cluster labels prediction)
+        n_flops = 3.0*(self._max_iter + 1)*n_items*n_clusters*n_features
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return memory, n_flops
 # =============================================================================
 class AgglomerativeSP(AgglomerativeAlgorithm):
     """Agglomerative clustering algorithm (wrapper).
@@ -378,6 +766,10 @@ class AgglomerativeSP(AgglomerativeAlgorithm):
     -------
     perform_clustering(self, data_matrix):
         Perform cluster analysis and get cluster label of each dataset item.
+    get_linkage_matrix(self):
+        Get hierarchical agglomerative clustering linkage matrix.
+    get_resources_estimate(self, n_items, n_features)
+        Get memory and computational cost estimates.
 
     Attributes
     ----------
@@ -473,3 +865,659 @@ class AgglomerativeSP(AgglomerativeAlgorithm):
             raise ValueError('Hierarchical agglomerative clustering linkage '
                              'matrix has not been computed yet.')
         return self._linkage_matrix
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, n_items, n_features):
+        """Get memory and computational cost estimates.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude).
+        """
+        # Estimate memory (condensed distance matrix, linkage matrix and
+        # cluster labels)
+        memory = 8*(n_items*(n_items - 1)//2 + 4*(n_items - 1) + n_items)
+        # Estimate number of floating-point operations (condensed distance
+        # matrix and nearest-neighbor chain hierarchical clustering)
+        n_flops = 1.5*n_items*(n_items - 1)*n_features + float(n_items)**2
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return memory, n_flops
+# =============================================================================
+class SubsampledAgglomerativeSP(AgglomerativeAlgorithm):
+    """Sub-sampled agglomerative clustering algorithm (wrapper).
+
+    The hierarchical agglomerative clustering is performed over a random
+    sub-sample of the dataset items, whose (unique) data points are the leaves
+    of the hierarchical tree. Each dataset item is then assigned to the
+    nearest leaf, i.e., the leaves act as the centroids of a Voronoi partition
+    of the dataset items. Given that each dataset item is associated with a
+    single leaf, any horizontal cut of the hierarchical tree defines a
+    consistent flat clustering of the dataset. If the number of dataset items
+    does not exceed the sub-sample size, then the hierarchical agglomerative
+    clustering is performed over the whole dataset (see
+    :py:class:`AgglomerativeSP`).
+
+    Documentation: see `here <https://docs.scipy.org/doc/scipy/reference/
+    cluster.hierarchy.html>`_.
+
+    Methods
+    -------
+    perform_clustering(self, data_matrix):
+        Perform cluster analysis and get cluster label of each dataset item.
+    get_linkage_matrix(self):
+        Get hierarchical agglomerative clustering linkage matrix.
+    get_items_leaves(self)
+        Get hierarchical tree leaf associated with each dataset item.
+    get_resources_estimate(self, n_items, n_features)
+        Get memory and computational cost estimates.
+
+    Attributes
+    ----------
+    _linkage_matrix : numpy.ndarray (2d)
+        Linkage matrix associated with the hierarchical agglomerative
+        clustering (numpy.ndarray of shape (n_leaves-1, 4)). At the i-th
+        iteration the clusterings with indices Z[i, 0] and Z[i, 1], with
+        distance Z[i, 2], are merged, forming a new cluster that contains
+        Z[i, 3] leaves. All cluster indices j >= n_leaves refer to the
+        cluster formed in Z[j-n_leaves, :].
+    _items_leaves : numpy.ndarray (1d)
+        Hierarchical tree leaf index (int) associated with each dataset item.
+        Set to None if each dataset item is a leaf of the hierarchical tree.
+    """
+    def __init__(self, t, n_subsample=5000, method='ward', metric='euclidean',
+                 criterion='maxclust', random_state=None, n_clusters=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        n_clusters : int, default=None
+            The number of clusters to find.
+        t : {int, float}
+            Scalar parameter associated to the criterion used to form a flat
+            clustering. Threshold (float) with criterion in {'inconsistent',
+            'distance', 'monocrit'} or maximum number of clusters with
+            criterion in {'maxclust', 'maxclust_monocrit'}.
+        n_subsample : int, default=5000
+            Maximum number of sub-sampled dataset items (hierarchical tree
+            leaves).
+        method : {'single', 'complete', 'average', 'weighted', 'centroid', \
+                  'median', 'ward'}, default='ward'
+            Linkage criterion.
+        metric : str, default='euclidean'
+            Distance metric. Options: {'cityblock', 'euclidean', 'cosine',
+            ...}.
+        criterion : str, {'inconsistent', 'distance', 'maxclust', 'monocrit', \
+                          'maxclust_monocrit'}, default='maxclust'
+            Criterion used to form a flat clustering (i.e., perform a
+            horizontal cut in the hierarchical tree).
+        random_state : {int, numpy.random.Generator}, default=None
+            Determines random number generation for the dataset items
+            sub-sampling. Use an int to make the randomness deterministic.
+        """
+        self._t = t
+        self.n_clusters = n_clusters
+        self._n_subsample = n_subsample
+        self._method = method
+        self._metric = metric
+        self._criterion = criterion
+        self._random_state = random_state
+        self._linkage_matrix = None
+        self._items_leaves = None
+    # -------------------------------------------------------------------------
+    def perform_clustering(self, data_matrix):
+        """Perform cluster analysis and get cluster label of each dataset item.
+
+        Parameters
+        ----------
+        data_matrix : numpy.ndarray (2d)
+            Data matrix containing the required data to perform the cluster
+            analysis (numpy.ndarray of shape (n_items, n_features)).
+
+        Returns
+        -------
+        cluster_labels : numpy.ndarray (1d)
+            Cluster label (int) assigned to each dataset item.
+        """
+        # Get number of dataset items
+        n_items = data_matrix.shape[0]
+        # Set hierarchical tree leaves data
+        if n_items <= self._n_subsample:
+            # Set dataset items as hierarchical tree leaves
+            leaves_data = data_matrix
+            self._items_leaves = None
+        else:
+            # Sub-sample dataset items
+            rng = np.random.default_rng(self._random_state)
+            subsample = np.sort(rng.choice(n_items, size=self._n_subsample,
+                                           replace=False))
+            # Set unique sub-sampled data points as hierarchical tree leaves
+            # (duplicated leaves would not be assigned any dataset item)
+            leaves_data, leaves_idxs = np.unique(data_matrix[subsample, :],
+                                                 axis=0, return_index=True)
+            # Assign each dataset item to the nearest leaf
+            self._items_leaves = sklearn.metrics.pairwise_distances_argmin(
+                data_matrix, leaves_data, metric=self._metric)
+            # Enforce the assignment of each sub-sampled data point to its own
+            # leaf (avoid leaves without dataset items due to round-off)
+            self._items_leaves[subsample[leaves_idxs]] = \
+                np.arange(leaves_data.shape[0])
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Perform hierarchical clustering and encode it in a linkage matrix
+        self._linkage_matrix = sciclst.linkage(leaves_data,
+                                               method=self._method,
+                                               metric=self._metric)
+        # Perform horizontal cut in hierarchical tree and get leaves cluster
+        # labels (form a flat clustering)
+        leaves_labels = sciclst.fcluster(self._linkage_matrix,
+                                         self.n_clusters,
+                                         criterion=self._criterion)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Propagate leaves cluster labels to dataset items
+        if self._items_leaves is None:
+            cluster_labels = leaves_labels
+        else:
+            cluster_labels = leaves_labels[self._items_leaves]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return cluster_labels
+    # -------------------------------------------------------------------------
+    def get_linkage_matrix(self):
+        """Get hierarchical agglomerative clustering linkage matrix.
+
+        Returns
+        -------
+        linkage_matrix : numpy.ndarray (2d)
+            Linkage matrix associated with the hierarchical agglomerative
+            clustering (numpy.ndarray of shape (n_leaves-1, 4)). At the i-th
+            iteration the clusterings with indices Z[i, 0] and Z[i, 1], with
+            distance Z[i, 2], are merged, forming a new cluster that contains
+            Z[i, 3] leaves. All cluster indices j >= n_leaves refer to the
+            cluster formed in Z[j-n_leaves, :].
+        """
+        if self._linkage_matrix is None:
+            raise ValueError('Hierarchical agglomerative clustering linkage '
+                             'matrix has not been computed yet.')
+        return self._linkage_matrix
+    # -------------------------------------------------------------------------
+    def get_items_leaves(self):
+        """Get hierarchical tree leaf associated with each dataset item.
+
+        Returns
+        -------
+        items_leaves : numpy.ndarray (1d)
+            Hierarchical tree leaf index (int) associated with each dataset
+            item. If None, then each dataset item is a leaf of the
+            hierarchical tree, i.e., the i-th dataset item is associated with
+            the i-th leaf.
+        """
+        return self._items_leaves
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, n_items, n_features):
+        """Get memory and computational cost estimates.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude).
+        """
+        # Get number of hierarchical tree leaves
+        n_leaves = min(n_items, self._n_subsample)
+        # Estimate memory (condensed distance matrix, linkage matrix, cluster
+        # labels and dataset items leaves)
+        memory = 8*(n_leaves*(n_leaves - 1)//2 + 4*(n_leaves - 1)
+                    + 2*n_items)
+        # Estimate number of floating-point operations (condensed distance
+        # matrix and nearest-neighbor chain hierarchical clustering)
+        n_flops = 1.5*n_leaves*(n_leaves - 1)*n_features + float(n_leaves)**2
+        # Estimate memory and number of floating-point operations associated
+        # with the nearest leaf assignment (distances are computed in chunks
+        # of 256 dataset items)
+        if n_items > n_leaves:
+            memory += 8*256*n_leaves
+            n_flops += 3.0*n_items*n_leaves*n_features
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return memory, n_flops
+# =============================================================================
+class StreamingMiniBatchKMeansSK(ClusteringAlgorithm):
+    """Streaming Mini-Batch K-Means clustering algorithm (wrapper).
+
+    The data matrix is read in chunks, each of which is used to perform an
+    incremental update of the cluster centers (see `here <https://
+    scikit-learn.org/stable/modules/generated/sklearn.cluster.MiniBatchKMeans.
+    html#sklearn.cluster.MiniBatchKMeans.partial_fit>`_). Each chunk is made
+    of the dataset items equally strided over the whole data matrix, such
+    that each chunk is representative of the whole dataset (e.g., the
+    cluster centers initialization from the first chunk is not biased towards
+    a particular region of the RVE). The cluster labels are then predicted
+    chunk by chunk. Only a chunk of the data matrix is loaded in memory at
+    once, such that the data matrix may be stored in disk (e.g.,
+    numpy.memmap).
+
+    Documentation: see `here <https://scikit-learn.org/stable/modules/
+    generated/sklearn.cluster.MiniBatchKMeans.html#sklearn.cluster.
+    MiniBatchKMeans>`_.
+
+    Methods
+    -------
+    perform_clustering(self, data_matrix, sample_weight=None):
+        Perform cluster analysis and get cluster label of each dataset item.
+    get_resources_estimate(self, n_items, n_features)
+        Get memory and computational cost estimates.
+    """
+    def __init__(self, init='k-means++', chunk_size=2**14, n_epochs=10,
+                 tol=1e-4, random_state=None, reassignment_ratio=0.01,
+                 n_clusters=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        n_clusters : int, default=None
+            Number of clusters to find.
+        init: {‘k-means++’, ‘random’, numpy.ndarray, callable}, \
+              default=’k-means++’
+            Method for centroid initialization (performed with the first
+            chunk).
+        chunk_size : int, default=16384
+            Minimum number of dataset items of each data matrix chunk. Chunks
+            contain at least as many dataset items as the number of clusters.
+        n_epochs : int, default=10
+            Maximum number of passes over the whole data matrix.
+        tol : float, default=1e-4
+            Convergence tolerance (based on the Frobenius norm of the
+            difference in the cluster centers of two consecutive passes over
+            the data matrix, relative to the Frobenius norm of the cluster
+            centers).
+        random_state : int, RandomState instance, default=None
+            Determines random number generation for centroid initialization.
+            Use an int to make the randomness deterministic.
+        reassignment_ratio : float, default=0.01
+            Control the fraction of the maximum number of counts for a center
+            to be reassigned.
+        """
+        self.n_clusters = n_clusters
+        self._init = init
+        self._chunk_size = chunk_size
+        self._n_epochs = n_epochs
+        self._tol = tol
+        self._random_state = random_state
+        self._reassignment_ratio = reassignment_ratio
+    # -------------------------------------------------------------------------
+    def perform_clustering(self, data_matrix, sample_weight=None):
+        """Perform cluster analysis and get cluster label of each dataset item.
+
+        Parameters
+        ----------
+        data_matrix : numpy.ndarray (2d)
+            Data matrix containing the required data to perform the cluster
+            analysis (numpy.ndarray of shape (n_items, n_features)).
+        sample_weight : numpy.ndarray (1d), default=None
+            Weight of each dataset item (numpy.ndarray of shape (n_items,)).
+            If None, then all dataset items are equally weighted.
+
+        Returns
+        -------
+        cluster_labels : numpy.ndarray (1d)
+            Cluster label (int) assigned to each dataset item.
+        """
+        # Get number of dataset items
+        n_items = data_matrix.shape[0]
+        # Set chunk size (enforce that each chunk contains at least as many
+        # dataset items as the number of clusters)
+        chunk_size = max(self._chunk_size, self.n_clusters)
+        # Set number of chunks
+        n_chunks = max(1, n_items//chunk_size)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Instantiate scikit-learn Mini-Batch K-Means clustering algorithm
+        self._clst_alg = skclst.MiniBatchKMeans(
+            n_clusters=self.n_clusters, init=self._init,
+            random_state=self._random_state,
+            reassignment_ratio=self._reassignment_ratio)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize cluster centers
+        centers = None
+        # Loop over passes over the data matrix
+        for _ in range(self._n_epochs):
+            # Loop over data matrix chunks (strided dataset items)
+            for i in range(n_chunks):
+                # Get data matrix chunk dataset items weights
+                if sample_weight is None:
+                    chunk_weight = None
+                else:
+                    chunk_weight = sample_weight[i::n_chunks]
+                # Update cluster centers (fitted estimator)
+                self._clst_alg.partial_fit(
+                    np.asarray(data_matrix[i::n_chunks, :]),
+                    sample_weight=chunk_weight)
+            # Check convergence
+            if centers is not None:
+                shift = np.linalg.norm(self._clst_alg.cluster_centers_
+                                       - centers)
+                if shift <= self._tol*np.linalg.norm(centers):
+                    break
+            # Store cluster centers
+            centers = self._clst_alg.cluster_centers_.copy()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize cluster labels
+        cluster_labels = np.full(n_items, -1, dtype=int)
+        # Predict cluster label (prediction) for each dataset item (contiguous
+        # data matrix chunks)
+        for i in range(0, n_items, chunk_size):
+            cluster_labels[i:i + chunk_size] = self._clst_alg.predict(
+                np.asarray(data_matrix[i:i + chunk_size, :]))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return cluster_labels
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, n_items, n_features):
+        """Get memory and computational cost estimates.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude).
+        """
+        # Get number of clusters
+        n_clusters = self.n_clusters
+        # Get maximum chunk size
+        chunk_size = min(n_items, 2*max(self._chunk_size, n_clusters))
+        # Estimate memory (cluster labels, cluster centers, data matrix chunk
+        # and distances between chunk dataset items and cluster centers)
+        memory = 8*(n_items + 2*n_clusters*n_features
+                    + chunk_size*(n_features + n_clusters))
+        # Estimate number of floating-point operations (distances between
+        # dataset items and cluster centers at each pass over the dataset and
+        # final cluster labels prediction)
+        n_flops = 3.0*(self._n_epochs + 1)*n_items*n_clusters*n_features
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return memory, n_flops
+# =============================================================================
+class BisectingKMeansSK(ClusteringAlgorithm):
+    """Bisecting K-Means clustering algorithm (wrapper).
+
+    Documentation: see `here <https://scikit-learn.org/stable/modules/
+    generated/sklearn.cluster.BisectingKMeans.html#sklearn.cluster.
+    BisectingKMeans>`_.
+
+    Methods
+    -------
+    perform_clustering(self, data_matrix, sample_weight=None):
+        Perform cluster analysis and get cluster label of each dataset item.
+    get_resources_estimate(self, n_items, n_features)
+        Get memory and computational cost estimates.
+    """
+    def __init__(self, init='k-means++', n_init=1, max_iter=300, tol=1e-4,
+                 random_state=None, algorithm='elkan',
+                 bisecting_strategy='biggest_inertia', n_clusters=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        n_clusters : int, default=None
+            Number of clusters to find.
+        init : {‘k-means++’, ‘random’, callable}, default=’k-means++’
+            Method for centroid initialization.
+        n_init : int, default=1
+            Number of times the inner K-Means is run with different centroid
+            seeds at each bisection.
+        max_iter : int, default=300
+            Maximum number of iterations of the inner K-Means at each
+            bisection.
+        tol : float, default=1e-4
+            Convergence tolerance (based on Frobenius norm of the different in
+            the cluster centers of two consecutive iterations).
+        random_state : {int, RandomState}, default=None
+            Determines random number generation for centroid initialization.
+            Use an int to make the randomness deterministic.
+        algorithm : {'lloyd', 'elkan'}, default='elkan'
+            Inner K-Means algorithm to use. 'lloyd' is the classical EM-style
+            algorithm, 'elkan' uses the triangle inequality to speed up
+            convergence.
+        bisecting_strategy : {'biggest_inertia', 'largest_cluster'}, \
+                             default='biggest_inertia'
+            Cluster selected to be bisected: cluster with the biggest
+            inertia ('biggest_inertia') or cluster with the largest number of
+            dataset items ('largest_cluster').
+        """
+        self.n_clusters = n_clusters
+        self._init = init
+        self._n_init = n_init
+        self._max_iter = max_iter
+        self._tol = tol
+        self._random_state = random_state
+        self._algorithm = algorithm
+        self._bisecting_strategy = bisecting_strategy
+    # -------------------------------------------------------------------------
+    def perform_clustering(self, data_matrix, sample_weight=None):
+        """Perform cluster analysis and get cluster label of each dataset item.
+
+        Parameters
+        ----------
+        data_matrix : numpy.ndarray (2d)
+            Data matrix containing the required data to perform the cluster
+            analysis (numpy.ndarray of shape (n_items, n_features)).
+        sample_weight : numpy.ndarray (1d), default=None
+            Weight of each dataset item (numpy.ndarray of shape (n_items,)).
+            If None, then all dataset items are equally weighted.
+
+        Returns
+        -------
+        cluster_labels : numpy.ndarray (1d)
+            Cluster label (int) assigned to each dataset item.
+        """
+        # Instantiate scikit-learn Bisecting K-Means clustering algorithm
+        self._clst_alg = skclst.BisectingKMeans(
+            n_clusters=self.n_clusters, init=self._init, n_init=self._n_init,
+            max_iter=self._max_iter, tol=self._tol,
+            random_state=self._random_state, algorithm=self._algorithm,
+            bisecting_strategy=self._bisecting_strategy)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute cluster centers (fitted estimator) and predict cluster label
+        # (prediction) for each dataset item
+        cluster_labels = self._clst_alg.fit_predict(
+            data_matrix, sample_weight=sample_weight)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return cluster_labels
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, n_items, n_features):
+        """Get memory and computational cost estimates.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude).
+        """
+        # Get number of clusters
+        n_clusters = self.n_clusters
+        # Estimate memory (copy of bisected cluster data, cluster labels,
+        # Elkan algorithm distance bounds and cluster centers)
+        memory = 8*(n_items*(n_features + 5) + 2*n_clusters*n_features)
+        # Estimate number of floating-point operations (2-means clustering of
+        # each hierarchical tree level, assuming balanced bisections)
+        n_levels = max(1.0, np.log2(n_clusters))
+        n_flops = 6.0*self._n_init*self._max_iter*n_items*n_features*n_levels
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return memory, n_flops
+# =============================================================================
+class HierarchicalTreeCut(AgglomerativeAlgorithm):
+    """Flat clustering from a given hierarchical agglomerative clustering tree.
+
+    The flat clustering is obtained from an horizontal cut of a given
+    (e.g., cached) hierarchical agglomerative clustering tree, such that the
+    cost of the cluster analysis is linear in the number of dataset items.
+
+    Methods
+    -------
+    perform_clustering(self, data_matrix):
+        Perform cluster analysis and get cluster label of each dataset item.
+    get_linkage_matrix(self):
+        Get hierarchical agglomerative clustering linkage matrix.
+    get_items_leaves(self)
+        Get hierarchical tree leaf associated with each dataset item.
+    get_resources_estimate(self, n_items, n_features)
+        Get memory and computational cost estimates.
+
+    Attributes
+    ----------
+    _linkage_matrix : numpy.ndarray (2d)
+        Linkage matrix associated with the hierarchical agglomerative
+        clustering (numpy.ndarray of shape (n_leaves-1, 4)).
+    _items_leaves : numpy.ndarray (1d)
+        Hierarchical tree leaf index (int) associated with each dataset item.
+        Set to None if each dataset item is a leaf of the hierarchical tree.
+    """
+    def __init__(self, linkage_matrix, items_leaves=None,
+                 criterion='maxclust', n_clusters=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        linkage_matrix : numpy.ndarray (2d)
+            Linkage matrix associated with the hierarchical agglomerative
+            clustering (numpy.ndarray of shape (n_leaves-1, 4)).
+        items_leaves : numpy.ndarray (1d), default=None
+            Hierarchical tree leaf index (int) associated with each dataset
+            item. If None, then each dataset item is a leaf of the
+            hierarchical tree.
+        criterion : str, {'maxclust', 'distance'}, default='maxclust'
+            Criterion used to form a flat clustering (i.e., perform a
+            horizontal cut in the hierarchical tree).
+        n_clusters : int, default=None
+            The number of clusters to find.
+        """
+        self.n_clusters = n_clusters
+        self._linkage_matrix = linkage_matrix
+        self._items_leaves = items_leaves
+        self._criterion = criterion
+    # -------------------------------------------------------------------------
+    def perform_clustering(self, data_matrix):
+        """Perform cluster analysis and get cluster label of each dataset item.
+
+        Parameters
+        ----------
+        data_matrix : numpy.ndarray (2d)
+            Data matrix containing the required data to perform the cluster
+            analysis (numpy.ndarray of shape (n_items, n_features)).
+
+        Returns
+        -------
+        cluster_labels : numpy.ndarray (1d)
+            Cluster label (int) assigned to each dataset item.
+        """
+        # Get number of dataset items
+        n_items = data_matrix.shape[0]
+        # Get number of hierarchical tree leaves
+        n_leaves = self._linkage_matrix.shape[0] + 1
+        # Check consistency between dataset and hierarchical tree
+        if (self._items_leaves is None and n_leaves != n_items) \
+                or (self._items_leaves is not None
+                    and len(self._items_leaves) != n_items):
+            raise RuntimeError('The hierarchical agglomerative clustering '
+                               'tree is not consistent with the dataset.')
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Perform horizontal cut in hierarchical tree and get leaves cluster
+        # labels (form a flat clustering)
+        leaves_labels = sciclst.fcluster(self._linkage_matrix,
+                                         self.n_clusters,
+                                         criterion=self._criterion)
+        # Propagate leaves cluster labels to dataset items
+        if self._items_leaves is None:
+            cluster_labels = leaves_labels
+        else:
+            cluster_labels = leaves_labels[self._items_leaves]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return cluster_labels
+    # -------------------------------------------------------------------------
+    def get_linkage_matrix(self):
+        """Get hierarchical agglomerative clustering linkage matrix.
+
+        Returns
+        -------
+        linkage_matrix : numpy.ndarray (2d)
+            Linkage matrix associated with the hierarchical agglomerative
+            clustering (numpy.ndarray of shape (n_leaves-1, 4)).
+        """
+        return self._linkage_matrix
+    # -------------------------------------------------------------------------
+    def get_items_leaves(self):
+        """Get hierarchical tree leaf associated with each dataset item.
+
+        Returns
+        -------
+        items_leaves : numpy.ndarray (1d)
+            Hierarchical tree leaf index (int) associated with each dataset
+            item. If None, then each dataset item is a leaf of the
+            hierarchical tree, i.e., the i-th dataset item is associated with
+            the i-th leaf.
+        """
+        return self._items_leaves
+    # -------------------------------------------------------------------------
+    def get_resources_estimate(self, n_items, n_features):
+        """Get memory and computational cost estimates.
+
+        Parameters
+        ----------
+        n_items : int
+            Number of dataset items.
+        n_features : int
+            Number of features (data matrix columns).
+
+        Returns
+        -------
+        memory : int
+            Estimated peak memory (bytes) required by the clustering algorithm
+            in addition to the data matrix.
+        n_flops : float
+            Estimated number of floating-point operations performed by the
+            clustering algorithm (upper bound of the order of magnitude).
+        """
+        # Get number of hierarchical tree leaves
+        n_leaves = self._linkage_matrix.shape[0] + 1
+        # Estimate memory (leaves and dataset items cluster labels)
+        memory = 8*(n_leaves + n_items)
+        # Estimate number of floating-point operations (horizontal cut of
+        # hierarchical tree and cluster labels propagation)
+        n_flops = float(n_leaves*np.log2(max(n_leaves, 2)) + n_items)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return memory, n_flops
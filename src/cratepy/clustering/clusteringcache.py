@@ -0,0 +1,189 @@
+"""Persistent cache of hierarchical agglomerative clustering trees.
+
+This module includes the class which embodies a persistent on-disk cache of
+hierarchical agglomerative clustering trees. Given that a hierarchical
+agglomerative clustering tree only depends on the clustering data matrix and
+on the clustering algorithm, each tree is stored under a content-addressed key
+(hash of these data). A flat clustering with any number of clusters can then
+be obtained from the cached tree through an horizontal cut, such that
+simulations sharing the same clustering data matrix and differing only in the
+prescribed number of clusters (e.g., convergence studies on the number of
+clusters) perform the expensive hierarchical agglomerative clustering only
+once.
+
+Classes
+-------
+ClusteringHierarchyCache
+    Persistent cache of hierarchical agglomerative clustering trees.
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Standard
+import os
+import uuid
+# Third-party
+import numpy as np
+# Local
+from clustering.rvedatabasecache import RVEDatabaseCache
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+class ClusteringHierarchyCache:
+    """Persistent cache of hierarchical agglomerative clustering trees.
+
+    Each cached tree is stored in a `.npz` file named after the associated
+    content-addressed key, containing the hierarchical agglomerative
+    clustering linkage matrix and, if the tree leaves do not coincide with the
+    dataset items, the hierarchical tree leaf associated with each dataset
+    item.
+
+    Attributes
+    ----------
+    _cache_dir : str
+        Cache directory path.
+
+    Methods
+    -------
+    get_key(data_matrix, clust_alg_id)
+        *staticmethod*: Get content-addressed key of hierarchical tree.
+    load(self, key)
+        Load hierarchical agglomerative clustering tree from cache.
+    store(self, key, linkage_matrix, items_leaves=None)
+        Store hierarchical agglomerative clustering tree in cache.
+    get_cache_dir(self)
+        Get cache directory path.
+    """
+    def __init__(self, cache_dir):
+        """Constructor.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Cache directory path. Created if it does not exist.
+        """
+        self._cache_dir = os.path.abspath(cache_dir)
+        # Create cache directory
+        os.makedirs(self._cache_dir, exist_ok=True)
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def get_key(data_matrix, clust_alg_id):
+        """Get content-addressed key of hierarchical tree.
+
+        Parameters
+        ----------
+        data_matrix : numpy.ndarray (2d)
+            Data matrix containing the required data to perform the cluster
+            analysis (numpy.ndarray of shape (n_items, n_features)).
+        clust_alg_id : str
+            Clustering algorithm identifier.
+
+        Returns
+        -------
+        key : str
+            Content-addressed key (SHA-256 hexadecimal digest).
+        """
+        return RVEDatabaseCache.get_key('hierarchical_tree',
+                                        np.asarray(data_matrix),
+                                        str(clust_alg_id))
+    # -------------------------------------------------------------------------
+    def load(self, key):
+        """Load hierarchical agglomerative clustering tree from cache.
+
+        Parameters
+        ----------
+        key : str
+            Content-addressed key.
+
+        Returns
+        -------
+        linkage_matrix : {numpy.ndarray (2d), None}
+            Linkage matrix associated with the hierarchical agglomerative
+            clustering (numpy.ndarray of shape (n_leaves-1, 4)). None if the
+            tree is not cached.
+        items_leaves : {numpy.ndarray (1d), None}
+            Hierarchical tree leaf index (int) associated with each dataset
+            item. None if each dataset item is a leaf of the hierarchical tree
+            or if the tree is not cached.
+        """
+        # Get tree file path
+        tree_file_path = os.path.join(self._cache_dir, key + '.npz')
+        # Check if tree is cached
+        if not os.path.isfile(tree_file_path):
+            return None, None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Load tree (a corrupted tree is discarded)
+        try:
+            with np.load(tree_file_path) as data:
+                linkage_matrix = data['linkage_matrix']
+                if 'items_leaves' in data.files:
+                    items_leaves = data['items_leaves'].astype(int)
+                else:
+                    items_leaves = None
+        except (OSError, ValueError, KeyError):
+            try:
+                os.remove(tree_file_path)
+            except OSError:
+                pass
+            return None, None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return linkage_matrix, items_leaves
+    # -------------------------------------------------------------------------
+    def store(self, key, linkage_matrix, items_leaves=None):
+        """Store hierarchical agglomerative clustering tree in cache.
+
+        The tree is first written to a temporary file that is then renamed,
+        such that concurrent simulations never read a partially written tree.
+
+        Parameters
+        ----------
+        key : str
+            Content-addressed key.
+        linkage_matrix : numpy.ndarray (2d)
+            Linkage matrix associated with the hierarchical agglomerative
+            clustering (numpy.ndarray of shape (n_leaves-1, 4)).
+        items_leaves : numpy.ndarray (1d), default=None
+            Hierarchical tree leaf index (int) associated with each dataset
+            item. If None, then each dataset item is a leaf of the
+            hierarchical tree.
+        """
+        # Get tree file path
+        tree_file_path = os.path.join(self._cache_dir, key + '.npz')
+        # Skip already cached tree
+        if os.path.isfile(tree_file_path):
+            return
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set tree data
+        tree_data = {'linkage_matrix': np.asarray(linkage_matrix)}
+        if items_leaves is not None:
+            tree_data['items_leaves'] = np.asarray(items_leaves,
+                                                   dtype=np.int32)
+        # Set temporary tree file path
+        tmp_file_path = os.path.join(self._cache_dir, '.tmp_' + key + '_'
+                                     + uuid.uuid4().hex + '.npz')
+        # Write tree
+        try:
+            np.savez(tmp_file_path, **tree_data)
+            os.replace(tmp_file_path, tree_file_path)
+        except OSError:
+            # Discard tree (e.g., insufficient disk space)
+            try:
+                os.remove(tmp_file_path)
+            except OSError:
+                pass
+    # -------------------------------------------------------------------------
+    def get_cache_dir(self):
+        """Get cache directory path.
+
+        Returns
+        -------
+        cache_dir : str
+            Cache directory path.
+        """
+        return self._cache_dir
@@ -57,7 +57,9 @@ def set_clustering_data(strain_formulation, problem_type, rve_dims,
                         n_voxels_dims, regular_grid, material_phases,
                         material_phases_properties, dns_method,
                         dns_method_data, standardization_method,
-                        base_clustering_scheme, adaptive_clustering_scheme):
+                        base_clustering_scheme, adaptive_clustering_scheme,
+                        dns_n_workers=1, dns_executor='thread',
+                        dns_cache=None):
     """Compute the features data required to perform the RVE cluster analysis.
 
     Parameters
@@ -99,6 +101,14 @@ def set_clustering_data(strain_formulation, problem_type, rve_dims,
         associated with a unique clustering characterized by a clustering
         algorithm (col 1, int), a list of features (col 2, list[int]) and a
         list of the features data matrix' indexes (col 3, list[int]).
+    dns_n_workers : int, default=1
+        Number of workers solving the DNS macroscale strain loadings in
+        parallel. If -1, then all the available CPUs are used.
+    dns_executor : {'thread', 'process'}, default='thread'
+        Pool of workers solving the DNS macroscale strain loadings: pool of
+        threads ('thread') or pool of processes ('process').
+    dns_cache : RVEDatabaseCache, default=None
+        Persistent cache of RVE local elastic response databases.
 
     Returns
     -------
@@ -135,7 +145,8 @@ def set_clustering_data(strain_formulation, problem_type, rve_dims,
                                               material_phases_properties)
     # Compute RVE's elastic response database
     rve_elastic_database.compute_rve_response_database(
-        dns_method, dns_method_data, mac_strains, is_strain_sym=True)
+        dns_method, dns_method_data, mac_strains, is_strain_sym=True,
+        n_workers=dns_n_workers, executor=dns_executor, cache=dns_cache)
     # Compute RVE's elastic effective tangent modulus if the elastic response
     # database contains a suitable set of orthogonal macroscale strain loadings
     if clustering_data.get_features() == {1}:
@@ -0,0 +1,508 @@
+"""Cluster adjacency graph.
+
+This module includes the class which embodies the adjacency graph of the
+clusters of a Cluster-Reduced Representative Volume Element (CRVE). Two
+clusters are adjacent if they share at least one voxel face in the regular
+grid of voxels (periodic boundary conditions are assumed, such that the
+first and last voxels along each dimension are adjacent). Besides the number
+of shared voxel faces between adjacent clusters, the number of voxels and the
+bounding box of each cluster are also stored, such that spatial cluster
+relationships can be queried without scanning the whole regular grid of
+voxels.
+
+Classes
+-------
+ClusterAdjacencyGraph
+    Cluster adjacency graph.
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Third-party
+import numpy as np
+import scipy.sparse
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+class ClusterAdjacencyGraph:
+    """Cluster adjacency graph.
+
+    The graph is computed once from the regular grid of voxels through
+    vectorized comparisons between each voxel and the next voxel along each
+    dimension. After a clustering update (e.g., clustering adaptivity), the
+    graph is updated incrementally by only evaluating the voxel faces of the
+    voxels whose cluster changed.
+
+    Attributes
+    ----------
+    _n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid (spatial
+        discretization of the RVE).
+    _adjacency_matrix : scipy.sparse.csr_matrix (2d)
+        Number of shared voxel faces between each pair of different clusters
+        (sparse symmetric matrix of shape (n_labels, n_labels)), where rows
+        and columns are indexed by the cluster labels.
+    _clusters_n_voxels : numpy.ndarray (1d)
+        Number of voxels of each cluster (numpy.ndarray of shape
+        (n_labels,)), indexed by the cluster labels.
+    _clusters_bbox : numpy.ndarray (3d)
+        Bounding box of each cluster (numpy.ndarray of shape
+        (n_labels, 2, n_dim)), indexed by the cluster labels, storing the
+        minimum (index 0) and maximum (index 1) voxel index along each
+        dimension. Set to -1 for unexistent clusters.
+
+    Methods
+    -------
+    update(self, old_voxels_clusters, voxels_clusters, voxels_idxs=None)
+        Update cluster adjacency graph after clustering update.
+    get_clusters(self)
+        Get clusters labels.
+    get_adjacency_matrix(self)
+        Get number of shared voxel faces between clusters (sparse matrix).
+    get_neighbours(self, cluster)
+        Get adjacent clusters and number of shared voxel faces.
+    get_n_shared_faces(self, cluster_1, cluster_2)
+        Get number of shared voxel faces between two clusters.
+    get_cluster_n_voxels(self, cluster)
+        Get cluster number of voxels.
+    get_cluster_bounding_box(self, cluster)
+        Get cluster bounding box.
+    get_cluster_slices(self, cluster)
+        Get regular grid slices of cluster bounding box.
+    _resize(self, n_labels)
+        Resize cluster adjacency graph to given number of cluster labels.
+    _get_voxels_faces(self, voxels_idxs)
+        Get voxel faces associated with given voxels.
+    _get_adjacency_matrix(clusters, clusters_next, shape=None)
+        *staticmethod*: Get number of shared voxel faces between clusters.
+    _set_clusters_bbox(self, voxels_clusters, clusters, voxels_idxs=None)
+        Set bounding box of given clusters.
+    """
+    def __init__(self, voxels_clusters):
+        """Constructor.
+
+        Parameters
+        ----------
+        voxels_clusters : numpy.ndarray (2d or 3d)
+            Regular grid of voxels (spatial discretization of the RVE), where
+            each entry contains the cluster label (int) assigned to the
+            corresponding voxel.
+        """
+        self._n_voxels_dims = list(voxels_clusters.shape)
+        # Get number of cluster labels
+        n_labels = int(np.max(voxels_clusters)) + 1
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize clusters of voxel faces
+        clusters = []
+        clusters_next = []
+        # Loop over dimensions
+        for i in range(len(self._n_voxels_dims)):
+            # Get cluster of next voxel along dimension. If voxel is the last
+            # one, then the next voxel is the first one
+            voxels_clusters_next = np.roll(voxels_clusters, -1, axis=i)
+            # Get voxel faces shared by different clusters
+            is_interface = voxels_clusters != voxels_clusters_next
+            # Store clusters of voxel faces
+            clusters.append(voxels_clusters[is_interface])
+            clusters_next.append(voxels_clusters_next[is_interface])
+        # Compute number of shared voxel faces between clusters
+        self._adjacency_matrix = self._get_adjacency_matrix(
+            np.concatenate(clusters), np.concatenate(clusters_next))
+        self._adjacency_matrix.resize((n_labels, n_labels))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute clusters number of voxels
+        self._clusters_n_voxels = np.bincount(voxels_clusters.ravel(),
+                                              minlength=n_labels)
+        # Initialize clusters bounding box
+        self._clusters_bbox = \
+            np.full((n_labels, 2, len(self._n_voxels_dims)), -1, dtype=int)
+        # Compute clusters bounding box
+        self._set_clusters_bbox(voxels_clusters,
+                                np.flatnonzero(self._clusters_n_voxels))
+    # -------------------------------------------------------------------------
+    def update(self, old_voxels_clusters, voxels_clusters, voxels_idxs=None):
+        """Update cluster adjacency graph after clustering update.
+
+        Parameters
+        ----------
+        old_voxels_clusters : numpy.ndarray (2d or 3d)
+            Regular grid of voxels (spatial discretization of the RVE), where
+            each entry contains the cluster label (int) assigned to the
+            corresponding voxel before the clustering update.
+        voxels_clusters : numpy.ndarray (2d or 3d)
+            Regular grid of voxels (spatial discretization of the RVE), where
+            each entry contains the cluster label (int) assigned to the
+            corresponding voxel after the clustering update.
+        voxels_idxs : numpy.ndarray (1d), default=None
+            Flat indexes (int) of the voxels whose cluster may have changed
+            during the clustering update. If None, then all the voxels are
+            considered.
+        """
+        # Get old and new voxels clusters (flattened regular grid)
+        old_labels = old_voxels_clusters.ravel()
+        labels = voxels_clusters.ravel()
+        # Get voxels whose cluster changed
+        if voxels_idxs is None:
+            voxels_idxs = np.flatnonzero(old_labels != labels)
+        else:
+            voxels_idxs = np.asarray(voxels_idxs, dtype=int)
+            voxels_idxs = voxels_idxs[old_labels[voxels_idxs]
+                                      != labels[voxels_idxs]]
+        # Skip update if clustering is unchanged
+        if len(voxels_idxs) == 0:
+            return
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get old and new clusters of changed voxels
+        old_clusters = old_labels[voxels_idxs]
+        new_clusters = labels[voxels_idxs]
+        # Resize cluster adjacency graph to accommodate new clusters labels
+        self._resize(max(int(np.max(new_clusters)) + 1,
+                         self._clusters_n_voxels.shape[0]))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get voxel faces associated with changed voxels
+        faces_idxs, faces_idxs_next = \
+            self._get_voxels_faces(voxels_idxs)
+        # Remove old shared voxel faces
+        is_interface = old_labels[faces_idxs] != old_labels[faces_idxs_next]
+        self._adjacency_matrix = self._adjacency_matrix \
+            - self._get_adjacency_matrix(
+                old_labels[faces_idxs[is_interface]],
+                old_labels[faces_idxs_next[is_interface]],
+                shape=self._adjacency_matrix.shape)
+        # Add new shared voxel faces
+        is_interface = labels[faces_idxs] != labels[faces_idxs_next]
+        self._adjacency_matrix = self._adjacency_matrix \
+            + self._get_adjacency_matrix(
+                labels[faces_idxs[is_interface]],
+                labels[faces_idxs_next[is_interface]],
+                shape=self._adjacency_matrix.shape)
+        # Remove pairs of clusters without shared voxel faces
+        self._adjacency_matrix.eliminate_zeros()
+        self._adjacency_matrix.sort_indices()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Update clusters number of voxels
+        np.subtract.at(self._clusters_n_voxels, old_clusters, 1)
+        np.add.at(self._clusters_n_voxels, new_clusters, 1)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get clusters that lost voxels
+        shrunk_clusters = np.unique(old_clusters)
+        # Reset bounding box of removed clusters
+        is_removed = self._clusters_n_voxels[shrunk_clusters] == 0
+        self._clusters_bbox[shrunk_clusters[is_removed]] = -1
+        # Update bounding box of clusters that gained voxels (bounding box
+        # can only be expanded)
+        self._set_clusters_bbox(voxels_clusters, np.setdiff1d(
+            np.unique(new_clusters), shrunk_clusters), voxels_idxs)
+        # Recompute bounding box of remaining clusters that lost voxels
+        # (search restricted to the previous bounding box and the voxels
+        # gained during the clustering update)
+        for cluster in shrunk_clusters[~is_removed]:
+            # Get cluster gained voxels spatial indexes
+            gained_idxs = np.array(np.unravel_index(
+                voxels_idxs[new_clusters == cluster], self._n_voxels_dims))
+            # Get search region
+            bbox = self._clusters_bbox[cluster].copy()
+            if gained_idxs.shape[1] > 0:
+                bbox[0] = np.minimum(bbox[0], np.min(gained_idxs, axis=1))
+                bbox[1] = np.maximum(bbox[1], np.max(gained_idxs, axis=1))
+            region = tuple(slice(bbox[0, i], bbox[1, i] + 1)
+                           for i in range(len(self._n_voxels_dims)))
+            # Get cluster voxels spatial indexes in search region
+            cluster_idxs = np.nonzero(voxels_clusters[region] == cluster)
+            # Update cluster bounding box
+            self._clusters_bbox[cluster, 0] = \
+                [bbox[0, i] + np.min(cluster_idxs[i])
+                 for i in range(len(self._n_voxels_dims))]
+            self._clusters_bbox[cluster, 1] = \
+                [bbox[0, i] + np.max(cluster_idxs[i])
+                 for i in range(len(self._n_voxels_dims))]
+    # -------------------------------------------------------------------------
+    def get_clusters(self):
+        """Get clusters labels.
+
+        Returns
+        -------
+        clusters : numpy.ndarray (1d)
+            Clusters labels (int) sorted in ascending order.
+        """
+        return np.flatnonzero(self._clusters_n_voxels)
+    # -------------------------------------------------------------------------
+    def get_adjacency_matrix(self):
+        """Get number of shared voxel faces between clusters (sparse matrix).
+
+        Returns
+        -------
+        adjacency_matrix : scipy.sparse.csr_matrix (2d)
+            Number of shared voxel faces between each pair of different
+            clusters (sparse symmetric matrix of shape (n_labels, n_labels)),
+            where rows and columns are indexed by the cluster labels.
+        """
+        return self._adjacency_matrix.copy()
+    # -------------------------------------------------------------------------
+    def get_neighbours(self, cluster):
+        """Get adjacent clusters and number of shared voxel faces.
+
+        Parameters
+        ----------
+        cluster : int
+            Cluster label.
+
+        Returns
+        -------
+        neighbours : numpy.ndarray (1d)
+            Labels (int) of the clusters adjacent to the cluster, sorted in
+            ascending order.
+        n_shared_faces : numpy.ndarray (1d)
+            Number of voxel faces (int) shared with each adjacent cluster.
+        """
+        # Check cluster
+        if cluster < 0 or cluster >= self._adjacency_matrix.shape[0]:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        # Get cluster row of sparse adjacency matrix
+        start = self._adjacency_matrix.indptr[cluster]
+        end = self._adjacency_matrix.indptr[cluster + 1]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return self._adjacency_matrix.indices[start:end].astype(int), \
+            self._adjacency_matrix.data[start:end].astype(int)
+    # -------------------------------------------------------------------------
+    def get_n_shared_faces(self, cluster_1, cluster_2):
+        """Get number of shared voxel faces between two clusters.
+
+        Parameters
+        ----------
+        cluster_1 : int
+            Cluster label.
+        cluster_2 : int
+            Cluster label.
+
+        Returns
+        -------
+        n_shared_faces : int
+            Number of voxel faces shared by both clusters.
+        """
+        # Get cluster adjacent clusters
+        neighbours, n_shared_faces = self.get_neighbours(cluster_1)
+        # Get position of second cluster
+        pos = np.searchsorted(neighbours, cluster_2)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        if pos < len(neighbours) and neighbours[pos] == cluster_2:
+            return int(n_shared_faces[pos])
+        else:
+            return 0
+    # -------------------------------------------------------------------------
+    def get_cluster_n_voxels(self, cluster):
+        """Get cluster number of voxels.
+
+        Parameters
+        ----------
+        cluster : int
+            Cluster label.
+
+        Returns
+        -------
+        n_voxels : int
+            Cluster number of voxels.
+        """
+        if cluster < 0 or cluster >= self._clusters_n_voxels.shape[0]:
+            return 0
+        else:
+            return int(self._clusters_n_voxels[cluster])
+    # -------------------------------------------------------------------------
+    def get_cluster_bounding_box(self, cluster):
+        """Get cluster bounding box.
+
+        Parameters
+        ----------
+        cluster : int
+            Cluster label.
+
+        Returns
+        -------
+        bbox : numpy.ndarray (2d)
+            Cluster bounding box (numpy.ndarray of shape (2, n_dim)) storing
+            the minimum (index 0) and maximum (index 1) voxel index along each
+            dimension.
+        """
+        if self.get_cluster_n_voxels(cluster) == 0:
+            raise RuntimeError('Unexistent cluster label.')
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return self._clusters_bbox[cluster].copy()
+    # -------------------------------------------------------------------------
+    def get_cluster_slices(self, cluster):
+        """Get regular grid slices of cluster bounding box.
+
+        Parameters
+        ----------
+        cluster : int
+            Cluster label.
+
+        Returns
+        -------
+        slices : tuple[slice]
+            Slice of the cluster bounding box along each dimension, such that
+            the cluster voxels are contained in regular_grid[slices].
+        """
+        # Get cluster bounding box
+        bbox = self.get_cluster_bounding_box(cluster)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return tuple(slice(bbox[0, i], bbox[1, i] + 1)
+                     for i in range(bbox.shape[1]))
+    # -------------------------------------------------------------------------
+    def _resize(self, n_labels):
+        """Resize cluster adjacency graph to given number of cluster labels.
+
+        Parameters
+        ----------
+        n_labels : int
+            Number of cluster labels.
+        """
+        # Get current number of cluster labels
+        n_labels_old = self._clusters_n_voxels.shape[0]
+        # Skip resize if number of cluster labels is unchanged
+        if n_labels == n_labels_old:
+            return
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Resize sparse adjacency matrix
+        self._adjacency_matrix.resize((n_labels, n_labels))
+        # Resize clusters number of voxels
+        self._clusters_n_voxels = np.concatenate(
+            (self._clusters_n_voxels,
+             np.zeros(n_labels - n_labels_old,
+                      dtype=self._clusters_n_voxels.dtype)))
+        # Resize clusters bounding box
+        self._clusters_bbox = np.concatenate(
+            (self._clusters_bbox,
+             np.full((n_labels - n_labels_old,)
+                     + self._clusters_bbox.shape[1:], -1, dtype=int)))
+    # -------------------------------------------------------------------------
+    def _get_voxels_faces(self, voxels_idxs):
+        """Get voxel faces associated with given voxels.
+
+        Each voxel face is defined by a voxel and the next voxel along a given
+        dimension. The voxel faces between two given voxels are only
+        considered once.
+
+        Parameters
+        ----------
+        voxels_idxs : numpy.ndarray (1d)
+            Flat indexes (int) of voxels.
+
+        Returns
+        -------
+        faces_idxs : numpy.ndarray (1d)
+            Flat index (int) of the voxel of each voxel face.
+        faces_idxs_next : numpy.ndarray (1d)
+            Flat index (int) of the next voxel of each voxel face.
+        """
+        # Get voxels spatial indexes
+        voxels_spatial_idxs = np.unravel_index(voxels_idxs,
+                                               self._n_voxels_dims)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize voxel faces
+        faces_idxs = []
+        faces_idxs_next = []
+        # Loop over dimensions
+        for i in range(len(self._n_voxels_dims)):
+            # Get next voxels along dimension (periodic)
+            spatial_idxs = list(voxels_spatial_idxs)
+            spatial_idxs[i] = (spatial_idxs[i] + 1) % self._n_voxels_dims[i]
+            next_idxs = np.ravel_multi_index(spatial_idxs,
+                                             self._n_voxels_dims)
+            # Get previous voxels along dimension (periodic)
+            spatial_idxs[i] = \
+                (voxels_spatial_idxs[i] - 1) % self._n_voxels_dims[i]
+            previous_idxs = np.ravel_multi_index(spatial_idxs,
+                                                 self._n_voxels_dims)
+            # Skip previous voxels that are also given voxels (voxel face is
+            # already considered as the given voxel next voxel face)
+            is_previous = ~np.isin(previous_idxs, voxels_idxs)
+            # Store voxel faces
+            faces_idxs += [voxels_idxs, previous_idxs[is_previous]]
+            faces_idxs_next += [next_idxs, voxels_idxs[is_previous]]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return np.concatenate(faces_idxs), np.concatenate(faces_idxs_next)
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _get_adjacency_matrix(clusters, clusters_next, shape=None):
+        """Get number of shared voxel faces between clusters.
+
+        Parameters
+        ----------
+        clusters : numpy.ndarray (1d)
+            Cluster label (int) of the voxel of each voxel face.
+        clusters_next : numpy.ndarray (1d)
+            Cluster label (int) of the next voxel of each voxel face.
+        shape : tuple[int], default=None
+            Sparse matrix shape. If None, then the shape is inferred from the
+            maximum cluster label.
+
+        Returns
+        -------
+        adjacency_matrix : scipy.sparse.csr_matrix (2d)
+            Number of shared voxel faces between each pair of clusters (sparse
+            symmetric matrix).
+        """
+        # Set symmetric pairs of clusters
+        rows = np.concatenate((clusters, clusters_next))
+        cols = np.concatenate((clusters_next, clusters))
+        # Set sparse matrix shape
+        if shape is None:
+            n_labels = int(np.max(rows)) + 1 if len(rows) > 0 else 0
+            shape = (n_labels, n_labels)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build sparse matrix (duplicated pairs of clusters are summed)
+        adjacency_matrix = scipy.sparse.csr_matrix(
+            (np.ones(len(rows), dtype=int), (rows, cols)), shape=shape)
+        adjacency_matrix.sum_duplicates()
+        adjacency_matrix.sort_indices()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return adjacency_matrix
+    # -------------------------------------------------------------------------
+    def _set_clusters_bbox(self, voxels_clusters, clusters, voxels_idxs=None):
+        """Set bounding box of given clusters.
+
+        If the voxels are provided, then the clusters bounding box is expanded
+        to include the clusters voxels among them. Otherwise, the clusters
+        bounding box is computed from the whole regular grid of voxels.
+
+        Parameters
+        ----------
+        voxels_clusters : numpy.ndarray (2d or 3d)
+            Regular grid of voxels (spatial discretization of the RVE), where
+            each entry contains the cluster label (int) assigned to the
+            corresponding voxel.
+        clusters : numpy.ndarray (1d)
+            Clusters labels (int).
+        voxels_idxs : numpy.ndarray (1d), default=None
+            Flat indexes (int) of voxels.
+        """
+        # Get voxels
+        if voxels_idxs is None:
+            voxels_idxs = np.arange(voxels_clusters.size)
+        # Get voxels clusters
+        labels = voxels_clusters.ravel()[voxels_idxs]
+        # Get voxels of given clusters
+        is_cluster = np.isin(labels, clusters)
+        voxels_idxs = voxels_idxs[is_cluster]
+        labels = labels[is_cluster]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get voxels spatial indexes
+        voxels_spatial_idxs = np.unravel_index(voxels_idxs,
+                                               self._n_voxels_dims)
+        # Loop over dimensions
+        for i in range(len(self._n_voxels_dims)):
+            # Initialize clusters minimum and maximum voxel index (unset
+            # bounding box)
+            min_idxs = self._clusters_bbox[:, 0, i]
+            max_idxs = self._clusters_bbox[:, 1, i]
+            min_idxs[clusters[min_idxs[clusters] < 0]] = \
+                self._n_voxels_dims[i]
+            # Update clusters minimum and maximum voxel index
+            np.minimum.at(min_idxs, labels, voxels_spatial_idxs[i])
+            np.maximum.at(max_idxs, labels, voxels_spatial_idxs[i])
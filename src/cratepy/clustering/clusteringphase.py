@@ -355,6 +355,12 @@ class SCRMP(CRMP):
     ----------
     _clustering_type : str
         Type of cluster-reduced material phase.
+    _quantization_tol : float
+        Quantization tolerance (relative to the range of each feature) to
+        collapse duplicated or near-duplicated dataset items (voxels) into
+        weighted unique dataset items before performing the cluster analyses.
+        If 0, then only duplicated dataset items are collapsed. If None, then
+        dataset items are not collapsed.
     max_label : int
         Clustering maximum label.
     cluster_labels : numpy.ndarray (1d)
@@ -363,7 +369,8 @@ class SCRMP(CRMP):
 
     Methods
     -------
-    perform_base_clustering(self, base_clustering_scheme, min_label=0)
+    perform_base_clustering(self, base_clustering_scheme, min_label=0, \
+                            hierarchy_cache=None)
         Perform SCRMP base clustering.
     get_n_clusters(self)
         Get current number of clusters.
@@ -372,7 +379,8 @@ class SCRMP(CRMP):
     get_valid_clust_algs()
         Get valid clustering algorithms to compute the CRMP.
     """
-    def __init__(self, mat_phase, cluster_data_matrix, n_clusters):
+    def __init__(self, mat_phase, cluster_data_matrix, n_clusters,
+                 quantization_tol=None):
         """Constructor.
 
         Parameters
@@ -385,15 +393,23 @@ class SCRMP(CRMP):
             features data to perform the material phase cluster analyses.
         n_clusters : int
             Number of material phase clusters.
+        quantization_tol : float, default=None
+            Quantization tolerance (relative to the range of each feature) to
+            collapse duplicated or near-duplicated dataset items (voxels) into
+            weighted unique dataset items before performing the cluster
+            analyses. If 0, then only duplicated dataset items are collapsed.
+            If None, then dataset items are not collapsed.
         """
         self._mat_phase = mat_phase
         self._cluster_data_matrix = cluster_data_matrix
         self._clustering_type = 'static'
         self._n_clusters = n_clusters
+        self._quantization_tol = quantization_tol
         self.max_label = 0
         self.cluster_labels = None
     # -------------------------------------------------------------------------
-    def perform_base_clustering(self, base_clustering_scheme, min_label=0):
+    def perform_base_clustering(self, base_clustering_scheme, min_label=0,
+                                hierarchy_cache=None):
         """Perform SCRMP base clustering.
 
         Parameters
@@ -406,6 +422,11 @@ class SCRMP(CRMP):
             list of the features data matrix' indexes (col 3, list[int]).
         min_label : int, default=0
             Minimum cluster label.
+        hierarchy_cache : ClusteringHierarchyCache, default=None
+            Persistent cache of hierarchical agglomerative clustering trees
+            (only hierarchical agglomerative clustering algorithms). If None,
+            then the hierarchical agglomerative clustering trees are not
+            cached.
         """
         # Get number of material phase voxels
         n_phase_voxels = self._cluster_data_matrix.shape[0]
@@ -429,9 +450,11 @@ class SCRMP(CRMP):
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             # Perform cluster analysis
             cluster_labels, _, is_n_clusters_satisfied = \
-                ClusterAnalysis().get_fitted_estimator(data_matrix,
-                                                       clust_alg_id,
-                                                       self._n_clusters)
+                ClusterAnalysis(
+                    quantization_tol=self._quantization_tol,
+                    hierarchy_cache=hierarchy_cache
+                ).get_fitted_estimator(data_matrix, clust_alg_id,
+                                       self._n_clusters)
             # Check if prescribed number of clusters is satisfied
             if not is_n_clusters_satisfied:
                 raise RuntimeError('The number of clusters ('
@@ -522,6 +545,12 @@ class GACRMP(ACRMP):
         cluster (key, str).
     _root_cluster_node : anytree.Node
         Clustering tree root node.
+    _quantization_tol : float
+        Quantization tolerance (relative to the range of each feature) to
+        collapse duplicated or near-duplicated dataset items (voxels) into
+        weighted unique dataset items before performing the cluster analyses.
+        If 0, then only duplicated dataset items are collapsed. If None, then
+        dataset items are not collapsed.
     max_label : int
         Clustering maximum label.
     cluster_labels : numpy.ndarray (1d)
@@ -534,7 +563,8 @@ class GACRMP(ACRMP):
 
     Methods
     -------
-    perform_base_clustering(self, base_clustering_scheme, min_label=0)
+    perform_base_clustering(self, base_clustering_scheme, min_label=0, \
+                            hierarchy_cache=None)
         Perform GACRMP base clustering.
     get_valid_clust_algs():
         Get valid clustering algorithms to compute the CRMP.
@@ -561,7 +591,7 @@ class GACRMP(ACRMP):
         Update clustering adaptivity parameters.
     """
     def __init__(self, mat_phase, cluster_data_matrix, n_clusters,
-                 adaptivity_type):
+                 adaptivity_type, quantization_tol=None):
         """Constructor.
 
         Parameters
@@ -576,12 +606,19 @@ class GACRMP(ACRMP):
             Number of material phase clusters.
         adaptivity_type : dict
             Clustering adaptivity parameters.
+        quantization_tol : float, default=None
+            Quantization tolerance (relative to the range of each feature) to
+            collapse duplicated or near-duplicated dataset items (voxels) into
+            weighted unique dataset items before performing the cluster
+            analyses. If 0, then only duplicated dataset items are collapsed.
+            If None, then dataset items are not collapsed.
         """
         self._mat_phase = mat_phase
         self._cluster_data_matrix = cluster_data_matrix
         self._clustering_type = 'adaptive'
         self._n_clusters = n_clusters
         self._adaptivity_type = adaptivity_type
+        self._quantization_tol = quantization_tol
         self._adaptive_step = 0
         self._clustering_tree_nodes = {}
         self.max_label = 0
@@ -601,7 +638,8 @@ class GACRMP(ACRMP):
         self._clustering_tree_nodes[str(root_cluster)] = \
             self._root_cluster_node
     # -------------------------------------------------------------------------
-    def perform_base_clustering(self, base_clustering_scheme, min_label=0):
+    def perform_base_clustering(self, base_clustering_scheme, min_label=0,
+                                hierarchy_cache=None):
         """Perform GACRMP base clustering.
 
         Parameters
@@ -614,6 +652,11 @@ class GACRMP(ACRMP):
             list of the features data matrix' indexes (col 3, list[int]).
         min_label : int, default=0
             Minimum cluster label.
+        hierarchy_cache : ClusteringHierarchyCache, default=None
+            Persistent cache of hierarchical agglomerative clustering trees
+            (only hierarchical agglomerative clustering algorithms). If None,
+            then the hierarchical agglomerative clustering trees are not
+            cached.
         """
         # Get number of material phase voxels
         n_phase_voxels = self._cluster_data_matrix.shape[0]
@@ -637,9 +680,11 @@ class GACRMP(ACRMP):
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             # Perform cluster analysis
             cluster_labels, _, is_n_clusters_satisfied = \
-                ClusterAnalysis().get_fitted_estimator(data_matrix,
-                                                       clust_alg_id,
-                                                       self._n_clusters)
+                ClusterAnalysis(
+                    quantization_tol=self._quantization_tol,
+                    hierarchy_cache=hierarchy_cache
+                ).get_fitted_estimator(data_matrix, clust_alg_id,
+                                       self._n_clusters)
             # Check if prescribed number of clusters is satisfied
             if not is_n_clusters_satisfied:
                 raise RuntimeError('The number of clusters ('
@@ -829,9 +874,10 @@ class GACRMP(ACRMP):
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                 # Perform cluster analysis
                 cluster_labels, _, is_n_clusters_satisfied = \
-                    ClusterAnalysis().get_fitted_estimator(data_matrix,
-                                                           clust_alg_id,
-                                                           n_new_clusters)
+                    ClusterAnalysis(
+                        quantization_tol=self._quantization_tol
+                    ).get_fitted_estimator(data_matrix, clust_alg_id,
+                                           n_new_clusters)
                 # Check if prescribed number of clusters is satisfied
                 if not is_n_clusters_satisfied:
                     # If the prescribed number of clusters is not satisfied,
@@ -1032,7 +1078,13 @@ class HAACRMP(ACRMP):
         Type of cluster-reduced material phase.
     _linkage_matrix : numpy.ndarray (2d)
         Linkage matrix associated with the hierarchical agglomerative
-        clustering (numpy.ndarray of shape (n_phase_voxels - 1, 4)).
+        clustering (numpy.ndarray of shape (n_leaves - 1, 4)).
+    _items_leaves : numpy.ndarray (1d)
+        Hierarchical tree leaf index (int) associated with each material
+        phase voxel (numpy.ndarray[int] of shape (n_phase_voxels,)). The
+        number of hierarchical tree leaves (n_leaves) is lower than the number
+        of material phase voxels if the hierarchical agglomerative clustering
+        is performed over a sub-sample of the material phase voxels.
     _cluster_node_map : dict
         Tree node id (item, int) associated with each cluster label (key, str).
     _adaptive_step : int
@@ -1063,7 +1115,8 @@ class HAACRMP(ACRMP):
 
     Methods
     -------
-    perform_base_clustering(self, base_clustering_scheme, min_label=0)
+    perform_base_clustering(self, base_clustering_scheme, min_label=0, \
+                            hierarchy_cache=None)
         Perform HAACRMP base clustering.
     perform_adaptive_clustering(self, target_clusters, target_clusters_data, \
                                 adaptive_clustering_scheme=None, \
@@ -1111,6 +1164,7 @@ class HAACRMP(ACRMP):
         self._n_clusters = n_clusters
         self._adaptivity_type = adaptivity_type
         self._linkage_matrix = None
+        self._items_leaves = None
         self._cluster_node_map = None
         self._adaptive_step = 0
         self.max_label = 0
@@ -1125,7 +1179,8 @@ class HAACRMP(ACRMP):
         else:
             self._is_dynamic_split_factor = True
     # -------------------------------------------------------------------------
-    def perform_base_clustering(self, base_clustering_scheme, min_label=0):
+    def perform_base_clustering(self, base_clustering_scheme, min_label=0,
+                                hierarchy_cache=None):
         """Perform HAACRMP base clustering.
 
         Parameters
@@ -1138,6 +1193,10 @@ class HAACRMP(ACRMP):
             list of the features data matrix' indexes (col 3, list[int]).
         min_label : int, default=0
             Minimum cluster label.
+        hierarchy_cache : ClusteringHierarchyCache, default=None
+            Persistent cache of hierarchical agglomerative clustering trees.
+            If None, then the hierarchical agglomerative clustering tree is not
+            cached.
         """
         # Get number of prescribed clusterings
         n_clusterings = base_clustering_scheme.shape[0]
@@ -1160,7 +1219,8 @@ class HAACRMP(ACRMP):
                                                indexes)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Perform cluster analysis
-        cluster_analysis = clstalgs.ClusterAnalysis()
+        cluster_analysis = \
+            clstalgs.ClusterAnalysis(hierarchy_cache=hierarchy_cache)
         cluster_labels, clust_alg, is_n_clusters_satisfied = \
             cluster_analysis.get_fitted_estimator(data_matrix, clust_alg_id,
                                                   self._n_clusters)
@@ -1176,6 +1236,12 @@ class HAACRMP(ACRMP):
         self.cluster_labels = cluster_labels
         # Get hierarchical agglomerative base clustering linkage matrix
         self._linkage_matrix = clust_alg.get_linkage_matrix()
+        # Get hierarchical tree leaf associated with each material phase voxel
+        items_leaves = clust_alg.get_items_leaves()
+        if items_leaves is None:
+            self._items_leaves = np.arange(n_phase_voxels)
+        else:
+            self._items_leaves = np.asarray(items_leaves, dtype=int)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Update cluster labels
         self.cluster_labels, self.max_label = \
@@ -1245,9 +1311,11 @@ class HAACRMP(ACRMP):
         # Initialize new cluster label
         new_cluster_label = min_label
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Get cluster labels (conversion to int32 is required to avoid raising
-        # a TypeError in scipy hierarchy leaders function)
-        labels = cluster_labels.astype('int32')
+        # Get hierarchical tree leaves cluster labels (conversion to int32 is
+        # required to avoid raising a TypeError in scipy hierarchy leaders
+        # function)
+        labels = np.zeros(self._linkage_matrix.shape[0] + 1, dtype='int32')
+        labels[self._items_leaves] = cluster_labels
         # Convert hierarchical agglomerative base clustering linkage matrix
         # into tree object
         rootnode, nodelist = sciclst.to_tree(self._linkage_matrix, rd=True)
@@ -1353,7 +1421,7 @@ class HAACRMP(ACRMP):
                 [x.id for x in child_nodes]
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Update RVE hierarchical agglomerative clustering
-        self.cluster_labels = labels
+        self.cluster_labels = labels[self._items_leaves]
         # Update number of material phase clusters
         self._n_clusters = len(set(self.cluster_labels))
         # Update clustering maximum label
@@ -1447,7 +1515,7 @@ class HAACRMP(ACRMP):
         clust_algs : list[str]
             Clustering algorithms identifiers (str).
         """
-        return ['3', ]
+        return ['3', '4']
     # -------------------------------------------------------------------------
     def get_n_clusters(self):
         """Get current number of clusters.
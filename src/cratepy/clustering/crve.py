@@ -27,6 +27,7 @@ CRVE
 #                                                                       Modules
 # =============================================================================
 # Standard
+import os
 import time
 import copy
 import itertools as it
@@ -37,7 +38,11 @@ import numpy as np
 import ioput.info as info
 import tensor.matrixoperations as mop
 import clustering.citoperations as citop
+from clustering.citparallel import CITProcessPool
+from clustering.clusteringcache import ClusteringHierarchyCache
+from clustering.clusteringgraph import ClusterAdjacencyGraph
 from clustering.clusteringphase import SCRMP, GACRMP, HAACRMP
+from clustering.greenoperator import CompactGreenOperator
 #
 #                                                          Authorship & Credits
 # =============================================================================
@@ -67,17 +72,48 @@ class CRVE:
     _phase_voxel_flatidx : dict
         Flat (1D) voxels' indexes (item, list[int]) associated with each
         material phase (key, str).
-    _gop_X_dft_vox : list[dict]
-        Green operator material independent terms. Each term is stored in a
-        dictionary, where each pair of strain/stress components (key, str) is
-        associated with the Green operator material independent term evaluated
-        in all spatial discrete points (item, numpy.ndarray (2d or 3d)).
+    _gop_terms : CompactGreenOperator
+        Compact Green operator material independent terms (half spectrum).
+    _gop_term_matrix : numpy.ndarray (2d)
+        Linear combination coefficients of the Green operator unique terms
+        associated with each Green operator material independent term (first,
+        second and zero-frequency terms) matricial form component, stored in a
+        numpy.ndarray of shape (n_unique_terms, 3*n_comps*n_comps). Each
+        coefficient is prescaled by the associated Kelvin notation
+        coefficients and by the voxel volume.
+    _gop_storage : {'stored', 'out_of_core', 'on_the_fly'}
+        Green operator unique terms storage: stored in memory ('stored'),
+        stored in a memory-mapped temporary file ('out_of_core') or computed
+        on the fly ('on_the_fly').
+    _gop_precision : {'double', 'single'}
+        Green operator unique terms and discrete convolutions floating-point
+        precision.
+    _cit_memory_budget : {float, None}
+        Memory budget (MB) of the cluster interaction tensors computation. If
+        None, then the computation is not memory bounded.
+    _cit_workers : int
+        Number of worker processes computing the cluster interaction tensors
+        associated with different clusters in parallel. If -1, then all the
+        available CPUs are used.
+    _fft_workers : int
+        Maximum number of workers used to perform the batched discrete Fourier
+        transforms (see scipy.fft).
     _cluster_phases : dict
         Cluster-Reduced material phase instance (item, CRMP) associated with
         each material phase (key, str).
     _base_phase_n_clusters : dict
         Number of clusters (item, int) prescribed (base clustering) for each
         material phase (key, str).
+    _clustering_quantization_tol : {float, None}
+        Quantization tolerance (relative to the range of each feature) to
+        collapse duplicated or near-duplicated voxels into weighted unique
+        dataset items before performing the material phases cluster analyses.
+        If 0, then only duplicated voxels are collapsed. If None, then voxels
+        are not collapsed.
+    _clustering_cache_dir : {str, None}
+        Persistent cache directory path of the material phases hierarchical
+        agglomerative clustering trees. If None, then the hierarchical
+        agglomerative clustering trees are not cached.
     _adaptive_step : int
         Counter of adaptive clustering steps, with 0 associated with the base
         clustering.
@@ -85,18 +121,31 @@ class CRVE:
         Regular grid of voxels (spatial discretization of the RVE), where each
         entry contains the cluster label (int) assigned to the corresponding
         voxel.
+    _cluster_graph : ClusterAdjacencyGraph
+        Cluster adjacency graph (shared voxel faces between clusters and
+        clusters number of voxels and bounding box).
     _phase_clusters : dict
         Clusters labels (item, list[int]) associated with each material phase
         (key, str).
     _clusters_vf : dict
         Volume fraction (item, float) associated with each material cluster
         (key, str).
-    _cit_x_mf : list[dict]
-        Cluster interaction tensors associated with the Green operator material
-        independent terms. Each term is stored in a dictionary (item, dict) for
-        each pair of material phases (key, str), which in turn contains the
-        corresponding matricial form (item, numpy.ndarray (2d)) associated with
-        each pair of clusters (key, str).
+    _cit_x_mf : numpy.ndarray (3d)
+        Global cluster interaction matrices associated with the Green operator
+        material independent terms (first, second and zero-frequency terms),
+        stored in a numpy.ndarray of shape
+        (3, n_total_clusters*n_comps, n_total_clusters*n_comps). Assembly
+        positions are assigned according to the order of material_phases (1st)
+        and phase_clusters (2nd).
+    _cit_offsets : dict
+        Row/column offset (item, int) of each cluster (key, str) in the global
+        cluster interaction matrices.
+    _global_cit_mf : numpy.ndarray (2d)
+        Last assembled global cluster interaction matrix (read-only).
+    _global_cit_ref_props : tuple
+        Reference material elastic properties (Young modulus and Poisson
+        ratio) associated with the last assembled global cluster interaction
+        matrix.
     _adapt_material_phases : list[str]
         RVE adaptive material phases labels (str).
     _adaptive_clustering_time : float
@@ -125,6 +174,8 @@ class CRVE:
         Get clusters associated with each material phase.
     get_voxels_clusters(self)
         Get regular grid containing the cluster label of each voxel.
+    get_cluster_graph(self)
+        Get cluster adjacency graph.
     get_n_total_clusters(self)
         Get current total number of clusters.
     get_cluster_phases(self)
@@ -133,6 +184,8 @@ class CRVE:
         Get clusters volume fraction.
     get_cit_x_mf(self)
         Get cluster interaction tensors (Green material independent terms).
+    get_global_cit_mf(self, mat_prop_ref)
+        Get global cluster interaction matrix.
     get_eff_isotropic_elastic_constants(self)
         Get isotropic elastic constants from elastic tangent modulus.
     get_adapt_material_phases(self)
@@ -179,16 +232,23 @@ class CRVE:
         Reassign and sort CRVE cluster labels material phasewise.
     compute_cit(self, mode='full', adaptive_clustering_map=None)
         Compute CRVE cluster interaction tensors.
-    _cluster_filter(self, cluster)
-        Compute cluster discrete characteristic function.
-    _gop_convolution(self, cluster_filter_dft, gop_1_dft_vox, \
-                     gop_2_dft_vox, gop_0_freq_dft_vox)
-        Convolution of cluster characteristic function and Green operator.
-    _discrete_cit_integral(self, cluster_filter, gop_1_filt_vox, \
-                           gop_2_filt_vox, gop_0_freq_filt_vox)
-        Discrete integral over the spatial domain of material cluster.
-    _switch_pair(x, delimiter='_')
-        Switch left and right sides of string with separating delimiter.
+    _compute_adaptive_cit_linearity(self, adaptive_clustering_map, \
+                                    old_cit_x_mf, old_cit_offsets, \
+                                    old_clusters, n_comps)
+        Compute adaptive cluster interaction tensors through linearity.
+    _set_gop_terms(self)
+        Set compact Green operator material independent terms.
+    _get_cit_n_workers(self, n_clusters_J)
+        Get number of cluster interaction tensors worker processes.
+    _get_cit_chunk_size(self, n_segments, n_workers=1)
+        Get cluster interaction tensors computation chunk size.
+    _assemble_cit_columns(self, clusters_J, cit_X_integrals_mf, \
+                          clusters_segments, factors)
+        Assemble cluster interaction tensors (clusters J columns).
+    _clusters_segments(self)
+        Get voxels segmentation according with associated cluster.
+    _get_cit_idxs(clusters, cit_offsets, n_comps)
+        Get clusters rows/columns in global cluster interaction matrices.
     save_crve_file(crve, crve_file_path)
         Dump CRVE into file.
     """
@@ -198,7 +258,10 @@ class CRVE:
                  clustering_type, phase_n_clusters, base_clustering_scheme,
                  eff_elastic_properties=None, adaptive_clustering_scheme=None,
                  adapt_criterion_data=None, adaptivity_type=None,
-                 adaptivity_control_feature=None):
+                 adaptivity_control_feature=None, fft_workers=1,
+                 gop_storage='stored', gop_precision='double',
+                 cit_memory_budget=None, cit_workers=1,
+                 clustering_quantization_tol=None, clustering_cache_dir=None):
         """Constructor.
 
         Parameters
@@ -252,6 +315,49 @@ class CRVE:
         adaptivity_control_feature : dict, default=None
             Clustering adaptivity control feature (item, str) associated with
             each material phase (key, str).
+        fft_workers : int, default=1
+            Maximum number of workers used to perform the batched discrete
+            Fourier transforms required to compute the cluster interaction
+            tensors (see scipy.fft). If negative, the value wraps around from
+            the number of available CPUs.
+        gop_storage : {'stored', 'out_of_core', 'on_the_fly'}, \
+                      default='stored'
+            Green operator unique terms storage: stored in memory ('stored'),
+            stored in a memory-mapped temporary file ('out_of_core') or
+            computed on the fly ('on_the_fly') whenever required to compute
+            the cluster interaction tensors.
+        gop_precision : {'double', 'single'}, default='double'
+            Green operator unique terms and discrete convolutions
+            floating-point precision. The single precision halves the memory
+            required to compute the cluster interaction tensors.
+        cit_memory_budget : float, default=None
+            Memory budget (MB) of the cluster interaction tensors computation.
+            The discrete convolutions with the Green operator unique terms are
+            processed in chunks whose size is bounded by the memory budget. If
+            None, then the computation is not memory bounded.
+        cit_workers : int, default=1
+            Number of worker processes computing the cluster interaction
+            tensors associated with different clusters in parallel (both in
+            `full` and `adaptive` computation modes). If -1, then all the
+            available CPUs are used.
+        clustering_quantization_tol : float, default=None
+            Quantization tolerance (relative to the range of each feature) to
+            collapse duplicated or near-duplicated voxels into weighted unique
+            dataset items before performing the material phases cluster
+            analyses (only full batch K-Means based clustering algorithms).
+            The cluster labels of the unique dataset items are then expanded
+            to the collapsed voxels. If 0, then only duplicated voxels are
+            collapsed. If None, then voxels are not collapsed.
+        clustering_cache_dir : str, default=None
+            Persistent cache directory path of the material phases
+            hierarchical agglomerative clustering trees (only hierarchical
+            agglomerative clustering algorithms). Each hierarchical tree is
+            stored once for a given material phase clustering data matrix and
+            clustering algorithm, such that the base clustering with any
+            number of clusters is obtained from an horizontal cut of the
+            cached tree (e.g., convergence studies on the number of clusters).
+            If None, then the hierarchical agglomerative clustering trees are
+            not cached.
         """
         self._rve_dims = copy.deepcopy(rve_dims)
         self._regular_grid = copy.deepcopy(regular_grid)
@@ -266,13 +372,25 @@ class CRVE:
         self._adaptive_clustering_scheme = \
             copy.deepcopy(adaptive_clustering_scheme)
         self._adaptivity_type = copy.deepcopy(adaptivity_type)
-        self._gop_X_dft_vox = None
+        self._gop_terms = None
+        self._gop_term_matrix = None
+        self._gop_storage = gop_storage
+        self._gop_precision = gop_precision
+        self._cit_memory_budget = cit_memory_budget
+        self._cit_workers = cit_workers
+        self._clustering_quantization_tol = clustering_quantization_tol
+        self._clustering_cache_dir = clustering_cache_dir
+        self._fft_workers = fft_workers
         self._cluster_phases = None
         self._adaptive_step = 0
         self._voxels_clusters = None
+        self._cluster_graph = None
         self._phase_clusters = None
         self._clusters_vf = None
         self._cit_x_mf = None
+        self._cit_offsets = None
+        self._global_cit_mf = None
+        self._global_cit_ref_props = None
         self._adaptivity_control_feature = \
             copy.deepcopy(adaptivity_control_feature)
         self._adapt_criterion_data = copy.deepcopy(adapt_criterion_data)
@@ -308,6 +426,12 @@ class CRVE:
         self._cluster_phases = {}
         # Initialize minimum cluster label
         min_label = 0
+        # Set hierarchical agglomerative clustering trees persistent cache
+        if self._clustering_cache_dir is not None:
+            hierarchy_cache = \
+                ClusteringHierarchyCache(self._clustering_cache_dir)
+        else:
+            hierarchy_cache = None
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Loop over material phases
         for mat_phase in self._material_phases:
@@ -331,7 +455,9 @@ class CRVE:
             # Instatiate cluster-reduced material phase
             if ctype == 'static':
                 # Instantiate static cluster-reduced material phase
-                crmp = SCRMP(mat_phase, cluster_data_matrix, n_phase_clusters)
+                crmp = SCRMP(
+                    mat_phase, cluster_data_matrix, n_phase_clusters,
+                    quantization_tol=self._clustering_quantization_tol)
             elif ctype == 'adaptive':
                 # Get material phase adaptivity type
                 atype = self._adaptivity_type[mat_phase]['adapt_type']
@@ -339,9 +465,10 @@ class CRVE:
                 if atype == GACRMP:
                     # Instantiate generalized adaptive cluster-reduced material
                     # phase
-                    crmp = GACRMP(mat_phase, cluster_data_matrix,
-                                  n_phase_clusters,
-                                  self._adaptivity_type[mat_phase])
+                    crmp = GACRMP(
+                        mat_phase, cluster_data_matrix, n_phase_clusters,
+                        self._adaptivity_type[mat_phase],
+                        quantization_tol=self._clustering_quantization_tol)
                 elif atype == HAACRMP:
                     # Instantiate hierarchical-agglomerative adaptive
                     # cluster-reduced material phase
@@ -358,7 +485,8 @@ class CRVE:
             # Get material phase base clustering scheme
             clustering_scheme = self._base_clustering_scheme[mat_phase]
             # Perform material phase base clustering
-            crmp.perform_base_clustering(clustering_scheme, min_label)
+            crmp.perform_base_clustering(clustering_scheme, min_label,
+                                         hierarchy_cache=hierarchy_cache)
             # Update minimum cluster label
             min_label = crmp.max_label + 1
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -375,6 +503,8 @@ class CRVE:
         # Compute base CRVE descriptors
         info.displayinfo('5', 'Computing CRVE base clustering descriptors...',
                          2)
+        # Build cluster adjacency graph
+        self._cluster_graph = ClusterAdjacencyGraph(self._voxels_clusters)
         # Store cluster labels belonging to each material phase
         self._set_phase_clusters()
         # Compute material clusters' volume fraction
@@ -437,6 +567,8 @@ class CRVE:
         # Initialize adaptive clustering map
         adaptive_clustering_map = \
             {mat_phase: {} for mat_phase in self._adapt_material_phases}
+        # Initialize voxels of adapted material phases
+        adapted_voxels_idxs = []
         # Loop over adaptive material phases
         for mat_phase in self._adapt_material_phases:
             # If there are no target clusters, skip to next adaptive material
@@ -458,10 +590,20 @@ class CRVE:
             min_label = self._get_clusters_max_label() + 1
             # Update CRVE clustering
             labels[self._phase_voxel_flatidx[mat_phase]] = crmp.cluster_labels
+            # Store voxels of adapted material phase
+            adapted_voxels_idxs.append(self._phase_voxel_flatidx[mat_phase])
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get CRVE clustering before adaptivity
+        old_voxels_clusters = self._voxels_clusters
         # Build adaptive CRVE
         self._voxels_clusters = np.reshape(np.array(labels, dtype=int),
                                            self._n_voxels_dims)
+        # Update cluster adjacency graph (only voxels of adapted material
+        # phases)
+        if adapted_voxels_idxs:
+            self._cluster_graph.update(
+                old_voxels_clusters, self._voxels_clusters,
+                voxels_idxs=np.concatenate(adapted_voxels_idxs))
         # Store cluster labels and update number of clusters belonging to each
         # material phase
         self._set_phase_clusters()
@@ -554,6 +696,23 @@ class CRVE:
         """
         return copy.deepcopy(self._voxels_clusters)
     # -------------------------------------------------------------------------
+    def get_cluster_graph(self):
+        """Get cluster adjacency graph.
+
+        The cluster adjacency graph is shared with the CRVE (not copied) and
+        is kept updated with the clustering. It must only be queried and never
+        updated outside the CRVE (read-only).
+
+        ----
+
+        Returns
+        -------
+        cluster_graph : ClusterAdjacencyGraph
+            Cluster adjacency graph (shared voxel faces between clusters and
+            clusters number of voxels and bounding box).
+        """
+        return self._cluster_graph
+    # -------------------------------------------------------------------------
     def get_n_total_clusters(self):
         """Get current total number of clusters.
 
@@ -598,16 +757,55 @@ class CRVE:
 
         Returns
         -------
-        cit_x_mf : list[dict]
-            Cluster interaction tensors associated with the Green operator
-            material independent terms. Each term is stored in a dictionary
-            (item, dict) for each pair of material phases (key, str), which in
-            turn contains the corresponding matricial form (item,
-            numpy.ndarray (2d)) associated with each pair of clusters
-            (key, str).
+        cit_x_mf : numpy.ndarray (3d)
+            Global cluster interaction matrices associated with the Green
+            operator material independent terms (first, second and
+            zero-frequency terms), stored in a numpy.ndarray of shape
+            (3, n_total_clusters*n_comps, n_total_clusters*n_comps). Assembly
+            positions are assigned according to the order of material_phases
+            (1st) and phase_clusters (2nd).
         """
         return self._cit_x_mf
     # -------------------------------------------------------------------------
+    def get_global_cit_mf(self, mat_prop_ref):
+        """Get global cluster interaction matrix.
+
+        The global cluster interaction matrix is assembled from the global
+        cluster interaction matrices associated with the Green operator
+        material independent terms by taking into account the reference
+        material elastic properties (see
+        :py:func:`clustering.citoperations.assemble_cit`). The last assembled
+        matrix is cached and reused as long as the reference material elastic
+        properties remain unchanged, being discarded whenever the cluster
+        interaction tensors are computed.
+
+        ----
+
+        Parameters
+        ----------
+        mat_prop_ref : dict
+            Reference material properties.
+
+        Returns
+        -------
+        global_cit_mf : numpy.ndarray (2d)
+            Global cluster interaction matrix (read-only). Assembly positions
+            are assigned according to the order of material_phases (1st) and
+            phase_clusters (2nd).
+        """
+        # Get reference material elastic properties
+        ref_props = (mat_prop_ref['E'], mat_prop_ref['v'])
+        # Assemble global cluster interaction matrix if not available for the
+        # reference material elastic properties
+        if self._global_cit_mf is None \
+                or ref_props != self._global_cit_ref_props:
+            self._global_cit_mf = citop.assemble_cit(
+                self._strain_formulation, mat_prop_ref, self._cit_x_mf)
+            self._global_cit_mf.flags.writeable = False
+            self._global_cit_ref_props = ref_props
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return self._global_cit_mf
+    # -------------------------------------------------------------------------
     def get_eff_isotropic_elastic_constants(self):
         """Get isotropic elastic constants from elastic tangent modulus.
 
@@ -952,8 +1150,9 @@ class CRVE:
         rve_vol = np.prod(self._rve_dims)
         # Compute volume fraction associated with each material cluster
         self._clusters_vf = {}
-        for cluster in np.unique(self._voxels_clusters):
-            n_voxels_cluster = np.sum(self._voxels_clusters == cluster)
+        for cluster in self._cluster_graph.get_clusters():
+            n_voxels_cluster = \
+                self._cluster_graph.get_cluster_n_voxels(cluster)
             self._clusters_vf[str(cluster)] = \
                 (n_voxels_cluster*voxel_vol)/rve_vol
     # -------------------------------------------------------------------------
@@ -1022,6 +1221,8 @@ class CRVE:
                                     for i in range(len(self._n_voxels_dims))]):
             self._voxels_clusters[voxel_idx] = \
                 sort_dict[self._voxels_clusters[voxel_idx]]
+        # Build cluster adjacency graph
+        self._cluster_graph = ClusterAdjacencyGraph(self._voxels_clusters)
     # -------------------------------------------------------------------------
     def compute_cit(self, mode='full', adaptive_clustering_map=None):
         """Compute CRVE cluster interaction tensors.
@@ -1101,486 +1302,573 @@ class CRVE:
             raise RuntimeError('Adaptive clustering map must be provided in '
                                '`adaptive` mode.')
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set strain/stress components order according to problem strain
+        # formulation
+        if self._strain_formulation == 'infinitesimal':
+            comp_order = self._comp_order_sym
+        elif self._strain_formulation == 'finite':
+            comp_order = self._comp_order_nsym
+        else:
+            raise RuntimeError('Unknown problem strain formulation.')
+        n_comps = len(comp_order)
+        # Get CRVE clusters sorted according to the global cluster interaction
+        # matrices assembly order (material phases (1st) and phase clusters
+        # (2nd))
+        clusters = [cluster for mat_phase in self._material_phases
+                    for cluster in self._phase_clusters[mat_phase]]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Discard cached global cluster interaction matrix
+        self._global_cit_mf = None
+        self._global_cit_ref_props = None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Perform mode-specific initialization procedures
         if mode == 'full':
             info.displayinfo('5',
                              'Computing CRVE cluster interaction tensors...')
-            # Initialize cluster interaction tensors dictionary
-            self._cit_x_mf = [{} for i in range(3)]
-            for mat_phase_B in self._material_phases:
-                for mat_phase_A in self._material_phases:
-                    for i in range(len(self._cit_x_mf)):
-                        self._cit_x_mf[i][mat_phase_A + '_' + mat_phase_B] = {}
-            # Compute Green operator material independent terms
-            self._gop_X_dft_vox = citop.gop_material_independent_terms(
-                self._strain_formulation, self._problem_type, self._rve_dims,
-                self._n_voxels_dims)
+            # Compute Green operator material independent terms (half
+            # spectrum)
+            self._set_gop_terms()
+            # Set clusters whose cluster interaction tensors are computed
+            clusters_J = clusters
         elif mode == 'adaptive':
             init_time = time.time()
-            # Build lists with old (preexistent) clusters and new (adapted)
-            # clusters for each material phase. Also get list of clusters that
-            # no longer exist due to clustering adaptivity
-            phase_old_clusters = {}
-            phase_new_clusters = {}
-            pop_clusters = []
-            for mat_phase in self._material_phases:
-                if mat_phase in adaptive_clustering_map.keys():
-                    phase_new_clusters[mat_phase] = \
-                        sum(adaptive_clustering_map[mat_phase].values(), [])
-                    pop_clusters += list(
-                        adaptive_clustering_map[mat_phase].keys())
-                else:
-                    phase_new_clusters[mat_phase] = []
-                phase_old_clusters[mat_phase] = list(
-                    set(self._phase_clusters[mat_phase])
-                    - set(phase_new_clusters[mat_phase]))
+            # Get new (adapted) clusters
+            new_clusters = []
+            for mat_phase in adaptive_clustering_map.keys():
+                new_clusters += \
+                    sum(adaptive_clustering_map[mat_phase].values(), [])
+            # Get last new cluster resulting from the refinement of each
+            # target cluster (cluster interaction tensors computed by
+            # linearity)
+            last_clusters = [children[-1]
+                             for mat_phase in adaptive_clustering_map.keys()
+                             for children in
+                             adaptive_clustering_map[mat_phase].values()]
+            # Set clusters whose cluster interaction tensors are computed
+            # through discrete convolutions
+            clusters_J = [cluster for cluster in clusters
+                          if cluster in new_clusters
+                          and cluster not in last_clusters]
+            # Get new (adapted) clusters sorted according to the global
+            # cluster interaction matrices assembly order
+            adapted_clusters = [cluster for cluster in clusters
+                                if cluster in new_clusters]
+            # Get old (preexistent) clusters
+            old_clusters = [cluster for cluster in clusters
+                            if cluster not in new_clusters]
+            # Get old clusters rows/columns in the preexistent global cluster
+            # interaction matrices
+            old_idxs = self._get_cit_idxs(old_clusters, self._cit_offsets,
+                                          n_comps)
+            # Store preexistent global cluster interaction matrices and
+            # clusters rows/columns offsets
+            old_cit_x_mf = self._cit_x_mf
+            old_cit_offsets = self._cit_offsets
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Loop over material phases
-        for mat_phase_B in self._material_phases:
-            # Set material phase B clusters to be looped over
+        # Set clusters rows/columns offsets in the global cluster interaction
+        # matrices
+        self._cit_offsets = {str(cluster): i*n_comps
+                             for i, cluster in enumerate(clusters)}
+        # Initialize global cluster interaction matrices
+        n_rows = n_comps*len(clusters)
+        self._cit_x_mf = np.zeros((3, n_rows, n_rows))
+        # Copy preexistent cluster interaction tensors (old clusters)
+        if mode == 'adaptive':
+            idxs = self._get_cit_idxs(old_clusters, self._cit_offsets,
+                                      n_comps)
+            self._cit_x_mf[:, idxs[:, np.newaxis], idxs] = \
+                old_cit_x_mf[:, old_idxs[:, np.newaxis], old_idxs]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get voxels segmentation according with associated cluster
+        clusters_labels, voxels_segments = self._clusters_segments()
+        # Get segment index of each cluster and of each cluster J
+        clusters_segments = np.searchsorted(clusters_labels, clusters)
+        segments_J = np.searchsorted(clusters_labels, clusters_J)
+        # Compute clusters discrete integral normalization factors
+        rve_vol = np.prod(self._rve_dims)
+        factors = np.array([1.0/(self._clusters_vf[str(cluster)]*rve_vol)
+                            for cluster in clusters])
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get number of worker processes
+        n_workers = self._get_cit_n_workers(len(clusters_J))
+        # Set number of clusters whose characteristic functions are
+        # transformed in each batch and number of Green operator unique terms
+        # convolved in each chunk (bounded by the memory budget)
+        n_batch, peak_memory = self._get_cit_chunk_size(
+            len(clusters_labels), n_workers=n_workers)
+        # Display chunk size and estimated peak memory
+        if mode == 'full' and self._cit_memory_budget is not None:
+            info.displayinfo('5', 'Cluster interaction tensors chunk size: '
+                             + str(n_batch) + ' (estimated peak memory: '
+                             + '{:.1f}'.format(peak_memory/1024**2)
+                             + ' MB)', 2)
+        # Set groups of clusters J (clusters J columns processed at once),
+        # balancing the work between the worker processes (no groups if there
+        # are no clusters J, e.g., each target cluster has a single new
+        # cluster computed through linearity)
+        n_group = max(1, min(n_batch, -(-len(clusters_J)//n_workers)))
+        groups_J = [slice(i, i + n_group)
+                    for i in range(0, len(clusters_J), n_group)]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute cluster interaction tensors (clusters J columns)
+        if n_workers == 1:
+            # Loop over groups of clusters J
+            for group_J in groups_J:
+                # Compute discrete integrals over the spatial domain of all
+                # clusters
+                cit_X_integrals_mf = citop.compute_cit_integrals(
+                    self._gop_terms, voxels_segments, self._n_voxels_dims,
+                    segments_J[group_J], len(clusters_labels),
+                    n_chunk=n_batch, fft_workers=self._fft_workers)
+                # Assemble cluster interaction tensors
+                self._assemble_cit_columns(clusters_J[group_J],
+                                           cit_X_integrals_mf,
+                                           clusters_segments, factors)
+        else:
             if mode == 'full':
-                clusters_J = self._phase_clusters[mat_phase_B]
-            elif mode == 'adaptive':
-                clusters_J = phase_new_clusters[mat_phase_B]
-            # Loop over material phase B clusters
-            for cluster_J in clusters_J:
-                # Set material phase B cluster characteristic function
-                _, cluster_J_filter_dft = self._cluster_filter(cluster_J)
-                # Perform discrete convolution between the material phase B
-                # cluster characteristic function and each of Green operator
-                # material independent terms
-                gop_X_filt_vox = self._gop_convolution(cluster_J_filter_dft,
-                                                       *self._gop_X_dft_vox)
-                # Loop over material phases
-                for mat_phase_A in self._material_phases:
-                    # Set material phase pair dictionary
-                    mat_phase_pair = mat_phase_A + '_' + mat_phase_B
-                    # Loop over material phase A clusters
-                    for cluster_I in self._phase_clusters[mat_phase_A]:
-                        # Set material cluster pair
-                        cluster_pair = str(cluster_I) + '_' + str(cluster_J)
-                        # Check if cluster-symmetric cluster interaction tensor
-                        sym_cluster_pair = self._switch_pair(cluster_pair)
-                        sym_mat_phase_pair = self._switch_pair(mat_phase_pair)
-                        is_clst_sym = sym_cluster_pair in \
-                            self._cit_x_mf[0][sym_mat_phase_pair].keys()
-                        # Compute cluster interaction tensor between material
-                        # phase A cluster and material phase B cluster
-                        # (complete computation or cluster-symmetric
-                        # computation)
-                        if is_clst_sym:
-                            # Set cluster volume fractions ratio
-                            clst_vf_ratio = (
-                                self._clusters_vf[str(cluster_J)]
-                                / self._clusters_vf[str(cluster_I)])
-                            # Compute clustering interaction tensor between
-                            # material phase A cluster and material phase B
-                            # cluster through cluster-symmetry
-                            for cit_mf in self._cit_x_mf:
-                                cit_mf[mat_phase_pair][cluster_pair] = \
-                                    np.multiply(clst_vf_ratio,
-                                                cit_mf[sym_mat_phase_pair][
-                                                    sym_cluster_pair])
-                        else:
-                            # Set material phase A cluster characteristic
-                            # function
-                            cluster_I_filter, _ = \
-                                self._cluster_filter(cluster_I)
-                            # Perform discrete integral over the spatial domain
-                            # of material phase A cluster I
-                            cit_X_integral_mf = self._discrete_cit_integral(
-                                cluster_I_filter, *gop_X_filt_vox)
-                            # Compute cluster interaction tensor between the
-                            # material phase A cluster and the material phase B
-                            # cluster
-                            rve_vol = np.prod(self._rve_dims)
-                            factor = 1.0/(self._clusters_vf[str(cluster_I)]
-                                          * rve_vol)
-                            for i in range(len(self._cit_x_mf)):
-                                self._cit_x_mf[i][mat_phase_pair][
-                                    cluster_pair] = np.multiply(
-                                        factor, cit_X_integral_mf[i])
+                info.displayinfo('5', 'Cluster interaction tensors worker '
+                                 'processes: ' + str(n_workers), 2)
+            # Set Green operator parameters (worker processes)
+            gop_parameters = {'strain_formulation': self._strain_formulation,
+                              'problem_type': self._problem_type,
+                              'rve_dims': self._rve_dims,
+                              'n_voxels_dims': self._n_voxels_dims,
+                              'precision': self._gop_precision}
+            # Compute discrete integrals with pool of worker processes
+            with CITProcessPool(n_workers, self._gop_terms, gop_parameters,
+                                voxels_segments, self._n_voxels_dims,
+                                len(clusters_labels), n_chunk=n_batch) as pool:
+                # Submit groups of clusters J
+                futures = [pool.submit(segments_J[group_J])
+                           for group_J in groups_J]
+                # Loop over groups of clusters J
+                for group_J, future in zip(groups_J, futures):
+                    # Assemble cluster interaction tensors
+                    self._assemble_cit_columns(clusters_J[group_J],
+                                               future.result(),
+                                               clusters_segments, factors)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Compute remaining adaptive cluster interaction tensors through
-        # cluster-symmetry and remove vanished clustering interaction tensors
+        # linearity and cluster-symmetry
         if mode == 'adaptive':
-            # Loop over material phases
-            for mat_phase_B in self._material_phases:
-                # Loop over material phase B old clusters
-                for cluster_J in phase_old_clusters[mat_phase_B]:
-                    # Loop over material phases
-                    for mat_phase_A in self._material_phases:
-                        # Set material phase pair dictionary
-                        mat_phase_pair = mat_phase_A + '_' + mat_phase_B
-                        # Loop over material phase A new clusters
-                        for cluster_I in phase_new_clusters[mat_phase_A]:
-                            # Set material cluster pair
-                            cluster_pair = str(cluster_I) + '_' \
-                                + str(cluster_J)
-                            # Check if cluster-symmetric cluster interaction
-                            # tensor
-                            sym_cluster_pair = self._switch_pair(cluster_pair)
-                            sym_mat_phase_pair = \
-                                self._switch_pair(mat_phase_pair)
-                            is_clst_sym = sym_cluster_pair in \
-                                self._cit_x_mf[0][sym_mat_phase_pair].keys()
-                            # Compute cluster interaction tensor between
-                            # material phase A cluster and material phase B
-                            # cluster through cluster-symmetry
-                            if not is_clst_sym:
-                                raise RuntimeError(
-                                    'All the remaining adaptive clustering '
-                                    'interaction tensors should be '
-                                    'cluster-symmetric.')
-                            # Set cluster volume fractions ratio
-                            clst_vf_ratio = (
-                                self._clusters_vf[str(cluster_J)]
-                                / self._clusters_vf[str(cluster_I)])
-                            # Compute clustering interaction tensor
-                            for cit_mf in self._cit_x_mf:
-                                cit_mf[mat_phase_pair][cluster_pair] = \
-                                    np.multiply(clst_vf_ratio,
-                                                cit_mf[sym_mat_phase_pair][
-                                                    sym_cluster_pair])
-            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Loop over material phases
-            for mat_phase_B in self._material_phases:
-                # Loop over material phases
-                for mat_phase_A in self._material_phases:
-                    # Set material phase pair dictionary
-                    mat_phase_pair = mat_phase_A + '_' + mat_phase_B
-                    # Set existent cluster interactions
-                    cluster_pairs = [x for x in
-                                     self._cit_x_mf[0][mat_phase_pair].keys()]
-                    # Loop over cluster pairs
-                    for cluster_pair in cluster_pairs:
-                        cluster_I = cluster_pair.split('_')[0]
-                        cluster_J = cluster_pair.split('_')[1]
-                        # If any of the interacting clusters no longer exists,
-                        # then remove the associated cluster interaction tensor
-                        if cluster_I in pop_clusters \
-                                or cluster_J in pop_clusters:
-                            for i in range(len(self._cit_x_mf)):
-                                self._cit_x_mf[i][mat_phase_pair].pop(
-                                    cluster_pair)
+            # Compute cluster interaction tensors between all clusters I and
+            # the last new cluster J of each target cluster through linearity
+            self._compute_adaptive_cit_linearity(
+                adaptive_clustering_map, old_cit_x_mf, old_cit_offsets,
+                old_clusters, n_comps)
+            # Get old clusters volume fractions
+            old_clusters_vf = np.array([self._clusters_vf[str(cluster)]
+                                        for cluster in old_clusters])
+            # Loop over new clusters
+            for cluster_I in adapted_clusters:
+                i_init = self._cit_offsets[str(cluster_I)]
+                # Set cluster volume fractions ratios
+                clst_vf_ratios = \
+                    old_clusters_vf/self._clusters_vf[str(cluster_I)]
+                # Get cluster-symmetric cluster interaction tensors (old
+                # clusters J rows and new cluster I columns)
+                cit_sym_mf = self._cit_x_mf[
+                    :, idxs, i_init:i_init + n_comps].reshape(
+                        3, len(old_clusters), n_comps, n_comps)
+                # Compute cluster interaction tensors between new cluster I
+                # and old clusters J through cluster-symmetry
+                cit_sym_mf = np.multiply(
+                    clst_vf_ratios[:, np.newaxis, np.newaxis], cit_sym_mf)
+                self._cit_x_mf[:, i_init:i_init + n_comps, idxs] = \
+                    np.transpose(cit_sym_mf, (0, 2, 1, 3)).reshape(
+                        3, n_comps, -1)
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             # Update total amount of time spent in clustering adaptivity
             # cluster interaction tensors computation procedures
             self._adaptive_cit_time += time.time() - init_time
     # -------------------------------------------------------------------------
-    def _cluster_filter(self, cluster):
-        """Compute cluster discrete characteristic function.
+    def _compute_adaptive_cit_linearity(self, adaptive_clustering_map,
+                                        old_cit_x_mf, old_cit_offsets,
+                                        old_clusters, n_comps):
+        """Compute adaptive cluster interaction tensors through linearity.
+
+        The unnormalized cluster interaction tensors
 
         .. math::
 
-           \\chi^{(I)} (\\boldsymbol{Y}) = \\begin{cases} 1 \\quad \\text{if}
-           \\; \\; \\; \\boldsymbol{Y}\\in \\Omega^{(I)}_{\\mu, \\, 0} \\\\ 0
-           \\quad \\text{otherwise} \\end{cases}
+           \\boldsymbol{\\mathsf{S}}^{(I)(J)} = f^{(I)} v_{\\mu} \\,
+           \\boldsymbol{\\mathsf{T}}^{(I)(J)} = \\int_{\\Omega_{\\mu, \\, 0}}
+           \\int_{\\Omega_{\\mu, \\, 0}} \\chi^{(I)}(\\boldsymbol{Y}) \\,
+           \\chi^{(J)} (\\boldsymbol{Y}') \\,
+           \\boldsymbol{\\mathsf{\\Phi}}^{0} (\\boldsymbol{Y}-\\boldsymbol{Y}')
+           \\, \\mathrm{d} v' \\mathrm{d} v \\, ,
 
-        where :math:`\\chi^{(I)}` is the
-        characteristic function of the :math:`I` th material cluster and
-        :math:`\\boldsymbol{Y}` is a point of the microscale reference
-        configuration (:math:`\\Omega_{\\mu,\\,0}`).
+        are linear with respect to both characteristic functions and
+        cluster-symmetric, i.e.,
+        :math:`\\boldsymbol{\\mathsf{S}}^{(I)(J)} =
+        \\boldsymbol{\\mathsf{S}}^{(J)(I)}`. Given that the characteristic
+        function of a target cluster :math:`P` is the sum of the
+        characteristic functions of the new clusters resulting from its
+        refinement, the cluster interaction tensors associated with the last
+        new cluster :math:`L` are computed as
 
-        The detailed description of the cluster characteristic function can
-        be found in Section 4.3.1 of Ferreira (2022) [#]_.
+        .. math::
 
-        .. [#] Ferreira, B.P. (2022). *Towards Data-driven Multi-scale
-               Optimization of Thermoplastic Blends: Microstructural
-               Generation, Constitutive Development and Clustering-based
-               Reduced-Order Modeling.* PhD Thesis, University of Porto
-               (see `here <https://repositorio-aberto.up.pt/handle/10216/
-               146900?locale=en>`_)
+           \\boldsymbol{\\mathsf{S}}^{(I)(L)} =
+           \\boldsymbol{\\mathsf{S}}^{(I)(P)} - \\sum_{C \\neq L}
+           \\boldsymbol{\\mathsf{S}}^{(I)(C)} \\, ,
 
-        ----
+        where the sum spans the remaining new clusters :math:`C` of the target
+        cluster :math:`P`, whose cluster interaction tensors are computed
+        through discrete convolutions. The target cluster interaction tensors
+        :math:`\\boldsymbol{\\mathsf{S}}^{(I)(P)}` follow from the preexistent
+        global cluster interaction matrices (old clusters I), from the
+        cluster-symmetry (new clusters I computed through discrete
+        convolutions) and from the linearity (last new clusters I). Therefore,
+        the discrete convolutions associated with the last new cluster of each
+        target cluster are avoided.
 
         Parameters
         ----------
-        cluster : int
-            Cluster label.
-
-        Returns
-        -------
-        cluster_filter : numpy.ndarray[bool] (2d or 3d)
-            Cluster discrete characteristic function in spatial domain.
-        cluster_filter_dft : numpy.ndarray
-            Cluster discrete characteristic function in frequency domain
-            (discrete Fourier transform).
+        adaptive_clustering_map : dict
+            Adaptive clustering map (item, dict with list of new cluster labels
+            (item, list[int]) resulting from the refinement of each target
+            cluster (key, str)) for each material phase (key, str).
+        old_cit_x_mf : numpy.ndarray (3d)
+            Preexistent global cluster interaction matrices.
+        old_cit_offsets : dict
+            Row/column offset (item, int) of each preexistent cluster (key,
+            str) in the preexistent global cluster interaction matrices.
+        old_clusters : list[int]
+            Old (preexistent) clusters sorted according to the global cluster
+            interaction matrices assembly order.
+        n_comps : int
+            Number of strain/stress components.
         """
-        # Check if valid cluster
-        if not isinstance(cluster, int) \
-                and not isinstance(cluster, np.integer):
-            raise RuntimeError('Cluster label must be an integer.')
-        elif cluster not in self._voxels_clusters:
-            raise RuntimeError('Cluster label does not exist in the CRVE.')
+        # Get CRVE clusters sorted according to the global cluster interaction
+        # matrices assembly order
+        clusters = [cluster for mat_phase in self._material_phases
+                    for cluster in self._phase_clusters[mat_phase]]
+        # Compute clusters volume associated with each global cluster
+        # interaction matrices row
+        rve_vol = np.prod(self._rve_dims)
+        rows_vol = np.repeat([self._clusters_vf[str(cluster)]*rve_vol
+                              for cluster in clusters], n_comps)
+        # Get old clusters rows in the current and preexistent global cluster
+        # interaction matrices
+        idxs = self._get_cit_idxs(old_clusters, self._cit_offsets, n_comps)
+        old_idxs = self._get_cit_idxs(old_clusters, old_cit_offsets, n_comps)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Build cluster filter (spatial domain)
-        cluster_filter = self._voxels_clusters == cluster
-        # Perform Discrete Fourier Transform (DFT) by means of Fast Fourier
-        # Transform (FFT)
-        cluster_filter_dft = np.fft.fftn(cluster_filter)
+        # Get new clusters resulting from the refinement of each target cluster
+        targets_children = {}
+        for mat_phase in adaptive_clustering_map.keys():
+            for target, children in adaptive_clustering_map[mat_phase].items():
+                targets_children[str(target)] = list(children)
+        # Get new clusters rows/columns in the global cluster interaction
+        # matrices (target clusters)
+        targets_idxs = {target: self._get_cit_idxs(children, self._cit_offsets,
+                                                   n_comps)
+                        for target, children in targets_children.items()}
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        return cluster_filter, cluster_filter_dft
+        # Initialize unnormalized cluster interaction tensors between all
+        # clusters I and each target cluster
+        targets_cit_mf = {}
+        # Loop over target clusters
+        for target in targets_children.keys():
+            # Get target cluster columns in the preexistent global cluster
+            # interaction matrices
+            target_cols = old_cit_offsets[target] + np.arange(n_comps)
+            # Initialize target cluster unnormalized cluster interaction
+            # tensors
+            target_cit_mf = np.zeros((3, len(rows_vol), n_comps))
+            # Set old clusters I (preexistent global cluster interaction
+            # matrices)
+            target_cit_mf[:, idxs, :] = np.multiply(
+                rows_vol[idxs][np.newaxis, :, np.newaxis],
+                old_cit_x_mf[:, old_idxs[:, np.newaxis], target_cols])
+            # Set new clusters I computed through discrete convolutions
+            # (cluster-symmetry and linearity)
+            for children in targets_children.values():
+                for cluster_I in children[:-1]:
+                    i_init = self._cit_offsets[str(cluster_I)]
+                    # Get unnormalized cluster interaction tensors between
+                    # target cluster new clusters and new cluster I
+                    cit_mf = np.multiply(
+                        rows_vol[targets_idxs[target]][
+                            np.newaxis, :, np.newaxis],
+                        self._cit_x_mf[:, targets_idxs[target],
+                                       i_init:i_init + n_comps])
+                    # Sum target cluster new clusters contributions
+                    # (cluster-symmetry)
+                    target_cit_mf[:, i_init:i_init + n_comps, :] = np.sum(
+                        cit_mf.reshape(3, -1, n_comps, n_comps), axis=1)
+            # Store target cluster unnormalized cluster interaction tensors
+            targets_cit_mf[target] = target_cit_mf
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Loop over target clusters
+        for target, target_cit_mf in targets_cit_mf.items():
+            # Get target cluster columns in the preexistent global cluster
+            # interaction matrices
+            target_cols = old_cit_offsets[target] + np.arange(n_comps)
+            # Set last new clusters I (linearity)
+            for target_I, children in targets_children.items():
+                # Get target cluster I rows in the preexistent global cluster
+                # interaction matrices
+                target_I_rows = old_cit_offsets[target_I] + np.arange(n_comps)
+                # Compute target cluster I volume
+                target_I_vol = sum([self._clusters_vf[str(cluster)]
+                                    for cluster in children])*rve_vol
+                # Compute unnormalized cluster interaction tensors between
+                # target clusters
+                cit_mf = target_I_vol*old_cit_x_mf[
+                    :, target_I_rows[:, np.newaxis], target_cols]
+                # Subtract remaining new clusters I contributions
+                for cluster_I in children[:-1]:
+                    i_init = self._cit_offsets[str(cluster_I)]
+                    cit_mf = cit_mf \
+                        - target_cit_mf[:, i_init:i_init + n_comps, :]
+                # Set last new cluster I
+                i_init = self._cit_offsets[str(children[-1])]
+                target_cit_mf[:, i_init:i_init + n_comps, :] = cit_mf
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Loop over target clusters
+        for target, children in targets_children.items():
+            # Compute unnormalized cluster interaction tensors between all
+            # clusters I and last new cluster J (linearity)
+            cit_mf = targets_cit_mf[target]
+            for cluster_J in children[:-1]:
+                j_init = self._cit_offsets[str(cluster_J)]
+                cit_mf = cit_mf - np.multiply(
+                    rows_vol[np.newaxis, :, np.newaxis],
+                    self._cit_x_mf[:, :, j_init:j_init + n_comps])
+            # Assemble cluster interaction tensors in the global cluster
+            # interaction matrices (last new cluster J columns)
+            j_init = self._cit_offsets[str(children[-1])]
+            self._cit_x_mf[:, :, j_init:j_init + n_comps] = \
+                np.divide(cit_mf, rows_vol[np.newaxis, :, np.newaxis])
     # -------------------------------------------------------------------------
-    def _gop_convolution(self, cluster_filter_dft, gop_1_dft_vox,
-                         gop_2_dft_vox, gop_0_freq_dft_vox):
-        """Convolution of cluster characteristic function and Green operator.
-
-        .. math::
-
-           \\int_{\\Omega_{\\mu, \\, 0}} \\chi^{(J)} (\\boldsymbol{Y}') \\,
-           \\boldsymbol{\\mathsf{\\Phi}}^{0} (\\boldsymbol{Y} -
-           \\boldsymbol{Y}') \\, \\mathrm{d} v' = \\mathscr{F}^{-1} \\left(
-           \\breve{\\chi}^{(J)}(\\boldsymbol{\\zeta}) \\,
-           \\breve{\\boldsymbol{\\mathsf{\\Phi}}}^{0} (\\boldsymbol{\\zeta})
-           \\right) \\, ,
-
-        where :math:`\\chi^{(J)}` is the characteristic function of the
-        :math:`J` th material cluster,
-        :math:`\\boldsymbol{\\mathsf{\\Phi}}^{0}` is the reference material
-        Green operator (fourth-order tensor), :math:`\\boldsymbol{Y}` and
-        :math:`\\boldsymbol{Y'}` are points of the microscale reference
-        configuration (:math:`\\Omega_{\\mu,\\,0}`), and
-        :math:`\\boldsymbol{\\zeta}` is the frequency wave vector. The operator
-        :math:`\\mathscr{F}^{-1}(\\cdot)` denotes the inverse Fourier transform
-        and :math:`\\breve{(\\cdot)}` denotes a field defined in the frequency
-        domain.
-
-        Such a computation is required to compute the cluster interaction
-        tensors. More information can be found in Ferreira (2022) [#]_
-        (see Equations (4.111) and surrounding text).
+    def _set_gop_terms(self):
+        """Set compact Green operator material independent terms.
+
+        The Green operator material independent terms are represented in the
+        frequency domain (half spectrum) by the unique products of the unit
+        wave vector components (see
+        :py:class:`clustering.greenoperator.CompactGreenOperator`), such that
+        only the discrete convolutions associated with the unique terms are
+        performed. In order to avoid repeated operations during the discrete
+        integrals, the linear combination coefficients of the unique terms are
+        prescaled by the voxel volume and by the Kelvin notation coefficients
+        associated with the matricial form.
+        """
+        # Set compact Green operator material independent terms
+        self._gop_terms = CompactGreenOperator(
+            self._strain_formulation, self._problem_type, self._rve_dims,
+            self._n_voxels_dims, storage=self._gop_storage,
+            precision=self._gop_precision)
+        # Get strain/stress components order
+        comp_order = self._gop_terms.get_comp_order()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute voxel volume
+        voxel_vol = np.prod(self._rve_dims)/np.prod(self._n_voxels_dims)
+        # Build Kelvin notation coefficients matrix
+        kelvin_factors = np.array([mop.kelvin_factor(i, comp_order)
+                                   for i in range(len(comp_order))])
+        factors_mf = voxel_vol*np.outer(kelvin_factors, kelvin_factors)
+        # Prescale unique terms linear combination coefficients
+        term_matrix = self._gop_terms.get_term_matrix()
+        term_matrix *= factors_mf.reshape(1, 1, *factors_mf.shape)
+        self._gop_term_matrix = \
+            term_matrix.reshape(self._gop_terms.get_n_unique_terms(), -1)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Display Green operator memory footprint
+        info.displayinfo('5', 'Green operator unique terms: '
+                         + str(self._gop_terms.get_n_unique_terms())
+                         + ' (' + self._gop_storage + ', '
+                         + '{:.1f}'.format(
+                             self._gop_terms.get_memory_footprint()/1024**2)
+                         + ' MB in memory, '
+                         + '{:.1f}'.format(
+                             self._gop_terms.get_disk_footprint()/1024**2)
+                         + ' MB on disk)', 2)
+    # -------------------------------------------------------------------------
+    def _get_cit_n_workers(self, n_clusters_J):
+        """Get number of cluster interaction tensors worker processes.
 
-        .. [#] Ferreira, B.P. (2022). *Towards Data-driven Multi-scale
-               Optimization of Thermoplastic Blends: Microstructural
-               Generation, Constitutive Development and Clustering-based
-               Reduced-Order Modeling.* PhD Thesis, University of Porto
-               (see `here <https://repositorio-aberto.up.pt/handle/10216/
-               146900?locale=en>`_)
+        Parameters
+        ----------
+        n_clusters_J : int
+            Number of clusters J whose cluster interaction tensors (global
+            cluster interaction matrices columns) are computed.
 
-        ----
+        Returns
+        -------
+        n_workers : int
+            Number of worker processes. If 1, then the cluster interaction
+            tensors are computed sequentially.
+        """
+        # Get number of worker processes
+        if self._cit_workers == -1:
+            n_workers = os.cpu_count()
+        else:
+            n_workers = self._cit_workers
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return max(1, min(n_workers, n_clusters_J))
+    # -------------------------------------------------------------------------
+    def _get_cit_chunk_size(self, n_segments, n_workers=1):
+        """Get cluster interaction tensors computation chunk size.
+
+        The chunk size is the number of clusters characteristic functions
+        transformed in each batch and the number of Green operator unique
+        terms convolved simultaneously with a given cluster characteristic
+        function. If a memory budget is prescribed, the chunk size is the
+        largest one such that the estimated peak memory of the cluster
+        interaction tensors computation (stored Green operator unique terms,
+        global cluster interaction matrices, voxels segmentation and chunk
+        spatial and frequency domain fields) does not exceed the memory
+        budget. The pages of the memory-mapped Green operator unique terms
+        (out-of-core storage) are not accounted for, given that these can be
+        reclaimed by the operating system whenever required. If the cluster
+        interaction tensors are computed by a pool of worker processes, then
+        the chunk memory is accounted for in each worker process.
 
         Parameters
         ----------
-        cluster_filter_dft : numpy.ndarray
-            Cluster discrete characteristic function in frequency domain
-            (discrete Fourier transform).
-        gop_1_dft_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the first Green
-            operator material independent term in the frequency domain
-            (discrete Fourier transform).
-        gop_2_dft_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the second
-            Green operator material independent term in the frequency domain
-            (discrete Fourier transform).
-        gop_0_freq_dft_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the Green
-            operator zero-frequency (material independent) term in the
-            frequency domain (discrete Fourier transform).
+        n_segments : int
+            Number of segments (clusters).
+        n_workers : int, default=1
+            Number of worker processes.
 
         Returns
         -------
-        gop_1_filt_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the convolution
-            between the material cluster characteristic function and the
-            first Green operator material independent term in the spatial
-            domain (inverse discrete Fourier transform).
-        gop_2_filt_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the convolution
-            between the material cluster characteristic function and the
-            second Green operator materia independent term in the spatial
-            domain (inverse discrete Fourier transform).
-        gop_0_freq_filt_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the convolution
-            between the material cluster characteristic function and the
-            zero-frequency Green operator (material independent) term in the
-            spatial domain (inverse discrete Fourier transform).
+        n_chunk : int
+            Chunk size.
+        peak_memory : {int, None}
+            Estimated peak memory (bytes) of the cluster interaction tensors
+            computation. If the computation is not memory bounded, then
+            returns None.
         """
-        # Set strain/stress components order according to problem strain
-        # formulation
+        # Get number of Green operator unique terms
+        n_terms = self._gop_terms.get_n_unique_terms()
+        # Return maximum chunk size if computation is not memory bounded
+        if self._cit_memory_budget is None:
+            return n_terms, None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get floating-point data type size (bytes)
+        item_size = self._gop_terms.get_dtype().itemsize
+        # Get number of voxels of spatial and frequency (half spectrum)
+        # domain fields
+        n_vox = np.prod(self._n_voxels_dims)
+        n_rdft = np.prod(self._n_voxels_dims[:-1]) \
+            * (self._n_voxels_dims[-1]//2 + 1)
+        # Get number of strain/stress components
         if self._strain_formulation == 'infinitesimal':
-            comp_order = self._comp_order_sym
-        elif self._strain_formulation == 'finite':
-            comp_order = self._comp_order_nsym
+            n_comps = len(self._comp_order_sym)
         else:
-            raise RuntimeError('Unknown problem strain formulation.')
+            n_comps = len(self._comp_order_nsym)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize discrete convolution (spatial and frequency domain)
-        gop_1_filt_dft_vox = copy.deepcopy(gop_1_dft_vox)
-        gop_2_filt_dft_vox = copy.deepcopy(gop_2_dft_vox)
-        gop_0_freq_filt_dft_vox = copy.deepcopy(gop_0_freq_dft_vox)
-        gop_1_filt_vox = copy.deepcopy(gop_1_dft_vox)
-        gop_2_filt_vox = copy.deepcopy(gop_1_dft_vox)
-        gop_0_freq_filt_vox = copy.deepcopy(gop_1_dft_vox)
-        # Compute RVE volume and total number of voxels
-        rve_vol = np.prod(self._rve_dims)
-        n_voxels = np.prod(self._n_voxels_dims)
+        # Estimate memory (bytes) independent of the chunk size: stored Green
+        # operator unique terms (shared by the worker processes), global
+        # cluster interaction matrices (preexistent and current) and voxels
+        # segmentation
+        fixed_bytes = self._gop_terms.get_memory_footprint() \
+            + 2*8*3*(n_comps*n_segments)**2 + 2*8*n_vox
+        # Estimate memory (bytes) per chunk unit: cluster characteristic
+        # function (spatial and frequency domains), discrete convolution with
+        # Green operator unique term (frequency and spatial domains), and
+        # cluster discrete integrals and interaction tensors
+        unit_bytes = 2*(2*item_size*n_rdft + item_size*n_vox) + n_vox \
+            + 8*n_segments*(n_terms + 3*n_comps**2)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Loop over Green operator components
-        for i in range(len(comp_order)):
-            compi = comp_order[i]
-            for j in range(len(comp_order)):
-                compj = comp_order[j]
-                # Perform discrete convolution in the frequency domain
-                gop_1_filt_dft_vox[compi + compj] = \
-                    np.multiply((rve_vol/n_voxels),
-                                np.multiply(cluster_filter_dft,
-                                            gop_1_filt_dft_vox[compi + compj]))
-                gop_2_filt_dft_vox[compi + compj] = \
-                    np.multiply((rve_vol/n_voxels),
-                                np.multiply(cluster_filter_dft,
-                                            gop_2_filt_dft_vox[compi + compj]))
-                gop_0_freq_filt_dft_vox[compi + compj] = \
-                    np.multiply((rve_vol/n_voxels), np.multiply(
-                        cluster_filter_dft,
-                        gop_0_freq_filt_dft_vox[compi + compj]))
-                # Perform an Inverse Discrete Fourier Transform (IDFT) by means
-                # of Fast Fourier Transform (FFT)
-                gop_1_filt_vox[compi + compj] = \
-                    np.real(np.fft.ifftn(gop_1_filt_dft_vox[compi + compj]))
-                gop_2_filt_vox[compi + compj] = \
-                    np.real(np.fft.ifftn(gop_2_filt_dft_vox[compi + compj]))
-                gop_0_freq_filt_vox[compi + compj] = np.real(np.fft.ifftn(
-                    gop_0_freq_filt_dft_vox[compi + compj]))
+        # Compute chunk size
+        budget_bytes = self._cit_memory_budget*1024**2
+        n_chunk = int(min(max((budget_bytes - fixed_bytes)
+                              // (n_workers*unit_bytes), 1), n_terms))
+        # Compute estimated peak memory
+        peak_memory = int(fixed_bytes + n_workers*n_chunk*unit_bytes)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        return gop_1_filt_vox, gop_2_filt_vox, gop_0_freq_filt_vox
+        return n_chunk, peak_memory
     # -------------------------------------------------------------------------
-    def _discrete_cit_integral(self, cluster_filter, gop_1_filt_vox,
-                               gop_2_filt_vox, gop_0_freq_filt_vox):
-        """Discrete integral over the spatial domain of material cluster.
-
-        .. math::
-
-           \\int_{\\Omega_{\\mu, 0}} \\chi^{(I)}(\\boldsymbol{Y}) \\left(
-           \\int_{\\Omega_{\\mu, 0}}  \\, \\chi^{(J)}(\\boldsymbol{Y}) \\,
-           \\boldsymbol{\\Phi}^{0}(\\boldsymbol{Y}-\\boldsymbol{Y}') \\,
-           \\mathrm{d}v' \\right) \\mathrm{d}v \\, ,
-
-        where :math:`\\chi^{(I)}` is the characteristic function of the
-        :math:`I` th material cluster,
-        :math:`\\boldsymbol{\\mathsf{\\Phi}}^{0}` is the reference material
-        Green operator (fourth-order tensor), and :math:`\\boldsymbol{Y}` and
-        :math:`\\boldsymbol{Y'}` are points of the microscale reference
-        configuration (:math:`\\Omega_{\\mu,\\,0}`).
-
-        Such a computation is required to compute the cluster interaction
-        tensors. More information can be found in Ferreira (2022) [#]_
-        (see Equations (4.112) and surrounding text).
+    def _assemble_cit_columns(self, clusters_J, cit_X_integrals_mf,
+                              clusters_segments, factors):
+        """Assemble cluster interaction tensors (clusters J columns).
 
-        .. [#] Ferreira, B.P. (2022). *Towards Data-driven Multi-scale
-               Optimization of Thermoplastic Blends: Microstructural
-               Generation, Constitutive Development and Clustering-based
-               Reduced-Order Modeling.* PhD Thesis, University of Porto
-               (see `here <https://repositorio-aberto.up.pt/handle/10216/
-               146900?locale=en>`_)
-
-        ----
+        The cluster interaction tensors between all clusters I and each
+        cluster J are computed as the linear combination of the discrete
+        integrals associated with the Green operator unique terms and
+        assembled in the global cluster interaction matrices (cluster J
+        columns).
 
         Parameters
         ----------
-        cluster_filter : numpy.ndarray
-            Cluster discrete characteristic function in spatial domain.
-        gop_1_filt_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the convolution
-            between the material cluster characteristic function and the first
-            Green operator material independent term in the spatial domain
-            (inverse discrete Fourier transform).
-        gop_2_filt_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the convolution
-            between the material cluster characteristic function and the second
-            Green operator material independent term in the spatial domain
-            (inverse discrete Fourier transform).
-        gop_0_freq_filt_vox : dict
-            Regular grid shaped matrix (item, numpy.ndarray) containing each
-            fourth-order matricial form component (key, str) of the convolution
-            between the material cluster characteristic function and the
-            zero-frequency Green operator (material independent) term in the
-            spatial domain (inverse discrete Fourier transform).
+        clusters_J : list[int]
+            Clusters J labels.
+        cit_X_integrals_mf : numpy.ndarray (3d)
+            Discrete integrals over the spatial domain of each cluster I of the
+            discrete convolution between each cluster J characteristic
+            function and each Green operator unique term, stored in a
+            numpy.ndarray of shape (n_clusters_J, n_segments, n_unique_terms).
+        clusters_segments : numpy.ndarray (1d)
+            Segment index of each cluster (sorted according to the global
+            cluster interaction matrices assembly order).
+        factors : numpy.ndarray (1d)
+            Clusters discrete integral normalization factors (sorted according
+            to the global cluster interaction matrices assembly order).
+        """
+        # Get number of strain/stress components
+        n_comps = self._gop_terms.get_term_matrix().shape[-1]
+        # Compute cluster interaction tensors between all clusters I and
+        # clusters J (linear combination of the Green operator unique terms)
+        cit_X_mf = np.multiply(
+            factors[np.newaxis, :, np.newaxis],
+            np.matmul(cit_X_integrals_mf[:, clusters_segments, :],
+                      self._gop_term_matrix)).reshape(
+                          len(clusters_J), -1, 3, n_comps, n_comps)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Loop over clusters J
+        for k, cluster_J in enumerate(clusters_J):
+            # Assemble cluster interaction tensors in the global cluster
+            # interaction matrices (cluster J columns)
+            j_init = self._cit_offsets[str(cluster_J)]
+            self._cit_x_mf[:, :, j_init:j_init + n_comps] = \
+                np.transpose(cit_X_mf[k], (1, 0, 2, 3)).reshape(3, -1,
+                                                                n_comps)
+    # -------------------------------------------------------------------------
+    def _clusters_segments(self):
+        """Get voxels segmentation according with associated cluster.
 
         Returns
         -------
-        cit_1_integral_mf : numpy.ndarray (2d)
-            Discrete integral over the spatial domain of material cluster I of
-            the discrete convolution between the material cluster J
-            characteristic function and the first Green operator material
-            independent term in the spatial domain (numpy.ndarray of shape
-            (n_comps, n_comps)).
-        cit_2_integral_mf : numpy.ndarray (2d)
-            Discrete integral over the spatial domain of material cluster I of
-            the discrete convolution between the material cluster J
-            characteristic function and the second Green operator material
-            independent term in the spatial domain (numpy.ndarray of shape
-            (n_comps, n_comps)).
-        cit_0_freq_integral_mf : numpy.ndarray (2d)
-            Discrete integral over the spatial domain of material cluster I of
-            the discrete convolution between the material cluster J
-            characteristic function and the zero-frequency Green operator
-            (material independent) term in the spatial domain.
+        clusters_labels : numpy.ndarray (1d)
+            CRVE cluster labels sorted in ascending order.
+        voxels_segments : numpy.ndarray (1d)
+            Segment index (index in `clusters_labels`) of the cluster
+            associated with each voxel (flattened regular grid).
         """
-        # Set strain/stress components order according to problem strain
-        # formulation
-        if self._strain_formulation == 'infinitesimal':
-            comp_order = self._comp_order_sym
-        elif self._strain_formulation == 'finite':
-            comp_order = self._comp_order_nsym
-        else:
-            raise RuntimeError('Unknown problem strain formulation.')
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize discrete integral
-        cit_1_integral_mf = np.zeros((len(comp_order), len(comp_order)))
-        cit_2_integral_mf = np.zeros((len(comp_order), len(comp_order)))
-        cit_0_freq_integral_mf = np.zeros((len(comp_order), len(comp_order)))
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Loop over matricial form components
-        for i in range(len(comp_order)):
-            compi = comp_order[i]
-            for j in range(len(comp_order)):
-                compj = comp_order[j]
-                # Perform discrete integral over the spatial domain of material
-                # cluster I
-                cit_1_integral_mf[i, j] = mop.kelvin_factor(i, comp_order) \
-                    * mop.kelvin_factor(j, comp_order) \
-                    * np.sum(np.multiply(cluster_filter,
-                                         gop_1_filt_vox[compi + compj]))
-                cit_2_integral_mf[i, j] = mop.kelvin_factor(i, comp_order) \
-                    * mop.kelvin_factor(j, comp_order) \
-                    * np.sum(np.multiply(cluster_filter,
-                                         gop_2_filt_vox[compi + compj]))
-                cit_0_freq_integral_mf[i, j] = \
-                    mop.kelvin_factor(i, comp_order) \
-                    * mop.kelvin_factor(j, comp_order) \
-                    * np.sum(np.multiply(cluster_filter,
-                                         gop_0_freq_filt_vox[compi + compj]))
+        # Get cluster labels and cluster segment index of each voxel
+        clusters_labels, voxels_segments = np.unique(
+            self._voxels_clusters.flatten(), return_inverse=True)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        return cit_1_integral_mf, cit_2_integral_mf, cit_0_freq_integral_mf
+        return clusters_labels, voxels_segments.flatten()
     # -------------------------------------------------------------------------
     @staticmethod
-    def _switch_pair(x, delimiter='_'):
-        """Switch left and right sides of string with separating delimiter.
+    def _get_cit_idxs(clusters, cit_offsets, n_comps):
+        """Get clusters rows/columns in global cluster interaction matrices.
 
         Parameters
         ----------
-        x : str
-            Target string.
-        delimiter : str, default='_'
-            Separating delimiter between target's string left and right sides.
+        clusters : list[int]
+            Clusters labels.
+        cit_offsets : dict
+            Row/column offset (item, int) of each cluster (key, str) in the
+            global cluster interaction matrices.
+        n_comps : int
+            Number of strain/stress components.
 
         Returns
         -------
-        y : str
-            Switched string.
+        idxs : numpy.ndarray (1d)
+            Rows/columns of the global cluster interaction matrices associated
+            with the clusters (sorted as `clusters`).
         """
-        if not isinstance(x, str) or x.count(delimiter) != 1:
-            raise RuntimeError('Input parameter must be a string and can '
-                               'only contain one delimiter.')
-        return delimiter.join(x.split(delimiter)[::-1])
+        offsets = np.array([cit_offsets[str(cluster)] for cluster in clusters],
+                           dtype=int)
+        idxs = (offsets[:, np.newaxis] + np.arange(n_comps)).flatten()
+        return idxs
     # -------------------------------------------------------------------------
     @staticmethod
     def save_crve_file(crve, crve_file_path):
@@ -0,0 +1,532 @@
+"""Compact Green operator material independent terms.
+
+This module includes the class that embodies a memory-lean representation of
+the Green operator material independent terms in the frequency domain (see
+:py:func:`clustering.citoperations.gop_material_independent_terms`). Given
+that these terms only depend on the frequency wave vector through the
+products of the unit wave vector components, only the unique products are
+stored (in memory or memory-mapped from disk) or computed on the fly and each
+Green operator matricial form component is recovered as a linear combination
+of the unique terms.
+
+Classes
+-------
+CompactGreenOperator
+    Compact Green operator material independent terms (half spectrum).
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Standard
+import itertools as it
+import tempfile
+# Third-party
+import numpy as np
+# Local
+import tensor.matrixoperations as mop
+import clustering.citoperations as citop
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+class CompactGreenOperator:
+    """Compact Green operator material independent terms (half spectrum).
+
+    The Green operator material independent terms only depend on the
+    frequency wave vector :math:`\\boldsymbol{\\zeta}` through the unit wave
+    vector :math:`\\boldsymbol{n} = \\boldsymbol{\\zeta} /
+    ||\\boldsymbol{\\zeta}||`,
+
+    .. math::
+
+       (\\breve{\\Phi}^{0}_{1})_{klij} = \\delta_{ki} n_{j} n_{l}
+       + \\delta_{kj} n_{i} n_{l} + \\delta_{li} n_{j} n_{k}
+       + \\delta_{lj} n_{i} n_{k} \\, , \\qquad
+       (\\breve{\\Phi}^{0}_{2})_{klij} = - n_{k} n_{l} n_{i} n_{j} \\, ,
+
+    where only the first Kronecker delta term of
+    :math:`\\breve{\\Phi}^{0}_{1}` is considered under finite strains. The
+    zero-frequency term is unitary at the zero frequency and null otherwise.
+    Therefore, only the unique second-order (:math:`n_{a} n_{b}`) and
+    fourth-order (:math:`n_{a} n_{b} n_{c} n_{d}`) products and the
+    zero-frequency term are stored, i.e., 22 terms in 3D instead of the
+    :math:`3 \\times n_{\\text{comps}}^{2}` components (108 under
+    infinitesimal strains and 243 under finite strains). Each Green operator
+    matricial form component is a linear combination of the unique terms,
+    where the linear combination coefficients are stored in the term matrix.
+
+    The unique terms are stored in the half spectrum (non-negative
+    frequencies of the last dimension) suitable to perform real-to-complex
+    discrete Fourier transforms, where only the Hermitian part of each term is
+    considered (see
+    :py:func:`clustering.citoperations.gop_half_spectrum_stack`). Moreover,
+    the unique terms can be stored in a memory-mapped temporary file
+    (out-of-core storage) or computed on the fly from the discrete
+    frequencies instead of being stored in memory, and both double and single
+    floating-point precisions are available.
+
+    Attributes
+    ----------
+    _n_dim : int
+        Problem number of spatial dimensions.
+    _comp_order : list[str]
+        Strain/Stress components order associated to matricial form.
+    _n_voxels_dims : list[int]
+        Number of voxels in each dimension of the regular grid (spatial
+        discretization of the RVE).
+    _rdft_dims : tuple[int]
+        Half spectrum dimensions.
+    _freqs_dims : list[numpy.ndarray (1d)]
+        Discrete frequencies (half spectrum) of each dimension, reshaped to be
+        broadcastable over the half spectrum grid.
+    _nyquist_signs : list[numpy.ndarray (1d)]
+        Sign (-1 at the Nyquist frequency and 1 otherwise) of each dimension,
+        reshaped to be broadcastable over the half spectrum grid.
+    _storage : {'stored', 'out_of_core', 'on_the_fly'}
+        Unique terms storage: stored in memory ('stored'), stored in a
+        memory-mapped temporary file ('out_of_core') or computed on the fly
+        ('on_the_fly').
+    _memmap_dir : {str, None}
+        Directory where the memory-mapped temporary file is created
+        (out-of-core storage). If None, then the default temporary directory
+        is adopted.
+    _dtype : numpy.dtype
+        Unique terms floating-point data type.
+    _unique_terms : list[tuple[int]]
+        Spatial dimensions indexes of the unit wave vector components product
+        associated with each unique term. The zero-frequency term is
+        associated with an empty tuple.
+    _term_matrix : numpy.ndarray (4d)
+        Linear combination coefficients of the unique terms associated with
+        each Green operator material independent term (first, second and
+        zero-frequency terms) matricial form component, stored in a
+        numpy.ndarray of shape (n_unique_terms, 3, n_comps, n_comps).
+    _terms_rdft_vox : {numpy.ndarray, numpy.memmap, None}
+        Unique terms (half spectrum) stored in a numpy.ndarray (or
+        numpy.memmap if out-of-core storage) of shape
+        (n_unique_terms, n_voxels_1, ..., n_voxels_d//2 + 1). Only available
+        if the unique terms are stored.
+
+    Methods
+    -------
+    get_comp_order(self)
+        Get strain/stress components order associated to matricial form.
+    get_n_unique_terms(self)
+        Get number of unique terms.
+    get_term_matrix(self)
+        Get unique terms linear combination coefficients.
+    get_dtype(self)
+        Get unique terms floating-point data type.
+    get_unique_term(self, index)
+        Get unique term (half spectrum).
+    get_unique_terms(self)
+        Get stacked unique terms (half spectrum).
+    attach_unique_terms(self, terms_rdft_vox)
+        Attach externally stored unique terms (half spectrum).
+    assemble_operator(self, term_factors)
+        Assemble Green operator matricial form components (half spectrum).
+    get_memory_footprint(self)
+        Get memory footprint of the stored unique terms.
+    get_disk_footprint(self)
+        Get disk footprint of the memory-mapped unique terms.
+    _store_unique_terms(self)
+        Store unique terms (in memory or memory-mapped temporary file).
+    _set_unique_terms(self)
+        Set unique terms and linear combination coefficients.
+    _compute_unique_term(self, index)
+        Compute unique term (half spectrum).
+    """
+    def __init__(self, strain_formulation, problem_type, rve_dims,
+                 n_voxels_dims, storage='stored', precision='double',
+                 memmap_dir=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        strain_formulation: {'infinitesimal', 'finite'}
+            Problem strain formulation.
+        problem_type : int
+            Problem type: 2D plane strain (1), 2D plane stress (2),
+            2D axisymmetric (3) and 3D (4).
+        rve_dims : list[float]
+            RVE size in each dimension.
+        n_voxels_dims : list[int]
+            Number of voxels in each dimension of the regular grid (spatial
+            discretization of the RVE).
+        storage : {'stored', 'out_of_core', 'on_the_fly'}, default='stored'
+            Unique terms storage: stored in memory ('stored'), stored in a
+            memory-mapped temporary file ('out_of_core') or computed on the
+            fly ('on_the_fly').
+        precision : {'double', 'single'}, default='double'
+            Unique terms floating-point precision.
+        memmap_dir : str, default=None
+            Directory where the memory-mapped temporary file is created
+            (out-of-core storage). If None, then the default temporary
+            directory is adopted.
+        """
+        self._strain_formulation = strain_formulation
+        self._n_voxels_dims = list(n_voxels_dims)
+        # Get problem type parameters
+        self._n_dim, comp_order_sym, comp_order_nsym = \
+            mop.get_problem_type_parameters(problem_type)
+        # Set strain/stress components order according to problem strain
+        # formulation
+        if strain_formulation == 'infinitesimal':
+            self._comp_order = comp_order_sym
+        elif strain_formulation == 'finite':
+            self._comp_order = comp_order_nsym
+        else:
+            raise RuntimeError('Unknown problem strain formulation.')
+        # Check unique terms storage
+        if storage not in ('stored', 'out_of_core', 'on_the_fly'):
+            raise RuntimeError('Unknown Green operator storage.')
+        self._storage = storage
+        self._memmap_dir = memmap_dir
+        # Set unique terms floating-point data type
+        if precision == 'double':
+            self._dtype = np.dtype(np.float64)
+        elif precision == 'single':
+            self._dtype = np.dtype(np.float32)
+        else:
+            raise RuntimeError('Unknown Green operator floating-point '
+                               'precision.')
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set half spectrum dimensions
+        self._rdft_dims = tuple(self._n_voxels_dims[:-1]) \
+            + (self._n_voxels_dims[-1]//2 + 1,)
+        # Set discrete frequencies (rad/m) for each dimension
+        freqs_dims = citop.set_discrete_freqs(self._n_dim, rve_dims,
+                                              self._n_voxels_dims)
+        # Set discrete frequencies and Nyquist frequency signs (half spectrum)
+        # broadcastable over the half spectrum grid
+        self._freqs_dims = []
+        self._nyquist_signs = []
+        for i in range(self._n_dim):
+            # Set broadcastable shape
+            shape = self._n_dim*[1, ]
+            shape[i] = self._rdft_dims[i]
+            # Set discrete frequencies
+            self._freqs_dims.append(
+                freqs_dims[i][:self._rdft_dims[i]].reshape(shape))
+            # Set Nyquist frequency sign
+            signs = np.ones(self._rdft_dims[i])
+            if self._n_voxels_dims[i] % 2 == 0:
+                signs[self._n_voxels_dims[i]//2] = -1.0
+            self._nyquist_signs.append(signs.reshape(shape))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set unique terms and linear combination coefficients
+        self._set_unique_terms()
+        # Compute and store unique terms
+        self._store_unique_terms()
+    # -------------------------------------------------------------------------
+    def get_comp_order(self):
+        """Get strain/stress components order associated to matricial form.
+
+        Returns
+        -------
+        comp_order : list[str]
+            Strain/Stress components order associated to matricial form.
+        """
+        return list(self._comp_order)
+    # -------------------------------------------------------------------------
+    def get_n_unique_terms(self):
+        """Get number of unique terms.
+
+        Returns
+        -------
+        n_unique_terms : int
+            Number of unique terms.
+        """
+        return len(self._unique_terms)
+    # -------------------------------------------------------------------------
+    def get_term_matrix(self):
+        """Get unique terms linear combination coefficients.
+
+        Returns
+        -------
+        term_matrix : numpy.ndarray (4d)
+            Linear combination coefficients of the unique terms associated
+            with each Green operator material independent term (first, second
+            and zero-frequency terms) matricial form component, stored in a
+            numpy.ndarray of shape (n_unique_terms, 3, n_comps, n_comps).
+        """
+        return self._term_matrix.copy()
+    # -------------------------------------------------------------------------
+    def get_dtype(self):
+        """Get unique terms floating-point data type.
+
+        Returns
+        -------
+        dtype : numpy.dtype
+            Unique terms floating-point data type.
+        """
+        return self._dtype
+    # -------------------------------------------------------------------------
+    def get_unique_term(self, index):
+        """Get unique term (half spectrum).
+
+        Parameters
+        ----------
+        index : int
+            Unique term index.
+
+        Returns
+        -------
+        term_rdft_vox : numpy.ndarray
+            Unique term (half spectrum) stored in a numpy.ndarray of shape
+            (n_voxels_1, ..., n_voxels_d//2 + 1).
+        """
+        if self._terms_rdft_vox is not None:
+            return self._terms_rdft_vox[index]
+        else:
+            return self._compute_unique_term(index)
+    # -------------------------------------------------------------------------
+    def get_unique_terms(self):
+        """Get stacked unique terms (half spectrum).
+
+        Returns
+        -------
+        terms_rdft_vox : numpy.ndarray
+            Unique terms (half spectrum) stored in a numpy.ndarray of shape
+            (n_unique_terms, n_voxels_1, ..., n_voxels_d//2 + 1).
+        """
+        if self._terms_rdft_vox is not None:
+            return self._terms_rdft_vox
+        else:
+            return np.stack([self._compute_unique_term(k)
+                             for k in range(len(self._unique_terms))])
+    # -------------------------------------------------------------------------
+    def attach_unique_terms(self, terms_rdft_vox):
+        """Attach externally stored unique terms (half spectrum).
+
+        The unique terms are stored in a buffer owned by the caller (e.g.,
+        shared memory block), which is neither copied nor released by this
+        instance. The unique terms storage is set as stored in memory.
+
+        Parameters
+        ----------
+        terms_rdft_vox : numpy.ndarray
+            Unique terms (half spectrum) stored in a numpy.ndarray of shape
+            (n_unique_terms, n_voxels_1, ..., n_voxels_d//2 + 1).
+        """
+        # Check unique terms shape and floating-point data type
+        if terms_rdft_vox.shape != (len(self._unique_terms),
+                                    *self._rdft_dims):
+            raise RuntimeError('Invalid Green operator unique terms shape.')
+        elif terms_rdft_vox.dtype != self._dtype:
+            raise RuntimeError('Invalid Green operator unique terms '
+                               'floating-point data type.')
+        # Attach unique terms
+        self._storage = 'stored'
+        self._terms_rdft_vox = terms_rdft_vox
+    # -------------------------------------------------------------------------
+    def assemble_operator(self, term_factors):
+        """Assemble Green operator matricial form components (half spectrum).
+
+        Parameters
+        ----------
+        term_factors : numpy.ndarray (1d)
+            Factors of the Green operator material independent terms (first,
+            second and zero-frequency terms).
+
+        Returns
+        -------
+        gop_rdft_vox : numpy.ndarray
+            Green operator matricial form components (half spectrum) stored
+            in a numpy.ndarray of shape
+            (n_comps, n_comps, n_voxels_1, ..., n_voxels_d//2 + 1).
+        """
+        # Compute linear combination coefficients of the unique terms
+        coeffs = np.tensordot(self._term_matrix, term_factors, axes=([1], [0]))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize Green operator
+        gop_rdft_vox = np.zeros((len(self._comp_order), len(self._comp_order),
+                                 *self._rdft_dims), dtype=self._dtype)
+        # Loop over unique terms
+        for k in range(len(self._unique_terms)):
+            # Skip unique term without contribution
+            if not np.any(coeffs[k]):
+                continue
+            # Get unique term
+            term_rdft_vox = self.get_unique_term(k)
+            # Add unique term contribution to Green operator components
+            for i, j in zip(*np.nonzero(coeffs[k])):
+                gop_rdft_vox[i, j] += coeffs[k, i, j]*term_rdft_vox
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return gop_rdft_vox
+    # -------------------------------------------------------------------------
+    def get_memory_footprint(self):
+        """Get memory footprint of the stored unique terms.
+
+        Returns
+        -------
+        n_bytes : int
+            Memory footprint (bytes) of the stored unique terms. Null if the
+            unique terms are memory-mapped or computed on the fly.
+        """
+        if self._storage == 'stored':
+            return int(self._terms_rdft_vox.nbytes)
+        else:
+            return 0
+    # -------------------------------------------------------------------------
+    def get_disk_footprint(self):
+        """Get disk footprint of the memory-mapped unique terms.
+
+        Returns
+        -------
+        n_bytes : int
+            Disk footprint (bytes) of the memory-mapped unique terms. Null if
+            the unique terms are stored in memory or computed on the fly.
+        """
+        if self._storage == 'out_of_core':
+            return int(self._terms_rdft_vox.nbytes)
+        else:
+            return 0
+    # -------------------------------------------------------------------------
+    def _store_unique_terms(self):
+        """Store unique terms (in memory or memory-mapped temporary file).
+
+        Under out-of-core storage, the unique terms are computed one at a time
+        and written to an anonymous temporary file (deleted when closed),
+        which is then memory-mapped such that only the pages currently
+        accessed are resident in memory.
+        """
+        # Set unique terms shape
+        shape = (len(self._unique_terms), *self._rdft_dims)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        if self._storage == 'stored':
+            # Initialize unique terms (memory)
+            self._terms_rdft_vox = np.empty(shape, dtype=self._dtype)
+        elif self._storage == 'out_of_core':
+            # Initialize unique terms (memory-mapped temporary file)
+            with tempfile.TemporaryFile(dir=self._memmap_dir) as memmap_file:
+                self._terms_rdft_vox = np.memmap(memmap_file, mode='w+',
+                                                 dtype=self._dtype,
+                                                 shape=shape)
+        else:
+            self._terms_rdft_vox = None
+            return
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute and store unique terms
+        for k in range(len(self._unique_terms)):
+            self._terms_rdft_vox[k] = self._compute_unique_term(k)
+        # Flush memory-mapped unique terms to disk
+        if self._storage == 'out_of_core':
+            self._terms_rdft_vox.flush()
+    # -------------------------------------------------------------------------
+    def __getstate__(self):
+        """Get state to be serialized (pickled).
+
+        The memory-mapped unique terms (out-of-core storage) are not
+        serialized, being recomputed when the state is restored.
+
+        Returns
+        -------
+        state : dict
+            Instance state.
+        """
+        state = self.__dict__.copy()
+        if self._storage == 'out_of_core':
+            state['_terms_rdft_vox'] = None
+        return state
+    # -------------------------------------------------------------------------
+    def __setstate__(self, state):
+        """Restore serialized (pickled) state.
+
+        Parameters
+        ----------
+        state : dict
+            Instance state.
+        """
+        self.__dict__.update(state)
+        if self._storage == 'out_of_core':
+            self._store_unique_terms()
+    # -------------------------------------------------------------------------
+    def _set_unique_terms(self):
+        """Set unique terms and linear combination coefficients."""
+        # Set unique second-order and fourth-order products of the unit wave
+        # vector components and zero-frequency term
+        self._unique_terms = \
+            list(it.combinations_with_replacement(range(self._n_dim), 2)) \
+            + list(it.combinations_with_replacement(range(self._n_dim), 4)) \
+            + [(), ]
+        # Set unique terms indexes
+        terms_idxs = {term: k for k, term in enumerate(self._unique_terms)}
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize linear combination coefficients
+        n_comps = len(self._comp_order)
+        self._term_matrix = np.zeros((len(self._unique_terms), 3, n_comps,
+                                      n_comps))
+        # Loop over Green operator matricial form components
+        for p, compi in enumerate(self._comp_order):
+            for q, compj in enumerate(self._comp_order):
+                # Get fourth-order tensor indexes
+                k, l, i, j = [int(x) - 1 for x in compi + compj]
+                # Set first term contributions (Kronecker delta and associated
+                # second-order product)
+                first_terms = [(k == i, (l, j)), ]
+                if self._strain_formulation == 'infinitesimal':
+                    first_terms += [(k == j, (l, i)), (l == j, (k, i)),
+                                    (l == i, (k, j))]
+                # Assemble first term contributions
+                for is_delta, product in first_terms:
+                    if is_delta:
+                        self._term_matrix[
+                            terms_idxs[tuple(sorted(product))], 0, p, q] += 1.0
+                # Assemble second term contribution
+                self._term_matrix[
+                    terms_idxs[tuple(sorted((k, l, i, j)))], 1, p, q] = -1.0
+                # Assemble zero-frequency term contribution
+                self._term_matrix[terms_idxs[()], 2, p, q] = 1.0
+    # -------------------------------------------------------------------------
+    def _compute_unique_term(self, index):
+        """Compute unique term (half spectrum).
+
+        Parameters
+        ----------
+        index : int
+            Unique term index.
+
+        Returns
+        -------
+        term_rdft_vox : numpy.ndarray
+            Unique term (half spectrum) stored in a numpy.ndarray of shape
+            (n_voxels_1, ..., n_voxels_d//2 + 1).
+        """
+        # Get spatial dimensions indexes of the unit wave vector components
+        # product
+        term = self._unique_terms[index]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute zero-frequency term
+        if len(term) == 0:
+            term_rdft_vox = np.zeros(self._rdft_dims, dtype=self._dtype)
+            term_rdft_vox[self._n_dim*(0,)] = 1.0
+            return term_rdft_vox
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute frequency wave vector squared norm
+        freq_sqnorm = sum([np.square(freqs) for freqs in self._freqs_dims])
+        # Compute frequency wave vector components product
+        product = np.ones(self._rdft_dims)
+        for i in term:
+            product = product*self._freqs_dims[i]
+        # Compute Hermitian part of the frequency wave vector components
+        # product, which vanishes if the product is odd with respect to the
+        # Nyquist frequencies
+        signs = np.ones(self._n_dim*(1,))
+        for i in range(self._n_dim):
+            if term.count(i) % 2 == 1:
+                signs = signs*self._nyquist_signs[i]
+        if np.any(signs < 0.0):
+            product = product*(0.5*(1.0 + signs))
+        # Compute unit wave vector components product
+        term_rdft_vox = np.divide(
+            product, freq_sqnorm**(len(term)//2),
+            out=np.zeros(self._rdft_dims),
+            where=np.sqrt(freq_sqnorm) > 1e-10)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return term_rdft_vox.astype(self._dtype, copy=False)
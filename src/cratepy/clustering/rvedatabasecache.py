@@ -0,0 +1,354 @@
+"""Persistent cache of RVE local elastic response databases.
+
+This module includes the class which embodies a persistent on-disk cache of
+RVE local elastic response databases. Given that the computation of a RVE
+local elastic response database (DNS solution of several microscale
+equilibrium problems) only depends on the RVE spatial discretization, on the
+material phases elastic properties, on the problem formulation, on the DNS
+homogenization-based multi-scale method and on the macroscale strain
+loadings, each database is stored under a content-addressed key (hash of
+these data). Simulations sharing the same offline-stage DNS data (e.g.,
+parametric studies on the number of clusters or on the macroscale loading)
+can then skip the DNS solution procedure.
+
+The cache size is bounded, being the least recently used databases evicted
+whenever the cache size exceeds the prescribed maximum size. The cache can be
+set either from the input data file or from the following environment
+variables:
+
+* ``CRATE_RVE_DATABASE_CACHE`` : Cache directory path.
+
+* ``CRATE_RVE_DATABASE_CACHE_SIZE`` : Cache maximum size (GB).
+
+Classes
+-------
+RVEDatabaseCache
+    Persistent cache of RVE local elastic response databases.
+
+Functions
+---------
+get_environment_cache_settings
+    Get RVE local elastic response database cache settings from environment.
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Standard
+import os
+import shutil
+import hashlib
+import uuid
+# Third-party
+import numpy as np
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+# Set cache format version (must be incremented whenever the format of the
+# stored databases changes, such that databases stored with a previous format
+# are never loaded)
+_CACHE_FORMAT_VERSION = 1
+# =============================================================================
+def get_environment_cache_settings():
+    """Get RVE local elastic response database cache settings from environment.
+
+    Returns
+    -------
+    cache_settings : {dict, None}
+        RVE local elastic response database cache settings, namely the cache
+        directory path (key 'cache_dir', item str) and the cache maximum size
+        in bytes (key 'max_size', item {int, None}). None if the cache
+        directory path environment variable is not set.
+    """
+    # Get cache directory path
+    cache_dir = os.environ.get('CRATE_RVE_DATABASE_CACHE', '').strip()
+    if not cache_dir:
+        return None
+    # Get cache maximum size
+    max_size = os.environ.get('CRATE_RVE_DATABASE_CACHE_SIZE', '').strip()
+    if max_size:
+        try:
+            max_size = int(float(max_size)*1024**3)
+        except ValueError:
+            raise RuntimeError('Invalid RVE local elastic response database '
+                               'cache maximum size (environment variable '
+                               'CRATE_RVE_DATABASE_CACHE_SIZE).')
+    else:
+        max_size = None
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return {'cache_dir': os.path.abspath(cache_dir), 'max_size': max_size}
+# =============================================================================
+class RVEDatabaseCache:
+    """Persistent cache of RVE local elastic response databases.
+
+    Each cached database is stored in a directory named after the associated
+    content-addressed key, containing the RVE local elastic strain response
+    (memory-mappable `.npy` file) and the RVE homogenized stress-strain
+    responses (`.npz` file). The last access time of each database is tracked
+    through the modification time of the database directory.
+
+    Attributes
+    ----------
+    _cache_dir : str
+        Cache directory path.
+    _max_size : int
+        Cache maximum size (bytes).
+
+    Methods
+    -------
+    get_key(*data)
+        *staticmethod*: Get content-addressed key of given data.
+    _update_hash(hasher, item)
+        *staticmethod*: Update hash with given data item.
+    load(self, key, mmap_mode='r')
+        Load RVE local elastic response database from cache.
+    store(self, key, rve_global_response, global_hom_stress_strain)
+        Store RVE local elastic response database in cache.
+    get_cache_size(self)
+        Get cache size.
+    _evict(self, keep_key=None)
+        Evict least recently used databases until cache size is admissible.
+    """
+    def __init__(self, cache_dir, max_size=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Cache directory path. Created if it does not exist.
+        max_size : int, default=None
+            Cache maximum size (bytes). If None, then the cache maximum size
+            is set to 5 GB.
+        """
+        self._cache_dir = os.path.abspath(cache_dir)
+        if max_size is None:
+            self._max_size = 5*1024**3
+        else:
+            self._max_size = int(max_size)
+        # Create cache directory
+        os.makedirs(self._cache_dir, exist_ok=True)
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def get_key(*data):
+        """Get content-addressed key of given data.
+
+        Parameters
+        ----------
+        *data : {str, int, float, bool, list, tuple, dict, numpy.ndarray}
+            Data from which the content-addressed key is computed. Containers
+            are processed recursively (dictionaries sorted by key) and numpy
+            arrays are processed through their data type, shape and binary
+            content.
+
+        Returns
+        -------
+        key : str
+            Content-addressed key (SHA-256 hexadecimal digest). The cache
+            format version is always accounted for.
+        """
+        # Initialize hash
+        hasher = hashlib.sha256()
+        # Update hash with cache format version
+        RVEDatabaseCache._update_hash(hasher, _CACHE_FORMAT_VERSION)
+        # Update hash
+        for item in data:
+            RVEDatabaseCache._update_hash(hasher, item)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return hasher.hexdigest()
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _update_hash(hasher, item):
+        """Update hash with given data item.
+
+        Parameters
+        ----------
+        hasher : hashlib.sha256
+            Hash object.
+        item : {str, int, float, bool, list, tuple, dict, numpy.ndarray}
+            Data item. Containers are processed recursively.
+        """
+        if isinstance(item, np.ndarray):
+            array = np.ascontiguousarray(item)
+            hasher.update(b'ndarray' + str(array.dtype.str).encode()
+                          + str(array.shape).encode())
+            hasher.update(array.tobytes())
+        elif isinstance(item, dict):
+            hasher.update(b'dict' + str(len(item)).encode())
+            for dict_key in sorted(item.keys(), key=str):
+                RVEDatabaseCache._update_hash(hasher, str(dict_key))
+                RVEDatabaseCache._update_hash(hasher, item[dict_key])
+        elif isinstance(item, (list, tuple)):
+            hasher.update(b'sequence' + str(len(item)).encode())
+            for sub_item in item:
+                RVEDatabaseCache._update_hash(hasher, sub_item)
+        elif isinstance(item, (float, np.floating)):
+            hasher.update(b'float' + np.float64(item).tobytes())
+        else:
+            hasher.update(type(item).__name__.encode() + b':'
+                          + str(item).encode())
+    # -------------------------------------------------------------------------
+    def load(self, key, mmap_mode='r'):
+        """Load RVE local elastic response database from cache.
+
+        Parameters
+        ----------
+        key : str
+            Content-addressed key.
+        mmap_mode : {None, 'r', 'r+', 'c'}, default='r'
+            Memory-map mode of the RVE local elastic strain response (see
+            `numpy.load`).
+
+        Returns
+        -------
+        rve_global_response : {numpy.ndarray (2d), None}
+            RVE local elastic strain response (numpy.ndarray of shape
+            (n_voxels, n_mac_strains*n_strain_comps)). None if the database
+            is not cached.
+        global_hom_stress_strain : {dict, None}
+            RVE homogenized stress-strain response (item, numpy.ndarray (2d))
+            for each macroscale strain loading identifier (key, int). None if
+            the database is not cached.
+        """
+        # Get database directory path
+        entry_dir = os.path.join(self._cache_dir, key)
+        # Check if database is cached
+        if not os.path.isdir(entry_dir):
+            return None, None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Load database (a corrupted database is discarded)
+        try:
+            rve_global_response = np.load(
+                os.path.join(entry_dir, 'rve_global_response.npy'),
+                mmap_mode=mmap_mode)
+            with np.load(os.path.join(entry_dir,
+                                      'global_hom_stress_strain.npz')) as data:
+                global_hom_stress_strain = {int(mac_strain_id): data[
+                    mac_strain_id] for mac_strain_id in data.files}
+        except (OSError, ValueError, KeyError):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None, None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Update database last access time
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            pass
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return rve_global_response, global_hom_stress_strain
+    # -------------------------------------------------------------------------
+    def store(self, key, rve_global_response, global_hom_stress_strain):
+        """Store RVE local elastic response database in cache.
+
+        The database is first written to a temporary directory that is then
+        renamed, such that concurrent simulations never read a partially
+        written database.
+
+        ----
+
+        Parameters
+        ----------
+        key : str
+            Content-addressed key.
+        rve_global_response : numpy.ndarray (2d)
+            RVE local elastic strain response (numpy.ndarray of shape
+            (n_voxels, n_mac_strains*n_strain_comps)).
+        global_hom_stress_strain : dict
+            RVE homogenized stress-strain response (item, numpy.ndarray (2d))
+            for each macroscale strain loading identifier (key, int).
+        """
+        # Get database directory path
+        entry_dir = os.path.join(self._cache_dir, key)
+        # Skip already cached database
+        if os.path.isdir(entry_dir):
+            return
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set temporary database directory path
+        tmp_dir = os.path.join(self._cache_dir,
+                               '.tmp_' + key + '_' + uuid.uuid4().hex)
+        # Write database
+        try:
+            os.makedirs(tmp_dir)
+            np.save(os.path.join(tmp_dir, 'rve_global_response.npy'),
+                    rve_global_response)
+            np.savez(os.path.join(tmp_dir, 'global_hom_stress_strain.npz'),
+                     **{str(mac_strain_id): hom_stress_strain
+                        for mac_strain_id, hom_stress_strain
+                        in global_hom_stress_strain.items()})
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Discard database (e.g., already stored by concurrent simulation
+            # or insufficient disk space)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Evict least recently used databases
+        self._evict(keep_key=key)
+    # -------------------------------------------------------------------------
+    def get_cache_size(self):
+        """Get cache size.
+
+        Returns
+        -------
+        cache_size : int
+            Cache size (bytes).
+        """
+        cache_size = 0
+        # Loop over cache directory files
+        for root, _, files in os.walk(self._cache_dir):
+            for file in files:
+                try:
+                    cache_size += os.path.getsize(os.path.join(root, file))
+                except OSError:
+                    pass
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return cache_size
+    # -------------------------------------------------------------------------
+    def _evict(self, keep_key=None):
+        """Evict least recently used databases until cache size is admissible.
+
+        Parameters
+        ----------
+        keep_key : str, default=None
+            Content-addressed key of database that is never evicted (e.g.,
+            database just stored).
+        """
+        # Initialize cached databases last access time and size
+        entries = []
+        # Loop over cached databases
+        for key in os.listdir(self._cache_dir):
+            # Skip temporary databases
+            if key.startswith('.'):
+                continue
+            # Get database directory path
+            entry_dir = os.path.join(self._cache_dir, key)
+            if not os.path.isdir(entry_dir):
+                continue
+            # Get database last access time and size
+            try:
+                access_time = os.path.getmtime(entry_dir)
+                entry_size = sum(
+                    os.path.getsize(os.path.join(entry_dir, file))
+                    for file in os.listdir(entry_dir))
+            except OSError:
+                continue
+            entries.append((access_time, entry_size, key))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute cache size
+        cache_size = sum([entry[1] for entry in entries])
+        # Evict least recently used databases
+        for access_time, entry_size, key in sorted(entries):
+            # Check cache size
+            if cache_size <= self._max_size:
+                break
+            # Skip protected database
+            if key == keep_key:
+                continue
+            # Evict database
+            shutil.rmtree(os.path.join(self._cache_dir, key),
+                          ignore_errors=True)
+            cache_size -= entry_size
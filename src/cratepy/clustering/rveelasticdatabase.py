@@ -15,13 +15,18 @@ RVEElasticDatabase
 #                                                                       Modules
 # =============================================================================
 # Standard
+import os
 import copy
+import concurrent.futures
 # Third-party
 import numpy as np
 # Local
 import ioput.info as info
 import tensor.matrixoperations as mop
 from clustering.solution.ffthombasicscheme import FFTBasicScheme
+from clustering.solution.fftandersonscheme import FFTAndersonScheme
+from clustering.solution.fftkrylovscheme import FFTKrylovScheme
+from clustering.rvedatabasecache import RVEDatabaseCache
 from material.materialoperations import compute_rotation_tensor
 #
 #                                                          Authorship & Credits
@@ -66,7 +71,8 @@ class RVEElasticDatabase:
     Methods
     -------
     compute_rve_response_database(self, dns_method, dns_method_data, \
-                                  mac_strains, is_strain_sym)
+                                  mac_strains, is_strain_sym, n_workers=1, \
+                                  executor='thread', cache=None)
         Compute RVE's local elastic strain response database.
     compute_rve_elastic_tangent_modulus(self, strain_magnitude_factor=1.0)
         Compute RVE's elastic effective tangent modulus.
@@ -74,6 +80,14 @@ class RVEElasticDatabase:
         Set isotropic elastic constants from effective tangent modulus.
     get_eff_isotropic_elastic_constants(self):
         Get isotropic elastic constants from effective tangent modulus.
+    _get_cache_key(self, dns_method, dns_method_data, mac_strains, \
+                   is_strain_sym)
+        Get RVE's local elastic strain response database cache key.
+    _get_homogenization_method(self, dns_method, dns_method_data)
+        Get DNS homogenization-based multi-scale method.
+    _compute_load_case_response(self, dns_method, dns_method_data, \
+                                mac_strain_id, mac_strain, comp_order)
+        Compute RVE's local elastic strain response to macroscale loading.
     """
     def __init__(self, strain_formulation, problem_type, rve_dims,
                  n_voxels_dims, regular_grid, material_phases,
@@ -115,7 +129,8 @@ class RVEElasticDatabase:
         self.rve_global_response = None
     # -------------------------------------------------------------------------
     def compute_rve_response_database(self, dns_method, dns_method_data,
-                                      mac_strains, is_strain_sym):
+                                      mac_strains, is_strain_sym, n_workers=1,
+                                      executor='thread', cache=None):
         """Compute RVE's local elastic strain response database.
 
         Build a RVE's local elastic strain response database by solving one or
@@ -123,11 +138,20 @@ class RVEElasticDatabase:
         macroscale strain loading) through a given homogenization-based
         multi-scale method.
 
+        Given that the microscale equilibrium problems are independent, they
+        can be solved in parallel by a pool of workers (threads or processes).
+        The RVE's local elastic strain response database is always assembled
+        according to the macroscale strain loadings order.
+
+        If a persistent cache is provided, then the RVE's local elastic strain
+        response database is loaded from the cache whenever available (the
+        DNS solution procedure is skipped) and stored in the cache otherwise.
+
         ----
 
         Parameters
         ----------
-        dns_method : {'fft-basic'}
+        dns_method : {'fft_basic', 'fft_anderson', 'fft_krylov'}
             DNS homogenization-based multi-scale method.
         dns_method_data : dict
             Parameters of DNS homogenization-based multi-scale method.
@@ -139,6 +163,15 @@ class RVEElasticDatabase:
             True if the macroscale strain second-order tensor associated with
             the RVE's local elastic strain response database is symmetric by
             definition, False otherwise.
+        n_workers : int, default=1
+            Number of workers solving the macroscale strain loadings in
+            parallel. If -1, then all the available CPUs are used. If 1, then
+            the macroscale strain loadings are solved sequentially.
+        executor : {'thread', 'process'}, default='thread'
+            Pool of workers: pool of threads ('thread') or pool of processes
+            ('process').
+        cache : RVEDatabaseCache, default=None
+            Persistent cache of RVE local elastic response databases.
         """
         # Get problem type parameters
         n_dim, comp_order_sym, comp_order_nsym = \
@@ -150,38 +183,109 @@ class RVEElasticDatabase:
             comp_order = comp_order_nsym
         # Get total number of voxels
         n_voxels = np.prod(self._n_voxels_dims)
+        # Get number of macroscale strain loadings
+        n_mac_strains = len(mac_strains)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Instatiate homogenization-based multi-scale method
-        if dns_method == 'fft_basic':
-            homogenization_method = FFTBasicScheme(
-                self._strain_formulation, self._problem_type, self._rve_dims,
-                self._n_voxels_dims, self._regular_grid, self._material_phases,
-                self._material_phases_properties)
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        else:
+        # Check homogenization-based multi-scale method
+        if dns_method not in ('fft_basic', 'fft_anderson', 'fft_krylov'):
             raise RuntimeError('Unknown homogenization-based multi-scale '
                                'method.')
+        # Set number of workers
+        if n_workers == -1:
+            n_workers = os.cpu_count()
+        n_workers = max(1, min(n_workers, n_mac_strains))
+        # Set pool of workers
+        if executor == 'thread':
+            pool_executor = concurrent.futures.ThreadPoolExecutor
+        elif executor == 'process':
+            pool_executor = concurrent.futures.ProcessPoolExecutor
+        else:
+            raise RuntimeError('Unknown pool of workers executor.')
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Load RVE's local elastic strain response database from cache
+        if cache is not None:
+            # Get cache key
+            cache_key = self._get_cache_key(dns_method, dns_method_data,
+                                            mac_strains, is_strain_sym)
+            # Load RVE's local elastic strain response database
+            rve_global_response, global_hom_stress_strain = \
+                cache.load(cache_key)
+            # Skip DNS solution procedure if database is cached
+            if rve_global_response is not None:
+                info.displayinfo('5', 'Loaded RVE local elastic strain '
+                                 'response database from cache...', 2)
+                self.rve_global_response = rve_global_response
+                self._global_hom_stress_strain = global_hom_stress_strain
+                return
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Reset RVE's local elastic strain response database (avoids
+        # transferring a previous database to the pool of processes)
+        self.rve_global_response = None
         # Initialize RVE's local elastic strain response database
-        self.rve_global_response = \
-            np.zeros((n_voxels, len(mac_strains)*len(comp_order)))
-        # Loop over macroscale strain loadings
-        for i in range(len(mac_strains)):
-            info.displayinfo('5', 'Macroscale strain loading (' + str(i + 1)
-                             + ' of ' + str(len(mac_strains)) + ')...', 2)
-            # Get macroscale strain tensor
-            mac_strain_id = i + 1
-            mac_strain = mac_strains[i]
-            # Compute RVE's local elastic strain response
-            strain_vox = homogenization_method.compute_rve_local_response(
-                mac_strain_id, mac_strain)
-            # Assemble RVE's local elastic strain response to database
-            for j in range(len(comp_order)):
-                self.rve_global_response[:, i*len(comp_order) + j] = \
-                    strain_vox[comp_order[j]].flatten()
-            # Store RVE's homogenized stress-strain material response
-            self._global_hom_stress_strain[mac_strain_id] = \
-                copy.deepcopy(homogenization_method.get_hom_stress_strain())
+        rve_global_response = \
+            np.zeros((n_voxels, n_mac_strains*len(comp_order)))
+        # Compute RVE's local elastic strain response database
+        if n_workers == 1:
+            # Loop over macroscale strain loadings
+            for i in range(n_mac_strains):
+                info.displayinfo('5', 'Macroscale strain loading ('
+                                 + str(i + 1) + ' of ' + str(n_mac_strains)
+                                 + ')...', 2)
+                # Get macroscale strain tensor
+                mac_strain_id = i + 1
+                mac_strain = mac_strains[i]
+                # Compute RVE's local elastic strain response
+                load_case_response, hom_stress_strain, n_iterations = \
+                    self._compute_load_case_response(
+                        dns_method, dns_method_data, mac_strain_id,
+                        mac_strain, comp_order)
+                info.displayinfo('5', 'Number of iterations: '
+                                 + str(n_iterations), 3)
+                # Assemble RVE's local elastic strain response to database
+                rve_global_response[:, i*len(comp_order):
+                                    (i + 1)*len(comp_order)] = \
+                    load_case_response
+                # Store RVE's homogenized stress-strain material response
+                self._global_hom_stress_strain[mac_strain_id] = \
+                    hom_stress_strain
+        else:
+            info.displayinfo('5', 'Solving ' + str(n_mac_strains)
+                             + ' macroscale strain loadings (' + str(n_workers)
+                             + ' ' + executor + ' workers)...', 2)
+            # Solve macroscale strain loadings with pool of workers
+            with pool_executor(max_workers=n_workers) as pool:
+                # Submit macroscale strain loadings
+                futures = [pool.submit(self._compute_load_case_response,
+                                       dns_method, dns_method_data, i + 1,
+                                       mac_strains[i], comp_order)
+                           for i in range(n_mac_strains)]
+                # Loop over macroscale strain loadings
+                for i in range(n_mac_strains):
+                    # Get macroscale strain loading identifier
+                    mac_strain_id = i + 1
+                    # Get RVE's local elastic strain response
+                    load_case_response, hom_stress_strain, n_iterations = \
+                        futures[i].result()
+                    info.displayinfo('5', 'Macroscale strain loading ('
+                                     + str(i + 1) + ' of '
+                                     + str(n_mac_strains) + ')...', 2)
+                    info.displayinfo('5', 'Number of iterations: '
+                                     + str(n_iterations), 3)
+                    # Assemble RVE's local elastic strain response to
+                    # database
+                    rve_global_response[:, i*len(comp_order):
+                                        (i + 1)*len(comp_order)] = \
+                        load_case_response
+                    # Store RVE's homogenized stress-strain material response
+                    self._global_hom_stress_strain[mac_strain_id] = \
+                        hom_stress_strain
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Store RVE's local elastic strain response database
+        self.rve_global_response = rve_global_response
+        # Store RVE's local elastic strain response database in cache
+        if cache is not None:
+            cache.store(cache_key, self.rve_global_response,
+                        self._global_hom_stress_strain)
     # -------------------------------------------------------------------------
     def compute_rve_elastic_tangent_modulus(self, strain_magnitude_factor=1.0):
         """Compute RVE's elastic effective tangent modulus.
@@ -292,3 +396,151 @@ class RVEElasticDatabase:
             estimated from the RVE's elastic effective tangent modulus.
         """
         return copy.deepcopy(self._eff_elastic_properties)
+    # -------------------------------------------------------------------------
+    def _get_cache_key(self, dns_method, dns_method_data, mac_strains,
+                       is_strain_sym):
+        """Get RVE's local elastic strain response database cache key.
+
+        The cache key is computed from all the data that the RVE's local
+        elastic strain response database depends on. Given that the DNS
+        solution is linear elastic, only the elastic properties of each
+        material phase are considered. Besides the DNS homogenization-based
+        multi-scale method, its solver version and solution procedure
+        parameters (e.g., convergence criterion and tolerance) are also
+        considered, such that a database is not reused once the solution
+        procedure changes. Parameters that do not change the solution (e.g.,
+        FFT backend) are not considered.
+
+        ----
+
+        Parameters
+        ----------
+        dns_method : {'fft_basic', 'fft_anderson', 'fft_krylov'}
+            DNS homogenization-based multi-scale method.
+        dns_method_data : dict
+            Parameters of DNS homogenization-based multi-scale method.
+        mac_strains : list[numpy.ndarray (2d)]
+            List of macroscale strain loadings (numpy.ndarray (2d)).
+        is_strain_sym : bool
+            True if the macroscale strain second-order tensor associated with
+            the RVE's local elastic strain response database is symmetric by
+            definition, False otherwise.
+
+        Returns
+        -------
+        cache_key : str
+            Content-addressed cache key.
+        """
+        # Get material phases elastic properties
+        elastic_properties = {
+            mat_phase: [float(self._material_phases_properties[mat_phase][
+                prop]) for prop in ('E', 'v')]
+            for mat_phase in self._material_phases}
+        # Get DNS homogenization-based multi-scale method solver parameters
+        solver_parameters = self._get_homogenization_method(
+            dns_method, dns_method_data).get_solver_parameters()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute cache key
+        cache_key = RVEDatabaseCache.get_key(
+            'rve_elastic_database', self._strain_formulation,
+            int(self._problem_type), [float(x) for x in self._rve_dims],
+            np.asarray(self._regular_grid, dtype=np.int64),
+            elastic_properties, dns_method, solver_parameters,
+            [np.asarray(x, dtype=float) for x in mac_strains],
+            bool(is_strain_sym))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return cache_key
+    # -------------------------------------------------------------------------
+    def _get_homogenization_method(self, dns_method, dns_method_data):
+        """Get DNS homogenization-based multi-scale method.
+
+        Parameters
+        ----------
+        dns_method : {'fft_basic', 'fft_anderson', 'fft_krylov'}
+            DNS homogenization-based multi-scale method.
+        dns_method_data : dict
+            Parameters of DNS homogenization-based multi-scale method.
+
+        Returns
+        -------
+        homogenization_method : DNSHomogenizationMethod
+            DNS homogenization-based multi-scale method.
+        """
+        # Instatiate homogenization-based multi-scale method
+        if dns_method in ('fft_basic', 'fft_anderson', 'fft_krylov'):
+            # Get FFT backend parameters
+            if dns_method_data is None:
+                dns_method_data = {}
+            fft_backend = dns_method_data.get('fft_backend', 'numpy')
+            fft_workers = dns_method_data.get('fft_workers', None)
+            # Get FFT-based homogenization scheme
+            if dns_method == 'fft_anderson':
+                fft_scheme = FFTAndersonScheme
+            elif dns_method == 'fft_krylov':
+                fft_scheme = FFTKrylovScheme
+            else:
+                fft_scheme = FFTBasicScheme
+            # Instantiate FFT-based homogenization scheme
+            homogenization_method = fft_scheme(
+                self._strain_formulation, self._problem_type, self._rve_dims,
+                self._n_voxels_dims, self._regular_grid, self._material_phases,
+                self._material_phases_properties, fft_backend=fft_backend,
+                fft_workers=fft_workers)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        else:
+            raise RuntimeError('Unknown homogenization-based multi-scale '
+                               'method.')
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return homogenization_method
+    # -------------------------------------------------------------------------
+    def _compute_load_case_response(self, dns_method, dns_method_data,
+                                    mac_strain_id, mac_strain, comp_order):
+        """Compute RVE's local elastic strain response to macroscale loading.
+
+        A dedicated instance of the DNS homogenization-based multi-scale
+        method is employed, such that different macroscale strain loadings
+        can be solved concurrently.
+
+        ----
+
+        Parameters
+        ----------
+        dns_method : {'fft_basic', 'fft_anderson', 'fft_krylov'}
+            DNS homogenization-based multi-scale method.
+        dns_method_data : dict
+            Parameters of DNS homogenization-based multi-scale method.
+        mac_strain_id : int
+            Macroscale strain loading identifier.
+        mac_strain : numpy.ndarray (2d)
+            Macroscale strain loading. Infinitesimal strain tensor
+            (infinitesimal strains) or deformation gradient (finite strains).
+        comp_order : list[str]
+            Strain components order.
+
+        Returns
+        -------
+        load_case_response : numpy.ndarray (2d)
+            RVE's local elastic strain response stored as numpy.ndarray of
+            shape (n_voxels, n_strain_comps), where each column is associated
+            with a strain component.
+        hom_stress_strain : numpy.ndarray (2d)
+            RVE's homogenized stress-strain material response.
+        n_iterations : int
+            Total number of iterations of the DNS solution procedure.
+        """
+        # Get DNS homogenization-based multi-scale method
+        homogenization_method = self._get_homogenization_method(
+            dns_method, dns_method_data)
+        # Compute RVE's local elastic strain response
+        strain_vox = homogenization_method.compute_rve_local_response(
+            mac_strain_id, mac_strain)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build RVE's local elastic strain response
+        load_case_response = np.stack(
+            [strain_vox[comp].flatten() for comp in comp_order], axis=1)
+        # Get RVE's homogenized stress-strain material response
+        hom_stress_strain = homogenization_method.get_hom_stress_strain()
+        # Get total number of iterations of the DNS solution procedure
+        n_iterations = homogenization_method.get_n_iterations()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return load_case_response, hom_stress_strain, n_iterations
@@ -3,4 +3,7 @@
 #                                                                       Modules
 # =============================================================================
 from clustering.solution import dnshomogenization
+from clustering.solution import fftandersonscheme
+from clustering.solution import fftbackends
 from clustering.solution import ffthombasicscheme
+from clustering.solution import fftkrylovscheme
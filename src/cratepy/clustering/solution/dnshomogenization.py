@@ -32,6 +32,8 @@ class DNSHomogenizationMethod(ABC):
         *abstract*: Compute RVE local strain response.
     get_hom_stress_strain(self)
         *abstract*: Get the homogenized strain-stress material response.
+    get_solver_parameters(self)
+        *abstract*: Get parameters that determine the RVE local response.
     """
     @abstractmethod
     def __init__(self):
@@ -85,3 +87,15 @@ class DNSHomogenizationMethod(ABC):
             Piola-Kirchhoff stress tensor (finite strains).
         """
         pass
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def get_solver_parameters(self):
+        """Get parameters that determine the RVE local response.
+
+        Returns
+        -------
+        solver_parameters : dict
+            Solution procedure parameters (item) that determine the RVE local
+            strain response (key, str), including the solver version.
+        """
+        pass
@@ -0,0 +1,228 @@
+"""FFT-based homogenization Anderson-accelerated scheme multi-scale method.
+
+This module includes the implementation of the Anderson-accelerated version of
+the FFT-based homogenization basic scheme proposed by Moulinec and Suquet
+(1998) [1]_. The Anderson acceleration [2]_ combines the last iterates of the
+basic fixed-point iterative scheme in order to minimize the fixed-point
+residual, significantly reducing the number of iterations required to solve
+the micro-scale equilibrium problem of materials with high phase contrast
+(see the review of Schneider (2021) [3]_).
+
+.. [1] Moulinec, H. and Suquet, P. (1998). *A numerical method for computing
+       the overall response of nonlinear composites with complex
+       microstructure.* Comp Methods Appl M, 157:69-94 (see `here
+       <https://www.sciencedirect.com/science/article/pii/S0045782597002181>`_)
+
+.. [2] Walker, H.F. and Ni, P. (2011). *Anderson acceleration for fixed-point
+       iterations.* SIAM J Numer Anal, 49(4):1715-1735 (see `here
+       <https://epubs.siam.org/doi/10.1137/10078356X>`_)
+
+.. [3] Schneider, M. (2021). *A review of nonlinear FFT-based computational
+       homogenization methods.* Acta Mech, 232:2051-2100 (see `here
+       <https://link.springer.com/article/10.1007/s00707-021-02962-1>`_)
+
+Classes
+-------
+FFTAndersonScheme
+    FFT-based homogenization Anderson-accelerated scheme.
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Third-party
+import numpy as np
+# Local
+from clustering.solution.ffthombasicscheme import FFTBasicScheme
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+class FFTAndersonScheme(FFTBasicScheme):
+    """FFT-based homogenization Anderson-accelerated scheme.
+
+    Anderson-accelerated version of the FFT-based homogenization basic scheme
+    proposed by Moulinec and Suquet (1998). Each iteration performs a basic
+    fixed-point update of the strain DFT, which is then replaced by the
+    combination of the last fixed-point updates that minimizes the
+    fixed-point residual in the least-squares sense (Anderson acceleration
+    with finite depth, see Walker and Ni (2011) [#]_). Since the Anderson
+    mixing is linear, it is performed directly on the strain DFT (half
+    spectrum) and the cost of each iteration is essentially the same as in
+    the basic scheme.
+
+    .. [#] Walker, H.F. and Ni, P. (2011). *Anderson acceleration for
+           fixed-point iterations.* SIAM J Numer Anal, 49(4):1715-1735 (see
+           `here <https://epubs.siam.org/doi/10.1137/10078356X>`_)
+
+    Attributes
+    ----------
+    _anderson_depth : int
+        Anderson acceleration depth, i.e., maximum number of previous
+        iterations considered in the Anderson mixing.
+    _res_diff_hist : list[numpy.ndarray]
+        Differences between consecutive fixed-point residuals (strain DFT).
+    _fp_diff_hist : list[numpy.ndarray]
+        Differences between consecutive fixed-point updates (strain DFT).
+    _res_old : numpy.ndarray
+        Last iteration fixed-point residual (strain DFT).
+    _fp_old : numpy.ndarray
+        Last iteration fixed-point update (strain DFT).
+
+    Methods
+    -------
+    get_solver_parameters(self)
+        Get parameters that determine the RVE local response.
+    _update_strain_DFT(self, iter, strain_DFT_field, stress_DFT_field, \
+                       gop_rdft_vox, mac_strain_DFT_0)
+        Update strain DFT (Anderson-accelerated fixed-point scheme).
+    """
+    def __init__(self, strain_formulation, problem_type, rve_dims,
+                 n_voxels_dims, regular_grid, material_phases,
+                 material_phases_properties, fft_backend='numpy',
+                 fft_workers=None, anderson_depth=5):
+        """Constructor.
+
+        Parameters
+        ----------
+        strain_formulation: {'infinitesimal', 'finite'}
+            Problem strain formulation.
+        problem_type : int
+            Problem type: 2D plane strain (1), 2D plane stress (2),
+            2D axisymmetric (3) and 3D (4).
+        rve_dims : list[float]
+            RVE size in each dimension.
+        n_voxels_dims : list[int]
+            Number of voxels in each dimension of the regular grid (spatial
+            discretization of the RVE).
+        regular_grid : numpy.ndarray (2d or 3d)
+            Regular grid of voxels (spatial discretization of the RVE), where
+            each entry contains the material phase label (int) assigned to the
+            corresponding voxel.
+        material_phases : list[str]
+            RVE material phases labels (str).
+        material_phases_properties : dict
+            Constitutive model material properties (item, dict) associated to
+            each material phase (key, str).
+        fft_backend : {'numpy', 'scipy', 'pyfftw'}, default='numpy'
+            FFT backend.
+        fft_workers : int, default=None
+            Number of workers (threads) of multithreaded FFT backends. If -1,
+            then all the available CPUs are used. If None, then the FFT
+            backend default is adopted.
+        anderson_depth : int, default=5
+            Anderson acceleration depth, i.e., maximum number of previous
+            iterations considered in the Anderson mixing.
+        """
+        super().__init__(strain_formulation, problem_type, rve_dims,
+                         n_voxels_dims, regular_grid, material_phases,
+                         material_phases_properties, fft_backend=fft_backend,
+                         fft_workers=fft_workers)
+        # Check Anderson acceleration depth
+        if anderson_depth < 1:
+            raise RuntimeError('The Anderson acceleration depth must be a '
+                               'positive integer.')
+        # Set Anderson acceleration depth
+        self._anderson_depth = anderson_depth
+        # Initialize Anderson acceleration history
+        self._res_diff_hist = []
+        self._fp_diff_hist = []
+        self._res_old = None
+        self._fp_old = None
+    # -------------------------------------------------------------------------
+    def get_solver_parameters(self):
+        """Get parameters that determine the RVE local response.
+
+        Returns
+        -------
+        solver_parameters : dict
+            Solution procedure parameters (item) that determine the RVE local
+            strain response (key, str), including the Anderson acceleration
+            depth.
+        """
+        solver_parameters = super().get_solver_parameters()
+        solver_parameters['anderson_depth'] = self._anderson_depth
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return solver_parameters
+    # -------------------------------------------------------------------------
+    def _update_strain_DFT(self, iter, strain_DFT_field, stress_DFT_field,
+                           gop_rdft_vox, mac_strain_DFT_0):
+        """Update strain DFT (Anderson-accelerated fixed-point scheme).
+
+        Parameters
+        ----------
+        iter : int
+            Iteration number.
+        strain_DFT_field : numpy.ndarray
+            Strain DFT (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, *n_freqs_dims). Updated in-place.
+        stress_DFT_field : numpy.ndarray
+            Stress DFT (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, *n_freqs_dims).
+        gop_rdft_vox : numpy.ndarray
+            Reference material Green operator (half spectrum) stored as
+            numpy.ndarray of shape (n_comps, n_comps, *n_freqs_dims).
+        mac_strain_DFT_0 : numpy.ndarray (1d)
+            Macroscale strain DFT at the zero-frequency.
+
+        Returns
+        -------
+        strain_DFT_field : numpy.ndarray
+            Updated strain DFT (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, *n_freqs_dims).
+        """
+        # Store current iterative strain DFT
+        strain_DFT_itold = strain_DFT_field.copy()
+        # Compute fixed-point update of strain DFT (basic scheme)
+        strain_DFT_field = super()._update_strain_DFT(
+            iter, strain_DFT_field, stress_DFT_field, gop_rdft_vox,
+            mac_strain_DFT_0)
+        # Compute fixed-point residual
+        res_DFT_field = strain_DFT_field - strain_DFT_itold
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Update Anderson acceleration history
+        if iter == 1:
+            # Reset Anderson acceleration history
+            self._res_diff_hist = []
+            self._fp_diff_hist = []
+        else:
+            # Append differences between consecutive iterations
+            self._res_diff_hist.append(res_DFT_field - self._res_old)
+            self._fp_diff_hist.append(strain_DFT_field - self._fp_old)
+            # Discard oldest iteration beyond Anderson acceleration depth
+            if len(self._res_diff_hist) > self._anderson_depth:
+                self._res_diff_hist.pop(0)
+                self._fp_diff_hist.pop(0)
+        # Store fixed-point residual and update
+        self._res_old = res_DFT_field
+        self._fp_old = strain_DFT_field.copy()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get number of previous iterations available for the Anderson mixing
+        n_hist = len(self._res_diff_hist)
+        # Return fixed-point update if Anderson mixing is not available
+        if n_hist == 0:
+            return strain_DFT_field
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build least-squares problem normal equations
+        normal_matrix = np.zeros((n_hist, n_hist))
+        normal_rhs = np.zeros(n_hist)
+        for i in range(n_hist):
+            normal_rhs[i] = \
+                np.vdot(self._res_diff_hist[i], res_DFT_field).real
+            for j in range(i + 1):
+                normal_matrix[i, j] = np.vdot(self._res_diff_hist[i],
+                                              self._res_diff_hist[j]).real
+                normal_matrix[j, i] = normal_matrix[i, j]
+        # Compute Anderson mixing coefficients (minimize fixed-point residual)
+        mixing_coeffs = np.linalg.lstsq(normal_matrix, normal_rhs,
+                                        rcond=None)[0]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Perform Anderson mixing
+        for i in range(n_hist):
+            strain_DFT_field -= mixing_coeffs[i]*self._fp_diff_hist[i]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return strain_DFT_field
@@ -0,0 +1,377 @@
+"""Fast Fourier Transform (FFT) backends.
+
+This module includes the interface to implement any FFT backend used by the
+FFT-based homogenization methods, as well as the available FFT backends. Since
+the strain and stress local fields are real-valued, only the real-to-complex
+(half spectrum) multidimensional FFT and the associated inverse are required.
+
+Classes
+-------
+FFTBackend
+    FFT backend interface.
+NumpyFFTBackend
+    NumPy FFT backend.
+ScipyFFTBackend
+    SciPy FFT backend.
+PyFFTWFFTBackend
+    pyFFTW FFT backend.
+
+Functions
+---------
+get_available_fft_backends
+    Get available FFT backends.
+get_fft_backend
+    Get FFT backend.
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Standard
+from abc import ABC, abstractmethod
+import os
+# Third-party
+import numpy as np
+import scipy.fft
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+def get_available_fft_backends():
+    """Get available FFT backends.
+
+    Available FFT backends:
+
+    * 'numpy' : NumPy FFT (numpy.fft).
+
+    * 'scipy' : SciPy FFT (scipy.fft), multithreaded.
+
+    * 'pyfftw' : pyFFTW FFT (pyfftw.interfaces.numpy_fft), multithreaded.
+      Requires the optional package pyFFTW.
+
+    ----
+
+    Returns
+    -------
+    available_fft_backends : tuple[str]
+        Available FFT backends.
+    """
+    return ('numpy', 'scipy', 'pyfftw')
+# =============================================================================
+def get_fft_backend(fft_backend='numpy', n_workers=None):
+    """Get FFT backend.
+
+    Parameters
+    ----------
+    fft_backend : {'numpy', 'scipy', 'pyfftw'}, default='numpy'
+        FFT backend.
+    n_workers : int, default=None
+        Number of workers (threads) of multithreaded FFT backends. If -1, then
+        all the available CPUs are used. If None, then the FFT backend default
+        is adopted.
+
+    Returns
+    -------
+    backend : FFTBackend
+        FFT backend.
+    """
+    if fft_backend == 'numpy':
+        backend = NumpyFFTBackend()
+    elif fft_backend == 'scipy':
+        backend = ScipyFFTBackend(n_workers=n_workers)
+    elif fft_backend == 'pyfftw':
+        backend = PyFFTWFFTBackend(n_workers=n_workers)
+    else:
+        raise RuntimeError('Unknown FFT backend.')
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return backend
+# =============================================================================
+class FFTBackend(ABC):
+    """FFT backend interface.
+
+    Attributes
+    ----------
+    _name : str
+        FFT backend name.
+
+    Methods
+    -------
+    rfftn(self, x, axes)
+        *abstract*: Compute real-to-complex multidimensional DFT.
+    irfftn(self, x, s, axes)
+        *abstract*: Compute complex-to-real multidimensional inverse DFT.
+    get_name(self)
+        Get FFT backend name.
+    """
+    @abstractmethod
+    def __init__(self):
+        """Constructor."""
+        pass
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def rfftn(self, x, axes):
+        """Compute real-to-complex multidimensional DFT.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Real-valued array.
+        axes : tuple[int]
+            Axes over which the DFT is computed.
+
+        Returns
+        -------
+        x_dft : numpy.ndarray
+            Discrete Fourier Transform (half spectrum along the last axis in
+            axes).
+        """
+        pass
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def irfftn(self, x, s, axes):
+        """Compute complex-to-real multidimensional inverse DFT.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Discrete Fourier Transform (half spectrum along the last axis in
+            axes).
+        s : tuple[int]
+            Shape of the real-valued output along the axes.
+        axes : tuple[int]
+            Axes over which the inverse DFT is computed.
+
+        Returns
+        -------
+        x_idft : numpy.ndarray
+            Real-valued inverse Discrete Fourier Transform.
+        """
+        pass
+    # -------------------------------------------------------------------------
+    def get_name(self):
+        """Get FFT backend name.
+
+        Returns
+        -------
+        name : str
+            FFT backend name.
+        """
+        return self._name
+# =============================================================================
+class NumpyFFTBackend(FFTBackend):
+    """NumPy FFT backend.
+
+    Attributes
+    ----------
+    _name : str
+        FFT backend name.
+
+    Methods
+    -------
+    rfftn(self, x, axes)
+        Compute real-to-complex multidimensional DFT.
+    irfftn(self, x, s, axes)
+        Compute complex-to-real multidimensional inverse DFT.
+    """
+    def __init__(self):
+        """Constructor."""
+        self._name = 'numpy'
+    # -------------------------------------------------------------------------
+    def rfftn(self, x, axes):
+        """Compute real-to-complex multidimensional DFT.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Real-valued array.
+        axes : tuple[int]
+            Axes over which the DFT is computed.
+
+        Returns
+        -------
+        x_dft : numpy.ndarray
+            Discrete Fourier Transform (half spectrum along the last axis in
+            axes).
+        """
+        return np.fft.rfftn(x, axes=axes)
+    # -------------------------------------------------------------------------
+    def irfftn(self, x, s, axes):
+        """Compute complex-to-real multidimensional inverse DFT.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Discrete Fourier Transform (half spectrum along the last axis in
+            axes).
+        s : tuple[int]
+            Shape of the real-valued output along the axes.
+        axes : tuple[int]
+            Axes over which the inverse DFT is computed.
+
+        Returns
+        -------
+        x_idft : numpy.ndarray
+            Real-valued inverse Discrete Fourier Transform.
+        """
+        return np.fft.irfftn(x, s=s, axes=axes)
+# =============================================================================
+class ScipyFFTBackend(FFTBackend):
+    """SciPy FFT backend.
+
+    Attributes
+    ----------
+    _name : str
+        FFT backend name.
+    _n_workers : {int, None}
+        Number of workers (threads). If -1, then all the available CPUs are
+        used. If None, then the SciPy default is adopted.
+
+    Methods
+    -------
+    rfftn(self, x, axes)
+        Compute real-to-complex multidimensional DFT.
+    irfftn(self, x, s, axes)
+        Compute complex-to-real multidimensional inverse DFT.
+    """
+    def __init__(self, n_workers=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        n_workers : int, default=None
+            Number of workers (threads). If -1, then all the available CPUs
+            are used. If None, then the SciPy default is adopted.
+        """
+        self._name = 'scipy'
+        self._n_workers = n_workers
+    # -------------------------------------------------------------------------
+    def rfftn(self, x, axes):
+        """Compute real-to-complex multidimensional DFT.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Real-valued array.
+        axes : tuple[int]
+            Axes over which the DFT is computed.
+
+        Returns
+        -------
+        x_dft : numpy.ndarray
+            Discrete Fourier Transform (half spectrum along the last axis in
+            axes).
+        """
+        return scipy.fft.rfftn(x, axes=axes, workers=self._n_workers)
+    # -------------------------------------------------------------------------
+    def irfftn(self, x, s, axes):
+        """Compute complex-to-real multidimensional inverse DFT.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Discrete Fourier Transform (half spectrum along the last axis in
+            axes).
+        s : tuple[int]
+            Shape of the real-valued output along the axes.
+        axes : tuple[int]
+            Axes over which the inverse DFT is computed.
+
+        Returns
+        -------
+        x_idft : numpy.ndarray
+            Real-valued inverse Discrete Fourier Transform.
+        """
+        return scipy.fft.irfftn(x, s=s, axes=axes, workers=self._n_workers)
+# =============================================================================
+class PyFFTWFFTBackend(FFTBackend):
+    """pyFFTW FFT backend.
+
+    The pyFFTW interfaces cache is enabled so that the FFTW plans are reused
+    between the successive transforms of the same shape performed along the
+    iterative solution procedure.
+
+    Attributes
+    ----------
+    _name : str
+        FFT backend name.
+    _n_threads : int
+        Number of threads.
+    _fft : module
+        pyFFTW NumPy-like FFT interface (pyfftw.interfaces.numpy_fft).
+
+    Methods
+    -------
+    rfftn(self, x, axes)
+        Compute real-to-complex multidimensional DFT.
+    irfftn(self, x, s, axes)
+        Compute complex-to-real multidimensional inverse DFT.
+    """
+    def __init__(self, n_workers=None):
+        """Constructor.
+
+        Parameters
+        ----------
+        n_workers : int, default=None
+            Number of threads. If -1, then all the available CPUs are used.
+            If None, then a single thread is used.
+        """
+        # Import optional pyFFTW package
+        try:
+            import pyfftw
+            import pyfftw.interfaces.numpy_fft
+        except ImportError:
+            raise RuntimeError('The pyFFTW FFT backend requires the optional '
+                               'package pyFFTW (pyfftw).')
+        # Enable pyFFTW interfaces cache (FFTW plans reuse)
+        pyfftw.interfaces.cache.enable()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        self._name = 'pyfftw'
+        if n_workers is None:
+            self._n_threads = 1
+        elif n_workers == -1:
+            self._n_threads = os.cpu_count()
+        else:
+            self._n_threads = n_workers
+        self._fft = pyfftw.interfaces.numpy_fft
+    # -------------------------------------------------------------------------
+    def rfftn(self, x, axes):
+        """Compute real-to-complex multidimensional DFT.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Real-valued array.
+        axes : tuple[int]
+            Axes over which the DFT is computed.
+
+        Returns
+        -------
+        x_dft : numpy.ndarray
+            Discrete Fourier Transform (half spectrum along the last axis in
+            axes).
+        """
+        return self._fft.rfftn(x, axes=axes, threads=self._n_threads)
+    # -------------------------------------------------------------------------
+    def irfftn(self, x, s, axes):
+        """Compute complex-to-real multidimensional inverse DFT.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Discrete Fourier Transform (half spectrum along the last axis in
+            axes).
+        s : tuple[int]
+            Shape of the real-valued output along the axes.
+        axes : tuple[int]
+            Axes over which the inverse DFT is computed.
+
+        Returns
+        -------
+        x_idft : numpy.ndarray
+            Real-valued inverse Discrete Fourier Transform.
+        """
+        return self._fft.irfftn(x, s=s, axes=axes, threads=self._n_threads)
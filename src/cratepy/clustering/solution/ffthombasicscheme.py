@@ -42,8 +42,9 @@ import colorama
 import ioput.ioutilities as ioutil
 import tensor.tensoroperations as top
 import tensor.matrixoperations as mop
-import clustering.citoperations as citop
+from clustering.greenoperator import CompactGreenOperator
 from clustering.solution.dnshomogenization import DNSHomogenizationMethod
+from clustering.solution.fftbackends import get_fft_backend
 #
 #                                                          Authorship & Credits
 # =============================================================================
@@ -53,6 +54,11 @@ __status__ = 'Stable'
 # =============================================================================
 #
 # =============================================================================
+# Set FFT-based homogenization schemes solver version (must be incremented
+# whenever a change modifies the RVE local strain response, such that cached
+# RVE local elastic strain response databases are not reused)
+_SOLVER_VERSION = 1
+# =============================================================================
 class FFTBasicScheme(DNSHomogenizationMethod):
     """FFT-based homogenization basic scheme.
 
@@ -108,6 +114,9 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         Maximum level of macroscale loading subincrementation.
     _max_cinc_cuts : int
         Maximum number of consecutive macroscale loading increment cuts.
+    _fft_backend : FFTBackend
+        FFT backend used to compute the real-to-complex Discrete Fourier
+        Transforms (half spectrum) of the strain and stress local fields.
     _hom_stress_strain : numpy.ndarray (2d)
         Homogenized stress-strain material response. The homogenized strain and
         homogenized stress tensor components of the i-th loading increment are
@@ -115,16 +124,31 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         strain tensor and Cauchy stress tensor (infinitesimal strains) or
         Deformation gradient and first Piola-Kirchhoff stress tensor (finite
         strains).
+    _n_iterations : int
+        Total number of iterations performed to compute the RVE local elastic
+        strain response (including the iterations of macroscale loading
+        increments that have been cut).
 
     Methods
     -------
     compute_rve_local_response(self, mac_strain_id, mac_strain, verbose=False)
         Compute RVE local elastic strain response.
+    _get_reference_material_properties(self)
+        Get reference material elastic properties.
+    _solve_equilibrium(self, strain_field, mac_strain, comp_order, \
+                       gop_rdft_vox, evar1, evar2, evar3, freqs_dims, \
+                       verbose=False)
+        Solve microscale equilibrium problem for macroscale strain loading.
+    _update_strain_DFT(self, iter, strain_DFT_field, stress_DFT_field, \
+                       gop_rdft_vox, mac_strain_DFT_0)
+        Update strain DFT (fixed-point iterative scheme).
     _elastic_constitutive_model(self, strain_vox, evar1, evar2, evar3, \
                                 finite_strains_model='stvenant-kirchhoff', \
                                 is_optimized=True)
         Elastic or hyperelastic material constitutive model.
-    stress_div_conv_criterion(self, freqs_dims, stress_DFT_vox)
+    _compute_material_log_strain(self, def_gradient_vox, chunk_size=65536)
+        Compute material logarithmic strain tensor local field.
+    stress_div_conv_criterion(self, freqs_dims, stress_DFT_field)
         Convergence criterion based on the divergence of the stress tensor.
     compute_avg_state_vox(self, state_vox)
         Compute average norm of strain or stress local field.
@@ -132,6 +156,10 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         Perform homogenization over regular grid spatial discretization.
     get_hom_stress_strain(self)
         Get homogenized strain-stress material response.
+    get_n_iterations(self)
+        Get total number of iterations.
+    get_solver_parameters(self)
+        Get parameters that determine the RVE local response.
     _display_greetings()
         Output greetings.
     _display_increment_init(inc, subinc_level, total_lfact, inc_lfact)
@@ -146,7 +174,8 @@ class FFTBasicScheme(DNSHomogenizationMethod):
     """
     def __init__(self, strain_formulation, problem_type, rve_dims,
                  n_voxels_dims, regular_grid, material_phases,
-                 material_phases_properties):
+                 material_phases_properties, fft_backend='numpy',
+                 fft_workers=None):
         """Constructor.
 
         Parameters
@@ -170,6 +199,12 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         material_phases_properties : dict
             Constitutive model material properties (item, dict) associated to
             each material phase (key, str).
+        fft_backend : {'numpy', 'scipy', 'pyfftw'}, default='numpy'
+            FFT backend.
+        fft_workers : int, default=None
+            Number of workers (threads) of multithreaded FFT backends. If -1,
+            then all the available CPUs are used. If None, then the FFT
+            backend default is adopted.
         """
         self._strain_formulation = strain_formulation
         self._problem_type = problem_type
@@ -192,10 +227,14 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         # Set macroscale loading subincrementation parameters
         self._max_subinc_level = 5
         self._max_cinc_cuts = 5
+        # Set FFT backend
+        self._fft_backend = get_fft_backend(fft_backend, n_workers=fft_workers)
         # Initialize homogenized strain-stress response
         self._hom_stress_strain = np.zeros((1, 2*n_dim**2))
         if self._strain_formulation == 'finite':
             self._hom_stress_strain[0, 0] = 1.0
+        # Initialize total number of iterations
+        self._n_iterations = 0
     # -------------------------------------------------------------------------
     def compute_rve_local_response(self, mac_strain_id, mac_strain,
                                    verbose=False):
@@ -236,8 +275,6 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Store total macroscale strain tensor
         mac_strain_total = copy.deepcopy(mac_strain)
-        # Initialize macroscale strain increment cut flag
-        is_inc_cut = False
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Set strain/stress components order according to problem strain
         # formulation
@@ -254,6 +291,8 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         self._hom_stress_strain = np.zeros((1, 2*self._n_dim**2))
         if self._strain_formulation == 'finite':
             self._hom_stress_strain[0, 0] = 1.0
+        # Initialize total number of iterations
+        self._n_iterations = 0
         #
         #                                    Material phases elasticity tensors
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -273,20 +312,8 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         #
         #                                 Reference material elastic properties
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Set reference material elastic properties as the mean between the
-        # minimum and maximum values existent among the microstructure's
-        # material phases (proposed by Moulinec and Suquet (1998))
-        mat_prop_ref = dict()
-        mat_prop_ref['E'] = \
-            0.5*(min([self._material_phases_properties[phase]['E']
-                      for phase in self._material_phases])
-                 + max([self._material_phases_properties[phase]['E']
-                        for phase in self._material_phases]))
-        mat_prop_ref['v'] = \
-            0.5*(min([self._material_phases_properties[phase]['v']
-                      for phase in self._material_phases])
-                 + max([self._material_phases_properties[phase]['v']
-                        for phase in self._material_phases]))
+        # Get reference material elastic properties
+        mat_prop_ref = self._get_reference_material_properties()
         #
         #                                              Frequency discretization
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -317,36 +344,24 @@ class FFTBasicScheme(DNSHomogenizationMethod):
             c1 = 1.0/(2.0*miu_ref)
             c2 = lam_ref/(2.0*miu_ref*(lam_ref + 2.0*miu_ref))
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Compute Green operator material independent terms
-        gop_1_dft_vox, gop_2_dft_vox, _ = \
-            citop.gop_material_independent_terms(
-                self._strain_formulation, self._problem_type, self._rve_dims,
-                self._n_voxels_dims)
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Set Green operator matricial form components
-        comps = list(it.product(comp_order, comp_order))
-        # Set mapping between Green operator fourth-order tensor and matricial
-        # form components
-        fo_indexes = list()
-        mf_indexes = list()
-        for i in range(len(comp_order)**2):
-            fo_indexes.append([int(x) - 1
-                               for x in list(comps[i][0] + comps[i][1])])
-            mf_indexes.append([x for x in [comp_order.index(comps[i][0]),
-                                           comp_order.index(comps[i][1])]])
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize Green operator
-        gop_dft_vox = {''.join([str(x + 1) for x in idx]):
-                       np.zeros(tuple(self._n_voxels_dims))
-                       for idx in fo_indexes}
-        # Compute Green operator matricial form components
-        for i in range(len(mf_indexes)):
-            # Get fourth-order tensor indexes
-            fo_idx = fo_indexes[i]
-            # Get Green operator component
-            comp = ''.join([str(x+1) for x in fo_idx])
-            # Compute Green operator matricial form component
-            gop_dft_vox[comp] = c1*gop_1_dft_vox[comp] + c2*gop_2_dft_vox[comp]
+        # Set compact Green operator material independent terms (unique
+        # terms are computed on the fly)
+        gop_terms = CompactGreenOperator(
+            self._strain_formulation, self._problem_type, self._rve_dims,
+            self._n_voxels_dims, storage='on_the_fly')
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set Green operator matricial form Kelvin factors such that the
+        # Green operator can be directly applied to the stress DFT components
+        kelvin_factors = np.array([mop.kelvin_factor(i, comp_order)
+                                   for i in range(len(comp_order))])
+        gop_kelvin_factors = np.array(
+            [[mop.kelvin_factor([i, j], comp_order)*kelvin_factors[j]
+              / kelvin_factors[i] for j in range(len(comp_order))]
+             for i in range(len(comp_order))])
+        # Compute Green operator (half spectrum)
+        gop_rdft_vox = gop_terms.assemble_operator(np.array([c1, c2, 0.0]))
+        gop_rdft_vox *= gop_kelvin_factors.reshape(
+            gop_kelvin_factors.shape + self._n_dim*(1,))
         #
         #                              Macroscale strain loading incrementation
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -372,8 +387,6 @@ class FFTBasicScheme(DNSHomogenizationMethod):
                 *mac_strain_incrementer.get_inc_output_data())
         # Set increment initial time
         inc_init_time = time.time()
-        # Set iteration initial time
-        iter_init_time = time.time()
         #
         #                                   Macroscale loading incremental loop
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -385,185 +398,36 @@ class FFTBasicScheme(DNSHomogenizationMethod):
             # Set initial iterative guess
             if mac_strain_incrementer.get_inc() == 1:
                 # Initialize strain tensor
-                strain_vox = {comp: np.zeros(tuple(self._n_voxels_dims))
-                              for comp in comp_order}
+                strain_field = np.zeros((len(comp_order),
+                                         *self._n_voxels_dims))
                 # Set strain initial iterative guess
-                for comp in comp_order:
+                for k, comp in enumerate(comp_order):
                     # Get strain component indexes
                     so_idx = tuple([int(x) - 1 for x in comp])
                     # Initial guess: Macroscale strain tensor
-                    strain_vox[comp] = np.full(self._regular_grid.shape,
-                                               mac_strain[so_idx])
+                    strain_field[k] = mac_strain[so_idx]
                 # Initialize last converged strain tensor
-                strain_old_vox = copy.deepcopy(strain_vox)
+                strain_old_field = strain_field.copy()
             else:
                 # Initial guess: Last converged strain field
-                strain_vox = copy.deepcopy(strain_old_vox)
-            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Compute stress initial iterative guess
-            stress_vox = self._elastic_constitutive_model(strain_vox, evar1,
-                                                          evar2, evar3)
-            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Compute average strain/stress norm
-            if self._conv_criterion == 'avg_stress_norm':
-                # Compute initial guess average stress norm
-                avg_stress_norm = self._compute_avg_state_vox(stress_vox)
-                # Initialize last iteration average stress norm
-                avg_stress_norm_itold = 0.0
-            #
-            #                           Strain Discrete Fourier Transform (DFT)
-            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Compute strain Discrete Fourier Transform (DFT)
-            strain_DFT_vox = {comp: np.zeros(tuple(self._n_voxels_dims),
-                                             dtype=complex)
-                              for comp in comp_order}
-            # Loop over strain components
-            for comp in comp_order:
-                # Discrete Fourier Transform (DFT) by means of Fast Fourier
-                # Transform (FFT)
-                strain_DFT_vox[comp] = np.fft.fftn(strain_vox[comp])
-            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Initialize macroscale strain voxelwise tensor
-            mac_strain_vox = {comp: np.zeros(tuple(self._n_voxels_dims))
-                              for comp in comp_order}
-            mac_strain_DFT_vox = {comp: np.zeros(tuple(self._n_voxels_dims),
-                                                 dtype=complex)
-                                  for comp in comp_order}
-            # Enforce macroscale strain DFT at the zero-frequency
-            freq_0_idx = self._n_dim*(0,)
-            mac_strain_DFT_0 = {}
-            for comp in comp_order:
-                # Get strain component indexes
-                so_idx = tuple([int(x) - 1 for x in comp])
-                # Compute macroscale strain DFT
-                mac_strain_vox[comp] = np.full(self._regular_grid.shape,
-                                               mac_strain[so_idx])
-                mac_strain_DFT_vox[comp] = np.fft.fftn(mac_strain_vox[comp])
-                # Enforce macroscale strain DFT at the zero-frequency
-                mac_strain_DFT_0[comp] = mac_strain_DFT_vox[comp][freq_0_idx]
+                strain_field = strain_old_field.copy()
             #
-            #                                      Fixed-point iterative scheme
+            #                                   Microscale equilibrium solution
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Initialize iteration counter:
-            iter = 0
-            # Start iterative loop
-            while True:
-                #
-                #                       Stress Discrete Fourier Transform (DFT)
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Compute stress Discrete Fourier Transform (DFT)
-                stress_DFT_vox = {comp: np.zeros(tuple(self._n_voxels_dims),
-                                                 dtype=complex)
-                                  for comp in comp_order}
-                for comp in comp_order:
-                    # Discrete Fourier Transform (DFT) by means of Fast Fourier
-                    # Transform (FFT)
-                    stress_DFT_vox[comp] = np.fft.fftn(stress_vox[comp])
-                #
-                #                                        Convergence evaluation
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Evaluate convergence criterion
-                if self._conv_criterion == 'stress_div':
-                    # Compute discrete error
-                    discrete_error = self._stress_div_conv_criterion(
-                        freqs_dims, stress_DFT_vox)
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                elif self._conv_criterion == 'avg_stress_norm':
-                    # Compute discrete error
-                    discrete_error = \
-                        abs(avg_stress_norm - avg_stress_norm_itold) \
-                        / avg_stress_norm
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Display iteration data
-                if verbose:
-                    type(self)._display_iteration(
-                        iter, time.time() - iter_init_time, discrete_error)
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Check solution convergence and iteration counter
-                if discrete_error <= self._conv_tol:
-                    # Leave fixed-point iterative scheme
-                    break
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                elif iter == self._max_n_iterations or \
-                        not np.isfinite(discrete_error):
-                    # Set increment cut output
-                    if not np.isfinite(discrete_error):
-                        cut_msg = 'Solution diverged.'
-                    else:
-                        cut_msg = 'Maximum number of iterations reached ' + \
-                                  'without convergence.'
-                    # Raise macroscale increment cut procedure
-                    is_inc_cut = True
-                    # Display increment cut (maximum number of iterations)
-                    type(self)._display_increment_cut(cut_msg)
-                    # Leave fixed-point iterative scheme
-                    break
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                else:
-                    # Increment iteration counter
-                    iter += 1
-                    # Set iteration initial time
-                    iter_init_time = time.time()
-                #
-                #                                                 Update strain
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~----~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Loop over strain components
-                for i in range(len(comp_order)):
-                    # Get strain component
-                    comp_i = comp_order[i]
-                    # Initialize auxiliar variable
-                    aux = 0.0
-                    # Loop over strain components
-                    for j in range(len(comp_order)):
-                        # Get strain component
-                        comp_j = comp_order[j]
-                        # Compute product between Green operator and stress DFT
-                        idx1 = [comp_order.index(comp_i),
-                                comp_order.index(comp_j)]
-                        idx2 = comp_order.index(comp_j)
-                        aux = np.add(
-                            aux, np.multiply(
-                                mop.kelvin_factor(idx1, comp_order)
-                                * gop_dft_vox[comp_i + comp_j],
-                                mop.kelvin_factor(idx2, comp_order)
-                                * stress_DFT_vox[comp_j]))
-                    # Update strain DFT
-                    strain_DFT_vox[comp_i] = np.subtract(
-                        strain_DFT_vox[comp_i],
-                        (1.0/mop.kelvin_factor(i, comp_order))*aux)
-                    # Enforce macroscale strain DFT at the zero-frequency
-                    freq_0_idx = self._n_dim*(0,)
-                    strain_DFT_vox[comp_i][freq_0_idx] = \
-                        mac_strain_DFT_0[comp_i]
-                #
-                #              Strain Inverse Discrete Fourier Transform (IDFT)
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Compute strain Inverse Discrete Fourier Transform (IDFT)
-                for comp in comp_order:
-                    # Inverse Discrete Fourier Transform (IDFT) by means of
-                    # Fast Fourier Transform (FFT)
-                    strain_vox[comp] = \
-                        np.real(np.fft.ifftn(strain_DFT_vox[comp]))
-                #
-                #                                                 Stress update
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Update stress
-                stress_vox = self._elastic_constitutive_model(strain_vox,
-                                                              evar1, evar2,
-                                                              evar3)
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Compute average strain/stress norm
-                if self._conv_criterion == 'avg_stress_norm':
-                    # Update last iteration average stress norm
-                    avg_stress_norm_itold = avg_stress_norm
-                    # Compute average stress norm
-                    avg_stress_norm = self._compute_avg_state_vox(stress_vox)
+            # Solve microscale equilibrium problem
+            strain_field, stress_vox, n_iterations, is_converged = \
+                self._solve_equilibrium(strain_field, mac_strain, comp_order,
+                                        gop_rdft_vox, evar1, evar2, evar3,
+                                        freqs_dims, verbose=verbose)
+            # Update total number of iterations
+            self._n_iterations += n_iterations
+            # Set strain local field components
+            strain_vox = {comp: strain_field[k]
+                          for k, comp in enumerate(comp_order)}
             #
             #                                   Macroscale strain increment cut
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            if is_inc_cut:
-                # Reset macroscale strain increment cut flag
-                is_inc_cut = False
+            if not is_converged:
                 # Perform macroscale strain increment cut
                 mac_strain_incrementer.increment_cut()
                 # Get current macroscale strain tensor
@@ -597,36 +461,21 @@ class FFTBasicScheme(DNSHomogenizationMethod):
                 # Compute material logarithmic strain tensor from deformation
                 # gradient
                 if self._strain_formulation == 'finite':
-                    # Loop over voxels
-                    for voxel in it.product(*[list(range(n))
-                                              for n in self._n_voxels_dims]):
-                        # Initialize deformation gradient
-                        def_gradient = np.zeros((self._n_dim, self._n_dim))
-                        # Loop over deformation gradient components
-                        for comp in self._comp_order_nsym:
-                            # Get second-order array index
-                            so_idx = tuple([int(i) - 1 for i in comp])
-                            # Get voxel deformation gradient component
-                            def_gradient[so_idx] = strain_vox[comp][voxel]
-                        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                        # Compute material logarithmic strain tensor
-                        mat_log_strain = 0.5*top.isotropic_tensor(
-                            'log', np.matmul(np.transpose(def_gradient),
-                                             def_gradient))
-                        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                        # Loop over material logarithmic strain tensor
-                        # components
-                        for comp in self._comp_order_sym:
-                            # Get second-order array index
-                            so_idx = tuple([int(i) - 1 for i in comp])
-                            # Store material logarithmic strain tensor
-                            strain_vox[comp][voxel] = mat_log_strain[so_idx]
+                    # Compute material logarithmic strain tensor (batched
+                    # over voxels)
+                    mat_log_strain_vox = \
+                        self._compute_material_log_strain(strain_vox)
+                    # Loop over material logarithmic strain tensor
+                    # components
+                    for comp in self._comp_order_sym:
+                        # Store material logarithmic strain tensor
+                        strain_vox[comp] = mat_log_strain_vox[comp]
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                 # Return local strain field
                 return strain_vox
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             # Update last converged strain tensor
-            strain_old_vox = copy.deepcopy(strain_vox)
+            strain_old_field = strain_field.copy()
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             # Setup new macroscale strain increment
             mac_strain_incrementer.update_inc()
@@ -639,6 +488,263 @@ class FFTBasicScheme(DNSHomogenizationMethod):
                 type(self)._display_increment_init(
                     *mac_strain_incrementer.get_inc_output_data())
     # -------------------------------------------------------------------------
+    def _get_reference_material_properties(self):
+        """Get reference material elastic properties.
+
+        The reference material elastic properties are set as the mean between
+        the minimum and maximum values existent among the microstructure's
+        material phases (proposed by Moulinec and Suquet (1998)).
+
+        Returns
+        -------
+        mat_prop_ref : dict
+            Reference material elastic properties (item, float), namely the
+            Young modulus ('E') and the Poisson coefficient ('v').
+        """
+        # Set reference material elastic properties
+        mat_prop_ref = dict()
+        mat_prop_ref['E'] = \
+            0.5*(min([self._material_phases_properties[phase]['E']
+                      for phase in self._material_phases])
+                 + max([self._material_phases_properties[phase]['E']
+                        for phase in self._material_phases]))
+        mat_prop_ref['v'] = \
+            0.5*(min([self._material_phases_properties[phase]['v']
+                      for phase in self._material_phases])
+                 + max([self._material_phases_properties[phase]['v']
+                        for phase in self._material_phases]))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return mat_prop_ref
+    # -------------------------------------------------------------------------
+    def _solve_equilibrium(self, strain_field, mac_strain, comp_order,
+                           gop_rdft_vox, evar1, evar2, evar3, freqs_dims,
+                           verbose=False):
+        """Solve microscale equilibrium problem for macroscale strain loading.
+
+        The microscale equilibrium problem is solved by means of the basic
+        fixed-point iterative scheme proposed by Moulinec and Suquet (1998),
+        where each iteration involves the application of the reference
+        material Green operator (see :meth:`_update_strain_DFT`).
+
+        ----
+
+        Parameters
+        ----------
+        strain_field : numpy.ndarray
+            Strain initial iterative guess stored as numpy.ndarray of shape
+            (n_comps, *n_voxels_dims), where the strain components are stacked
+            according to comp_order. Infinitesimal strain tensor (infinitesimal
+            strains) or deformation gradient (finite strains).
+        mac_strain : numpy.ndarray (2d)
+            Current macroscale strain second-order tensor. Infinitesimal strain
+            tensor (infinitesimal strains) or deformation gradient (finite
+            strains).
+        comp_order : list[str]
+            Strain/Stress components (str) order.
+        gop_rdft_vox : numpy.ndarray
+            Reference material Green operator (half spectrum) stored as
+            numpy.ndarray of shape (n_comps, n_comps, *n_freqs_dims), where
+            the Kelvin factors are already accounted for such that it can be
+            directly applied to the stacked stress DFT components.
+        evar1 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        evar2 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        evar3 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        freqs_dims : list[numpy.ndarray (1d)]
+            List of discrete frequencies (numpy.ndarray (1d)) associated to
+            each spatial dimension.
+        verbose : bool, default=False
+            Enable verbose output.
+
+        Returns
+        -------
+        strain_field : numpy.ndarray
+            Strain local field stored as numpy.ndarray of shape
+            (n_comps, *n_voxels_dims).
+        stress_vox: dict
+            Local stress response (item, numpy.ndarray of shape equal to RVE
+            regular grid discretization) for each stress component (key, str).
+        n_iterations : int
+            Number of iterations.
+        is_converged : bool
+            True if the solution procedure converged, False otherwise.
+        """
+        # Set iteration initial time
+        iter_init_time = time.time()
+        # Compute total number of voxels
+        n_voxels = np.prod(self._n_voxels_dims)
+        # Set spatial axes of the stacked strain/stress local fields
+        spatial_axes = tuple(range(1, self._n_dim + 1))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set strain local field components
+        strain_vox = {comp: strain_field[k]
+                      for k, comp in enumerate(comp_order)}
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute stress initial iterative guess
+        stress_vox = self._elastic_constitutive_model(strain_vox, evar1,
+                                                      evar2, evar3)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute average strain/stress norm
+        if self._conv_criterion == 'avg_stress_norm':
+            # Compute initial guess average stress norm
+            avg_stress_norm = self._compute_avg_state_vox(stress_vox)
+            # Initialize last iteration average stress norm
+            avg_stress_norm_itold = 0.0
+        #
+        #                               Strain Discrete Fourier Transform (DFT)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute strain Discrete Fourier Transform (DFT) by means of
+        # real-to-complex Fast Fourier Transform (FFT) (half spectrum)
+        strain_DFT_field = self._fft_backend.rfftn(strain_field,
+                                                   axes=spatial_axes)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute macroscale strain DFT at the zero-frequency
+        mac_strain_DFT_0 = n_voxels*np.array(
+            [mac_strain[tuple([int(x) - 1 for x in comp])]
+             for comp in comp_order])
+        #
+        #                                          Fixed-point iterative scheme
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize iteration counter:
+        iter = 0
+        # Start iterative loop
+        while True:
+            #
+            #                           Stress Discrete Fourier Transform (DFT)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Stack stress local field components
+            stress_field = np.stack([stress_vox[comp]
+                                     for comp in comp_order])
+            # Compute stress Discrete Fourier Transform (DFT) by means of
+            # real-to-complex Fast Fourier Transform (FFT) (half spectrum)
+            stress_DFT_field = self._fft_backend.rfftn(stress_field,
+                                                       axes=spatial_axes)
+            #
+            #                                            Convergence evaluation
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Evaluate convergence criterion
+            if self._conv_criterion == 'stress_div':
+                # Compute discrete error
+                discrete_error = self._stress_div_conv_criterion(
+                    freqs_dims, stress_DFT_field)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            elif self._conv_criterion == 'avg_stress_norm':
+                # Compute discrete error
+                discrete_error = \
+                    abs(avg_stress_norm - avg_stress_norm_itold) \
+                    / avg_stress_norm
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Display iteration data
+            if verbose:
+                type(self)._display_iteration(
+                    iter, time.time() - iter_init_time, discrete_error)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Check solution convergence and iteration counter
+            if discrete_error <= self._conv_tol:
+                # Set solution convergence
+                is_converged = True
+                # Leave fixed-point iterative scheme
+                break
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            elif iter == self._max_n_iterations or \
+                    not np.isfinite(discrete_error):
+                # Set increment cut output
+                if not np.isfinite(discrete_error):
+                    cut_msg = 'Solution diverged.'
+                else:
+                    cut_msg = 'Maximum number of iterations reached ' + \
+                              'without convergence.'
+                # Set solution convergence failure
+                is_converged = False
+                # Display increment cut (maximum number of iterations)
+                type(self)._display_increment_cut(cut_msg)
+                # Leave fixed-point iterative scheme
+                break
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            else:
+                # Increment iteration counter
+                iter += 1
+                # Set iteration initial time
+                iter_init_time = time.time()
+            #
+            #                                                     Update strain
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Update strain DFT
+            strain_DFT_field = self._update_strain_DFT(
+                iter, strain_DFT_field, stress_DFT_field, gop_rdft_vox,
+                mac_strain_DFT_0)
+            #
+            #                  Strain Inverse Discrete Fourier Transform (IDFT)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Compute strain Inverse Discrete Fourier Transform (IDFT) by
+            # means of complex-to-real Fast Fourier Transform (FFT)
+            strain_field = self._fft_backend.irfftn(
+                strain_DFT_field, s=self._n_voxels_dims,
+                axes=spatial_axes)
+            # Set strain local field components
+            strain_vox = {comp: strain_field[k]
+                          for k, comp in enumerate(comp_order)}
+            #
+            #                                                     Stress update
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Update stress
+            stress_vox = self._elastic_constitutive_model(strain_vox,
+                                                          evar1, evar2,
+                                                          evar3)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Compute average strain/stress norm
+            if self._conv_criterion == 'avg_stress_norm':
+                # Update last iteration average stress norm
+                avg_stress_norm_itold = avg_stress_norm
+                # Compute average stress norm
+                avg_stress_norm = self._compute_avg_state_vox(stress_vox)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return strain_field, stress_vox, iter, is_converged
+    # -------------------------------------------------------------------------
+    def _update_strain_DFT(self, iter, strain_DFT_field, stress_DFT_field,
+                           gop_rdft_vox, mac_strain_DFT_0):
+        """Update strain DFT (fixed-point iterative scheme).
+
+        The product between the Green operator and the stress DFT is performed
+        for all components and frequencies at once.
+
+        ----
+
+        Parameters
+        ----------
+        iter : int
+            Iteration number.
+        strain_DFT_field : numpy.ndarray
+            Strain DFT (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, *n_freqs_dims). Updated in-place.
+        stress_DFT_field : numpy.ndarray
+            Stress DFT (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, *n_freqs_dims).
+        gop_rdft_vox : numpy.ndarray
+            Reference material Green operator (half spectrum) stored as
+            numpy.ndarray of shape (n_comps, n_comps, *n_freqs_dims).
+        mac_strain_DFT_0 : numpy.ndarray (1d)
+            Macroscale strain DFT at the zero-frequency.
+
+        Returns
+        -------
+        strain_DFT_field : numpy.ndarray
+            Updated strain DFT (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, *n_freqs_dims).
+        """
+        # Update strain DFT
+        strain_DFT_field -= np.einsum('ij...,j...->i...', gop_rdft_vox,
+                                      stress_DFT_field)
+        # Enforce macroscale strain DFT at the zero-frequency
+        strain_DFT_field[(slice(None),) + self._n_dim*(0,)] = mac_strain_DFT_0
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return strain_DFT_field
+    # -------------------------------------------------------------------------
     def _elastic_constitutive_model(self, strain_vox, evar1, evar2, evar3,
                                     finite_strains_model='stvenant-kirchhoff',
                                     is_optimized=True):
@@ -1349,11 +1455,95 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         # Return
         return stress_vox
     # -------------------------------------------------------------------------
-    def _stress_div_conv_criterion(self, freqs_dims, stress_DFT_vox):
+    def _compute_material_log_strain(self, def_gradient_vox,
+                                     chunk_size=65536):
+        """Compute material logarithmic strain tensor local field.
+
+        The material logarithmic strain tensor is computed from the spectral
+        decomposition of the right Cauchy-Green strain tensor,
+
+        .. math::
+
+           \\boldsymbol{E}^{(0)} = \\dfrac{1}{2} \\ln(\\boldsymbol{C}) =
+           \\dfrac{1}{2} \\sum_{i} \\ln(\\lambda_{i}) \\,
+           \\boldsymbol{e}_{i} \\otimes \\boldsymbol{e}_{i} \\, , \\quad
+           \\boldsymbol{C} = \\boldsymbol{F}^{T} \\boldsymbol{F} \\, ,
+
+        where :math:`\\boldsymbol{F}` is the deformation gradient and
+        :math:`\\lambda_{i}` and :math:`\\boldsymbol{e}_{i}` are the
+        eigenvalues and eigenvectors of :math:`\\boldsymbol{C}`. The
+        symmetric eigendecompositions are performed in batches of voxels
+        (`numpy.linalg.eigh`) to bound the memory requirements.
+
+        ----
+
+        Parameters
+        ----------
+        def_gradient_vox : dict
+            Local deformation gradient (item, numpy.ndarray of shape equal to
+            RVE regular grid discretization) for each component (key, str).
+        chunk_size : int, default=65536
+            Maximum number of voxels processed in each batch.
+
+        Returns
+        -------
+        mat_log_strain_vox : dict
+            Local material logarithmic strain tensor (item, numpy.ndarray of
+            shape equal to RVE regular grid discretization) for each
+            symmetric component (key, str).
+        """
+        # Get total number of voxels
+        n_voxels = np.prod(self._n_voxels_dims)
+        # Get deformation gradient components second-order indexes
+        nsym_idxs = [tuple([int(i) - 1 for i in comp])
+                     for comp in self._comp_order_nsym]
+        # Get material logarithmic strain components second-order indexes
+        sym_idxs = [tuple([int(i) - 1 for i in comp])
+                    for comp in self._comp_order_sym]
+        # Get flattened deformation gradient components
+        def_gradient_flat = [np.ravel(def_gradient_vox[comp])
+                             for comp in self._comp_order_nsym]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize flattened material logarithmic strain tensor
+        mat_log_strain_flat = np.zeros((len(self._comp_order_sym), n_voxels))
+        # Loop over batches of voxels
+        for init in range(0, n_voxels, chunk_size):
+            end = min(init + chunk_size, n_voxels)
+            # Build deformation gradient
+            def_gradient = np.zeros((end - init, self._n_dim, self._n_dim))
+            for k, so_idx in enumerate(nsym_idxs):
+                def_gradient[(slice(None),) + so_idx] = \
+                    def_gradient_flat[k][init:end]
+            # Compute right Cauchy-Green strain tensor
+            right_cauchy_green = np.matmul(
+                np.transpose(def_gradient, axes=(0, 2, 1)), def_gradient)
+            # Perform spectral decomposition
+            eigenvalues, eigenvectors = np.linalg.eigh(right_cauchy_green)
+            # Compute material logarithmic strain tensor
+            mat_log_strain = 0.5*np.matmul(
+                eigenvectors*np.log(eigenvalues)[:, np.newaxis, :],
+                np.transpose(eigenvectors, axes=(0, 2, 1)))
+            # Store material logarithmic strain tensor
+            for k, so_idx in enumerate(sym_idxs):
+                mat_log_strain_flat[k, init:end] = \
+                    mat_log_strain[(slice(None),) + so_idx]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build material logarithmic strain tensor local field
+        mat_log_strain_vox = \
+            {comp: mat_log_strain_flat[k].reshape(self._n_voxels_dims)
+             for k, comp in enumerate(self._comp_order_sym)}
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return mat_log_strain_vox
+    # -------------------------------------------------------------------------
+    def _stress_div_conv_criterion(self, freqs_dims, stress_DFT_field):
         """Convergence criterion based on the divergence of the stress tensor.
 
         Convergence criterion proposed by Moulinec and Suquet (1998) [#]_.
 
+        Given that the stress local field is real, the stress DFT negative
+        frequencies of the last dimension (not stored in the half spectrum)
+        are recovered from the Hermitian symmetry of the DFT.
+
         .. [#] Moulinec, H. and Suquet, P. (1998). *A numerical method for
                computing the overall response of nonlinear composites with
                complex microstructure.* Comp Methods Appl M, 157:69-94 (see
@@ -1367,10 +1557,11 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         freqs_dims : list[numpy.ndarray (1d)]
             List of discrete frequencies (numpy.ndarray (1d)) associated to
             each spatial dimension.
-        stress_DFT_vox : dict
-            Discrete Fourier Transform of local stress response (item,
-            numpy.ndarray of shape equal to RVE regular grid discretization)
-            for each stress component (key, str). Cauchy stress tensor
+        stress_DFT_field : numpy.ndarray
+            Discrete Fourier Transform (half spectrum) of local stress response
+            stored in a numpy.ndarray of shape (n_comps, n_voxels_1, ...,
+            n_voxels_d//2 + 1), where the components are sorted according to
+            the strain/stress components order. Cauchy stress tensor
             (infinitesimal strains) or First Piola-Kirchhoff stress tensor
             (finite strains).
 
@@ -1392,57 +1583,65 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         # Compute total number of voxels
         n_voxels = np.prod(self._n_voxels_dims)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get number of voxels and number of half spectrum frequencies of the
+        # last dimension
+        n_last = self._n_voxels_dims[-1]
+        n_half = stress_DFT_field.shape[-1]
+        # Recover stress DFT negative frequencies of the last dimension from
+        # the Hermitian symmetry, i.e., the DFT at the symmetric frequency is
+        # the complex conjugate
+        stress_DFT_neg = stress_DFT_field[..., n_last - n_half:0:-1]
+        for axis in range(1, self._n_dim):
+            stress_DFT_neg = np.roll(np.flip(stress_DFT_neg, axis=axis), 1,
+                                     axis=axis)
+        stress_DFT_neg = np.conj(stress_DFT_neg)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Initialize discrete error sum
         error_sum = 0.0
-        # Initialize stress DFT at the zero-frequency
-        stress_DFT_0_mf = np.zeros(len(comp_order), dtype=complex)
-        # Initialize stress divergence DFT
-        div_stress_DFT = \
-            {str(comp + 1): np.zeros(tuple(self._n_voxels_dims), dtype=complex)
-             for comp in range(self._n_dim)}
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Loop over discrete frequencies
-        for freq_coord in it.product(*freqs_dims):
-            # Get discrete frequency index
-            freq_idx = tuple([list(freqs_dims[x]).index(freq_coord[x])
-                              for x in range(self._n_dim)])
-            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Initialize stress tensor DFT matricial form
-            stress_DFT_mf = np.zeros(len(comp_order), dtype=complex)
-            # Loop over stress components
-            for i in range(len(comp_order)):
-                # Get stress component
-                comp = comp_order[i]
-                # Build stress tensor DFT matricial form
-                stress_DFT_mf[i] = mop.kelvin_factor(i, comp_order) \
-                    * stress_DFT_vox[comp][freq_idx]
-                # Store stress tensor DFT matricial form for zero-frequency
-                if freq_idx == self._n_dim*(0,):
-                    stress_DFT_0_mf[i] = mop.kelvin_factor(i, comp_order) \
-                        * stress_DFT_vox[comp][freq_idx]
-            # Build stress tensor DFT
-            stress_DFT = mop.get_tensor_from_mf(stress_DFT_mf, self._n_dim,
-                                                comp_order)
-            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Add discrete frequency contribution to discrete error sum
-            error_sum = error_sum + np.linalg.norm(
-                top.dot12_1(1j*np.asarray(freq_coord), stress_DFT))**2
-            # Compute stress divergence Discrete Fourier Transform (DFT)
+        # Loop over non-negative (half spectrum) and negative frequencies of
+        # the last dimension
+        for stress_DFT, freqs_last in (
+                (stress_DFT_field, freqs_dims[-1][:n_half]),
+                (stress_DFT_neg, freqs_dims[-1][n_half:])):
+            # Set discrete frequencies of each dimension broadcastable over
+            # the regular grid of discrete frequencies (wave vectors
+            # components)
+            freqs_grid = []
             for i in range(self._n_dim):
-                div_stress_DFT[str(i + 1)][freq_idx] = \
-                    top.dot12_1(1j*np.asarray(freq_coord), stress_DFT)[i]
+                shape = self._n_dim*[1, ]
+                if i == self._n_dim - 1:
+                    shape[i] = len(freqs_last)
+                    freqs_grid.append(np.asarray(freqs_last).reshape(shape))
+                else:
+                    shape[i] = len(freqs_dims[i])
+                    freqs_grid.append(
+                        np.asarray(freqs_dims[i]).reshape(shape))
+            # Initialize stress divergence DFT (up to the imaginary unit
+            # factor)
+            div_stress_DFT = np.zeros((self._n_dim, *stress_DFT.shape[1:]),
+                                      dtype=complex)
+            # Loop over stress components
+            for k, comp in enumerate(comp_order):
+                # Get second-order array index
+                i, j = [int(x) - 1 for x in comp]
+                # Add stress component contribution to stress divergence DFT
+                div_stress_DFT[j] += freqs_grid[i]*stress_DFT[k]
+                # Add symmetric stress component contribution (symmetric
+                # stress tensor stored in matricial form)
+                if comp[::-1] not in comp_order:
+                    div_stress_DFT[i] += freqs_grid[j]*stress_DFT[k]
+            # Add contribution to discrete error sum
+            error_sum += \
+                np.sum(div_stress_DFT.real**2 + div_stress_DFT.imag**2)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build stress tensor DFT matricial form for zero-frequency
+        stress_DFT_0_mf = np.array(
+            [mop.kelvin_factor(k, comp_order)
+             * stress_DFT_field[(k,) + self._n_dim*(0,)]
+             for k in range(len(comp_order))])
         # Compute discrete error
         discrete_error = \
             np.sqrt(error_sum/n_voxels)/np.linalg.norm(stress_DFT_0_mf)
-        # Compute stress divergence Inverse Discrete Fourier Transform (IDFT)
-        div_stress = {str(comp + 1): np.zeros(tuple(self._n_voxels_dims))
-                      for comp in range(self._n_dim)}
-        for i in range(self._n_dim):
-            # Inverse Discrete Fourier Transform (IDFT) by means of Fast
-            # Fourier Transform (FFT)
-            div_stress[str(i + 1)] = \
-                np.real(np.fft.ifftn(div_stress_DFT[str(i + 1)]))
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Return
         return discrete_error
@@ -1553,6 +1752,40 @@ class FFTBasicScheme(DNSHomogenizationMethod):
         """
         return copy.deepcopy(self._hom_stress_strain)
     # -------------------------------------------------------------------------
+    def get_n_iterations(self):
+        """Get total number of iterations.
+
+        Returns
+        -------
+        n_iterations : int
+            Total number of iterations performed to compute the RVE local
+            elastic strain response (including the iterations of macroscale
+            loading increments that have been cut).
+        """
+        return self._n_iterations
+    # -------------------------------------------------------------------------
+    def get_solver_parameters(self):
+        """Get parameters that determine the RVE local response.
+
+        Returns
+        -------
+        solver_parameters : dict
+            Solution procedure parameters (item) that determine the RVE local
+            strain response (key, str), namely the FFT-based homogenization
+            scheme, the solver version, the Nyquist frequencies handling and
+            the convergence and incrementation settings.
+        """
+        solver_parameters = {'scheme': type(self).__name__,
+                             'solver_version': _SOLVER_VERSION,
+                             'nyquist_frequencies': 'kept',
+                             'conv_criterion': self._conv_criterion,
+                             'conv_tol': self._conv_tol,
+                             'max_n_iterations': self._max_n_iterations,
+                             'max_subinc_level': self._max_subinc_level,
+                             'max_cinc_cuts': self._max_cinc_cuts}
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return solver_parameters
+    # -------------------------------------------------------------------------
     @staticmethod
     def _display_greetings():
         """Output greetings."""
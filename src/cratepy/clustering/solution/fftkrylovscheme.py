@@ -0,0 +1,715 @@
+"""FFT-based homogenization Newton-Krylov scheme multi-scale method.
+
+This module includes the implementation of a FFT-based homogenization
+Newton-Krylov scheme for the solution of micro-scale equilibrium problems of
+linear elastic (infinitesimal strains) or hyperelastic (finite strains)
+heterogeneous materials. Following Zeman and coworkers (2010) [1]_ and de Geus
+and coworkers (2017) [2]_, the Green operator associated with a unit reference
+material (orthogonal projection onto compatible fields) is employed to
+formulate the (linearized) equilibrium problem as a symmetric positive
+definite linear system of equations, which is solved with the conjugate
+gradient method. In opposition to the basic fixed-point scheme, the number of
+iterations grows with the square root of the phase contrast.
+
+.. [1] Zeman, J., Vondrejc, J., Novak, J., and Marek, I. (2010). *Accelerating
+       a FFT-based solver for numerical homogenization of periodic media by
+       conjugate gradients.* J Comput Phys, 229(21):8065-8071 (see `here
+       <https://www.sciencedirect.com/science/article/pii/S0021999110003876>`_)
+
+.. [2] de Geus, T.W.J., Vondrejc, J., Zeman, J., Peerlings, R.H.J., and
+       Geers, M.G.D. (2017). *Finite strain FFT-based non-linear solvers made
+       simple.* Comp Methods Appl M, 318:412-430 (see `here
+       <https://www.sciencedirect.com/science/article/pii/S0045782516318709>`_)
+
+Classes
+-------
+FFTKrylovScheme
+    FFT-based homogenization Newton-Krylov scheme.
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Standard
+import time
+# Third-party
+import numpy as np
+# Local
+import tensor.matrixoperations as mop
+from clustering.solution.ffthombasicscheme import FFTBasicScheme
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+class FFTKrylovScheme(FFTBasicScheme):
+    """FFT-based homogenization Newton-Krylov scheme.
+
+    The microscale equilibrium problem is solved by means of the Newton-Raphson
+    method, where the linearized equilibrium problem of each Newton iteration
+    is solved with the conjugate gradient method (Newton-Krylov scheme). The
+    Green operator associated with a unit reference material (orthogonal
+    projection onto compatible fields) is employed, such that the linearized
+    equilibrium operator is symmetric and positive definite on the subspace of
+    compatible fields with zero average (see Zeman and coworkers (2010) [#]_
+    and de Geus and coworkers (2017) [#]_). Given that the problem is linear
+    under infinitesimal strains, the solution is obtained in a single Newton
+    iteration.
+
+    The number of iterations reported for this scheme is the total number of
+    Newton and conjugate gradient iterations, each requiring the application
+    of the Green operator (pair of forward and inverse FFTs), such that it can
+    be directly compared with the number of iterations of the fixed-point
+    schemes.
+
+    On regular grids with an even number of voxels along some dimension, the
+    Nyquist frequencies are excluded from the space of compatible fields (see
+    :meth:`_remove_nyquist_frequencies`), whereas the basic and
+    Anderson-accelerated schemes keep them. The local fields then differ from
+    the basic scheme solution by the discretization error associated with
+    these frequencies (e.g., about 1e-2 of the local strain on a 32x32
+    two-phase grid), while the same solution is obtained on grids with an odd
+    number of voxels along each dimension.
+
+    .. [#] Zeman, J., Vondrejc, J., Novak, J., and Marek, I. (2010).
+           *Accelerating a FFT-based solver for numerical homogenization of
+           periodic media by conjugate gradients.* J Comput Phys,
+           229(21):8065-8071 (see `here <https://www.sciencedirect.com/
+           science/article/pii/S0021999110003876>`_)
+
+    .. [#] de Geus, T.W.J., Vondrejc, J., Zeman, J., Peerlings, R.H.J., and
+           Geers, M.G.D. (2017). *Finite strain FFT-based non-linear solvers
+           made simple.* Comp Methods Appl M, 318:412-430 (see `here
+           <https://www.sciencedirect.com/science/article/pii/
+           S0045782516318709>`_)
+
+    Attributes
+    ----------
+    _krylov_tol : float
+        Conjugate gradient convergence tolerance relative to the equilibrium
+        residual norm of each Newton iteration (inexact Newton forcing term).
+    _max_n_krylov_iterations : int
+        Maximum number of conjugate gradient iterations per Newton iteration.
+
+    Methods
+    -------
+    get_solver_parameters(self)
+        Get parameters that determine the RVE local response.
+    _get_reference_material_properties(self)
+        Get reference material elastic properties.
+    _solve_equilibrium(self, strain_field, mac_strain, comp_order, \
+                       gop_rdft_vox, evar1, evar2, evar3, freqs_dims, \
+                       verbose=False)
+        Solve microscale equilibrium problem for macroscale strain loading.
+    _solve_linearized_equilibrium(self, strain_field, res_field, comp_order, \
+                                  gop_rdft_vox, evar1, evar2, evar3)
+        Solve linearized equilibrium problem (conjugate gradient method).
+    _tangent_product(self, dstrain_field, comp_order, evar1, evar2, evar3, \
+                     def_gradient=None, second_piola_stress=None)
+        Compute product between material tangent modulus and strain field.
+    _apply_green_operator(self, stress_DFT_field, gop_rdft_vox)
+        Apply Green operator to stress DFT.
+    _remove_nyquist_frequencies(self, DFT_field)
+        Remove Nyquist frequencies from DFT (even number of voxels).
+    _get_tensor_field(field, comp_order, n_dim)
+        Get second-order tensor local field from stacked components.
+    _get_stacked_field(tensor_field, comp_order)
+        Get stacked components from second-order tensor local field.
+    """
+    def __init__(self, strain_formulation, problem_type, rve_dims,
+                 n_voxels_dims, regular_grid, material_phases,
+                 material_phases_properties, fft_backend='numpy',
+                 fft_workers=None, krylov_tol=1e-5,
+                 max_n_krylov_iterations=1000):
+        """Constructor.
+
+        Parameters
+        ----------
+        strain_formulation: {'infinitesimal', 'finite'}
+            Problem strain formulation.
+        problem_type : int
+            Problem type: 2D plane strain (1), 2D plane stress (2),
+            2D axisymmetric (3) and 3D (4).
+        rve_dims : list[float]
+            RVE size in each dimension.
+        n_voxels_dims : list[int]
+            Number of voxels in each dimension of the regular grid (spatial
+            discretization of the RVE).
+        regular_grid : numpy.ndarray (2d or 3d)
+            Regular grid of voxels (spatial discretization of the RVE), where
+            each entry contains the material phase label (int) assigned to the
+            corresponding voxel.
+        material_phases : list[str]
+            RVE material phases labels (str).
+        material_phases_properties : dict
+            Constitutive model material properties (item, dict) associated to
+            each material phase (key, str).
+        fft_backend : {'numpy', 'scipy', 'pyfftw'}, default='numpy'
+            FFT backend.
+        fft_workers : int, default=None
+            Number of workers (threads) of multithreaded FFT backends. If -1,
+            then all the available CPUs are used. If None, then the FFT
+            backend default is adopted.
+        krylov_tol : float, default=1e-5
+            Conjugate gradient convergence tolerance relative to the
+            equilibrium residual norm of each Newton iteration (inexact Newton
+            forcing term).
+        max_n_krylov_iterations : int, default=1000
+            Maximum number of conjugate gradient iterations per Newton
+            iteration.
+        """
+        super().__init__(strain_formulation, problem_type, rve_dims,
+                         n_voxels_dims, regular_grid, material_phases,
+                         material_phases_properties, fft_backend=fft_backend,
+                         fft_workers=fft_workers)
+        # Set conjugate gradient parameters
+        self._krylov_tol = krylov_tol
+        self._max_n_krylov_iterations = max_n_krylov_iterations
+    # -------------------------------------------------------------------------
+    def get_solver_parameters(self):
+        """Get parameters that determine the RVE local response.
+
+        Returns
+        -------
+        solver_parameters : dict
+            Solution procedure parameters (item) that determine the RVE local
+            strain response (key, str), including the conjugate gradient
+            parameters. The Nyquist frequencies are removed (see
+            :meth:`_remove_nyquist_frequencies`).
+        """
+        solver_parameters = super().get_solver_parameters()
+        solver_parameters['nyquist_frequencies'] = 'removed'
+        solver_parameters['krylov_tol'] = self._krylov_tol
+        solver_parameters['max_n_krylov_iterations'] = \
+            self._max_n_krylov_iterations
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return solver_parameters
+    # -------------------------------------------------------------------------
+    def _get_reference_material_properties(self):
+        """Get reference material elastic properties.
+
+        The unit reference material elasticity tensor (Young modulus equal to
+        1 and null Poisson coefficient, such that the Lamé parameters are
+        :math:`\\lambda_{0} = 0` and :math:`\\mu_{0} = 1/2`) is adopted, so
+        that the associated Green operator is the orthogonal projection onto
+        compatible fields with zero average.
+
+        ----
+
+        Returns
+        -------
+        mat_prop_ref : dict
+            Reference material elastic properties (item, float), namely the
+            Young modulus ('E') and the Poisson coefficient ('v').
+        """
+        return {'E': 1.0, 'v': 0.0}
+    # -------------------------------------------------------------------------
+    def _solve_equilibrium(self, strain_field, mac_strain, comp_order,
+                           gop_rdft_vox, evar1, evar2, evar3, freqs_dims,
+                           verbose=False):
+        """Solve microscale equilibrium problem for macroscale strain loading.
+
+        Parameters
+        ----------
+        strain_field : numpy.ndarray
+            Strain initial iterative guess stored as numpy.ndarray of shape
+            (n_comps, *n_voxels_dims), where the strain components are stacked
+            according to comp_order. Infinitesimal strain tensor (infinitesimal
+            strains) or deformation gradient (finite strains).
+        mac_strain : numpy.ndarray (2d)
+            Current macroscale strain second-order tensor. Infinitesimal strain
+            tensor (infinitesimal strains) or deformation gradient (finite
+            strains).
+        comp_order : list[str]
+            Strain/Stress components (str) order.
+        gop_rdft_vox : numpy.ndarray
+            Reference material Green operator (half spectrum) stored as
+            numpy.ndarray of shape (n_comps, n_comps, *n_freqs_dims), where
+            the Kelvin factors are already accounted for such that it can be
+            directly applied to the stacked stress DFT components.
+        evar1 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        evar2 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        evar3 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        freqs_dims : list[numpy.ndarray (1d)]
+            List of discrete frequencies (numpy.ndarray (1d)) associated to
+            each spatial dimension.
+        verbose : bool, default=False
+            Enable verbose output.
+
+        Returns
+        -------
+        strain_field : numpy.ndarray
+            Strain local field stored as numpy.ndarray of shape
+            (n_comps, *n_voxels_dims).
+        stress_vox: dict
+            Local stress response (item, numpy.ndarray of shape equal to RVE
+            regular grid discretization) for each stress component (key, str).
+        n_iterations : int
+            Number of iterations (Newton and conjugate gradient iterations).
+        is_converged : bool
+            True if the solution procedure converged, False otherwise.
+        """
+        # Set iteration initial time
+        iter_init_time = time.time()
+        # Set spatial axes of the stacked strain/stress local fields
+        spatial_axes = tuple(range(1, self._n_dim + 1))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Enforce macroscale strain as the average of the strain initial
+        # iterative guess
+        strain_field = strain_field.copy()
+        for k, comp in enumerate(comp_order):
+            # Get strain component indexes
+            so_idx = tuple([int(x) - 1 for x in comp])
+            # Enforce macroscale strain component
+            strain_field[k] += mac_strain[so_idx] - np.mean(strain_field[k])
+        # Set strain local field components
+        strain_vox = {comp: strain_field[k]
+                      for k, comp in enumerate(comp_order)}
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute stress initial iterative guess
+        stress_vox = self._elastic_constitutive_model(strain_vox, evar1,
+                                                      evar2, evar3)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute average strain/stress norm
+        if self._conv_criterion == 'avg_stress_norm':
+            # Compute initial guess average stress norm
+            avg_stress_norm = self._compute_avg_state_vox(stress_vox)
+            # Initialize last iteration average stress norm
+            avg_stress_norm_itold = 0.0
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize total number of conjugate gradient iterations
+        n_krylov_iterations = 0
+        #
+        #                                        Newton-Krylov iterative scheme
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize iteration counter:
+        iter = 0
+        # Start iterative loop
+        while True:
+            #
+            #                           Stress Discrete Fourier Transform (DFT)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Stack stress local field components
+            stress_field = np.stack([stress_vox[comp]
+                                     for comp in comp_order])
+            # Compute stress Discrete Fourier Transform (DFT) by means of
+            # real-to-complex Fast Fourier Transform (FFT) (half spectrum)
+            stress_DFT_field = self._fft_backend.rfftn(stress_field,
+                                                       axes=spatial_axes)
+            # Remove Nyquist frequencies
+            self._remove_nyquist_frequencies(stress_DFT_field)
+            #
+            #                                            Convergence evaluation
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Evaluate convergence criterion
+            if self._conv_criterion == 'stress_div':
+                # Compute discrete error
+                discrete_error = self._stress_div_conv_criterion(
+                    freqs_dims, stress_DFT_field)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            elif self._conv_criterion == 'avg_stress_norm':
+                # Compute discrete error
+                discrete_error = \
+                    abs(avg_stress_norm - avg_stress_norm_itold) \
+                    / avg_stress_norm
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Display iteration data
+            if verbose:
+                type(self)._display_iteration(
+                    iter, time.time() - iter_init_time, discrete_error)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Check solution convergence and iteration counter
+            if discrete_error <= self._conv_tol:
+                # Set solution convergence
+                is_converged = True
+                # Leave Newton-Krylov iterative scheme
+                break
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            elif iter == self._max_n_iterations or \
+                    not np.isfinite(discrete_error):
+                # Set increment cut output
+                if not np.isfinite(discrete_error):
+                    cut_msg = 'Solution diverged.'
+                else:
+                    cut_msg = 'Maximum number of iterations reached ' + \
+                              'without convergence.'
+                # Set solution convergence failure
+                is_converged = False
+                # Display increment cut (maximum number of iterations)
+                type(self)._display_increment_cut(cut_msg)
+                # Leave Newton-Krylov iterative scheme
+                break
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            else:
+                # Increment iteration counter
+                iter += 1
+                # Set iteration initial time
+                iter_init_time = time.time()
+            #
+            #                                              Newton-Krylov update
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Compute equilibrium residual
+            res_field = -self._apply_green_operator(stress_DFT_field,
+                                                    gop_rdft_vox)
+            # Solve linearized equilibrium problem
+            dstrain_field, n_cg_iterations = \
+                self._solve_linearized_equilibrium(
+                    strain_field, res_field, comp_order, gop_rdft_vox, evar1,
+                    evar2, evar3)
+            # Update total number of conjugate gradient iterations
+            n_krylov_iterations += n_cg_iterations
+            # Update strain
+            strain_field += dstrain_field
+            # Set strain local field components
+            strain_vox = {comp: strain_field[k]
+                          for k, comp in enumerate(comp_order)}
+            #
+            #                                                     Stress update
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Update stress
+            stress_vox = self._elastic_constitutive_model(strain_vox,
+                                                          evar1, evar2,
+                                                          evar3)
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Compute average strain/stress norm
+            if self._conv_criterion == 'avg_stress_norm':
+                # Update last iteration average stress norm
+                avg_stress_norm_itold = avg_stress_norm
+                # Compute average stress norm
+                avg_stress_norm = self._compute_avg_state_vox(stress_vox)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return strain_field, stress_vox, iter + n_krylov_iterations, \
+            is_converged
+    # -------------------------------------------------------------------------
+    def _solve_linearized_equilibrium(self, strain_field, res_field,
+                                      comp_order, gop_rdft_vox, evar1, evar2,
+                                      evar3):
+        """Solve linearized equilibrium problem (conjugate gradient method).
+
+        Solves the linear system of equations
+
+        .. math::
+
+           \\boldsymbol{\\mathsf{G}} \\ast (\\boldsymbol{\\mathsf{K}} :
+           \\delta \\boldsymbol{F}) = - \\boldsymbol{\\mathsf{G}} \\ast
+           \\boldsymbol{P} \\, ,
+
+        where :math:`\\boldsymbol{\\mathsf{G}}` is the Green operator
+        (orthogonal projection onto compatible fields with zero average),
+        :math:`\\boldsymbol{\\mathsf{K}}` is the material tangent modulus and
+        :math:`\\boldsymbol{P}` is the stress local field. The conjugate
+        gradient method is employed with the inner product associated with the
+        double contraction of second-order tensors.
+
+        ----
+
+        Parameters
+        ----------
+        strain_field : numpy.ndarray
+            Strain local field stored as numpy.ndarray of shape
+            (n_comps, *n_voxels_dims). Infinitesimal strain tensor
+            (infinitesimal strains) or deformation gradient (finite strains).
+        res_field : numpy.ndarray
+            Equilibrium residual (right-hand side) stored as numpy.ndarray of
+            shape (n_comps, *n_voxels_dims).
+        comp_order : list[str]
+            Strain/Stress components (str) order.
+        gop_rdft_vox : numpy.ndarray
+            Green operator (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, n_comps, *n_freqs_dims).
+        evar1 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        evar2 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        evar3 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+
+        Returns
+        -------
+        dstrain_field : numpy.ndarray
+            Strain iterative update stored as numpy.ndarray of shape
+            (n_comps, *n_voxels_dims).
+        n_cg_iterations : int
+            Number of conjugate gradient iterations.
+        """
+        # Set inner product weights (double contraction of symmetric or
+        # nonsymmetric second-order tensors)
+        weights = np.array([mop.kelvin_factor(i, comp_order)**2
+                            for i in range(len(comp_order))]).reshape(
+                                (len(comp_order),) + self._n_dim*(1,))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute material tangent modulus related quantities
+        if self._strain_formulation == 'finite':
+            # Get deformation gradient
+            def_gradient = type(self)._get_tensor_field(
+                strain_field, comp_order, self._n_dim)
+            # Compute material Green-Lagrange strain tensor
+            green_strain = 0.5*(np.einsum('ki...,kj...->ij...', def_gradient,
+                                          def_gradient)
+                                - np.eye(self._n_dim).reshape(
+                                    2*(self._n_dim,) + self._n_dim*(1,)))
+            # Compute second Piola-Kirchhoff stress tensor
+            second_piola_stress = evar2*green_strain
+            second_piola_stress[np.diag_indices(self._n_dim)] += \
+                evar1*np.trace(green_strain)
+        else:
+            def_gradient = None
+            second_piola_stress = None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize strain iterative update
+        dstrain_field = np.zeros_like(res_field)
+        # Initialize conjugate gradient residual and search direction
+        cg_res_field = res_field.copy()
+        search_field = res_field.copy()
+        # Compute conjugate gradient residual squared norm
+        cg_res_sqnorm = np.sum(weights*cg_res_field*cg_res_field)
+        # Check null equilibrium residual
+        if cg_res_sqnorm == 0.0:
+            return dstrain_field, 0
+        # Set conjugate gradient convergence tolerance (squared norm)
+        cg_tol_sqnorm = (self._krylov_tol**2)*cg_res_sqnorm
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Loop over conjugate gradient iterations
+        for n_cg_iterations in range(1, self._max_n_krylov_iterations + 1):
+            # Compute product between material tangent modulus and search
+            # direction
+            stress_search_field = self._tangent_product(
+                search_field, comp_order, evar1, evar2, evar3,
+                def_gradient=def_gradient,
+                second_piola_stress=second_piola_stress)
+            # Apply Green operator
+            op_search_field = self._apply_green_operator(
+                self._fft_backend.rfftn(
+                    stress_search_field,
+                    axes=tuple(range(1, self._n_dim + 1))), gop_rdft_vox)
+            # Compute step length
+            step = cg_res_sqnorm/np.sum(weights*search_field*op_search_field)
+            # Update strain iterative update and conjugate gradient residual
+            dstrain_field += step*search_field
+            cg_res_field -= step*op_search_field
+            # Compute conjugate gradient residual squared norm
+            cg_res_sqnorm_old = cg_res_sqnorm
+            cg_res_sqnorm = np.sum(weights*cg_res_field*cg_res_field)
+            # Check conjugate gradient convergence
+            if cg_res_sqnorm <= cg_tol_sqnorm:
+                break
+            # Update search direction
+            search_field *= cg_res_sqnorm/cg_res_sqnorm_old
+            search_field += cg_res_field
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return dstrain_field, n_cg_iterations
+    # -------------------------------------------------------------------------
+    def _tangent_product(self, dstrain_field, comp_order, evar1, evar2, evar3,
+                         def_gradient=None, second_piola_stress=None):
+        """Compute product between material tangent modulus and strain field.
+
+        Under infinitesimal strains, the product is computed with the linear
+        elastic constitutive model. Under finite strains, the product between
+        the first Piola-Kirchhoff stress tensor derivative with respect to the
+        deformation gradient and the deformation gradient iterative update is
+        computed for the St.Venant-Kirchhoff hyperelastic constitutive model,
+
+        .. math::
+
+           \\delta \\boldsymbol{P} = \\delta \\boldsymbol{F} \\boldsymbol{S} +
+           \\boldsymbol{F} (\\boldsymbol{\\mathsf{D}}^{e} : \\delta
+           \\boldsymbol{E}^{(2)}) \\, , \\qquad \\delta \\boldsymbol{E}^{(2)} =
+           \\mathrm{sym} (\\boldsymbol{F}^{T} \\delta \\boldsymbol{F}) \\, .
+
+        ----
+
+        Parameters
+        ----------
+        dstrain_field : numpy.ndarray
+            Strain local field stored as numpy.ndarray of shape
+            (n_comps, *n_voxels_dims).
+        comp_order : list[str]
+            Strain/Stress components (str) order.
+        evar1 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        evar2 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        evar3 : numpy.ndarray (2d or 3d)
+            Auxiliar elastic properties array (see
+            :meth:`_elastic_constitutive_model`).
+        def_gradient : numpy.ndarray, default=None
+            Deformation gradient local field stored as numpy.ndarray of shape
+            (n_dim, n_dim, *n_voxels_dims). Only required under finite
+            strains.
+        second_piola_stress : numpy.ndarray, default=None
+            Second Piola-Kirchhoff stress tensor local field stored as
+            numpy.ndarray of shape (n_dim, n_dim, *n_voxels_dims). Only
+            required under finite strains.
+
+        Returns
+        -------
+        dstress_field : numpy.ndarray
+            Stress local field stored as numpy.ndarray of shape
+            (n_comps, *n_voxels_dims).
+        """
+        if self._strain_formulation == 'infinitesimal':
+            # Compute linear elastic stress
+            dstress_vox = self._elastic_constitutive_model(
+                {comp: dstrain_field[k] for k, comp in enumerate(comp_order)},
+                evar1, evar2, evar3)
+            # Stack stress local field components
+            dstress_field = np.stack([dstress_vox[comp]
+                                      for comp in comp_order])
+        else:
+            # Get deformation gradient iterative update
+            ddef_gradient = type(self)._get_tensor_field(
+                dstrain_field, comp_order, self._n_dim)
+            # Compute material Green-Lagrange strain tensor iterative update
+            dgreen_strain = np.einsum('ki...,kj...->ij...', def_gradient,
+                                      ddef_gradient)
+            dgreen_strain = 0.5*(dgreen_strain
+                                 + np.swapaxes(dgreen_strain, 0, 1))
+            # Compute second Piola-Kirchhoff stress tensor iterative update
+            dsecond_piola_stress = evar2*dgreen_strain
+            dsecond_piola_stress[np.diag_indices(self._n_dim)] += \
+                evar1*np.trace(dgreen_strain)
+            # Compute first Piola-Kirchhoff stress tensor iterative update
+            dfirst_piola_stress = \
+                np.einsum('ik...,kj...->ij...', ddef_gradient,
+                          second_piola_stress) \
+                + np.einsum('ik...,kj...->ij...', def_gradient,
+                            dsecond_piola_stress)
+            # Stack stress local field components
+            dstress_field = type(self)._get_stacked_field(dfirst_piola_stress,
+                                                          comp_order)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return dstress_field
+    # -------------------------------------------------------------------------
+    def _apply_green_operator(self, stress_DFT_field, gop_rdft_vox):
+        """Apply Green operator to stress DFT.
+
+        The Nyquist frequencies associated with an even number of voxels are
+        removed (see :meth:`_remove_nyquist_frequencies`), such that the Green
+        operator (unit reference material) is the orthogonal projection onto
+        compatible fields with zero average.
+
+        ----
+
+        Parameters
+        ----------
+        stress_DFT_field : numpy.ndarray
+            Stress DFT (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, *n_freqs_dims).
+        gop_rdft_vox : numpy.ndarray
+            Green operator (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, n_comps, *n_freqs_dims).
+
+        Returns
+        -------
+        strain_field : numpy.ndarray
+            Strain local field with zero average stored as numpy.ndarray of
+            shape (n_comps, *n_voxels_dims).
+        """
+        # Apply Green operator (product between Green operator and stress DFT
+        # performed for all components and frequencies at once)
+        strain_DFT_field = np.einsum('ij...,j...->i...', gop_rdft_vox,
+                                     stress_DFT_field)
+        # Enforce zero average
+        strain_DFT_field[(slice(None),) + self._n_dim*(0,)] = 0.0
+        # Remove Nyquist frequencies
+        self._remove_nyquist_frequencies(strain_DFT_field)
+        # Compute strain Inverse Discrete Fourier Transform (IDFT) by means of
+        # complex-to-real Fast Fourier Transform (FFT)
+        strain_field = self._fft_backend.irfftn(
+            strain_DFT_field, s=self._n_voxels_dims,
+            axes=tuple(range(1, self._n_dim + 1)))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return strain_field
+    # -------------------------------------------------------------------------
+    def _remove_nyquist_frequencies(self, DFT_field):
+        """Remove Nyquist frequencies from DFT (even number of voxels).
+
+        Only the Hermitian part of the Green operator is available at the
+        Nyquist frequencies, which is not an orthogonal projection onto
+        compatible fields as required by the conjugate gradient method, such
+        that these frequencies are excluded from the space of compatible
+        fields. Unlike the basic scheme, the reference solver of the offline
+        stage, this modifies the discrete equilibrium problem on grids with an
+        even number of voxels.
+
+        ----
+
+        Parameters
+        ----------
+        DFT_field : numpy.ndarray
+            DFT (half spectrum) stored as numpy.ndarray of shape
+            (n_comps, *n_freqs_dims). Updated in-place.
+        """
+        # Loop over spatial dimensions
+        for i in range(self._n_dim):
+            # Skip dimension with odd number of voxels (no Nyquist frequency)
+            if self._n_voxels_dims[i] % 2 != 0:
+                continue
+            # Set Nyquist frequency index
+            nyquist_idx = (slice(None),) + i*(slice(None),) \
+                + (self._n_voxels_dims[i]//2,)
+            # Remove Nyquist frequency
+            DFT_field[nyquist_idx] = 0.0
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _get_tensor_field(field, comp_order, n_dim):
+        """Get second-order tensor local field from stacked components.
+
+        Parameters
+        ----------
+        field : numpy.ndarray
+            Second-order tensor local field components stored as
+            numpy.ndarray of shape (n_comps, *n_voxels_dims).
+        comp_order : list[str]
+            Second-order tensor components (str) order. Must be nonsymmetric.
+        n_dim : int
+            Problem number of spatial dimensions.
+
+        Returns
+        -------
+        tensor_field : numpy.ndarray
+            Second-order tensor local field stored as numpy.ndarray of shape
+            (n_dim, n_dim, *n_voxels_dims).
+        """
+        # Initialize second-order tensor local field
+        tensor_field = np.zeros((n_dim, n_dim, *field.shape[1:]))
+        # Loop over second-order tensor components
+        for k, comp in enumerate(comp_order):
+            tensor_field[int(comp[0]) - 1, int(comp[1]) - 1] = field[k]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return tensor_field
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _get_stacked_field(tensor_field, comp_order):
+        """Get stacked components from second-order tensor local field.
+
+        Parameters
+        ----------
+        tensor_field : numpy.ndarray
+            Second-order tensor local field stored as numpy.ndarray of shape
+            (n_dim, n_dim, *n_voxels_dims).
+        comp_order : list[str]
+            Second-order tensor components (str) order.
+
+        Returns
+        -------
+        field : numpy.ndarray
+            Second-order tensor local field components stored as
+            numpy.ndarray of shape (n_comps, *n_voxels_dims).
+        """
+        return np.stack([tensor_field[int(comp[0]) - 1, int(comp[1]) - 1]
+                         for comp in comp_order])
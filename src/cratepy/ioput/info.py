@@ -64,6 +64,7 @@ def displayinfo(code, *args, **kwargs):
         * 16 : Clustering adaptivity step triggered
         * 17 : Adaptive clustering solution rewinding
         * 18 : Writing increment VTK output file
+        * 19 : Linear solver summary
     """
     # Get display features
     display_features = ioutil.setdisplayfeatures()
@@ -574,6 +575,46 @@ def displayinfo(code, *args, **kwargs):
             + indent + asterisk_line[:-len(indent)] \
             + colorama.Style.RESET_ALL
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    elif code == '19':
+        # Get linear solver and total online stage time
+        linear_solver = args[0]
+        total_time_os = args[1]
+        # Get linear solver profile
+        n_solves, n_iterations, n_factorizations, n_dense_fallbacks, \
+            solve_time = linear_solver.get_solver_profile()
+        # Compute average number of iterations per solve
+        if n_solves > 0:
+            avg_n_iterations = n_iterations/n_solves
+        else:
+            avg_n_iterations = 0.0
+        # Compute relative solve time
+        if total_time_os > 1e-10:
+            solve_time_rel = (solve_time/total_time_os)*100
+        else:
+            solve_time_rel = 0.0
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build output structure
+        arguments = ['Linear solver', linear_solver.get_name(),
+                     'Number of solves', n_solves,
+                     'Total number of iterations', n_iterations,
+                     'Average number of iterations', avg_n_iterations,
+                     'Number of factorizations', n_factorizations,
+                     'Number of dense fallbacks', n_dense_fallbacks,
+                     'Solve time (s)', solve_time,
+                     'Solve time (% total)', solve_time_rel]
+        info = tuple(arguments)
+        template = '\n\n' \
+            + indent + 'Linear solver summary:' + '\n\n' \
+            + 2*indent + '{:50s}{:>20s}' + '\n' \
+            + 2*indent + dashed_line[:-11*len(indent)] + '\n' \
+            + 2*indent + '{:50s}{:>20d}' + '\n' \
+            + 2*indent + '{:50s}{:>20d}' + '\n' \
+            + 2*indent + '{:50s}{:>20.2f}' + '\n' \
+            + 2*indent + '{:50s}{:>20d}' + '\n' \
+            + 2*indent + '{:50s}{:>20d}' + '\n' \
+            + 2*indent + '{:50s}{:>20.2e}' + '\n' \
+            + 2*indent + '{:50s}{:>20.2f}'
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # Display information
     ioutil.print2(template.format(*info, width=output_width))
     # Program abortion codes
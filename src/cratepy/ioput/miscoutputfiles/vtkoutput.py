@@ -67,8 +67,8 @@ class VTKOutput:
     _state_var_cell_data_array(self, n_dim, comp_order_sym, comp_order_nsym, \
                                material_phases, material_phases_models, \
                                phase_clusters, voxels_clusters, \
-                               clusters_state, var_name, var_type, \
-                               comp_idx=None, model_name=None)
+                               cluster_graph, clusters_state, var_name, \
+                               var_type, comp_idx=None, model_name=None)
         Build state variable cell data array.
     _reset_labels_from_zero(array_1d)
         Reset 1d array of integers starting from zero.
@@ -256,6 +256,8 @@ class VTKOutput:
         phase_clusters = crve.get_phase_clusters()
         # Get cluster associated with each pixel/voxel
         voxels_clusters = crve.get_voxels_clusters()
+        # Get cluster adjacency graph (read-only)
+        cluster_graph = crve.get_cluster_graph()
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Get material constitutive model associated with each material phase
         material_phases_models = material_state.get_material_phases_models()
@@ -340,8 +342,9 @@ class VTKOutput:
                     rg_array = self._state_var_cell_data_array(
                         n_dim, comp_order_sym, comp_order_nsym,
                         material_phases, material_phases_models,
-                        phase_clusters, voxels_clusters, clusters_state,
-                        var_name, var_type, comp_idx=comp_idx)
+                        phase_clusters, voxels_clusters, cluster_graph,
+                        clusters_state, var_name, var_type,
+                        comp_idx=comp_idx)
                     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                     # Set output variable data name
                     data_name = self._set_cell_data_name(
@@ -395,9 +398,9 @@ class VTKOutput:
                         rg_array = self._state_var_cell_data_array(
                             n_dim, comp_order_sym, comp_order_nsym,
                             material_phases, material_phases_models,
-                            phase_clusters, voxels_clusters, clusters_state,
-                            var_name, var_type, comp_idx=comp_idx,
-                            model_name=model_name)
+                            phase_clusters, voxels_clusters, cluster_graph,
+                            clusters_state, var_name, var_type,
+                            comp_idx=comp_idx, model_name=model_name)
                         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                         # Set output variable data name
                         data_name = self._set_cell_data_name(
@@ -441,7 +444,8 @@ class VTKOutput:
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Write VTK cell data array - Cluster adaptive level
         if adaptivity_manager is not None:
-            rg_array = adaptivity_manager.get_adapt_vtk_array(voxels_clusters)
+            rg_array = adaptivity_manager.get_adapt_vtk_array(
+                voxels_clusters, cluster_graph=cluster_graph)
             data_list = list(rg_array.flatten('F'))
             min_val = min(data_list)
             max_val = max(data_list)
@@ -662,10 +666,16 @@ class VTKOutput:
     def _state_var_cell_data_array(
             self, n_dim, comp_order_sym, comp_order_nsym, material_phases,
             material_phases_models, phase_clusters, voxels_clusters,
-            clusters_state, var_name, var_type, comp_idx=None,
+            cluster_graph, clusters_state, var_name, var_type, comp_idx=None,
             model_name=None):
         """Build state variable cell data array.
 
+        The state variable of each cluster is only assembled over the cluster
+        bounding box provided by the cluster adjacency graph instead of the
+        whole regular grid of voxels.
+
+        ----
+
         Parameters
         ----------
         n_dim : int
@@ -686,6 +696,8 @@ class VTKOutput:
             Regular grid of voxels (spatial discretization of the RVE), where
             each entry contains the cluster label (int) assigned to the
             corresponding voxel.
+        cluster_graph : ClusterAdjacencyGraph
+            Cluster adjacency graph associated with voxels_clusters.
         clusters_state : dict
             Material constitutive model state variables (item, dict) associated
             with each material cluster (key, str) (required if
@@ -716,54 +728,49 @@ class VTKOutput:
         for mat_phase in material_phases:
             # Get material phase constitutive model
             constitutive_model = material_phases_models[str(mat_phase)]
-            # Build state variable cell data array
-            if model_name is None \
-                    or constitutive_model.get_name() == model_name:
-                # Loop over material phase clusters
-                for cluster in phase_clusters[mat_phase]:
+            # Loop over material phase clusters
+            for cluster in phase_clusters[mat_phase]:
+                # Build state variable cell data array
+                if model_name is None \
+                        or constitutive_model.get_name() == model_name:
                     # Get material cluster state variable
                     cluster_var, _, _ = self._set_state_var_descriptors(
                         n_dim, comp_order_sym, comp_order_nsym, var_name,
                         source='clusters_state', cluster=cluster,
                         clusters_state=clusters_state)
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Assemble material cluster state variable
+                    # Get material cluster state variable component
                     if var_type in ['int', 'bool', 'float']:
-                        rg_array = np.where(rg_array == str(cluster),
-                                            cluster_var, rg_array)
+                        cluster_value = cluster_var
                     elif var_type == 'vector':
-                        rg_array = np.where(rg_array == str(cluster),
-                                            cluster_var[comp_idx], rg_array)
+                        cluster_value = cluster_var[comp_idx]
                     elif var_type == 'sym_matrix_mf':
                         idx = tuple([int(x) - 1
                                      for x in comp_order_sym[comp_idx]])
-                        rg_array = np.where(rg_array == str(cluster),
-                                            cluster_var[idx], rg_array)
-                    elif var_type == 'nsym_matrix_mf':
-                        idx = tuple([int(x) - 1
-                                     for x in comp_order_nsym[comp_idx]])
-                        rg_array = np.where(rg_array == str(cluster),
-                                            cluster_var[idx], rg_array)
+                        cluster_value = cluster_var[idx]
                     else:
                         idx = tuple([int(x) - 1
                                      for x in comp_order_nsym[comp_idx]])
-                        rg_array = np.where(rg_array == str(cluster),
-                                            cluster_var[idx], rg_array)
-            else:
-                # Loop over material phase clusters
-                for cluster in phase_clusters[mat_phase]:
-                    # Assemble a default state variable value for all clusters
-                    # for which the associated material phase is not governed
-                    # by the provided material constitutive model
+                        cluster_value = cluster_var[idx]
+                else:
+                    # Set a default state variable value for all clusters for
+                    # which the associated material phase is not governed by
+                    # the provided material constitutive model
                     if var_type in ['int']:
-                        rg_array = np.where(rg_array == str(cluster), int(0),
-                                            rg_array)
+                        cluster_value = int(0)
                     elif var_type in ['bool']:
-                        rg_array = np.where(rg_array == str(cluster), False,
-                                            rg_array)
+                        cluster_value = False
                     else:
-                        rg_array = np.where(rg_array == str(cluster), float(0),
-                                            rg_array)
+                        cluster_value = float(0)
+                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                # Skip unexistent cluster
+                if cluster_graph.get_cluster_n_voxels(cluster) == 0:
+                    continue
+                # Get cluster bounding box slices
+                slices = cluster_graph.get_cluster_slices(cluster)
+                # Assemble material cluster state variable
+                rg_array[slices] = np.where(
+                    voxels_clusters[slices] == cluster, cluster_value,
+                    rg_array[slices])
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Check if the state variable has been specified for every pixels
         # (2D) / voxels (3D)
@@ -286,7 +286,14 @@ def store_clustering_data(clustering_solution_method, standardization_method,
                           base_clustering_scheme, adaptive_clustering_scheme,
                           adapt_criterion_data, adaptivity_type,
                           adaptivity_control_feature, clust_adapt_freq,
-                          is_clust_adapt_output, is_store_final_clustering):
+                          is_clust_adapt_output, is_store_final_clustering,
+                          fft_backend='numpy', fft_workers=None,
+                          clustering_solution_workers=1,
+                          clustering_solution_executor='thread',
+                          rve_database_cache=None, gop_storage='stored',
+                          gop_precision='double', cit_memory_budget=None,
+                          cit_workers=1, clustering_quantization_tol=None,
+                          clustering_cache_dir=None):
     """Store data associated with the clustering-based domain decomposition.
 
     Parameters
@@ -335,6 +342,47 @@ def store_clustering_data(clustering_solution_method, standardization_method,
     is_store_final_clustering : bool
         `True` to store CRVE final clustering state into file, `False`
         otherwise.
+    fft_backend : {'numpy', 'scipy', 'pyfftw'}, default='numpy'
+        FFT backend of FFT-based homogenization methods.
+    fft_workers : int, default=None
+        Number of workers (threads) of multithreaded FFT backends. If -1, then
+        all the available CPUs are used. If None, then the FFT backend default
+        is adopted.
+    clustering_solution_workers : int, default=1
+        Number of workers solving the clustering data DNS macroscale strain
+        loadings in parallel. If -1, then all the available CPUs are used.
+    clustering_solution_executor : {'thread', 'process'}, default='thread'
+        Pool of workers solving the clustering data DNS macroscale strain
+        loadings: pool of threads ('thread') or pool of processes
+        ('process').
+    rve_database_cache : dict, default=None
+        RVE local elastic response database persistent cache settings, namely
+        the cache directory path (key 'cache_dir', item str) and the cache
+        maximum size in bytes (key 'max_size', item {int, None}). If None,
+        then the persistent cache is disabled.
+    gop_storage : {'stored', 'out_of_core', 'on_the_fly'}, default='stored'
+        Green operator unique terms storage employed to compute the cluster
+        interaction tensors: stored in memory ('stored'), stored in a
+        memory-mapped temporary file ('out_of_core') or computed on the fly
+        ('on_the_fly').
+    gop_precision : {'double', 'single'}, default='double'
+        Green operator unique terms and discrete convolutions floating-point
+        precision employed to compute the cluster interaction tensors.
+    cit_memory_budget : float, default=None
+        Memory budget (MB) of the cluster interaction tensors computation. If
+        None, then the computation is not memory bounded.
+    cit_workers : int, default=1
+        Number of worker processes computing the cluster interaction tensors
+        in parallel. If -1, then all the available CPUs are used.
+    clustering_quantization_tol : float, default=None
+        Quantization tolerance (relative to the range of each feature) to
+        collapse duplicated or near-duplicated voxels into weighted unique
+        dataset items before performing the cluster analyses. If None, then
+        voxels are not collapsed.
+    clustering_cache_dir : str, default=None
+        Persistent cache directory path of the hierarchical agglomerative
+        clustering trees. If None, then the hierarchical agglomerative
+        clustering trees are not cached.
 
     Returns
     -------
@@ -367,6 +415,17 @@ def store_clustering_data(clustering_solution_method, standardization_method,
     clst_dict['clust_adapt_freq'] = clust_adapt_freq
     clst_dict['is_clust_adapt_output'] = is_clust_adapt_output
     clst_dict['is_store_final_clustering'] = is_store_final_clustering
+    clst_dict['fft_backend'] = fft_backend
+    clst_dict['fft_workers'] = fft_workers
+    clst_dict['clustering_solution_workers'] = clustering_solution_workers
+    clst_dict['clustering_solution_executor'] = clustering_solution_executor
+    clst_dict['rve_database_cache'] = rve_database_cache
+    clst_dict['gop_storage'] = gop_storage
+    clst_dict['gop_precision'] = gop_precision
+    clst_dict['cit_memory_budget'] = cit_memory_budget
+    clst_dict['cit_workers'] = cit_workers
+    clst_dict['clustering_quantization_tol'] = clustering_quantization_tol
+    clst_dict['clustering_cache_dir'] = clustering_cache_dir
     # Return
     return clst_dict
 # =============================================================================
@@ -402,7 +461,9 @@ def store_scs_data(self_consistent_scheme, scs_parameters,
     return scs_dict
 # =============================================================================
 def store_algorithmic_data(max_n_iterations, conv_tol, max_subinc_level,
-                           max_cinc_cuts, su_max_n_iterations, su_conv_tol):
+                           max_cinc_cuts, su_max_n_iterations, su_conv_tol,
+                           linear_solver='dense',
+                           linear_solver_parameters=None):
     """Store data associated with the problem solution algorithmic parameters.
 
     Parameters
@@ -419,6 +480,11 @@ def store_algorithmic_data(max_n_iterations, conv_tol, max_subinc_level,
         State update maximum number of iterations.
     su_conv_tol : float
         State update convergence tolerance.
+    linear_solver : {'dense', 'gmres', 'bicgstab', 'lu_reuse'}, default='dense'
+        Linear solver of the Lippmann-Schwinger linearized system of
+        equilibrium equations.
+    linear_solver_parameters : dict, default=None
+        Linear solver parameters (key, str; item, {int, float, bool, str}).
 
     Returns
     -------
@@ -434,6 +500,8 @@ def store_algorithmic_data(max_n_iterations, conv_tol, max_subinc_level,
     algpar_dict['max_cinc_cuts'] = max_cinc_cuts
     algpar_dict['su_max_n_iterations'] = su_max_n_iterations
     algpar_dict['su_conv_tol'] = su_conv_tol
+    algpar_dict['linear_solver'] = linear_solver
+    algpar_dict['linear_solver_parameters'] = linear_solver_parameters
     # Return
     return algpar_dict
 # =============================================================================
@@ -24,6 +24,7 @@ import ioput.packager as packager
 import ioput.readprocedures as rproc
 import tensor.matrixoperations as mop
 from clustering.clusteringdata import get_available_clustering_features
+from clustering.rvedatabasecache import get_environment_cache_settings
 from material.materialmodeling import MaterialState
 #
 #                                                          Authorship & Credits
@@ -78,6 +79,7 @@ def read_input_data_file(input_file, dirs_dict, is_minimize_output=False):
     # Get input data file path and output directories paths
     input_file_name = dirs_dict['input_file_name']
     input_file_path = dirs_dict['input_file_path']
+    input_file_dir = dirs_dict['input_file_dir']
     discret_file_dir = dirs_dict['discret_file_dir']
     problem_dir = dirs_dict['problem_dir']
     postprocess_dir = dirs_dict['postprocess_dir']
@@ -234,12 +236,103 @@ def read_input_data_file(input_file, dirs_dict, is_minimize_output=False):
     keyword = 'Clustering_Solution_Method'
     is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
     if is_found:
-        max_val = 1
+        max_val = 3
         clustering_solution_method = rproc.readtypeAkeyword(
             input_file, input_file_path, keyword, max_val)
     else:
         clustering_solution_method = 1
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read FFT backend of FFT-based homogenization methods (optional)
+    # If the associated keyword is not found, then a default option is adopted
+    keyword = 'FFT_Backend'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        fft_backend, fft_workers = rproc.read_fft_backend(
+            input_file, input_file_path, keyword)
+    else:
+        fft_backend = 'numpy'
+        fft_workers = None
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read clustering solution method parallel workers (optional)
+    # If the associated keyword is not found, then a default option is adopted
+    keyword = 'Clustering_Solution_Workers'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        clustering_solution_workers, clustering_solution_executor = \
+            rproc.read_clustering_solution_workers(
+                input_file, input_file_path, keyword)
+    else:
+        clustering_solution_workers = 1
+        clustering_solution_executor = 'thread'
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read RVE local elastic response database persistent cache (optional)
+    # If the associated keyword is not found, then the cache settings are
+    # read from the environment variables (cache is disabled by default)
+    keyword = 'RVE_Database_Cache'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        rve_database_cache = rproc.read_rve_database_cache(
+            input_file, input_file_path, keyword)
+    else:
+        rve_database_cache = get_environment_cache_settings()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read Green operator storage of cluster interaction tensors computation
+    # (optional)
+    # If the associated keyword is not found, then a default option is adopted
+    keyword = 'Green_Operator_Storage'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        gop_storage, gop_precision = rproc.read_green_operator_storage(
+            input_file, input_file_path, keyword)
+    else:
+        gop_storage = 'stored'
+        gop_precision = 'double'
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read memory budget of cluster interaction tensors computation (optional)
+    # If the associated keyword is not found, then the computation is not
+    # memory bounded
+    keyword = 'CIT_Memory_Budget'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        cit_memory_budget = rproc.readtypeBkeyword(input_file,
+                                                   input_file_path, keyword)
+    else:
+        cit_memory_budget = None
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read number of worker processes of cluster interaction tensors
+    # computation (optional)
+    # If the associated keyword is not found, then a default option is adopted
+    keyword = 'CIT_Workers'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        cit_workers = rproc.read_cit_workers(input_file, input_file_path,
+                                             keyword)
+    else:
+        cit_workers = 1
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read clustering data matrix quantization tolerance (optional)
+    # If the associated keyword is not found, then voxels are not collapsed
+    # into weighted unique dataset items
+    keyword = 'Clustering_Data_Quantization'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        clustering_quantization_tol = rproc.read_clustering_quantization(
+            input_file, input_file_path, keyword)
+    else:
+        clustering_quantization_tol = None
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read hierarchical clustering trees persistent cache directory (optional)
+    # If the associated keyword is not found, then the hierarchical clustering
+    # trees are not cached
+    keyword = 'Clustering_Hierarchy_Cache'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        clustering_cache_dir = rproc.read_clustering_hierarchy_cache(
+            input_file, input_file_path, keyword,
+            input_file_dir + 'clustering_cache')
+    else:
+        clustering_cache_dir = None
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # Read macroscale loading incrementation parameters (mandatory)
     keyword_1 = 'Number_of_Load_Increments'
     is_found_1, _ = rproc.searchoptkeywordline(input_file, keyword_1)
@@ -329,6 +422,18 @@ def read_input_data_file(input_file, dirs_dict, is_minimize_output=False):
     else:
         su_conv_tol = 1e-6
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read linear solver of the Lippmann-Schwinger linearized system of
+    # equilibrium equations and associated parameters (optional)
+    # If the associated keyword is not found, then a default option is adopted
+    keyword = 'Linear_Solver'
+    is_found, _ = rproc.searchoptkeywordline(input_file, keyword)
+    if is_found:
+        linear_solver, linear_solver_parameters = rproc.read_linear_solver(
+            input_file, input_file_path, keyword)
+    else:
+        linear_solver = 'dense'
+        linear_solver_parameters = {}
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # Read the spatial discretization file absolute path (mandatory)
     keyword = 'Discretization_File'
     valid_exts = ['.rgmsh']
@@ -482,7 +587,15 @@ def read_input_data_file(input_file, dirs_dict, is_minimize_output=False):
         phase_n_clusters, rg_dict, clustering_type, base_clustering_scheme,
         adaptive_clustering_scheme, adapt_criterion_data, adaptivity_type,
         adaptivity_control_feature, clust_adapt_freq, is_clust_adapt_output,
-        is_store_final_clustering)
+        is_store_final_clustering, fft_backend=fft_backend,
+        fft_workers=fft_workers,
+        clustering_solution_workers=clustering_solution_workers,
+        clustering_solution_executor=clustering_solution_executor,
+        rve_database_cache=rve_database_cache, gop_storage=gop_storage,
+        gop_precision=gop_precision, cit_memory_budget=cit_memory_budget,
+        cit_workers=cit_workers,
+        clustering_quantization_tol=clustering_quantization_tol,
+        clustering_cache_dir=clustering_cache_dir)
     # Store data associated with the self-consistent scheme
     info.displayinfo('5', 'Storing self-consistent scheme data...')
     scs_dict = packager.store_scs_data(
@@ -492,7 +605,8 @@ def read_input_data_file(input_file, dirs_dict, is_minimize_output=False):
     info.displayinfo('5', 'Storing algorithmic data...')
     algpar_dict = packager.store_algorithmic_data(
         max_n_iterations, conv_tol, max_subinc_level, max_cinc_cuts,
-        su_max_n_iterations, su_conv_tol)
+        su_max_n_iterations, su_conv_tol, linear_solver,
+        linear_solver_parameters)
     # Store data associated with the VTK output
     info.displayinfo('5', 'Storing VTK output data...')
     if is_vtk_output:
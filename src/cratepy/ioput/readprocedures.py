@@ -40,6 +40,22 @@ read_rve_dimensions
     Read RVE dimensions (size length along each spatial dimension).
 read_self_consistent_scheme
     Read self-consistent scheme and associated parameters.
+read_linear_solver
+    Read linear solver and associated parameters.
+read_fft_backend
+    Read FFT backend and associated number of workers.
+read_clustering_solution_workers
+    Read clustering solution method number of parallel workers.
+read_rve_database_cache
+    Read RVE local elastic response database persistent cache settings.
+read_green_operator_storage
+    Read Green operator storage and floating-point precision.
+read_cit_workers
+    Read cluster interaction tensors number of worker processes.
+read_clustering_quantization
+    Read clustering data matrix quantization tolerance.
+read_clustering_hierarchy_cache
+    Read hierarchical clustering trees persistent cache directory.
 read_vtk_options
     Read VTK output options.
 """
@@ -65,6 +81,8 @@ from material.models.elastic import Elastic
 from material.models.von_mises import VonMises
 from material.models.stvenant_kirchhoff import StVenantKirchhoff
 from online.crom.asca import ElasticReferenceMaterial
+from online.crom.linearsolvers import get_available_linear_solvers
+from clustering.solution.fftbackends import get_available_fft_backends
 #
 #                                                          Authorship & Credits
 # =============================================================================
@@ -2413,6 +2431,550 @@ def read_self_consistent_scheme(file, file_path, keyword, strain_formulation):
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     return self_consistent_scheme, scs_parameters
 # =============================================================================
+def read_linear_solver(file, file_path, keyword):
+    """Read linear solver and associated parameters.
+
+    The specification of the linear solver of the Lippmann-Schwinger
+    linearized system of equilibrium equations has the following input data
+    file syntax:
+
+    .. code-block:: text
+
+       Linear_Solver < solver > [ < n_parameters > ]
+       [ < parameter_1_name > < value > ]
+       [ < parameter_2_name > < value > ]
+       ...
+
+    where `solver` (str) is the linear solver, `n_parameters` (int) is the
+    number of linear solver parameters, and `parameter_X_name` (str) is the
+    linear solver parameter name.
+
+    ----
+
+    Parameters
+    ----------
+    file : file
+        Data file.
+    file_path : str
+        Data file path.
+    keyword: str
+        Keyword.
+
+    Returns
+    -------
+    linear_solver : {'dense', 'gmres', 'bicgstab', 'lu_reuse'}
+        Linear solver of the Lippmann-Schwinger linearized system of
+        equilibrium equations.
+    linear_solver_parameters : dict
+        Linear solver parameters (key, str; item, {int, float, bool, str}).
+    """
+    # Get display features
+    indent = ioutil.setdisplayfeatures()[2]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read keyword line
+    keyword_line_number = searchkeywordline(file, keyword)
+    line = linecache.getline(file_path, keyword_line_number).split()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Get available linear solvers
+    available_linear_solvers = get_available_linear_solvers()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    if len(line) == 1 or len(line) > 3:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.'
+        info.displayinfo('4', summary, description, keyword)
+    elif str(line[1]) not in available_linear_solvers.keys():
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined ' \
+            + 'in the input data file.' + '\n' \
+            + indent + 'Unknown linear solver.'
+        info.displayinfo('4', summary, description, keyword)
+    else:
+        linear_solver = str(line[1])
+    # Get linear solver available parameters
+    available_parameters = available_linear_solvers[linear_solver]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Initialize linear solver parameters
+    linear_solver_parameters = {}
+    # Read linear solver parameters
+    if len(line) == 3:
+        if not ioutil.checkposint(line[2]):
+            summary = 'Invalid keyword specification'
+            description = 'The keyword - {} - is not properly defined in the '\
+                + 'input data file.' + '\n' \
+                + indent + 'Invalid number of linear solver parameters.'
+            info.displayinfo('4', summary, description, keyword)
+        # Get number of linear solver parameters
+        n_parameters = int(line[2])
+        # Loop over linear solver parameters
+        line_number = keyword_line_number + 1
+        for i in range(n_parameters):
+            # Get linear solver parameter specification line
+            parameter_line = \
+                linecache.getline(file_path, line_number + i).split()
+            # Get linear solver parameter
+            if not parameter_line:
+                summary = 'Missing linear solver parameter'
+                description = 'The keyword - {} - is not properly '\
+                    + 'defined in the input data file.' + '\n' \
+                    + indent + 'Missing specification of linear solver '\
+                    + 'parameter.'
+                info.displayinfo('4', summary, description, keyword)
+            elif len(parameter_line) != 2 \
+                    or parameter_line[0] not in available_parameters.keys():
+                summary = 'Invalid linear solver parameter'
+                description = 'The keyword - {} - is not properly '\
+                    + 'defined in the input data file.' + '\n' \
+                    + indent + 'Invalid specification of linear solver '\
+                    + 'parameter.'
+                info.displayinfo('4', summary, description, keyword)
+            # Get parameter name and expected type
+            parameter = str(parameter_line[0])
+            etype = available_parameters[parameter]
+            # Get formatted parameter (integer specifications of float-valued
+            # parameters are accepted)
+            value = get_formatted_parameter(parameter, parameter_line[1])
+            if etype is float and isinstance(value, int) \
+                    and not isinstance(value, bool):
+                value = float(value)
+            if not isinstance(value, etype):
+                summary = 'Invalid linear solver parameter'
+                description = 'The keyword - {} - is not properly '\
+                    + 'defined in the input data file.' + '\n' \
+                    + indent + 'Invalid value of linear solver parameter '\
+                    + '\'' + parameter + '\' (expected ' + etype.__name__ \
+                    + ').'
+                info.displayinfo('4', summary, description, keyword)
+            # Store linear solver parameter
+            linear_solver_parameters[parameter] = value
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return linear_solver, linear_solver_parameters
+# =============================================================================
+def read_fft_backend(file, file_path, keyword):
+    """Read FFT backend and associated number of workers.
+
+    The specification of the FFT backend of the FFT-based homogenization
+    methods has the following input data file syntax:
+
+    .. code-block:: text
+
+       FFT_Backend < backend > [ < n_workers > ]
+
+    where `backend` (str) is the FFT backend and `n_workers` (int) is the
+    number of workers (threads) of multithreaded FFT backends (-1 to use all
+    the available CPUs).
+
+    ----
+
+    Parameters
+    ----------
+    file : file
+        Data file.
+    file_path : str
+        Data file path.
+    keyword: str
+        Keyword.
+
+    Returns
+    -------
+    fft_backend : {'numpy', 'scipy', 'pyfftw'}
+        FFT backend.
+    fft_workers : {int, None}
+        Number of workers (threads) of multithreaded FFT backends. If -1, then
+        all the available CPUs are used. If None, then the FFT backend default
+        is adopted.
+    """
+    # Get display features
+    indent = ioutil.setdisplayfeatures()[2]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read keyword line
+    keyword_line_number = searchkeywordline(file, keyword)
+    line = linecache.getline(file_path, keyword_line_number).split()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    if len(line) == 1 or len(line) > 3:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.'
+        info.displayinfo('4', summary, description, keyword)
+    elif str(line[1]) not in get_available_fft_backends():
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined ' \
+            + 'in the input data file.' + '\n' \
+            + indent + 'Unknown FFT backend.'
+        info.displayinfo('4', summary, description, keyword)
+    else:
+        fft_backend = str(line[1])
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read number of workers
+    fft_workers = None
+    if len(line) == 3:
+        if not (ioutil.checkposint(line[2]) or line[2] == '-1'):
+            summary = 'Invalid keyword specification'
+            description = 'The keyword - {} - is not properly defined in the '\
+                + 'input data file.' + '\n' \
+                + indent + 'Invalid number of FFT backend workers.'
+            info.displayinfo('4', summary, description, keyword)
+        fft_workers = int(line[2])
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return fft_backend, fft_workers
+# =============================================================================
+def read_clustering_solution_workers(file, file_path, keyword):
+    """Read clustering solution method number of parallel workers.
+
+    The specification of the number of workers solving the clustering data DNS
+    macroscale strain loadings in parallel has the following input data file
+    syntax:
+
+    .. code-block:: text
+
+       Clustering_Solution_Workers < n_workers > [ < executor > ]
+
+    where `n_workers` (int) is the number of workers (-1 to use all the
+    available CPUs) and `executor` (str) is the pool of workers, either a pool
+    of threads ('thread') or a pool of processes ('process').
+
+    ----
+
+    Parameters
+    ----------
+    file : file
+        Data file.
+    file_path : str
+        Data file path.
+    keyword: str
+        Keyword.
+
+    Returns
+    -------
+    n_workers : int
+        Number of workers solving the clustering data DNS macroscale strain
+        loadings in parallel. If -1, then all the available CPUs are used.
+    executor : {'thread', 'process'}
+        Pool of workers: pool of threads ('thread') or pool of processes
+        ('process').
+    """
+    # Get display features
+    indent = ioutil.setdisplayfeatures()[2]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read keyword line
+    keyword_line_number = searchkeywordline(file, keyword)
+    line = linecache.getline(file_path, keyword_line_number).split()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    if len(line) == 1 or len(line) > 3:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.'
+        info.displayinfo('4', summary, description, keyword)
+    elif not (ioutil.checkposint(line[1]) or line[1] == '-1'):
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.' + '\n' \
+            + indent + 'Invalid number of workers.'
+        info.displayinfo('4', summary, description, keyword)
+    else:
+        n_workers = int(line[1])
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read pool of workers
+    executor = 'thread'
+    if len(line) == 3:
+        if str(line[2]) not in ('thread', 'process'):
+            summary = 'Invalid keyword specification'
+            description = 'The keyword - {} - is not properly defined in the '\
+                + 'input data file.' + '\n' \
+                + indent + 'Unknown pool of workers.'
+            info.displayinfo('4', summary, description, keyword)
+        executor = str(line[2])
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return n_workers, executor
+# =============================================================================
+def read_rve_database_cache(file, file_path, keyword):
+    """Read RVE local elastic response database persistent cache settings.
+
+    The specification of the RVE local elastic response database persistent
+    cache has the following input data file syntax:
+
+    .. code-block:: text
+
+       RVE_Database_Cache [ < max_size > ]
+       < path >
+
+    where `max_size` (float) is the cache maximum size (GB) and `path` is the
+    cache directory path (created if it does not exist).
+
+    ----
+
+    Parameters
+    ----------
+    file : file
+        Data file.
+    file_path : str
+        Data file path.
+    keyword: str
+        Keyword.
+
+    Returns
+    -------
+    rve_database_cache : dict
+        RVE local elastic response database persistent cache settings, namely
+        the cache directory path (key 'cache_dir', item str) and the cache
+        maximum size in bytes (key 'max_size', item {int, None}).
+    """
+    # Get display features
+    indent = ioutil.setdisplayfeatures()[2]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read keyword line
+    keyword_line_number = searchkeywordline(file, keyword)
+    line = linecache.getline(file_path, keyword_line_number).split()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read cache maximum size
+    max_size = None
+    if len(line) > 2:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.'
+        info.displayinfo('4', summary, description, keyword)
+    elif len(line) == 2:
+        if not ioutil.checknumber(line[1]) or float(line[1]) <= 0:
+            summary = 'Invalid keyword specification'
+            description = 'The keyword - {} - is not properly defined in the '\
+                + 'input data file.' + '\n' \
+                + indent + 'Invalid cache maximum size.'
+            info.displayinfo('4', summary, description, keyword)
+        max_size = int(float(line[1])*1024**3)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read cache directory path
+    cache_dir = linecache.getline(file_path, keyword_line_number + 1).strip()
+    if not cache_dir:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.' + '\n' \
+            + indent + 'Missing cache directory path.'
+        info.displayinfo('4', summary, description, keyword)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return {'cache_dir': os.path.abspath(cache_dir), 'max_size': max_size}
+# =============================================================================
+def read_green_operator_storage(file, file_path, keyword):
+    """Read Green operator storage and floating-point precision.
+
+    The specification of the Green operator storage employed to compute the
+    cluster interaction tensors has the following input data file syntax:
+
+    .. code-block:: text
+
+       Green_Operator_Storage < storage > [ < precision > ]
+
+    where `storage` (str) is the Green operator unique terms storage, either
+    stored in memory ('stored'), stored in a memory-mapped temporary file
+    ('out_of_core') or computed on the fly ('on_the_fly'), and `precision`
+    (str) is the floating-point precision ('double' or 'single').
+
+    ----
+
+    Parameters
+    ----------
+    file : file
+        Data file.
+    file_path : str
+        Data file path.
+    keyword: str
+        Keyword.
+
+    Returns
+    -------
+    gop_storage : {'stored', 'out_of_core', 'on_the_fly'}
+        Green operator unique terms storage.
+    gop_precision : {'double', 'single'}
+        Green operator unique terms and discrete convolutions floating-point
+        precision.
+    """
+    # Get display features
+    indent = ioutil.setdisplayfeatures()[2]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read keyword line
+    keyword_line_number = searchkeywordline(file, keyword)
+    line = linecache.getline(file_path, keyword_line_number).split()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    if len(line) == 1 or len(line) > 3:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.'
+        info.displayinfo('4', summary, description, keyword)
+    elif str(line[1]) not in ('stored', 'out_of_core', 'on_the_fly'):
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined ' \
+            + 'in the input data file.' + '\n' \
+            + indent + 'Unknown Green operator storage.'
+        info.displayinfo('4', summary, description, keyword)
+    else:
+        gop_storage = str(line[1])
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read floating-point precision
+    gop_precision = 'double'
+    if len(line) == 3:
+        if str(line[2]) not in ('double', 'single'):
+            summary = 'Invalid keyword specification'
+            description = 'The keyword - {} - is not properly defined in the '\
+                + 'input data file.' + '\n' \
+                + indent + 'Unknown floating-point precision.'
+            info.displayinfo('4', summary, description, keyword)
+        gop_precision = str(line[2])
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return gop_storage, gop_precision
+# =============================================================================
+def read_cit_workers(file, file_path, keyword):
+    """Read cluster interaction tensors number of worker processes.
+
+    The specification of the number of worker processes computing the cluster
+    interaction tensors in parallel has the following input data file syntax:
+
+    .. code-block:: text
+
+       CIT_Workers < n_workers >
+
+    where `n_workers` (int) is the number of worker processes (-1 to use all
+    the available CPUs).
+
+    ----
+
+    Parameters
+    ----------
+    file : file
+        Data file.
+    file_path : str
+        Data file path.
+    keyword: str
+        Keyword.
+
+    Returns
+    -------
+    n_workers : int
+        Number of worker processes computing the cluster interaction tensors
+        in parallel. If -1, then all the available CPUs are used.
+    """
+    # Get display features
+    indent = ioutil.setdisplayfeatures()[2]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read keyword line
+    keyword_line_number = searchkeywordline(file, keyword)
+    line = linecache.getline(file_path, keyword_line_number).split()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    if len(line) != 2:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.'
+        info.displayinfo('4', summary, description, keyword)
+    elif not (ioutil.checkposint(line[1]) or line[1] == '-1'):
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.' + '\n' \
+            + indent + 'Invalid number of worker processes.'
+        info.displayinfo('4', summary, description, keyword)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return int(line[1])
+# =============================================================================
+def read_clustering_quantization(file, file_path, keyword):
+    """Read clustering data matrix quantization tolerance.
+
+    The specification of the quantization tolerance employed to collapse
+    duplicated or near-duplicated voxels into weighted unique dataset items
+    before performing the material phases cluster analyses has the following
+    input data file syntax:
+
+    .. code-block:: text
+
+       Clustering_Data_Quantization < tolerance >
+
+    where `tolerance` (float) is the quantization tolerance relative to the
+    range of each clustering feature (0 to collapse only duplicated voxels).
+
+    ----
+
+    Parameters
+    ----------
+    file : file
+        Data file.
+    file_path : str
+        Data file path.
+    keyword: str
+        Keyword.
+
+    Returns
+    -------
+    quantization_tol : float
+        Quantization tolerance (relative to the range of each feature). If 0,
+        then only duplicated voxels are collapsed.
+    """
+    # Get display features
+    indent = ioutil.setdisplayfeatures()[2]
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Read keyword line
+    keyword_line_number = searchkeywordline(file, keyword)
+    line = linecache.getline(file_path, keyword_line_number).split()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    if len(line) != 2:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.'
+        info.displayinfo('4', summary, description, keyword)
+    elif not ioutil.checknumber(line[1]) or float(line[1]) < 0 \
+            or float(line[1]) >= 1:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.' + '\n' \
+            + indent + 'Quantization tolerance must be contained between 0 ' \
+            + '(included) and 1.'
+        info.displayinfo('4', summary, description, keyword)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return float(line[1])
+# =============================================================================
+def read_clustering_hierarchy_cache(file, file_path, keyword, default_dir):
+    """Read hierarchical clustering trees persistent cache directory.
+
+    The specification of the persistent cache of hierarchical agglomerative
+    clustering trees has the following input data file syntax:
+
+    .. code-block:: text
+
+       Clustering_Hierarchy_Cache [ < path > ]
+
+    where `path` is the cache directory path (created if it does not exist).
+
+    ----
+
+    Parameters
+    ----------
+    file : file
+        Data file.
+    file_path : str
+        Data file path.
+    keyword: str
+        Keyword.
+    default_dir : str
+        Default cache directory path, adopted if the cache directory path is
+        not specified.
+
+    Returns
+    -------
+    cache_dir : str
+        Cache directory path.
+    """
+    # Read keyword line
+    keyword_line_number = searchkeywordline(file, keyword)
+    line = linecache.getline(file_path, keyword_line_number).split()
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    if len(line) > 2:
+        summary = 'Invalid keyword specification'
+        description = 'The keyword - {} - is not properly defined in the ' \
+            + 'input data file.'
+        info.displayinfo('4', summary, description, keyword)
+    # Read cache directory path
+    if len(line) == 2:
+        cache_dir = line[1]
+    else:
+        cache_dir = default_dir
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return os.path.abspath(cache_dir)
+# =============================================================================
 def read_vtk_options(file, file_path, keyword, keyword_line_number):
     """Read VTK output options.
 
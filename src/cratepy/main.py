@@ -36,6 +36,7 @@ import ioput.readinputdata as rid
 import numpy as np
 from clustering.clusteringdata import set_clustering_data
 from clustering.crve import CRVE
+from clustering.rvedatabasecache import RVEDatabaseCache
 from ioput.miscoutputfiles.vtkoutput import VTKOutput
 from online.crom.asca import ASCA
 
@@ -156,9 +157,23 @@ def crate_simulation(arg_input_file_path, arg_discret_file_dir=None,
         dns_method_id = clst_dict['clustering_solution_method']
         if dns_method_id == 1:
             dns_method = 'fft_basic'
-            dns_method_data = None
+            dns_method_data = {'fft_backend': clst_dict['fft_backend'],
+                               'fft_workers': clst_dict['fft_workers']}
+        elif dns_method_id == 2:
+            dns_method = 'fft_anderson'
+            dns_method_data = {'fft_backend': clst_dict['fft_backend'],
+                               'fft_workers': clst_dict['fft_workers']}
+        elif dns_method_id == 3:
+            dns_method = 'fft_krylov'
+            dns_method_data = {'fft_backend': clst_dict['fft_backend'],
+                               'fft_workers': clst_dict['fft_workers']}
         else:
             raise RuntimeError('Unknown DNS solution method.')
+        # Set RVE local elastic response database persistent cache
+        if clst_dict['rve_database_cache'] is not None:
+            dns_cache = RVEDatabaseCache(**clst_dict['rve_database_cache'])
+        else:
+            dns_cache = None
         # Compute the physical-based data required to perform the RVE
         # clustering-based domain decomposition
         clustering_data, rve_elastic_database = set_clustering_data(
@@ -168,7 +183,10 @@ def crate_simulation(arg_input_file_path, arg_discret_file_dir=None,
             mat_dict['material_phases_properties'],
             dns_method, dns_method_data, clst_dict['standardization_method'],
             clst_dict['base_clustering_scheme'],
-            clst_dict['adaptive_clustering_scheme'])
+            clst_dict['adaptive_clustering_scheme'],
+            dns_n_workers=clst_dict['clustering_solution_workers'],
+            dns_executor=clst_dict['clustering_solution_executor'],
+            dns_cache=dns_cache)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Set phase ending time and display finishing phase information
         phase_end_time = time.time()
@@ -238,7 +256,14 @@ def crate_simulation(arg_input_file_path, arg_discret_file_dir=None,
             rve_elastic_database.get_eff_isotropic_elastic_constants(),
             clst_dict['adaptive_clustering_scheme'],
             clst_dict['adapt_criterion_data'], clst_dict['adaptivity_type'],
-            clst_dict['adaptivity_control_feature'])
+            clst_dict['adaptivity_control_feature'],
+            gop_storage=clst_dict['gop_storage'],
+            gop_precision=clst_dict['gop_precision'],
+            cit_memory_budget=clst_dict['cit_memory_budget'],
+            cit_workers=clst_dict['cit_workers'],
+            clustering_quantization_tol=clst_dict[
+                'clustering_quantization_tol'],
+            clustering_cache_dir=clst_dict['clustering_cache_dir'])
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Compute Cluster-Reduced Representative Volume Element (CRVE)
         crve.perform_crve_base_clustering()
@@ -326,7 +351,10 @@ def crate_simulation(arg_input_file_path, arg_discret_file_dir=None,
                 max_n_iterations=algpar_dict['max_n_iterations'],
                 conv_tol=algpar_dict['conv_tol'],
                 max_subinc_level=algpar_dict['max_subinc_level'],
-                max_cinc_cuts=algpar_dict['max_cinc_cuts'])
+                max_cinc_cuts=algpar_dict['max_cinc_cuts'],
+                linear_solver=algpar_dict['linear_solver'],
+                linear_solver_parameters=algpar_dict[
+                    'linear_solver_parameters'])
     # Solve clustering-based reduced-order equilibrium problem
     asca.solve_equilibrium_problem(
         crve, material_state, macload_dict['mac_load'],
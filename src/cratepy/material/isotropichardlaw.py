@@ -168,6 +168,13 @@ def build_hardening_parameters(type, material_properties):
 def get_hardening_law(type):
     """Get isotropic hardening law to compute yield stress and hardening slope.
 
+    The isotropic hardening law accepts either a single value of accumulated
+    plastic strain (float) or several values of accumulated plastic strain
+    (numpy.ndarray (1d)), in which case the yield stress and hardening slope
+    are computed for each of them.
+
+    ----
+
     Parameters
     ----------
     type : str
@@ -201,9 +208,9 @@ def get_hardening_law(type):
 
             Returns
             -------
-            yield_stress : float
+            yield_stress : {float, numpy.ndarray (1d)}
                 Material yield stress.
-            H : float
+            H : {float, numpy.ndarray (1d)}
                 Material hardening slope.
             """
             # Get hardening curve points array
@@ -233,7 +240,16 @@ def get_hardening_law(type):
             # the yield stress
             yield_stress = np.interp(acc_p_strain, a, b, b[0], b[-1])
             # Get hardening slope
-            if acc_p_strain < a[0] or acc_p_strain >= a[-1]:
+            if np.ndim(acc_p_strain) > 0:
+                # Get hardening curve intervals
+                slopes = np.append(np.diff(b)/np.diff(a), 0.0)
+                idxs = np.clip(
+                    np.searchsorted(a, acc_p_strain, side='right') - 1, 0,
+                    len(a) - 1)
+                # Compute hardening slopes
+                H = np.where((acc_p_strain < a[0]) | (acc_p_strain >= a[-1]),
+                             0.0, slopes[idxs])
+            elif acc_p_strain < a[0] or acc_p_strain >= a[-1]:
                 H = 0
             else:
                 # Get hardening curve interval
@@ -270,9 +286,9 @@ def get_hardening_law(type):
 
             Returns
             -------
-            yield_stress : float
+            yield_stress : {float, numpy.ndarray (1d)}
                 Material yield stress.
-            H : float
+            H : {float, numpy.ndarray (1d)}
                 Material hardening slope.
             """
             # Get initial yield stress and hardening slope
@@ -313,9 +329,9 @@ def get_hardening_law(type):
 
             Returns
             -------
-            yield_stress : float
+            yield_stress : {float, numpy.ndarray (1d)}
                 Material yield stress.
-            H : float
+            H : {float, numpy.ndarray (1d)}
                 Material hardening slope.
             """
             # Get initial yield stress and parameters
@@ -66,22 +66,35 @@ class MaterialState:
     _clusters_vf : dict
         Volume fraction (item, float) associated to each material cluster
         (key, str).
-    _clusters_def_gradient_mf : dict
-        Deformation gradient (item, numpy.darray (1d)) associated to each
-        material cluster (key, str), stored in matricial form.
-    _clusters_def_gradient_old_mf : dict
-        Last converged deformation gradient (item, numpy.darray (1d))
-        associated to each material cluster (key, str), stored in matricial
-        form.
+    _clusters_rows : dict
+        Row (item, int) of each material cluster (key, str) in the clusters
+        global arrays, where clusters are sorted by material phase and, within
+        each material phase, according with the material phase clusters
+        labels.
+    _phases_rows : dict
+        Rows (item, slice) of the clusters of each material phase (key, str)
+        in the clusters global arrays.
+    _clusters_def_gradient_mf : numpy.ndarray (2d)
+        Deformation gradient of each material cluster stored in matricial
+        form, numpy.ndarray (2d) of shape (n_total_clusters, n_comps_nsym).
+    _clusters_def_gradient_old_mf : numpy.ndarray (2d)
+        Last converged deformation gradient of each material cluster stored in
+        matricial form, numpy.ndarray (2d) of shape
+        (n_total_clusters, n_comps_nsym).
     _clusters_state : dict
         Material constitutive model state variables (item, dict) associated to
-        each material cluster (key, str).
+        each material phase (key, str). Each state variable (key, str) is
+        stored as a numpy.ndarray stacking the material phase clusters along
+        the first dimension.
     _clusters_state_old : dict
         Last converged material constitutive model state variables (item, dict)
-        associated to each material cluster (key, str).
-    _clusters_tangent_mf : dict
-        Material consistent tangent modulus (item, numpy.ndarray) associated to
-        each material cluster (key, str), stored in matricial form.
+        associated to each material phase (key, str). Each state variable
+        (key, str) is stored as a numpy.ndarray stacking the material phase
+        clusters along the first dimension.
+    _clusters_tangent_mf : numpy.ndarray (3d)
+        Material consistent tangent modulus of each material cluster stored in
+        matricial form, numpy.ndarray (3d) of shape
+        (n_total_clusters, n_comps, n_comps).
     _hom_strain_mf : numpy.ndarray (1d)
         Homogenized strain tensor stored in matricial form: infinitesimal
         strain tensor (infinitesimal strains) or deformation gradient (finite
@@ -120,6 +133,15 @@ class MaterialState:
         Get clusters incremental strain in matricial form.
     update_clusters_state(self, clusters_inc_strain_mf)
         Update clusters state variables and consistent tangent modulus.
+    _is_batch_state_update(self, constitutive_model)
+        Check if material phase clusters batched state update is performed.
+    _update_phase_clusters_state_batch(self, mat_phase, \
+                                       clusters_inc_strain_mf)
+        Update material phase clusters state through batched state update.
+    _stack_clusters_state(clusters_state)
+        Stack material clusters state variables.
+    _copy_clusters_state(clusters_state)
+        Copy material phases stacked state variables.
     update_state_homogenization(self)
         Update homogenized strain and stress tensors.
     update_converged_state(self)
@@ -160,6 +182,14 @@ class MaterialState:
         Get last converged material state variables of each material cluster.
     get_clusters_tangent_mf(self)
         Get material consistent tangent modulus of each material cluster.
+    get_stacked_clusters_tangent_mf(self)
+        Get stacked material consistent tangent modulus of material clusters.
+    _set_clusters_rows(self)
+        Set rows of material clusters in the clusters global arrays.
+    _get_clusters_state_dict(self, clusters_state)
+        Get material state variables of each material cluster.
+    _get_cluster_state(phase_state, i)
+        Get material state variables of material phase cluster.
     _material_su_interface(strain_formulation, problem_type, \
                            constitutive_model, def_gradient_old, inc_strain, \
                            state_variables_old)
@@ -204,6 +234,8 @@ class MaterialState:
         self._clusters_vf = None
         self._material_phases_models = {mat_phase: None
                                         for mat_phase in material_phases}
+        self._clusters_rows = None
+        self._phases_rows = None
         self._clusters_def_gradient_mf = None
         self._clusters_def_gradient_old_mf = None
         self._clusters_state = None
@@ -261,32 +293,31 @@ class MaterialState:
     # -------------------------------------------------------------------------
     def init_clusters_state(self):
         """Initialize clusters state variables."""
+        # Get total number of clusters
+        n_total_clusters = len(self._clusters_rows)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Initialize clusters state variables
         self._clusters_state = {}
-        self._clusters_state_old = {}
-        # Initialize clusters deformation gradient
-        self._clusters_def_gradient_mf = {}
-        self._clusters_def_gradient_old_mf = {}
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Set second-order identity tensor matricial form
-        soid_mf = mop.get_tensor_mf(np.eye(self._n_dim), self._n_dim,
-                                    self._comp_order_nsym)
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Loop over material phases
         for mat_phase in self._material_phases:
             # Get material phase constitutive model
             constitutive_model = self._material_phases_models[mat_phase]
+            # Get number of material phase clusters
+            n_phase_clusters = len(self._phase_clusters[mat_phase])
             # Initialize material constitutive model state variables
             state_variables = constitutive_model.state_init()
-            state_variables_old = copy.deepcopy(state_variables)
-            # Loop over material phase clusters
-            for cluster in self._phase_clusters[mat_phase]:
-                # Initialize clusters state variables
-                self._clusters_state[str(cluster)] = state_variables
-                self._clusters_state_old[str(cluster)] = state_variables_old
-                # Initialize clusters deformation gradient
-                self._clusters_def_gradient_mf[str(cluster)] = soid_mf
-                self._clusters_def_gradient_old_mf[str(cluster)] = soid_mf
+            # Initialize material phase clusters state variables
+            self._clusters_state[mat_phase] = \
+                {key: np.repeat(np.asarray(value)[np.newaxis, ...],
+                                n_phase_clusters, axis=0)
+                 for key, value in state_variables.items()}
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set second-order identity tensor matricial form
+        soid_mf = mop.get_tensor_mf(np.eye(self._n_dim), self._n_dim,
+                                    self._comp_order_nsym)
+        # Initialize clusters deformation gradient
+        self._clusters_def_gradient_mf = np.tile(soid_mf,
+                                                 (n_total_clusters, 1))
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Compute initial state homogenized strain and stress tensors
         self.update_state_homogenization()
@@ -306,6 +337,8 @@ class MaterialState:
         """
         self._phase_clusters = copy.deepcopy(phase_clusters)
         self._clusters_vf = copy.deepcopy(clusters_vf)
+        # Set rows of material clusters in the clusters global arrays
+        self._set_clusters_rows()
     # -------------------------------------------------------------------------
     def get_clusters_inc_strain_mf(self, global_strain_mf):
         """Get clusters incremental strain in matricial form.
@@ -364,58 +397,34 @@ class MaterialState:
         else:
             comp_order = self._comp_order_nsym
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize dictionary of clusters incremental strain
-        clusters_inc_strain_mf = {}
+        # Build clusters infinitesimal strain tensors (infinitesimal strains)
+        # or deformation gradient tensors (finite strains) from global vector
+        # of clusters strains
+        strain_mf = np.reshape(global_strain_mf, (-1, len(comp_order)))
+        # Compute clusters incremental strain tensors
+        if self._strain_formulation == 'infinitesimal':
+            # Get clusters last converged infinitesimal strain tensors
+            strain_old_mf = np.concatenate(
+                [self._clusters_state_old[mat_phase]['strain_mf']
+                 for mat_phase in self._material_phases], axis=0)
+            # Compute clusters incremental infinitesimal strain tensors
+            inc_strain_mf = strain_mf - strain_old_mf
+        else:
+            # Build clusters last converged deformation gradient tensors
+            def_gradient_old = mop.get_tensor_from_mf_batch(
+                self._clusters_def_gradient_old_mf, self._n_dim, comp_order)
+            # Build clusters deformation gradient tensors
+            def_gradient = mop.get_tensor_from_mf_batch(
+                strain_mf, self._n_dim, comp_order)
+            # Compute clusters incremental deformation gradient tensors
+            inc_strain_mf = mop.get_tensor_mf_batch(
+                np.matmul(def_gradient, np.linalg.inv(def_gradient_old)),
+                self._n_dim, comp_order)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize material cluster strain range indexes
-        i_init = 0
-        i_end = i_init + len(comp_order)
-        # Loop over material phases
-        for mat_phase in self._material_phases:
-            # Loop over material phase clusters
-            for cluster in self._phase_clusters[mat_phase]:
-                # Get material cluster last converged infinitesimal strain
-                # tensor (infinitesimal strains) or deformation gradient tensor
-                # (finite strains)
-                if self._strain_formulation == 'infinitesimal':
-                    strain_old_mf = \
-                        self._clusters_state_old[str(cluster)]['strain_mf']
-                else:
-                    def_gradient_old_mf = \
-                        self._clusters_def_gradient_old_mf[str(cluster)]
-                # Get material cluster infinitesimal strain tensor
-                # (infinitesimal strains) or deformation gradient tensor
-                # (finite strains) from global vector of clusters strains
-                strain_mf = global_strain_mf[i_init:i_end]
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Compute material cluster incremental infinitesimal strain
-                # tensor (infinitesimal strains) or deformation gradient tensor
-                # (finite strains)
-                if self._strain_formulation == 'infinitesimal':
-                    inc_strain_mf = strain_mf - strain_old_mf
-                else:
-                    # Build last converged deformation gradient tensor
-                    def_gradient_old = mop.get_tensor_from_mf(
-                        def_gradient_old_mf, self._n_dim, comp_order)
-                    # Build deformation gradient tensor
-                    def_gradient = mop.get_tensor_from_mf(
-                        strain_mf, self._n_dim, comp_order)
-                    # Compute material cluster incremental deformation gradient
-                    # tensor
-                    inc_def_gradient = np.matmul(
-                        def_gradient, np.linalg.inv(def_gradient_old))
-                    # Build material cluster incremental deformation gradient
-                    # tensor (matricial form)
-                    inc_strain_mf = mop.get_tensor_mf(inc_def_gradient,
-                                                      self._n_dim, comp_order)
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Store material cluster incremental strain (matricial form)
-                clusters_inc_strain_mf[str(cluster)] = \
-                    copy.deepcopy(inc_strain_mf)
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Update material cluster strain range indexes
-                i_init += len(comp_order)
-                i_end = i_init + len(comp_order)
+        # Build dictionary of clusters incremental strain
+        clusters_inc_strain_mf = \
+            {cluster_key: inc_strain_mf[row]
+             for cluster_key, row in self._clusters_rows.items()}
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Return
         return clusters_inc_strain_mf
@@ -438,13 +447,22 @@ class MaterialState:
         su_fail_state = {'is_su_fail': False, 'mat_phase': None,
                          'cluster': None}
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set strain components according to problem strain formulation
+        if self._strain_formulation == 'infinitesimal':
+            comp_order = self._comp_order_sym
+        else:
+            comp_order = self._comp_order_nsym
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Initialize clusters deformation gradient
         if self._strain_formulation == 'finite':
-            self._clusters_def_gradient_mf = {}
+            self._clusters_def_gradient_mf = \
+                self._clusters_def_gradient_old_mf.copy()
         # Initialize clusters state variables and material consistent tangent
         # modulus
-        self._clusters_state = {}
-        self._clusters_tangent_mf = {}
+        self._clusters_state = \
+            self._copy_clusters_state(self._clusters_state_old)
+        self._clusters_tangent_mf = np.zeros(
+            (len(self._clusters_rows), len(comp_order), len(comp_order)))
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Loop over material phases
         for mat_phase in self._material_phases:
@@ -453,26 +471,38 @@ class MaterialState:
             # Get material constitutive model source
             source = constitutive_model.get_source()
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Perform the state update of all the material phase clusters at
+            # once if the constitutive model provides a batched state update
+            if self._is_batch_state_update(constitutive_model):
+                su_fail_state = self._update_phase_clusters_state_batch(
+                    mat_phase, clusters_inc_strain_mf)
+                # Check state update failure status
+                if su_fail_state['is_su_fail']:
+                    # Return
+                    return su_fail_state
+                # Proceed to next material phase
+                continue
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Get material phase clusters state variables
+            phase_state = self._clusters_state[mat_phase]
+            phase_state_old = self._clusters_state_old[mat_phase]
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             # Loop over material phase clusters
-            for cluster in self._phase_clusters[mat_phase]:
+            for i, cluster in enumerate(self._phase_clusters[mat_phase]):
+                # Get material cluster row in clusters global arrays
+                row = self._clusters_rows[str(cluster)]
                 # Get material cluster incremental strain tensor (matricial
                 # form)
                 inc_strain_mf = clusters_inc_strain_mf[str(cluster)]
-                if self._strain_formulation == 'infinitesimal':
-                    # Infinitesimal strain tensor (symmetric)
-                    comp_order = self._comp_order_sym
-                else:
-                    # Deformation gradient tensor (nonsymmetric)
-                    comp_order = self._comp_order_nsym
                 inc_strain = mop.get_tensor_from_mf(inc_strain_mf, self._n_dim,
                                                     comp_order)
                 # Get material cluster last converged state variables
-                state_variables_old = self._clusters_state_old[str(cluster)]
+                state_variables_old = \
+                    self._get_cluster_state(phase_state_old, i)
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                 # Get material cluster last converged deformation gradient
                 # tensor
-                def_gradient_old_mf = \
-                    self._clusters_def_gradient_old_mf[str(cluster)]
+                def_gradient_old_mf = self._clusters_def_gradient_old_mf[row]
                 def_gradient_old = mop.get_tensor_from_mf(
                     def_gradient_old_mf, self._n_dim, self._comp_order_nsym)
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -482,15 +512,12 @@ class MaterialState:
                         self._material_su_interface(
                             self._strain_formulation, self._problem_type,
                             constitutive_model,
-                            copy.deepcopy(def_gradient_old),
-                            copy.deepcopy(inc_strain),
-                            copy.deepcopy(state_variables_old))
+                            def_gradient_old, inc_strain,
+                            state_variables_old)
                 else:
                     state_variables, consistent_tangent_mf = \
                         constitutive_model.state_update(
-                            copy.deepcopy(inc_strain),
-                            copy.deepcopy(state_variables_old),
-                            copy.deepcopy(def_gradient_old))
+                            inc_strain, state_variables_old, def_gradient_old)
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                 # Check state update failure status
                 try:
@@ -509,18 +536,173 @@ class MaterialState:
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                 # Update cluster deformation gradient
                 if self._strain_formulation == 'finite':
-                    self._clusters_def_gradient_mf[str(cluster)] = \
+                    self._clusters_def_gradient_mf[row] = \
                         mop.get_tensor_mf(np.matmul(inc_strain,
                                                     def_gradient_old),
                                           self._n_dim, self._comp_order_nsym)
                 # Update cluster state variables and material consistent
                 # tangent modulus
-                self._clusters_state[str(cluster)] = state_variables
-                self._clusters_tangent_mf[str(cluster)] = consistent_tangent_mf
+                for key, value in state_variables.items():
+                    phase_state[key][i] = value
+                self._clusters_tangent_mf[row] = consistent_tangent_mf
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Return
+        return su_fail_state
+    # -------------------------------------------------------------------------
+    def _is_batch_state_update(self, constitutive_model):
+        """Check if material phase clusters batched state update is performed.
+
+        The batched state update
+        (:py:meth:`ConstitutiveModel.state_update_batch`) is performed for
+        all CRATE constitutive models, except for constitutive models whose
+        finite strain formulation is obtained through a purely kinematic
+        extension, which are updated cluster by cluster through
+        :py:meth:`_material_su_interface`.
+
+        ----
+
+        Parameters
+        ----------
+        constitutive_model : ConstitutiveModel
+            Material constitutive model.
+
+        Returns
+        -------
+        is_batch : bool
+            True if material phase clusters batched state update is performed,
+            False otherwise.
+        """
+        # Check constitutive model source
+        if constitutive_model.get_source() != 'crate':
+            return False
+        # Check finite strain formulation through kinematic extension
+        if self._strain_formulation == 'finite' \
+                and constitutive_model.get_strain_type() == 'finite-kinext':
+            return False
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Return
+        return True
+    # -------------------------------------------------------------------------
+    def _update_phase_clusters_state_batch(self, mat_phase,
+                                           clusters_inc_strain_mf):
+        """Update material phase clusters state through batched state update.
+
+        Parameters
+        ----------
+        mat_phase : str
+            Material phase label.
+        clusters_inc_strain_mf : dict
+            Incremental strain (item, numpy.ndarray) associated to each
+            material cluster (key, str), stored in matricial form.
+
+        Returns
+        -------
+        su_fail_state : dict
+            State update failure state.
+        """
+        # Initialize state update failure state
+        su_fail_state = {'is_su_fail': False, 'mat_phase': None,
+                         'cluster': None}
+        # Get material phase constitutive model
+        constitutive_model = self._material_phases_models[mat_phase]
+        # Get material phase clusters
+        clusters = self._phase_clusters[mat_phase]
+        if len(clusters) == 0:
+            return su_fail_state
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Stack material phase clusters incremental strain tensors (matricial
+        # form)
+        inc_strain_mf = np.array([clusters_inc_strain_mf[str(cluster)]
+                                  for cluster in clusters])
+        # Get material phase clusters last converged state variables
+        state_variables_old = self._clusters_state_old[mat_phase]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Perform batched state update
+        state_variables, consistent_tangent_mf = \
+            constitutive_model.state_update_batch(inc_strain_mf,
+                                                  state_variables_old)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Check state update failure status
+        try:
+            is_su_fail = np.asarray(state_variables['is_su_fail'])
+        except KeyError:
+            raise RuntimeError('Material constitutive model state '
+                               'variables must include the state '
+                               'update failure flag '
+                               '(\'is_su_fail\': bool).')
+        if np.any(is_su_fail):
+            # Update state update failure status (first failed cluster)
+            su_fail_state = {'is_su_fail': True,
+                             'mat_phase': mat_phase,
+                             'cluster': clusters[int(np.argmax(is_su_fail))]}
+            # Return
+            return su_fail_state
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get material phase clusters rows in clusters global arrays
+        rows = self._phases_rows[mat_phase]
+        # Update clusters deformation gradient
+        if self._strain_formulation == 'finite':
+            inc_def_gradient = mop.get_tensor_from_mf_batch(
+                inc_strain_mf, self._n_dim, self._comp_order_nsym)
+            def_gradient_old = mop.get_tensor_from_mf_batch(
+                self._clusters_def_gradient_old_mf[rows], self._n_dim,
+                self._comp_order_nsym)
+            self._clusters_def_gradient_mf[rows] = mop.get_tensor_mf_batch(
+                np.matmul(inc_def_gradient, def_gradient_old), self._n_dim,
+                self._comp_order_nsym)
+        # Update material phase clusters state variables and material
+        # consistent tangent modulus
+        self._clusters_state[mat_phase] = \
+            {key: np.asarray(value) for key, value in state_variables.items()}
+        self._clusters_tangent_mf[rows] = consistent_tangent_mf
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Return
         return su_fail_state
     # -------------------------------------------------------------------------
+    @staticmethod
+    def _stack_clusters_state(clusters_state):
+        """Stack material clusters state variables.
+
+        Parameters
+        ----------
+        clusters_state : list[dict]
+            Material constitutive model state variables of each material
+            cluster. All the material clusters must share the same
+            constitutive model.
+
+        Returns
+        -------
+        stacked_state : dict
+            Material constitutive model state variables (key, str), where each
+            state variable is stored as a numpy.ndarray stacking the material
+            clusters along the first dimension.
+        """
+        return {key: np.array([state_variables[key]
+                               for state_variables in clusters_state])
+                for key in clusters_state[0].keys()}
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _copy_clusters_state(clusters_state):
+        """Copy material phases stacked state variables.
+
+        Parameters
+        ----------
+        clusters_state : dict
+            Material constitutive model state variables (item, dict) associated
+            to each material phase (key, str). Each state variable (key, str)
+            is stored as a numpy.ndarray stacking the material phase clusters
+            along the first dimension.
+
+        Returns
+        -------
+        clusters_state_copy : dict
+            Copy of material constitutive model state variables (item, dict)
+            associated to each material phase (key, str).
+        """
+        return {mat_phase: {key: value.copy()
+                            for key, value in phase_state.items()}
+                for mat_phase, phase_state in clusters_state.items()}
+    # -------------------------------------------------------------------------
     def update_state_homogenization(self):
         """Update homogenized strain and stress tensors.
 
@@ -582,39 +764,24 @@ class MaterialState:
         :math:`n_{c}` is the number of material clusters, and :math:`n+1`
         denotes the current increment.
         """
-        # Set strain components according to problem strain formulation
+        # Get clusters volume fractions
+        clusters_vf = np.array([self._clusters_vf[cluster_key]
+                                for cluster_key in self._clusters_rows.keys()])
+        # Get clusters strain tensors (matricial form)
         if self._strain_formulation == 'infinitesimal':
-            comp_order = self._comp_order_sym
+            strain_mf = np.concatenate(
+                [self._clusters_state[mat_phase]['strain_mf']
+                 for mat_phase in self._material_phases], axis=0)
         else:
-            comp_order = self._comp_order_nsym
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize incremental homogenized strain and stress tensors
-        # (matricial form)
-        hom_strain_mf = np.zeros(len(comp_order))
-        hom_stress_mf = np.zeros(len(comp_order))
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Loop over material phases
-        for mat_phase in self._material_phases:
-            # Loop over material phase clusters
-            for cluster in self._phase_clusters[mat_phase]:
-                # Get material cluster strain tensor (matricial form)
-                if self._strain_formulation == 'infinitesimal':
-                    strain_mf = self._clusters_state[str(cluster)]['strain_mf']
-                else:
-                    strain_mf = self._clusters_def_gradient_mf[str(cluster)]
-                # Get material cluster stress tensor (matricial form)
-                stress_mf = self._clusters_state[str(cluster)]['stress_mf']
-                # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                # Add material cluster contribution to homogenized strain and
-                # stress tensors (matricial form)
-                hom_strain_mf = np.add(
-                    hom_strain_mf, self._clusters_vf[str(cluster)]*strain_mf)
-                hom_stress_mf = np.add(
-                    hom_stress_mf, self._clusters_vf[str(cluster)]*stress_mf)
+            strain_mf = self._clusters_def_gradient_mf
+        # Get clusters stress tensors (matricial form)
+        stress_mf = np.concatenate(
+            [self._clusters_state[mat_phase]['stress_mf']
+             for mat_phase in self._material_phases], axis=0)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Update homogenized strain and stress tensors
-        self._hom_strain_mf = copy.deepcopy(hom_strain_mf)
-        self._hom_stress_mf = copy.deepcopy(hom_stress_mf)
+        self._hom_strain_mf = np.matmul(clusters_vf, strain_mf)
+        self._hom_stress_mf = np.matmul(clusters_vf, stress_mf)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         if self._problem_type == 1:
             # Set out-of-plane stress component (2D plane strain problem)
@@ -623,17 +790,10 @@ class MaterialState:
             else:
                 raise RuntimeError('Unavailable plane problem type.')
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            # Initialize homogenized out-of-plane component
-            oop_hom_comp = 0.0
-            # Loop over material phases
-            for mat_phase in self._material_phases:
-                # Loop over material phase clusters
-                for cluster in self._phase_clusters[mat_phase]:
-                    # Add material cluster contribution to the homogenized
-                    # out-of-plane component component
-                    oop_hom_comp = oop_hom_comp \
-                        + self._clusters_vf[str(cluster)] \
-                        * self._clusters_state[str(cluster)][comp_name]
+            # Compute homogenized out-of-plane component
+            oop_hom_comp = float(np.dot(clusters_vf, np.concatenate(
+                [self._clusters_state[mat_phase][comp_name]
+                 for mat_phase in self._material_phases], axis=0)))
             # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             # Update out-of-plane stress or strain component
             if self._strain_formulation == 'infinitesimal':
@@ -645,10 +805,11 @@ class MaterialState:
     def update_converged_state(self):
         """Update last converged material state variables."""
         self._clusters_def_gradient_old_mf = \
-            copy.deepcopy(self._clusters_def_gradient_mf)
-        self._clusters_state_old = copy.deepcopy(self._clusters_state)
-        self._hom_strain_old_mf = copy.deepcopy(self._hom_strain_mf)
-        self._hom_stress_old_mf = copy.deepcopy(self._hom_stress_mf)
+            self._clusters_def_gradient_mf.copy()
+        self._clusters_state_old = \
+            self._copy_clusters_state(self._clusters_state)
+        self._hom_strain_old_mf = self._hom_strain_mf.copy()
+        self._hom_stress_old_mf = self._hom_stress_mf.copy()
     # -------------------------------------------------------------------------
     def set_rewind_state_updated_clustering(self, phase_clusters, clusters_vf,
                                             clusters_state,
@@ -670,11 +831,27 @@ class MaterialState:
             Deformation gradient (item, numpy.darray (1d)) associated to each
             material cluster (key, str), stored in matricial form.
         """
-        self._phase_clusters = copy.deepcopy(phase_clusters)
-        self._clusters_vf = copy.deepcopy(clusters_vf)
-        self._clusters_state_old = copy.deepcopy(clusters_state)
-        self._clusters_def_gradient_old_mf = \
-            copy.deepcopy(clusters_def_gradient_mf)
+        # Update CRVE material state clusters labels and volume fraction
+        self.set_phase_clusters(phase_clusters, clusters_vf)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set last converged clusters state variables
+        self._clusters_state_old = {
+            mat_phase: self._stack_clusters_state(
+                [clusters_state[str(cluster)]
+                 for cluster in self._phase_clusters[mat_phase]])
+            for mat_phase in self._material_phases}
+        # Set last converged clusters deformation gradient
+        self._clusters_def_gradient_old_mf = np.array(
+            [clusters_def_gradient_mf[cluster_key]
+             for cluster_key in self._clusters_rows.keys()])
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Reset clusters state variables, deformation gradient and material
+        # consistent tangent modulus
+        self._clusters_state = \
+            self._copy_clusters_state(self._clusters_state_old)
+        self._clusters_def_gradient_mf = \
+            self._clusters_def_gradient_old_mf.copy()
+        self._clusters_tangent_mf = None
     # -------------------------------------------------------------------------
     def get_hom_strain_mf(self):
         """Get homogenized strain tensor (matricial form).
@@ -900,7 +1077,8 @@ class MaterialState:
             Deformation gradient (item, numpy.ndarray (1d)) associated to each
             material cluster (key, str), stored in matricial form.
         """
-        return copy.deepcopy(self._clusters_def_gradient_mf)
+        return {cluster_key: self._clusters_def_gradient_mf[row].copy()
+                for cluster_key, row in self._clusters_rows.items()}
     # -------------------------------------------------------------------------
     def get_clusters_def_gradient_old_mf(self):
         """Get last converged deformation gradient of each material cluster.
@@ -912,7 +1090,8 @@ class MaterialState:
             associated to each material cluster (key, str), stored in matricial
             form.
         """
-        return copy.deepcopy(self._clusters_def_gradient_old_mf)
+        return {cluster_key: self._clusters_def_gradient_old_mf[row].copy()
+                for cluster_key, row in self._clusters_rows.items()}
     # -------------------------------------------------------------------------
     def get_clusters_state(self):
         """Get material state variables of each material cluster.
@@ -923,7 +1102,7 @@ class MaterialState:
             Material constitutive model state variables (item, dict) associated
             to each material cluster (key, str).
         """
-        return copy.deepcopy(self._clusters_state)
+        return self._get_clusters_state_dict(self._clusters_state)
     # -------------------------------------------------------------------------
     def get_clusters_state_old(self):
         """Get last converged material state variables of each mat. cluster.
@@ -934,7 +1113,7 @@ class MaterialState:
             Last converged material constitutive model state variables
             (item, dict) associated to each material cluster (key, str).
         """
-        return copy.deepcopy(self._clusters_state_old)
+        return self._get_clusters_state_dict(self._clusters_state_old)
     # -------------------------------------------------------------------------
     def get_clusters_tangent_mf(self):
         """Get material consistent tangent modulus of each material cluster.
@@ -946,7 +1125,96 @@ class MaterialState:
             associated to each material cluster (key, str), stored in matricial
             form.
         """
-        return copy.deepcopy(self._clusters_tangent_mf)
+        if self._clusters_tangent_mf is None:
+            return None
+        return {cluster_key: self._clusters_tangent_mf[row].copy()
+                for cluster_key, row in self._clusters_rows.items()}
+    # -------------------------------------------------------------------------
+    def get_stacked_clusters_tangent_mf(self):
+        """Get material clusters consistent tangent modulus stacked array.
+
+        Material clusters are sorted by material phase and, within each
+        material phase, according with the material phase clusters labels.
+
+        ----
+
+        Returns
+        -------
+        clusters_tangent_mf : numpy.ndarray (3d)
+            Material consistent tangent modulus of each material cluster
+            stored in matricial form, numpy.ndarray (3d) of shape
+            (n_total_clusters, n_comps, n_comps). Returned array is read-only.
+        """
+        if self._clusters_tangent_mf is None:
+            return None
+        clusters_tangent_mf = self._clusters_tangent_mf.view()
+        clusters_tangent_mf.flags.writeable = False
+        return clusters_tangent_mf
+    # -------------------------------------------------------------------------
+    def _set_clusters_rows(self):
+        """Set rows of material clusters in the clusters global arrays."""
+        self._clusters_rows = {}
+        self._phases_rows = {}
+        # Initialize row
+        row = 0
+        # Loop over material phases
+        for mat_phase in self._material_phases:
+            # Get number of material phase clusters
+            n_phase_clusters = len(self._phase_clusters[mat_phase])
+            # Set material phase clusters rows
+            self._phases_rows[mat_phase] = slice(row, row + n_phase_clusters)
+            for cluster in self._phase_clusters[mat_phase]:
+                self._clusters_rows[str(cluster)] = row
+                row += 1
+    # -------------------------------------------------------------------------
+    def _get_clusters_state_dict(self, clusters_state):
+        """Get material state variables of each material cluster.
+
+        Parameters
+        ----------
+        clusters_state : dict
+            Material constitutive model state variables (item, dict) associated
+            to each material phase (key, str). Each state variable (key, str)
+            is stored as a numpy.ndarray stacking the material phase clusters
+            along the first dimension.
+
+        Returns
+        -------
+        clusters_state_dict : dict
+            Material constitutive model state variables (item, dict) associated
+            to each material cluster (key, str).
+        """
+        clusters_state_dict = {}
+        # Loop over material phases
+        for mat_phase in self._material_phases:
+            # Loop over material phase clusters
+            for i, cluster in enumerate(self._phase_clusters[mat_phase]):
+                clusters_state_dict[str(cluster)] = \
+                    self._get_cluster_state(clusters_state[mat_phase], i)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Return
+        return clusters_state_dict
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _get_cluster_state(phase_state, i):
+        """Get material state variables of material phase cluster.
+
+        Parameters
+        ----------
+        phase_state : dict
+            Material constitutive model state variables (key, str), where each
+            state variable is stored as a numpy.ndarray stacking the material
+            phase clusters along the first dimension.
+        i : int
+            Material cluster index in material phase.
+
+        Returns
+        -------
+        state_variables : dict
+            Material cluster constitutive model state variables.
+        """
+        return {key: (value[i].item() if value.ndim == 1 else value[i].copy())
+                for key, value in phase_state.items()}
     # -------------------------------------------------------------------------
     @staticmethod
     def _material_su_interface(strain_formulation, problem_type,
@@ -1267,29 +1535,51 @@ class MaterialState:
             (item, list[int]) resulting from the refinement of each target
             cluster (key, str)) for each material phase (key, str).
         """
+        # Get rows of material clusters in the clusters global arrays prior to
+        # the clustering adaptivity step
+        clusters_rows_old = self._clusters_rows
+        phases_rows_old = self._phases_rows
+        # Build mapping between each child cluster and the associated target
+        # cluster
+        child_target = {}
+        for mat_phase in adaptive_clustering_map.keys():
+            for target_cluster, child_clusters in \
+                    adaptive_clustering_map[mat_phase].items():
+                for child_cluster in child_clusters:
+                    child_target[str(child_cluster)] = str(target_cluster)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Update CRVE material state clusters labels and volume fraction
         self.set_phase_clusters(phase_clusters, clusters_vf)
-        # Group cluster-related dictionaries
-        cluster_dicts = [self._clusters_def_gradient_mf,
-                         self._clusters_def_gradient_old_mf,
-                         self._clusters_state, self._clusters_state_old,
-                         self._clusters_tangent_mf]
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Loop over adaptive material phases
-        for mat_phase in adaptive_clustering_map.keys():
-            # Loop over material phase target clusters
-            for target_cluster in adaptive_clustering_map[mat_phase].keys():
-                # Get list of target's child clusters
-                child_clusters = \
-                    adaptive_clustering_map[mat_phase][target_cluster]
-                # Loop over cluster-keyd dictionaries
-                for cluster_dict in cluster_dicts:
-                    # Loop over child clusters and build their items
-                    for child_cluster in child_clusters:
-                        cluster_dict[str(child_cluster)] = \
-                            copy.deepcopy(cluster_dict[target_cluster])
-                    # Remove target cluster item
-                    cluster_dict.pop(target_cluster)
+        # Get source row (prior to the clustering adaptivity step) of each
+        # material cluster. Child clusters inherit the data of the associated
+        # target cluster
+        source_rows = np.zeros(len(self._clusters_rows), dtype=int)
+        for cluster_key, row in self._clusters_rows.items():
+            if cluster_key in child_target.keys():
+                source_rows[row] = clusters_rows_old[child_target[cluster_key]]
+            else:
+                source_rows[row] = clusters_rows_old[cluster_key]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Update clusters deformation gradient and material consistent tangent
+        # modulus
+        self._clusters_def_gradient_mf = \
+            self._clusters_def_gradient_mf[source_rows]
+        self._clusters_def_gradient_old_mf = \
+            self._clusters_def_gradient_old_mf[source_rows]
+        if self._clusters_tangent_mf is not None:
+            self._clusters_tangent_mf = self._clusters_tangent_mf[source_rows]
+        # Loop over material phases
+        for mat_phase in self._material_phases:
+            # Get material phase clusters source rows (material phase arrays)
+            phase_source_rows = source_rows[self._phases_rows[mat_phase]] \
+                - phases_rows_old[mat_phase].start
+            # Update material phase clusters state variables
+            for clusters_state in (self._clusters_state,
+                                   self._clusters_state_old):
+                clusters_state[mat_phase] = \
+                    {key: value[phase_source_rows]
+                     for key, value in clusters_state[mat_phase].items()}
 #
 #                                        Available material constitutive models
 # =============================================================================
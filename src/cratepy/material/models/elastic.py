@@ -59,6 +59,9 @@ class Elastic(ConstitutiveModel):
     state_update(self, inc_strain, state_variables_old, \
                  su_max_n_iterations=20, su_conv_tol=1e-6)
         Perform constitutive model state update.
+    state_update_batch(self, inc_strain_mf, state_variables_old, \
+                       su_max_n_iterations=20, su_conv_tol=1e-6)
+        Perform batched material constitutive model state update.
     get_available_elastic_symmetries()
         Get available elastic symmetries under general anisotropy.
     elastic_tangent_modulus(elastic_properties, elastic_symmetry='isotropic')
@@ -343,6 +346,111 @@ class Elastic(ConstitutiveModel):
         # Return
         return state_variables, consistent_tangent_mf
     # -------------------------------------------------------------------------
+    def state_update_batch(self, inc_strain_mf, state_variables_old,
+                           su_max_n_iterations=20, su_conv_tol=1e-6):
+        """Perform batched material constitutive model state update.
+
+        Parameters
+        ----------
+        inc_strain_mf : numpy.ndarray (2d)
+            Incremental strain second-order tensor (matricial form) of each
+            material point stored as numpy.ndarray(2d) of shape
+            (n_batch, n_comps).
+        state_variables_old : dict
+            Last converged material constitutive model state variables, where
+            each state variable (key, str) is stored as a numpy.ndarray
+            stacking the material points along the first dimension.
+        su_max_n_iterations : int, default=20
+            State update maximum number of iterations.
+        su_conv_tol : float, default=1e-6
+            State update convergence tolerance.
+
+        Returns
+        -------
+        state_variables : dict
+            Material constitutive model state variables, where each state
+            variable (key, str) is stored as a numpy.ndarray stacking the
+            material points along the first dimension.
+        consistent_tangent_mf : numpy.ndarray (3d)
+            Material constitutive model consistent tangent modulus in
+            matricial form of each material point stored as numpy.ndarray(3d)
+            of shape (n_batch, n_comps, n_comps).
+        """
+        # Get number of material points
+        n_batch = inc_strain_mf.shape[0]
+        # Get last increment converged state variables
+        e_strain_old_mf = np.asarray(state_variables_old['e_strain_mf'])
+        #
+        #                                                    2D > 3D conversion
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # When the problem type corresponds to a 2D analysis, perform the state
+        # update and consistent tangent computation as in the 3D case,
+        # considering the appropriate out-of-plain strain and stress components
+        if self._problem_type == 4:
+            comp_order_sym = self._comp_order_sym
+        else:
+            # Set 3D problem parameters
+            _, comp_order_sym, _ = mop.get_problem_type_parameters(4)
+            # Get 2D strain/stress components indexes in 3D matricial form
+            comps_idxs = [comp_order_sym.index(comp)
+                          for comp in self._comp_order_sym]
+            # Build strain tensors (matricial form) by including the
+            # appropriate out-of-plain components
+            inc_strain_3d_mf = np.zeros((n_batch, len(comp_order_sym)))
+            inc_strain_3d_mf[:, comps_idxs] = inc_strain_mf
+            inc_strain_mf = inc_strain_3d_mf
+            e_strain_old_3d_mf = np.zeros((n_batch, len(comp_order_sym)))
+            e_strain_old_3d_mf[:, comps_idxs] = e_strain_old_mf
+            e_strain_old_3d_mf[:, comp_order_sym.index('33')] = \
+                state_variables_old['e_strain_33']
+            e_strain_old_mf = e_strain_old_3d_mf
+        #
+        #                             State update & Consistent tangent modulus
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Update elastic strain
+        e_strain_mf = e_strain_old_mf + inc_strain_mf
+        # Compute 3D elasticity tensor (matricial form)
+        elastic_tangent_mf = Elastic.elastic_tangent_modulus(
+            self._material_properties,
+            elastic_symmetry=self._material_properties['elastic_symmetry'])
+        # Update stress
+        stress_mf = np.matmul(e_strain_mf, elastic_tangent_mf.T)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get the out-of-plane strain and stress components
+        if self._problem_type == 1:
+            e_strain_33 = e_strain_mf[:, comp_order_sym.index('33')]
+            stress_33 = stress_mf[:, comp_order_sym.index('33')]
+        #
+        #                                                    3D > 2D Conversion
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # When the problem type corresponds to a 2D analysis, build the
+        # 2D strain and stress tensors and consistent tangent modulus
+        # (matricial form) from the associated 3D counterparts
+        if self._problem_type == 1:
+            e_strain_mf = e_strain_mf[:, comps_idxs]
+            stress_mf = stress_mf[:, comps_idxs]
+            elastic_tangent_mf = \
+                elastic_tangent_mf[np.ix_(comps_idxs, comps_idxs)]
+        # Build consistent tangent modulus (matricial form) of each material
+        # point
+        consistent_tangent_mf = np.tile(elastic_tangent_mf, (n_batch, 1, 1))
+        #
+        #                                                Update state variables
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Store updated state variables
+        state_variables = dict()
+        state_variables['e_strain_mf'] = e_strain_mf
+        state_variables['strain_mf'] = e_strain_mf.copy()
+        state_variables['stress_mf'] = stress_mf
+        state_variables['is_plast'] = np.zeros(n_batch, dtype=bool)
+        state_variables['is_su_fail'] = np.zeros(n_batch, dtype=bool)
+        if self._problem_type == 1:
+            state_variables['e_strain_33'] = e_strain_33
+            state_variables['stress_33'] = stress_33
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Return
+        return state_variables, consistent_tangent_mf
+    # -------------------------------------------------------------------------
     @staticmethod
     def get_available_elastic_symmetries():
         """Get available elastic symmetries under general anisotropy.
@@ -13,6 +13,10 @@ ConstitutiveModel
 # Standard
 from abc import ABC, abstractmethod
 import copy
+# Third-party
+import numpy as np
+# Local
+import tensor.matrixoperations as mop
 #
 #                                                          Authorship & Credits
 # =============================================================================
@@ -37,6 +41,14 @@ class ConstitutiveModel(ABC):
         extension - 'finite-kinext').
     _source : {'crate',}
         Material constitutive model source.
+    _strain_formulation: {'infinitesimal', 'finite'}
+        Problem strain formulation.
+    _n_dim : int
+        Problem number of spatial dimensions.
+    _comp_order_sym : list[str]
+        Strain/Stress components symmetric order.
+    _comp_order_nsym : list[str]
+        Strain/Stress components nonsymmetric order.
 
     Methods
     -------
@@ -49,6 +61,9 @@ class ConstitutiveModel(ABC):
     state_update(self, inc_strain, state_variables_old, \
                  su_max_n_iterations=20, su_conv_tol=1e-6)
         *abstract*: Perform material constitutive model state update.
+    state_update_batch(self, inc_strain_mf, state_variables_old, \
+                       su_max_n_iterations=20, su_conv_tol=1e-6)
+        Perform batched material constitutive model state update.
     get_name(self)
         Get constitutive model name.
     get_strain_type(self)
@@ -127,6 +142,94 @@ class ConstitutiveModel(ABC):
         """
         pass
     # -------------------------------------------------------------------------
+    def state_update_batch(self, inc_strain_mf, state_variables_old,
+                           su_max_n_iterations=20, su_conv_tol=1e-6):
+        """Perform batched material constitutive model state update.
+
+        By default, the state update (:py:meth:`state_update`) is performed
+        independently for each material point of the batch. Constitutive
+        models may override this method with a vectorized implementation,
+        which must be equivalent to the default one.
+
+        Material points whose state update fails (``is_su_fail`` set to
+        `True`) recover the last converged state variables and the
+        corresponding consistent tangent modulus is undefined.
+
+        ----
+
+        Parameters
+        ----------
+        inc_strain_mf : numpy.ndarray (2d)
+            Incremental strain second-order tensor (matricial form) of each
+            material point stored as numpy.ndarray(2d) of shape
+            (n_batch, n_comps).
+        state_variables_old : dict
+            Last converged material constitutive model state variables, where
+            each state variable (key, str) is stored as a numpy.ndarray
+            stacking the material points along the first dimension.
+        su_max_n_iterations : int, default=20
+            State update maximum number of iterations.
+        su_conv_tol : float, default=1e-6
+            State update convergence tolerance.
+
+        Returns
+        -------
+        state_variables : dict
+            Material constitutive model state variables, where each state
+            variable (key, str) is stored as a numpy.ndarray stacking the
+            material points along the first dimension.
+        consistent_tangent_mf : numpy.ndarray (3d)
+            Material constitutive model consistent tangent modulus in
+            matricial form of each material point stored as numpy.ndarray(3d)
+            of shape (n_batch, n_comps, n_comps).
+        """
+        # Get strain/stress components order
+        if self._strain_formulation == 'infinitesimal':
+            comp_order = self._comp_order_sym
+        else:
+            comp_order = self._comp_order_nsym
+        # Get number of material points
+        n_batch = inc_strain_mf.shape[0]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize material points state variables and consistent tangent
+        # modulus
+        states = []
+        consistent_tangent_mf = np.zeros((n_batch, len(comp_order),
+                                          len(comp_order)))
+        # Loop over material points
+        for i in range(n_batch):
+            # Get material point incremental strain tensor
+            inc_strain = mop.get_tensor_from_mf(inc_strain_mf[i], self._n_dim,
+                                                comp_order)
+            # Get material point last converged state variables
+            state_variables_old_i = {}
+            for key, value in state_variables_old.items():
+                value = np.asarray(value)
+                if value.ndim == 1:
+                    state_variables_old_i[key] = value[i].item()
+                else:
+                    state_variables_old_i[key] = value[i].copy()
+            # Perform material point state update
+            state_variables_i, consistent_tangent_mf_i = self.state_update(
+                inc_strain, state_variables_old_i,
+                su_max_n_iterations=su_max_n_iterations,
+                su_conv_tol=su_conv_tol)
+            # Recover last converged state variables if state update failed
+            # (consistent tangent modulus is undefined)
+            if state_variables_i['is_su_fail']:
+                state_variables_i = copy.deepcopy(state_variables_old_i)
+                state_variables_i['is_su_fail'] = True
+            else:
+                consistent_tangent_mf[i] = consistent_tangent_mf_i
+            # Store material point state variables
+            states.append(state_variables_i)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Stack material points state variables
+        state_variables = {key: np.array([state[key] for state in states])
+                           for key in states[0].keys()}
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return state_variables, consistent_tangent_mf
+    # -------------------------------------------------------------------------
     def get_name(self):
         """Get constitutive model name.
 
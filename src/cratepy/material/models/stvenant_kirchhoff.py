@@ -68,6 +68,9 @@ class StVenantKirchhoff(ConstitutiveModel):
     state_update(self, inc_strain, state_variables_old, \
                  su_max_n_iterations=20, su_conv_tol=1e-6)
         Perform material constitutive model state update.
+    state_update_batch(self, inc_strain_mf, state_variables_old, \
+                       su_max_n_iterations=20, su_conv_tol=1e-6)
+        Perform batched material constitutive model state update.
     """
     def __init__(self, strain_formulation, problem_type, material_properties):
         """Constitutive model constructor.
@@ -102,7 +105,7 @@ class StVenantKirchhoff(ConstitutiveModel):
         # Compute technical constants of elasticity
         if elastic_symmetry == 'isotropic':
             # Compute technical constants of elasticity
-            technical_constants = Elastic.get_technical_from_elastic_modulii(
+            technical_constants = Elastic.get_technical_from_elastic_moduli(
                 elastic_symmetry, material_properties)
             # Assemble technical constants of elasticity
             self._material_properties.update(technical_constants)
@@ -365,3 +368,158 @@ class StVenantKirchhoff(ConstitutiveModel):
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Return
         return state_variables, consistent_tangent_mf
+    # -------------------------------------------------------------------------
+    def state_update_batch(self, inc_strain_mf, state_variables_old,
+                           su_max_n_iterations=20, su_conv_tol=1e-6):
+        """Perform batched material constitutive model state update.
+
+        The material consistent tangent modulus is computed directly as the
+        derivative of the first Piola-Kirchhoff stress tensor with respect to
+        the deformation gradient,
+
+        .. math::
+
+           \\mathsf{A}_{iJkL} = \\delta_{ik} S_{JL} +
+               F_{iM} \\, \\mathsf{D}_{MJNL} \\, F_{kN} \\, ,
+
+        where :math:`\\boldsymbol{S}` is the second Piola-Kirchhoff stress
+        tensor, :math:`\\boldsymbol{F}` is the deformation gradient and
+        :math:`\\mathsf{D}` is the elasticity tensor.
+
+        ----
+
+        Parameters
+        ----------
+        inc_strain_mf : numpy.ndarray (2d)
+            Incremental deformation gradient (matricial form) of each material
+            point stored as numpy.ndarray(2d) of shape (n_batch, n_comps).
+        state_variables_old : dict
+            Last converged material constitutive model state variables, where
+            each state variable (key, str) is stored as a numpy.ndarray
+            stacking the material points along the first dimension.
+        su_max_n_iterations : int, default=20
+            State update maximum number of iterations.
+        su_conv_tol : float, default=1e-6
+            State update convergence tolerance.
+
+        Returns
+        -------
+        state_variables : dict
+            Material constitutive model state variables, where each state
+            variable (key, str) is stored as a numpy.ndarray stacking the
+            material points along the first dimension.
+        consistent_tangent_mf : numpy.ndarray (3d)
+            Material constitutive model consistent tangent modulus in
+            matricial form of each material point stored as numpy.ndarray(3d)
+            of shape (n_batch, n_comps, n_comps).
+        """
+        # Get number of material points
+        n_batch = inc_strain_mf.shape[0]
+        # Get last increment converged state variables
+        e_strain_old_mf = np.asarray(state_variables_old['e_strain_mf'])
+        #
+        #                                                    2D > 3D conversion
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # When the problem type corresponds to a 2D analysis, perform the state
+        # update and consistent tangent computation as in the 3D case,
+        # considering the appropriate out-of-plain strain and stress components
+        if self._problem_type == 4:
+            n_dim = self._n_dim
+            comp_order_sym = self._comp_order_sym
+            comp_order_nsym = self._comp_order_nsym
+        else:
+            # Set 3D problem parameters
+            n_dim, comp_order_sym, comp_order_nsym = \
+                mop.get_problem_type_parameters(4)
+            # Get 2D strain/stress components indexes in 3D matricial form
+            comps_idxs = [comp_order_nsym.index(comp)
+                          for comp in self._comp_order_nsym]
+            # Build deformation gradient tensors (matricial form) by including
+            # the appropriate out-of-plain components
+            inc_strain_3d_mf = np.zeros((n_batch, len(comp_order_nsym)))
+            inc_strain_3d_mf[:, comps_idxs] = inc_strain_mf
+            inc_strain_3d_mf[:, comp_order_nsym.index('33')] = 1.0
+            inc_strain_mf = inc_strain_3d_mf
+            e_strain_old_3d_mf = np.zeros((n_batch, len(comp_order_nsym)))
+            e_strain_old_3d_mf[:, comps_idxs] = e_strain_old_mf
+            e_strain_old_3d_mf[:, comp_order_nsym.index('33')] = \
+                state_variables_old['e_strain_33']
+            e_strain_old_mf = e_strain_old_3d_mf
+        #
+        #                                                          State update
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build last converged and incremental deformation gradient tensors
+        e_strain_old = mop.get_tensor_from_mf_batch(e_strain_old_mf, n_dim,
+                                                    comp_order_nsym)
+        inc_strain = mop.get_tensor_from_mf_batch(inc_strain_mf, n_dim,
+                                                  comp_order_nsym)
+        # Update elastic deformation gradient tensor
+        e_strain = np.matmul(inc_strain, e_strain_old)
+        # Build elastic deformation gradient tensor matricial form
+        e_strain_mf = mop.get_tensor_mf_batch(e_strain, n_dim, comp_order_nsym)
+        # Compute right Cauchy-Green strain tensor
+        right_cauchy_green = np.matmul(np.transpose(e_strain, (0, 2, 1)),
+                                       e_strain)
+        # Compute Green-Lagrange strain tensor
+        green_lagrange = 0.5*(right_cauchy_green - np.eye(n_dim))
+        # Compute 3D elasticity tensor (matricial form)
+        elastic_tangent_mf = Elastic.elastic_tangent_modulus(
+            self._material_properties,
+            elastic_symmetry=self._material_properties['elastic_symmetry'])
+        # Compute second Piola-Kirchhoff stress tensor (matricial form)
+        second_piola_stress_mf = np.matmul(
+            mop.get_tensor_mf_batch(green_lagrange, n_dim, comp_order_sym),
+            elastic_tangent_mf.T)
+        # Build second Piola-Kirchhoff stress tensor
+        second_piola_stress = mop.get_tensor_from_mf_batch(
+            second_piola_stress_mf, n_dim, comp_order_sym)
+        # Compute first Piola-Kirchhoff stress tensor
+        first_piola_stress = np.matmul(e_strain, second_piola_stress)
+        # Build first Piola-Kirchhoff stress tensor matricial form
+        stress_mf = mop.get_tensor_mf_batch(first_piola_stress, n_dim,
+                                            comp_order_nsym)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get the out-of-plane strain and stress components
+        if self._problem_type == 1:
+            e_strain_33 = e_strain_mf[:, comp_order_nsym.index('33')]
+            stress_33 = stress_mf[:, comp_order_nsym.index('33')]
+        #
+        #                                            Consistent tangent modulus
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get 3D elasticity tensor
+        elastic_tangent = mop.get_tensor_from_mf(elastic_tangent_mf, n_dim,
+                                                 comp_order_sym)
+        # Compute material consistent tangent modulus
+        material_consistent_tangent = \
+            np.einsum('ik,njl->nijkl', np.eye(n_dim), second_piola_stress) \
+            + np.einsum('nim,mjpl,nkp->nijkl', e_strain, elastic_tangent,
+                        e_strain, optimize=True)
+        # Build material consistent tangent modulus matricial form
+        consistent_tangent_mf = mop.get_tensor_mf_batch(
+            material_consistent_tangent, n_dim, comp_order_nsym)
+        #
+        #                                                    3D > 2D Conversion
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # When the problem type corresponds to a 2D analysis, build the
+        # 2D strain and stress tensors and consistent tangent modulus
+        # (matricial form) from the associated 3D counterparts
+        if self._problem_type == 1:
+            e_strain_mf = e_strain_mf[:, comps_idxs]
+            stress_mf = stress_mf[:, comps_idxs]
+            consistent_tangent_mf = \
+                consistent_tangent_mf[:, comps_idxs, :][:, :, comps_idxs]
+        #
+        #                                                Update state variables
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Store updated state variables
+        state_variables = dict()
+        state_variables['e_strain_mf'] = e_strain_mf
+        state_variables['strain_mf'] = e_strain_mf.copy()
+        state_variables['stress_mf'] = stress_mf
+        state_variables['is_su_fail'] = np.zeros(n_batch, dtype=bool)
+        if self._problem_type == 1:
+            state_variables['e_strain_33'] = e_strain_33
+            state_variables['stress_33'] = stress_33
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Return
+        return state_variables, consistent_tangent_mf
@@ -70,6 +70,9 @@ class VonMises(ConstitutiveModel):
     state_update(self, inc_strain, state_variables_old, \
                  su_max_n_iterations=20, su_conv_tol=1e-6)
         Perform material constitutive model state update.
+    state_update_batch(self, inc_strain_mf, state_variables_old, \
+                       su_max_n_iterations=20, su_conv_tol=1e-6)
+        Perform batched material constitutive model state update.
     """
     def __init__(self, strain_formulation, problem_type, material_properties):
         """Constitutive model constructor.
@@ -504,3 +507,263 @@ class VonMises(ConstitutiveModel):
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Return
         return state_variables, consistent_tangent_mf
+    # -------------------------------------------------------------------------
+    def state_update_batch(self, inc_strain_mf, state_variables_old,
+                           su_max_n_iterations=20, su_conv_tol=1e-6):
+        """Perform batched material constitutive model state update.
+
+        The elastic trial state is computed simultaneously for all the
+        material points of the batch, while the return-mapping is solved
+        simultaneously for the subset of material points undergoing a plastic
+        step.
+
+        ----
+
+        Parameters
+        ----------
+        inc_strain_mf : numpy.ndarray (2d)
+            Incremental strain second-order tensor (matricial form) of each
+            material point stored as numpy.ndarray(2d) of shape
+            (n_batch, n_comps).
+        state_variables_old : dict
+            Last converged material constitutive model state variables, where
+            each state variable (key, str) is stored as a numpy.ndarray
+            stacking the material points along the first dimension.
+        su_max_n_iterations : int, default=20
+            State update maximum number of iterations.
+        su_conv_tol : float, default=1e-6
+            State update convergence tolerance.
+
+        Returns
+        -------
+        state_variables : dict
+            Material constitutive model state variables, where each state
+            variable (key, str) is stored as a numpy.ndarray stacking the
+            material points along the first dimension.
+        consistent_tangent_mf : numpy.ndarray (3d)
+            Material constitutive model consistent tangent modulus in
+            matricial form of each material point stored as numpy.ndarray(3d)
+            of shape (n_batch, n_comps, n_comps).
+        """
+        # Get number of material points
+        n_batch = inc_strain_mf.shape[0]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get material properties
+        E = self._material_properties['E']
+        v = self._material_properties['v']
+        # Get material isotropic strain hardening law
+        hardening_law = get_hardening_law(
+            self._material_properties['isotropic_hardening'])
+        hardening_parameters = build_hardening_parameters(
+            self._material_properties['isotropic_hardening'],
+            self._material_properties)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute shear modulus
+        G = E/(2.0*(1.0 + v))
+        # Compute Lamé parameters
+        lam = (E*v)/((1.0 + v)*(1.0 - 2.0*v))
+        miu = E/(2.0*(1.0 + v))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get last increment converged state variables
+        e_strain_old_mf = np.asarray(state_variables_old['e_strain_mf'])
+        p_strain_old_mf = \
+            np.asarray(state_variables_old['strain_mf']) - e_strain_old_mf
+        acc_p_strain_old = np.asarray(state_variables_old['acc_p_strain'],
+                                      dtype=float)
+        #
+        #                                                    2D > 3D conversion
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # When the problem type corresponds to a 2D analysis, perform the state
+        # update and consistent tangent computation as in the 3D case,
+        # considering the appropriate out-of-plain strain and stress components
+        if self._problem_type == 4:
+            n_dim = self._n_dim
+            comp_order_sym = self._comp_order_sym
+        else:
+            # Set 3D problem parameters
+            n_dim, comp_order_sym, _ = mop.get_problem_type_parameters(4)
+            # Get 2D strain/stress components indexes in 3D matricial form
+            comps_idxs = [comp_order_sym.index(comp)
+                          for comp in self._comp_order_sym]
+            # Build strain tensors (matricial form) by including the
+            # appropriate out-of-plain components
+            inc_strain_3d_mf = np.zeros((n_batch, len(comp_order_sym)))
+            inc_strain_3d_mf[:, comps_idxs] = inc_strain_mf
+            inc_strain_mf = inc_strain_3d_mf
+            e_strain_old_3d_mf = np.zeros((n_batch, len(comp_order_sym)))
+            e_strain_old_3d_mf[:, comps_idxs] = e_strain_old_mf
+            e_strain_old_3d_mf[:, comp_order_sym.index('33')] = \
+                state_variables_old['e_strain_33']
+            e_strain_old_mf = e_strain_old_3d_mf
+        #
+        #                                                          State update
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set required fourth-order tensors
+        _, _, _, fosym, fodiagtrace, _, fodevprojsym = \
+            top.get_id_operators(n_dim)
+        FODevProjSym_mf = mop.get_tensor_mf(fodevprojsym, n_dim,
+                                            comp_order_sym)
+        # Compute elastic consistent tangent modulus and store it in matricial
+        # form
+        e_consistent_tangent_mf = mop.get_tensor_mf(
+            lam*fodiagtrace + 2.0*miu*fosym, n_dim, comp_order_sym)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute elastic trial strain
+        e_trial_strain_mf = e_strain_old_mf + inc_strain_mf
+        # Compute trial stress
+        trial_stress_mf = np.matmul(e_trial_strain_mf,
+                                    e_consistent_tangent_mf.T)
+        # Compute deviatoric trial stress
+        dev_trial_stress_mf = np.matmul(trial_stress_mf, FODevProjSym_mf.T)
+        dev_trial_stress_norm = np.linalg.norm(dev_trial_stress_mf, axis=1)
+        # Compute flow vector
+        is_dev_stress = \
+            np.any(np.abs(dev_trial_stress_mf) > 1e-10, axis=1)
+        flow_vector_mf = np.zeros(dev_trial_stress_mf.shape)
+        flow_vector_mf[is_dev_stress, :] = np.sqrt(3.0/2.0)*(
+            dev_trial_stress_mf[is_dev_stress, :]
+            / dev_trial_stress_norm[is_dev_stress, np.newaxis])
+        # Compute von Mises equivalent trial stress
+        vm_trial_stress = np.sqrt(3.0/2.0)*dev_trial_stress_norm
+        # Compute trial yield stress
+        yield_stress, _ = hardening_law(hardening_parameters,
+                                        acc_p_strain_old)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Check yield function
+        yield_function = vm_trial_stress - yield_stress
+        # Set plastic step flag
+        is_plast = yield_function/yield_stress > su_conv_tol
+        # Initialize state update failure flag
+        is_su_fail = np.zeros(n_batch, dtype=bool)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize incremental plastic multiplier and hardening modulus
+        inc_p_mult = np.zeros(n_batch)
+        H = np.zeros(n_batch)
+        # Get material points undergoing a plastic step
+        plast_idxs = np.flatnonzero(is_plast)
+        # Solve the return-mapping nonlinear equation simultaneously for all
+        # the material points undergoing a plastic step. The Newton-Raphson
+        # iterative procedure is only carried out for the material points that
+        # are not yet converged
+        if plast_idxs.size > 0:
+            # Initialize Newton-Raphson iteration counter
+            nr_iter = 0
+            # Initialize material points to be iterated
+            iter_idxs = plast_idxs
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            # Start Newton-Raphson iterative loop
+            while True:
+                # Compute current yield stress and hardening modulus
+                yield_stress_iter, H_iter = hardening_law(
+                    hardening_parameters,
+                    acc_p_strain_old[iter_idxs] + inc_p_mult[iter_idxs])
+                H[iter_idxs] = H_iter
+                # Compute return-mapping residual
+                residual = vm_trial_stress[iter_idxs] \
+                    - 3.0*G*inc_p_mult[iter_idxs] - yield_stress_iter
+                # Check Newton-Raphson iterative procedure convergence
+                error = np.abs(residual/yield_stress_iter)
+                is_converged = error < su_conv_tol
+                # Control Newton-Raphson iteration loop flow
+                if np.all(is_converged):
+                    # Leave Newton-Raphson iterative loop (converged solution)
+                    break
+                elif nr_iter == su_max_n_iterations:
+                    # If the maximum number of Newton-Raphson iterations is
+                    # reached without achieving convergence, set state update
+                    # failure flag of the non-converged material points
+                    is_su_fail[iter_idxs[~is_converged]] = True
+                    break
+                else:
+                    # Increment iteration counter
+                    nr_iter = nr_iter + 1
+                # Discard converged material points
+                iter_idxs = iter_idxs[~is_converged]
+                residual = residual[~is_converged]
+                # Compute return-mapping Jacobian
+                Jacobian = -3.0*G - H[iter_idxs]
+                # Solve return-mapping linearized equation
+                d_iter = -residual/Jacobian
+                # Update incremental plastic multiplier
+                inc_p_mult[iter_idxs] = inc_p_mult[iter_idxs] + d_iter
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Update elastic strain
+        e_strain_mf = e_trial_strain_mf \
+            - inc_p_mult[:, np.newaxis]*flow_vector_mf
+        # Update stress
+        stress_mf = trial_stress_mf.copy()
+        stress_mf[plast_idxs, :] = np.matmul(e_strain_mf[plast_idxs, :],
+                                             e_consistent_tangent_mf.T)
+        # Update accumulated plastic strain
+        acc_p_strain = acc_p_strain_old + inc_p_mult
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get the out-of-plane strain and stress components
+        if self._problem_type == 1:
+            e_strain_33 = e_strain_mf[:, comp_order_sym.index('33')]
+            stress_33 = stress_mf[:, comp_order_sym.index('33')]
+        #
+        #                                                    3D > 2D Conversion
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # When the problem type corresponds to a 2D analysis, build the 2D
+        # strain and stress tensors (matricial form) once the state update has
+        # been performed
+        if self._problem_type == 1:
+            # Builds 2D strain and stress tensors (matricial form) from the
+            # associated 3D counterparts
+            e_trial_strain_mf = e_trial_strain_mf[:, comps_idxs]
+            e_strain_mf = e_strain_mf[:, comps_idxs]
+            stress_mf = stress_mf[:, comps_idxs]
+        #
+        #                                                Update state variables
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Store updated state variables
+        state_variables = dict()
+        state_variables['e_strain_mf'] = e_strain_mf
+        state_variables['acc_p_strain'] = acc_p_strain
+        state_variables['strain_mf'] = e_trial_strain_mf + p_strain_old_mf
+        state_variables['stress_mf'] = stress_mf
+        state_variables['is_plast'] = is_plast
+        state_variables['is_su_fail'] = is_su_fail
+        if self._problem_type == 1:
+            state_variables['e_strain_33'] = e_strain_33
+            state_variables['stress_33'] = stress_33
+        # Recover last converged state variables of the material points whose
+        # state update failed
+        if np.any(is_su_fail):
+            for key, value in state_variables.items():
+                if key != 'is_su_fail':
+                    value[is_su_fail] = np.asarray(
+                        state_variables_old[key])[is_su_fail]
+        #
+        #                                            Consistent tangent modulus
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize consistent tangent modulus with the elastic consistent
+        # tangent modulus
+        consistent_tangent_mf = np.tile(e_consistent_tangent_mf,
+                                        (n_batch, 1, 1))
+        # Compute elastoplastic consistent tangent modulus of the material
+        # points undergoing a plastic step
+        if plast_idxs.size > 0:
+            factor_1 = \
+                (inc_p_mult[plast_idxs]*6.0*G**2)/vm_trial_stress[plast_idxs]
+            factor_2 = (6.0*G**2)*(
+                (inc_p_mult[plast_idxs]/vm_trial_stress[plast_idxs])
+                - (1.0/(3.0*G + H[plast_idxs])))
+            unit_flow_vector_mf = \
+                np.sqrt(2.0/3.0)*flow_vector_mf[plast_idxs, :]
+            consistent_tangent_mf[plast_idxs, :, :] += \
+                - factor_1[:, np.newaxis, np.newaxis]*FODevProjSym_mf \
+                + factor_2[:, np.newaxis, np.newaxis]*np.einsum(
+                    'ni,nj->nij', unit_flow_vector_mf, unit_flow_vector_mf)
+        #
+        #                                                    3D > 2D Conversion
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # When the problem type corresponds to a 2D analysis, build the 2D
+        # consistent tangent modulus (matricial form) from the 3D counterpart
+        if self._problem_type == 1:
+            consistent_tangent_mf = \
+                consistent_tangent_mf[:, comps_idxs, :][:, :, comps_idxs]
+        #
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Return
+        return state_variables, consistent_tangent_mf
@@ -3,3 +3,4 @@
 #                                                                       Modules
 # =============================================================================
 from online.crom import asca
+from online.crom import linearsolvers
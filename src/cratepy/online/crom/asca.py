@@ -56,12 +56,12 @@ import copy
 # Third-party
 import numpy as np
 import numpy.matlib
-import scipy.linalg
+import scipy.sparse.linalg
 # Local
 import ioput.info as info
 import tensor.matrixoperations as mop
 import tensor.tensoroperations as top
-from clustering.citoperations import assemble_cit
+from online.crom.linearsolvers import get_linear_solver
 from online.loading.macloadincrem import LoadingPath, IncrementRewinder, \
                                          RewindManager
 from clustering.adaptivity.crve_adaptivity import AdaptivityManager, \
@@ -112,6 +112,12 @@ class ASCA:
         form.
     _farfield_strain_old_mf : numpy.ndarray (1d), default=None
         Last converged far-field strain tensor (matricial form).
+    _jacobian_buffer : {numpy.ndarray (2d), None}
+        Lippmann-Schwinger equilibrium Jacobian matrix buffer, reused between
+        Newton-Raphson iterations while the number of clusters is unchanged.
+    _linear_solver : LinearSolver
+        Linear solver of the Lippmann-Schwinger linearized system of
+        equilibrium equations.
     _total_time : float
         Total time (s) associated with online-stage.
     _effective_time : float
@@ -154,6 +160,15 @@ class ASCA:
     _build_global_cit_diff_tangent_mf(self, crve, global_cit_mf, \
                                       material_state, ref_material)
         Build global cluster interaction - tangent modulus matrix.
+    _build_jacobian_operator(self, crve, material_state, presc_strain_idxs, \
+                             global_cit_mf, ref_material)
+        Build Lippmann-Schwinger equilibrium Jacobian matrix action.
+    _get_diagonal_blocks(matrix, n_blocks, n_comps)
+        Get diagonal blocks of square matrix.
+    _get_clusters_vf_array(crve, material_phases)
+        Get clusters volume fractions sorted according to global order.
+    _add_block_diagonal(matrix, block_mf)
+        Add constant block to diagonal blocks of square matrix in-place.
     _check_convergence(self, crve, material_state, presc_strain_idxs, \
                        presc_stress_idxs, applied_mac_load_mf, residual, \
                        applied_mix_strain_mf=None)
@@ -189,7 +204,8 @@ class ASCA:
                  self_consistent_scheme='regression', scs_parameters=None,
                  scs_max_n_iterations=20, scs_conv_tol=1e-4,
                  max_n_iterations=12, conv_tol=1e-6, max_subinc_level=5,
-                 max_cinc_cuts=5, is_adapt_repeat_inc=True):
+                 max_cinc_cuts=5, is_adapt_repeat_inc=True,
+                 linear_solver='dense', linear_solver_parameters=None):
         """Constructor.
 
         Parameters
@@ -220,6 +236,13 @@ class ASCA:
         is_adapt_repeat_inc : bool, default=False
             True if loading increment is to be repeated after a clustering
             adaptivity step, False otherwise.
+        linear_solver : str, default='dense'
+            Linear solver of the Lippmann-Schwinger linearized system of
+            equilibrium equations: 'dense', 'gmres', 'bicgstab' or
+            'lu_reuse'.
+        linear_solver_parameters : dict, default=None
+            Linear solver parameters (key, str; item,
+            {int, float, bool, str}).
         """
         self._strain_formulation = strain_formulation
         self._problem_type = problem_type
@@ -240,6 +263,11 @@ class ASCA:
         # Initialize last converged algorithmic variables
         self._global_strain_old_mf = None
         self._farfield_strain_old_mf = None
+        # Initialize Jacobian matrix buffer
+        self._jacobian_buffer = None
+        # Set linear solver
+        self._linear_solver = get_linear_solver(
+            linear_solver, linear_solver_parameters=linear_solver_parameters)
         # Initialize times
         self._total_time = 0.0
         self._effective_time = 0.0
@@ -565,19 +593,17 @@ class ASCA:
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                 # Update cluster interaction tensors with elastic reference
                 # material properties and assemble global cluster interaction
-                # matrix
-                global_cit_mf = assemble_cit(
-                    self._strain_formulation, self._problem_type,
-                    ref_material.get_material_properties(),
-                    material_state.get_material_phases(),
-                    crve.get_phase_n_clusters(), crve.get_phase_clusters(),
-                    crve.get_cit_x_mf()[0], crve.get_cit_x_mf()[1],
-                    crve.get_cit_x_mf()[2])
+                # matrix (reused while the reference material properties are
+                # unchanged)
+                global_cit_mf = crve.get_global_cit_mf(
+                    ref_material.get_material_properties())
                 #
                 #                                 Newton-Raphson iterative loop
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                 # Initialize Newton-Raphson iteration counter
                 nr_iter = 0
+                # Reset linear solver sequence of systems of linear equations
+                self._linear_solver.reset_sequence()
                 # Display Newton-Raphson iteration header
                 type(self)._display_nr_iter_data(mode='init')
                 # Set Newton-Raphson iteration initial time
@@ -613,14 +639,6 @@ class ASCA:
                     # Update homogenized strain and stress tensors
                     material_state.update_state_homogenization()
                     #
-                    #        Global cluster interaction - tangent moduli matrix
-                    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    # Compute global cluster interaction - tangent moduli
-                    # matrix
-                    global_cit_diff_tangent_mf = \
-                        self._build_global_cit_diff_tangent_mf(
-                            crve, global_cit_mf, material_state, ref_material)
-                    #
                     #                  Lippmann-Schwinger equilibrium residuals
                     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                     # Build Lippmann-Schwinger equilibrium residuals
@@ -670,16 +688,41 @@ class ASCA:
                     #            Lippmann-Schwinger equilibrium Jacobian matrix
                     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                     # Build Lippmann-Schwinger equilibrium Jacobian matrix
-                    jacobian = self._build_jacobian(crve, material_state,
-                                                    presc_strain_idxs,
-                                                    presc_stress_idxs,
-                                                    global_cit_diff_tangent_mf)
+                    # (or Jacobian matrix action) and the associated leading
+                    # diagonal blocks (block-Jacobi preconditioner). Skipped
+                    # if the linear solver reuses a previous Jacobian matrix
+                    if not self._linear_solver.is_jacobian_required(
+                            -residual):
+                        jacobian = None
+                        precond_blocks = None
+                    elif self._linear_solver.is_matrix_free():
+                        jacobian, precond_blocks = \
+                            self._build_jacobian_operator(
+                                crve, material_state, presc_strain_idxs,
+                                global_cit_mf, ref_material)
+                    else:
+                        # Compute global cluster interaction - tangent moduli
+                        # matrix
+                        global_cit_diff_tangent_mf = \
+                            self._build_global_cit_diff_tangent_mf(
+                                crve, global_cit_mf, material_state,
+                                ref_material)
+                        # Build Jacobian matrix
+                        jacobian = self._build_jacobian(
+                            crve, material_state, presc_strain_idxs,
+                            presc_stress_idxs, global_cit_diff_tangent_mf)
+                        precond_blocks = None
+                        if self._linear_solver.is_block_preconditioned():
+                            precond_blocks = type(self)._get_diagonal_blocks(
+                                jacobian, crve.get_n_total_clusters(),
+                                len(comp_order))
                     #
                     #                   Lippmann-Schwinger equilibrium solution
                     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
                     # Solve Lippmann-Schwinger equilibrium system of linearized
                     # equilibrium equations
-                    d_iter = numpy.linalg.solve(jacobian, -residual)
+                    d_iter = self._linear_solver.solve(
+                        jacobian, -residual, precond_blocks=precond_blocks)
                     #
                     #                                  Strains iterative update
                     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -697,6 +740,11 @@ class ASCA:
                 if is_inc_cut:
                     break
                 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                # Compute global cluster interaction - tangent moduli matrix
+                # (converged solution)
+                global_cit_diff_tangent_mf = \
+                    self._build_global_cit_diff_tangent_mf(
+                        crve, global_cit_mf, material_state, ref_material)
                 # Compute CRVE effective tangent modulus and clusters strain
                 # concentration tensors
                 eff_tangent_mf, clusters_sct_mf = \
@@ -1117,6 +1165,9 @@ class ASCA:
                 if is_crve_adaptivity:
                     info.displayinfo('15', adaptivity_manager, crve,
                                      self._effective_time)
+                # Output linear solver summary
+                info.displayinfo('19', self._linear_solver,
+                                 self._effective_time)
                 # Finish solution of clustering-based reduced order equilibrium
                 # problem
                 return
@@ -1944,72 +1995,52 @@ class ASCA:
         _, foid, _, fosym, _, _, _ = top.get_id_operators(self._n_dim)
         if self._strain_formulation == 'infinitesimal':
             # Set fourth-order symmetric projection tensor (matricial form)
-            fosym_mf = mop.get_tensor_mf(fosym, self._n_dim, comp_order)
+            id_mf = mop.get_tensor_mf(fosym, self._n_dim, comp_order)
         else:
             # Set fourth-order identity tensor (matricial form)
-            foid_mf = mop.get_tensor_mf(foid, self._n_dim, comp_order)
+            id_mf = mop.get_tensor_mf(foid, self._n_dim, comp_order)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Get material phases
         material_phases = material_state.get_material_phases()
-        # Get clusters associated with each material phase
-        phase_clusters = crve.get_phase_clusters()
         # Get total number of clusters
         n_total_clusters = crve.get_n_total_clusters()
-        # Get clusters volume fraction
-        clusters_vf = crve.get_clusters_vf()
+        # Get clusters volume fraction (global order)
+        clusters_vf = self._get_clusters_vf_array(crve, material_phases)
         # Get material consistent tangent modulus associated with each material
-        # cluster
-        clusters_tangent_mf = material_state.get_clusters_tangent_mf()
+        # cluster (global order)
+        clusters_tangent_mf = material_state.get_stacked_clusters_tangent_mf()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get number of strain/stress components and number of clusters
+        # equilibrium equations
+        n_comps = len(comp_order)
+        n_clst_eqs = n_total_clusters*n_comps
+        # Get Jacobian matrix buffer (reallocated only if the number of
+        # clusters changes)
+        if self._jacobian_buffer is None or \
+                self._jacobian_buffer.shape[0] != n_clst_eqs + n_comps:
+            self._jacobian_buffer = np.zeros(2*(n_clst_eqs + n_comps,))
+        jacobian = self._jacobian_buffer
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize Jacobian matrix
-        jacobian = np.zeros(2*(n_total_clusters*len(comp_order)
-                               + len(comp_order),))
         # Compute Jacobian matrix component 11
-        i_init = 0
-        i_end = n_total_clusters*len(comp_order)
-        j_init = 0
-        j_end = n_total_clusters*len(comp_order)
-        if self._strain_formulation == 'infinitesimal':
-            jacobian[i_init:i_end, j_init:j_end] = \
-                scipy.linalg.block_diag(*(n_total_clusters*[fosym_mf, ])) \
-                + global_cit_diff_tangent_mf
-        else:
-            jacobian[i_init:i_end, j_init:j_end] = \
-                scipy.linalg.block_diag(*(n_total_clusters*[foid_mf, ])) \
-                + global_cit_diff_tangent_mf
+        jacobian[:n_clst_eqs, :n_clst_eqs] = global_cit_diff_tangent_mf
+        self._add_block_diagonal(jacobian[:n_clst_eqs, :n_clst_eqs], id_mf)
         # Compute Jacobian matrix component 12
-        i_init = 0
-        i_end = n_total_clusters*len(comp_order)
-        j_init = n_total_clusters*len(comp_order)
-        j_end = n_total_clusters*len(comp_order) + len(comp_order)
-        if self._strain_formulation == 'infinitesimal':
-            jacobian[i_init:i_end, j_init:j_end] = \
-                numpy.matlib.repmat(-1.0*fosym_mf, n_total_clusters, 1)
-        else:
-            jacobian[i_init:i_end, j_init:j_end] = \
-                numpy.matlib.repmat(-1.0*foid_mf, n_total_clusters, 1)
-        # Compute Jacobian matrix component 21
-        for k in range(len(comp_order)):
-            i = n_total_clusters*len(comp_order) + k
-            jclst = 0
-            for mat_phase in material_phases:
-                for cluster in phase_clusters[mat_phase]:
-                    if k in presc_strain_idxs:
-                        if self._strain_formulation == 'infinitesimal':
-                            f_foid_mf = clusters_vf[str(cluster)]*fosym_mf
-                        else:
-                            f_foid_mf = clusters_vf[str(cluster)]*foid_mf
-                        j_init = jclst*len(comp_order)
-                        j_end = j_init + len(comp_order)
-                        jacobian[i, j_init:j_end] = f_foid_mf[k, :]
-                    else:
-                        vf_tangent_mf = clusters_vf[str(cluster)]\
-                            * clusters_tangent_mf[str(cluster)]
-                        j_init = jclst*len(comp_order)
-                        j_end = j_init + len(comp_order)
-                        jacobian[i, j_init:j_end] = vf_tangent_mf[k, :]
-                    # Increment column cluster index
-                    jclst = jclst + 1
+        jacobian[:n_clst_eqs, n_clst_eqs:].reshape(
+            n_total_clusters, n_comps, n_comps)[:, :, :] = -1.0*id_mf
+        # Compute Jacobian matrix component 21 (rows sorted by component,
+        # columns sorted by cluster and component)
+        jacobian_21 = jacobian[n_clst_eqs:, :n_clst_eqs].reshape(
+            n_comps, n_total_clusters, n_comps)
+        jacobian_21[:, :, :] = np.transpose(
+            clusters_vf[:, np.newaxis, np.newaxis]*clusters_tangent_mf,
+            (1, 0, 2))
+        if len(presc_strain_idxs) > 0:
+            presc_strain_idxs = np.array(presc_strain_idxs, dtype=int)
+            jacobian_21[presc_strain_idxs, :, :] = \
+                clusters_vf[np.newaxis, :, np.newaxis] \
+                * id_mf[presc_strain_idxs, np.newaxis, :]
+        # Compute Jacobian matrix component 22
+        jacobian[n_clst_eqs:, n_clst_eqs:] = 0.0
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Return
         return jacobian
@@ -2082,32 +2113,223 @@ class ASCA:
             tangent modulus and the reference material elastic tangent modulus.
         """
         # Get material consistent tangent modulus associated with each material
-        # cluster
-        clusters_tangent_mf = material_state.get_clusters_tangent_mf()
+        # cluster (global order)
+        clusters_tangent_mf = material_state.get_stacked_clusters_tangent_mf()
         # Get elastic reference material tangent modulus
         ref_elastic_tangent_mf = ref_material.get_elastic_tangent_mf()
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Build list which stores the difference between the material cluster
-        # consistent tangent modulus (matricial form) and the reference
-        # material elastic tangent modulus (matricial form)
-        diff_tangent_mf = list()
-        # Loop over material phases
-        for mat_phase in material_state.get_material_phases():
-            # Loop over material clusters
-            for cluster in crve.get_phase_clusters()[mat_phase]:
-                diff_tangent_mf.append(clusters_tangent_mf[str(cluster)]
-                                       - ref_elastic_tangent_mf)
+        # Compute difference between the material clusters consistent tangent
+        # modulus (matricial form) and the reference material elastic tangent
+        # modulus (matricial form)
+        diff_tangent_mf = clusters_tangent_mf - ref_elastic_tangent_mf
+        # Get number of clusters and number of strain/stress components
+        n_total_clusters, n_comps, _ = diff_tangent_mf.shape
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Build global matrix similar to the global cluster interaction matrix
         # but where each cluster interaction tensor is double contracted with
         # the difference between the associated material cluster consistent
-        # tangent modulus and the reference material elastic tangent modulus
-        global_cit_diff_tangent_mf = np.matmul(
-            global_cit_mf, scipy.linalg.block_diag(*diff_tangent_mf))
+        # tangent modulus and the reference material elastic tangent modulus.
+        # Each block column of the global cluster interaction matrix is
+        # multiplied by the associated cluster tangent modulus difference
+        # through a single batched matrix product
+        global_cit_diff_tangent_mf = np.empty(global_cit_mf.shape)
+        np.matmul(
+            global_cit_mf.reshape(-1, n_total_clusters, n_comps).transpose(
+                1, 0, 2), diff_tangent_mf,
+            out=global_cit_diff_tangent_mf.reshape(
+                -1, n_total_clusters, n_comps).transpose(1, 0, 2))
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Return
         return global_cit_diff_tangent_mf
     # -------------------------------------------------------------------------
+    def _build_jacobian_operator(self, crve, material_state, presc_strain_idxs,
+                                 global_cit_mf, ref_material):
+        """Build Lippmann-Schwinger equilibrium Jacobian matrix action.
+
+        The action of the Jacobian matrix (see :py:meth:`_build_jacobian`) on
+        a given vector is computed without assembling neither the Jacobian
+        matrix nor the global cluster interaction - tangent modulus matrix,
+        i.e., only requiring the global cluster interaction matrix and the
+        material clusters tangent moduli (matrix-free).
+
+        ----
+
+        Parameters
+        ----------
+        crve : CRVE
+            Cluster-Reduced Representative Volume Element.
+        material_state : MaterialState
+            CRVE material constitutive state.
+        presc_strain_idxs : list[int]
+            Prescribed macroscale loading strain components indexes.
+        global_cit_mf : numpy.ndarray (2d)
+            Global cluster interaction matrix. Assembly positions are assigned
+            according to the order of material_phases (1st) and phase_clusters
+            (2nd).
+        ref_material : ElasticReferenceMaterial
+            Elastic reference material.
+
+        Returns
+        -------
+        jacobian : scipy.sparse.linalg.LinearOperator
+            Lippmann-Schwinger equilibrium Jacobian matrix action.
+        precond_blocks : numpy.ndarray (3d)
+            Jacobian matrix diagonal blocks associated with the material
+            clusters equilibrium residuals, stored as numpy.ndarray of shape
+            (n_total_clusters, n_comps, n_comps).
+        """
+        # Set strain/stress components order according to problem strain
+        # formulation
+        if self._strain_formulation == 'infinitesimal':
+            comp_order = self._comp_order_sym
+        elif self._strain_formulation == 'finite':
+            comp_order = self._comp_order_nsym
+        else:
+            raise RuntimeError('Unknown problem strain formulation.')
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        _, foid, _, fosym, _, _, _ = top.get_id_operators(self._n_dim)
+        if self._strain_formulation == 'infinitesimal':
+            # Set fourth-order symmetric projection tensor (matricial form)
+            id_mf = mop.get_tensor_mf(fosym, self._n_dim, comp_order)
+        else:
+            # Set fourth-order identity tensor (matricial form)
+            id_mf = mop.get_tensor_mf(foid, self._n_dim, comp_order)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get material phases
+        material_phases = material_state.get_material_phases()
+        # Get total number of clusters
+        n_total_clusters = crve.get_n_total_clusters()
+        # Get clusters volume fraction (global order)
+        clusters_vf = self._get_clusters_vf_array(crve, material_phases)
+        # Get material consistent tangent modulus associated with each material
+        # cluster (global order)
+        clusters_tangent_mf = material_state.get_stacked_clusters_tangent_mf()
+        # Compute difference between the material clusters consistent tangent
+        # modulus and the reference material elastic tangent modulus
+        diff_tangent_mf = \
+            clusters_tangent_mf - ref_material.get_elastic_tangent_mf()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Get number of strain/stress components and number of clusters
+        # equilibrium equations
+        n_comps = len(comp_order)
+        n_clst_eqs = n_total_clusters*n_comps
+        # Get prescribed strain components indexes
+        presc_strain_idxs = np.array(presc_strain_idxs, dtype=int)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set Jacobian matrix action
+        def matvec(x):
+            # Get clusters strains and far-field strain
+            x = np.asarray(x, dtype=float).reshape(-1)
+            x_clusters = x[:n_clst_eqs].reshape(n_total_clusters, n_comps)
+            x_farfield = x[n_clst_eqs:]
+            # Compute identity and tangent moduli contractions
+            id_x_clusters = np.matmul(x_clusters, id_mf.T)
+            tangent_x_clusters = np.matmul(
+                clusters_tangent_mf, x_clusters[:, :, np.newaxis])[:, :, 0]
+            diff_tangent_x_clusters = np.matmul(
+                diff_tangent_mf, x_clusters[:, :, np.newaxis])[:, :, 0]
+            # Compute Jacobian matrix action (clusters equilibrium residuals)
+            y_clusters = id_x_clusters \
+                + np.matmul(global_cit_mf,
+                            diff_tangent_x_clusters.reshape(-1)).reshape(
+                                n_total_clusters, n_comps) \
+                - np.matmul(id_mf, x_farfield)
+            # Compute Jacobian matrix action (loading constraints residuals)
+            y_farfield = np.matmul(clusters_vf, tangent_x_clusters)
+            if len(presc_strain_idxs) > 0:
+                y_farfield[presc_strain_idxs] = np.matmul(
+                    clusters_vf, id_x_clusters[:, presc_strain_idxs])
+            # Return
+            return np.concatenate((y_clusters.reshape(-1), y_farfield))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build Lippmann-Schwinger equilibrium Jacobian matrix action
+        jacobian = scipy.sparse.linalg.LinearOperator(
+            2*(n_clst_eqs + n_comps,), matvec=matvec, dtype=float)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Compute Jacobian matrix diagonal blocks associated with the material
+        # clusters equilibrium residuals
+        precond_blocks = id_mf + np.matmul(
+            type(self)._get_diagonal_blocks(global_cit_mf, n_total_clusters,
+                                            n_comps), diff_tangent_mf)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return jacobian, precond_blocks
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _get_diagonal_blocks(matrix, n_blocks, n_comps):
+        """Get diagonal blocks of square matrix.
+
+        Parameters
+        ----------
+        matrix : numpy.ndarray (2d)
+            Square matrix whose leading n_blocks*n_comps rows and columns
+            are split in square blocks of size n_comps.
+        n_blocks : int
+            Number of diagonal blocks.
+        n_comps : int
+            Size of diagonal blocks.
+
+        Returns
+        -------
+        blocks : numpy.ndarray (3d)
+            Diagonal blocks stored as numpy.ndarray of shape
+            (n_blocks, n_comps, n_comps).
+        """
+        # Get leading square submatrix split in blocks
+        n_block_eqs = n_blocks*n_comps
+        blocks = matrix[:n_block_eqs, :n_block_eqs].reshape(
+            n_blocks, n_comps, n_blocks, n_comps)
+        # Get diagonal blocks
+        idxs = np.arange(n_blocks)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return blocks[idxs, :, idxs, :]
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _get_clusters_vf_array(crve, material_phases):
+        """Get clusters volume fractions sorted according to global order.
+
+        Parameters
+        ----------
+        crve : CRVE
+            Cluster-Reduced Representative Volume Element.
+        material_phases : list[str]
+            RVE material phases labels (str).
+
+        Returns
+        -------
+        clusters_vf : numpy.ndarray (1d)
+            Clusters volume fractions sorted according to the order of
+            material_phases (1st) and phase_clusters (2nd).
+        """
+        # Get clusters associated with each material phase
+        phase_clusters = crve.get_phase_clusters()
+        # Get clusters volume fraction
+        clusters_vf = crve.get_clusters_vf()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return np.array([clusters_vf[str(cluster)]
+                         for mat_phase in material_phases
+                         for cluster in phase_clusters[mat_phase]])
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _add_block_diagonal(matrix, block_mf):
+        """Add constant block to diagonal blocks of square matrix in-place.
+
+        Parameters
+        ----------
+        matrix : numpy.ndarray (2d)
+            Square matrix (or square matrix view) of shape
+            (n_blocks*n_comps, n_blocks*n_comps).
+        block_mf : numpy.ndarray (2d)
+            Block of shape (n_comps, n_comps) added to each diagonal block.
+        """
+        # Get number of diagonal blocks
+        n_comps = block_mf.shape[0]
+        n_blocks = matrix.shape[0]//n_comps
+        # Get diagonal blocks view
+        blocks = matrix.reshape(n_blocks, n_comps, n_blocks, n_comps)
+        # Add block to diagonal blocks
+        idxs = np.arange(n_blocks)
+        blocks[idxs, :, idxs, :] += block_mf
+    # -------------------------------------------------------------------------
     def _check_convergence(self, crve, material_state, presc_strain_idxs,
                            presc_stress_idxs, applied_mac_load_mf, residual,
                            applied_mix_strain_mf=None):
@@ -2406,14 +2628,11 @@ class ASCA:
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Compute equilibrium jacobian matrix (cluster strain concentration
         # tensors system of linear equations coefficient matrix)
+        csct_matrix = global_cit_diff_tangent_mf.copy()
         if self._strain_formulation == 'infinitesimal':
-            csct_matrix = \
-                scipy.linalg.block_diag(*(n_total_clusters*[fosym_mf, ])) \
-                + global_cit_diff_tangent_mf
+            self._add_block_diagonal(csct_matrix, fosym_mf)
         else:
-            csct_matrix = \
-                scipy.linalg.block_diag(*(n_total_clusters*[foid_mf, ])) \
-                + global_cit_diff_tangent_mf
+            self._add_block_diagonal(csct_matrix, foid_mf)
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         # Select clusters strain concentration tensors computation option:
         #
@@ -0,0 +1,812 @@
+"""Linear solvers of the clustering-based equilibrium problem.
+
+This module includes the interface to implement any linear solver of the
+Lippmann-Schwinger linearized system of equilibrium equations solved at each
+Newton-Raphson iteration of the clustering-based reduced-order equilibrium
+problem, as well as the available linear solvers.
+
+The dense direct linear solver performs a LU factorization of the Jacobian
+matrix (:math:`\\mathcal{O}(n^{3})`). The Krylov iterative linear solvers
+(GMRES and BiCGSTAB) only require the action of the Jacobian matrix, which can
+be computed without assembling the Jacobian matrix (matrix-free mode), and can
+be accelerated with a block-Jacobi preconditioner built from the material
+clusters diagonal blocks. The LU reuse direct linear solver keeps the LU
+factorization of the Jacobian matrix across Newton-Raphson iterations and
+loading increments (modified Newton-Raphson or Broyden quasi-Newton updates),
+only requesting a new Jacobian matrix when the convergence rate degrades.
+
+Classes
+-------
+LinearSolver
+    Linear solver interface.
+DenseLinearSolver
+    Dense direct linear solver.
+KrylovLinearSolver
+    Krylov iterative linear solver.
+LUReuseLinearSolver
+    LU factorization reuse direct linear solver.
+
+Functions
+---------
+get_available_linear_solvers
+    Get available linear solvers.
+get_linear_solver
+    Get linear solver.
+"""
+#
+#                                                                       Modules
+# =============================================================================
+# Standard
+from abc import ABC, abstractmethod
+import time
+import inspect
+# Third-party
+import numpy as np
+import scipy.linalg
+import scipy.sparse.linalg
+#
+#                                                          Authorship & Credits
+# =============================================================================
+__author__ = 'Bernardo Ferreira (bernardo_ferreira@brown.edu)'
+__credits__ = ['Bernardo Ferreira', ]
+__status__ = 'Stable'
+# =============================================================================
+#
+# =============================================================================
+# Set Krylov iterative methods relative tolerance keyword (renamed from 'tol'
+# to 'rtol' in recent SciPy versions)
+if 'rtol' in inspect.signature(scipy.sparse.linalg.gmres).parameters:
+    _TOL_KEYWORD = 'rtol'
+else:
+    _TOL_KEYWORD = 'tol'
+# =============================================================================
+def get_available_linear_solvers():
+    """Get available linear solvers.
+
+    Available linear solvers and parameters:
+
+    * 'dense' : Dense direct linear solver (LU factorization).
+
+    * 'gmres' : Restarted Generalized Minimal RESidual method.
+
+    * 'bicgstab' : BIConjugate Gradient STABilized method.
+
+    * 'lu_reuse' : Dense direct linear solver reusing the LU factorization.
+
+    Krylov iterative linear solvers parameters:
+
+    * 'preconditioner' : {'block_jacobi', 'none'}, default='block_jacobi'
+
+    * 'matrix_free' : bool, default=False
+
+    * 'rtol' : float, default=1e-10
+
+    * 'max_n_iterations' : int, default=None
+
+    * 'restart' : int, default=None (GMRES only)
+
+    * 'dense_fallback' : bool, default=True
+
+    LU reuse direct linear solver parameters:
+
+    * 'update' : {'modified_newton', 'broyden'}, default='modified_newton'
+
+    * 'rate_threshold' : float, default=0.1
+
+    ----
+
+    Returns
+    -------
+    available_linear_solvers : dict
+        Available linear solvers (key, str) and associated parameters
+        (item, dict) with parameters names (key, str) and types (item, type).
+    """
+    # Set Krylov iterative linear solvers parameters
+    krylov_parameters = {'preconditioner': str, 'matrix_free': bool,
+                         'rtol': float, 'max_n_iterations': int,
+                         'restart': int, 'dense_fallback': bool}
+    # Set LU reuse direct linear solver parameters
+    lu_reuse_parameters = {'update': str, 'rate_threshold': float}
+    # Set available linear solvers
+    available_linear_solvers = {'dense': {},
+                                'gmres': krylov_parameters,
+                                'bicgstab': krylov_parameters,
+                                'lu_reuse': lu_reuse_parameters}
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return available_linear_solvers
+# =============================================================================
+def get_linear_solver(linear_solver, linear_solver_parameters=None):
+    """Get linear solver.
+
+    Parameters
+    ----------
+    linear_solver : {'dense', 'gmres', 'bicgstab', 'lu_reuse'}
+        Linear solver.
+    linear_solver_parameters : dict, default=None
+        Linear solver parameters (key, str; item, {int, float, bool, str}).
+
+    Returns
+    -------
+    solver : LinearSolver
+        Linear solver.
+    """
+    # Set linear solver parameters
+    if linear_solver_parameters is None:
+        parameters = {}
+    else:
+        parameters = dict(linear_solver_parameters)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Instantiate linear solver
+    if linear_solver == 'dense':
+        solver = DenseLinearSolver()
+    elif linear_solver in ('gmres', 'bicgstab'):
+        solver = KrylovLinearSolver(
+            method=linear_solver,
+            preconditioner=parameters.get('preconditioner', 'block_jacobi'),
+            is_matrix_free=parameters.get('matrix_free', False),
+            rtol=parameters.get('rtol', 1e-10),
+            max_n_iterations=parameters.get('max_n_iterations', None),
+            restart=parameters.get('restart', None),
+            is_dense_fallback=parameters.get('dense_fallback', True))
+    elif linear_solver == 'lu_reuse':
+        solver = LUReuseLinearSolver(
+            update=parameters.get('update', 'modified_newton'),
+            rate_threshold=parameters.get('rate_threshold', 0.1))
+    else:
+        raise RuntimeError('Unknown linear solver.')
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return solver
+# =============================================================================
+class LinearSolver(ABC):
+    """Linear solver interface.
+
+    Attributes
+    ----------
+    _name : str
+        Linear solver name.
+    _n_solves : int
+        Number of solved systems of linear equations.
+    _n_iterations : int
+        Total number of iterations performed by the linear solver (null for
+        direct linear solvers).
+    _n_factorizations : int
+        Number of Jacobian matrix factorizations.
+    _n_dense_fallbacks : int
+        Number of systems of linear equations solved with the dense direct
+        fallback linear solver.
+    _solve_time : float
+        Total time (s) associated with the solution of the systems of linear
+        equations.
+
+    Methods
+    -------
+    solve(self, jacobian, rhs, precond_blocks=None)
+        *abstract*: Solve system of linear equations.
+    is_matrix_free(self)
+        Check if linear solver only requires the Jacobian matrix action.
+    is_block_preconditioned(self)
+        Check if linear solver requires the Jacobian matrix diagonal blocks.
+    is_jacobian_required(self, rhs)
+        Check if linear solver requires a new Jacobian matrix.
+    reset_sequence(self)
+        Reset sequence of systems of linear equations.
+    get_name(self)
+        Get linear solver name.
+    get_solver_profile(self)
+        Get linear solver profile.
+    """
+    @abstractmethod
+    def __init__(self):
+        """Constructor."""
+        pass
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def solve(self, jacobian, rhs, precond_blocks=None):
+        """Solve system of linear equations.
+
+        Parameters
+        ----------
+        jacobian : {numpy.ndarray (2d), scipy.sparse.linalg.LinearOperator}
+            Jacobian matrix or Jacobian matrix action (matrix-free).
+        rhs : numpy.ndarray (1d)
+            Right-hand side.
+        precond_blocks : numpy.ndarray (3d), default=None
+            Leading diagonal blocks of the Jacobian matrix stored as
+            numpy.ndarray of shape (n_blocks, n_comps, n_comps).
+
+        Returns
+        -------
+        solution : numpy.ndarray (1d)
+            Solution of system of linear equations.
+        """
+        pass
+    # -------------------------------------------------------------------------
+    def is_matrix_free(self):
+        """Check if linear solver only requires the Jacobian matrix action.
+
+        Returns
+        -------
+        is_matrix_free : bool
+            True if linear solver only requires the Jacobian matrix action,
+            False if it requires the assembled Jacobian matrix.
+        """
+        return False
+    # -------------------------------------------------------------------------
+    def is_block_preconditioned(self):
+        """Check if linear solver requires the Jacobian matrix diagonal blocks.
+
+        Returns
+        -------
+        is_block_preconditioned : bool
+            True if linear solver requires the Jacobian matrix leading
+            diagonal blocks to build the preconditioner, False otherwise.
+        """
+        return False
+    # -------------------------------------------------------------------------
+    def is_jacobian_required(self, rhs):
+        """Check if linear solver requires a new Jacobian matrix.
+
+        Parameters
+        ----------
+        rhs : numpy.ndarray (1d)
+            Right-hand side of the system of linear equations to be solved.
+
+        Returns
+        -------
+        is_required : bool
+            True if the Jacobian matrix (or Jacobian matrix action) must be
+            provided to solve the system of linear equations, False if the
+            linear solver reuses a previous Jacobian matrix.
+        """
+        return True
+    # -------------------------------------------------------------------------
+    def reset_sequence(self):
+        """Reset sequence of systems of linear equations.
+
+        Called at the beginning of each Newton-Raphson iterative loop, i.e.,
+        the following systems of linear equations are associated with a new
+        sequence of iterations.
+        """
+        pass
+    # -------------------------------------------------------------------------
+    def get_name(self):
+        """Get linear solver name.
+
+        Returns
+        -------
+        name : str
+            Linear solver name.
+        """
+        return self._name
+    # -------------------------------------------------------------------------
+    def get_solver_profile(self):
+        """Get linear solver profile.
+
+        Returns
+        -------
+        n_solves : int
+            Number of solved systems of linear equations.
+        n_iterations : int
+            Total number of iterations performed by the linear solver (null
+            for direct linear solvers).
+        n_factorizations : int
+            Number of Jacobian matrix factorizations.
+        n_dense_fallbacks : int
+            Number of systems of linear equations solved with the dense direct
+            fallback linear solver.
+        solve_time : float
+            Total time (s) associated with the solution of the systems of
+            linear equations.
+        """
+        return self._n_solves, self._n_iterations, self._n_factorizations, \
+            self._n_dense_fallbacks, self._solve_time
+# =============================================================================
+class DenseLinearSolver(LinearSolver):
+    """Dense direct linear solver.
+
+    Attributes
+    ----------
+    _name : str
+        Linear solver name.
+    _n_solves : int
+        Number of solved systems of linear equations.
+    _n_iterations : int
+        Total number of iterations performed by the linear solver (null for
+        direct linear solvers).
+    _n_factorizations : int
+        Number of Jacobian matrix factorizations.
+    _n_dense_fallbacks : int
+        Number of systems of linear equations solved with the dense direct
+        fallback linear solver.
+    _solve_time : float
+        Total time (s) associated with the solution of the systems of linear
+        equations.
+
+    Methods
+    -------
+    solve(self, jacobian, rhs, precond_blocks=None)
+        Solve system of linear equations.
+    """
+    def __init__(self):
+        """Constructor."""
+        self._name = 'dense'
+        self._n_solves = 0
+        self._n_iterations = 0
+        self._n_factorizations = 0
+        self._n_dense_fallbacks = 0
+        self._solve_time = 0.0
+    # -------------------------------------------------------------------------
+    def solve(self, jacobian, rhs, precond_blocks=None):
+        """Solve system of linear equations.
+
+        Parameters
+        ----------
+        jacobian : numpy.ndarray (2d)
+            Jacobian matrix.
+        rhs : numpy.ndarray (1d)
+            Right-hand side.
+        precond_blocks : numpy.ndarray (3d), default=None
+            Leading diagonal blocks of the Jacobian matrix stored as
+            numpy.ndarray of shape (n_blocks, n_comps, n_comps). Ignored by
+            dense direct linear solver.
+
+        Returns
+        -------
+        solution : numpy.ndarray (1d)
+            Solution of system of linear equations.
+        """
+        # Set solution initial time
+        init_time = time.time()
+        # Solve system of linear equations
+        solution = np.linalg.solve(jacobian, rhs)
+        # Update linear solver profile
+        self._n_solves += 1
+        self._n_factorizations += 1
+        self._solve_time += time.time() - init_time
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return solution
+# =============================================================================
+class KrylovLinearSolver(LinearSolver):
+    """Krylov iterative linear solver.
+
+    Attributes
+    ----------
+    _name : str
+        Linear solver name.
+    _method : {'gmres', 'bicgstab'}
+        Krylov iterative method.
+    _preconditioner : {'block_jacobi', 'none'}
+        Preconditioner.
+    _is_matrix_free : bool
+        True if the Jacobian matrix is not assembled and only its action is
+        computed, False otherwise.
+    _rtol : float
+        Relative tolerance of the iterative solution (residual norm).
+    _max_n_iterations : {int, None}
+        Maximum number of iterations (restart cycles for GMRES). If None,
+        the iterative method default is adopted.
+    _restart : {int, None}
+        Number of iterations between restarts (GMRES only). If None, the
+        iterative method default is adopted.
+    _is_dense_fallback : bool
+        If True, then the system of linear equations is solved with a dense
+        direct linear solver whenever the iterative method fails to converge.
+        Otherwise, the last iterative solution is accepted (inexact
+        Newton-Raphson iteration).
+    _n_solves : int
+        Number of solved systems of linear equations.
+    _n_iterations : int
+        Total number of iterations performed by the linear solver.
+    _n_factorizations : int
+        Number of Jacobian matrix factorizations.
+    _n_dense_fallbacks : int
+        Number of systems of linear equations solved with the dense direct
+        fallback linear solver.
+    _solve_time : float
+        Total time (s) associated with the solution of the systems of linear
+        equations.
+
+    Methods
+    -------
+    solve(self, jacobian, rhs, precond_blocks=None)
+        Solve system of linear equations.
+    is_matrix_free(self)
+        Check if linear solver only requires the Jacobian matrix action.
+    is_block_preconditioned(self)
+        Check if linear solver requires the Jacobian matrix diagonal blocks.
+    _build_block_jacobi(precond_blocks, n_eqs)
+        Build block-Jacobi preconditioner.
+    """
+    def __init__(self, method='gmres', preconditioner='block_jacobi',
+                 is_matrix_free=False, rtol=1e-10, max_n_iterations=None,
+                 restart=None, is_dense_fallback=True):
+        """Constructor.
+
+        Parameters
+        ----------
+        method : {'gmres', 'bicgstab'}, default='gmres'
+            Krylov iterative method.
+        preconditioner : {'block_jacobi', 'none'}, default='block_jacobi'
+            Preconditioner.
+        is_matrix_free : bool, default=False
+            True if the Jacobian matrix is not assembled and only its action
+            is computed, False otherwise.
+        rtol : float, default=1e-10
+            Relative tolerance of the iterative solution (residual norm).
+        max_n_iterations : int, default=None
+            Maximum number of iterations (restart cycles for GMRES). If None,
+            the iterative method default is adopted.
+        restart : int, default=None
+            Number of iterations between restarts (GMRES only). If None, the
+            iterative method default is adopted.
+        is_dense_fallback : bool, default=True
+            If True, then the system of linear equations is solved with a
+            dense direct linear solver whenever the iterative method fails to
+            converge. Otherwise, the last iterative solution is accepted
+            (inexact Newton-Raphson iteration).
+        """
+        if method not in ('gmres', 'bicgstab'):
+            raise RuntimeError('Unknown Krylov iterative method.')
+        if preconditioner not in ('block_jacobi', 'none'):
+            raise RuntimeError('Unknown Krylov iterative method '
+                               'preconditioner.')
+        self._name = method
+        self._method = method
+        self._preconditioner = preconditioner
+        self._is_matrix_free = is_matrix_free
+        self._rtol = rtol
+        self._max_n_iterations = max_n_iterations
+        self._restart = restart
+        self._is_dense_fallback = is_dense_fallback
+        self._n_solves = 0
+        self._n_iterations = 0
+        self._n_factorizations = 0
+        self._n_dense_fallbacks = 0
+        self._solve_time = 0.0
+    # -------------------------------------------------------------------------
+    def solve(self, jacobian, rhs, precond_blocks=None):
+        """Solve system of linear equations.
+
+        Parameters
+        ----------
+        jacobian : {numpy.ndarray (2d), scipy.sparse.linalg.LinearOperator}
+            Jacobian matrix or Jacobian matrix action (matrix-free).
+        rhs : numpy.ndarray (1d)
+            Right-hand side.
+        precond_blocks : numpy.ndarray (3d), default=None
+            Leading diagonal blocks of the Jacobian matrix stored as
+            numpy.ndarray of shape (n_blocks, n_comps, n_comps). Required to
+            build the block-Jacobi preconditioner.
+
+        Returns
+        -------
+        solution : numpy.ndarray (1d)
+            Solution of system of linear equations.
+        """
+        # Set solution initial time
+        init_time = time.time()
+        # Get number of equations
+        n_eqs = rhs.shape[0]
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Build preconditioner
+        if self._preconditioner == 'block_jacobi' \
+                and precond_blocks is not None:
+            preconditioner = type(self)._build_block_jacobi(precond_blocks,
+                                                            n_eqs)
+        else:
+            preconditioner = None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Initialize number of iterations
+        n_iterations = [0, ]
+        # Set iteration counter
+        def iteration_counter(_):
+            n_iterations[0] += 1
+        # Set iterative method parameters
+        kwargs = {_TOL_KEYWORD: self._rtol, 'atol': 0.0,
+                  'maxiter': self._max_n_iterations, 'M': preconditioner,
+                  'callback': iteration_counter}
+        # Solve system of linear equations
+        if self._method == 'gmres':
+            solution, info = scipy.sparse.linalg.gmres(
+                jacobian, rhs, restart=self._restart,
+                callback_type='pr_norm', **kwargs)
+        else:
+            solution, info = scipy.sparse.linalg.bicgstab(jacobian, rhs,
+                                                          **kwargs)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Solve system of linear equations with dense direct linear solver if
+        # iterative method failed to converge
+        if info != 0 and self._is_dense_fallback:
+            # Assemble Jacobian matrix (matrix-free)
+            if isinstance(jacobian, scipy.sparse.linalg.LinearOperator):
+                jacobian = jacobian.matmat(np.eye(n_eqs))
+            # Solve system of linear equations
+            solution = np.linalg.solve(jacobian, rhs)
+            # Update number of factorizations and dense fallbacks
+            self._n_factorizations += 1
+            self._n_dense_fallbacks += 1
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Update linear solver profile
+        self._n_solves += 1
+        self._n_iterations += n_iterations[0]
+        self._solve_time += time.time() - init_time
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return solution
+    # -------------------------------------------------------------------------
+    def is_matrix_free(self):
+        """Check if linear solver only requires the Jacobian matrix action.
+
+        Returns
+        -------
+        is_matrix_free : bool
+            True if linear solver only requires the Jacobian matrix action,
+            False if it requires the assembled Jacobian matrix.
+        """
+        return self._is_matrix_free
+    # -------------------------------------------------------------------------
+    def is_block_preconditioned(self):
+        """Check if linear solver requires the Jacobian matrix diagonal blocks.
+
+        Returns
+        -------
+        is_block_preconditioned : bool
+            True if linear solver requires the Jacobian matrix leading
+            diagonal blocks to build the preconditioner, False otherwise.
+        """
+        return self._preconditioner == 'block_jacobi'
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _build_block_jacobi(precond_blocks, n_eqs):
+        """Build block-Jacobi preconditioner.
+
+        The preconditioner applies the inverse of each leading diagonal block
+        to the associated equations and leaves the remaining trailing
+        equations unchanged.
+
+        ----
+
+        Parameters
+        ----------
+        precond_blocks : numpy.ndarray (3d)
+            Leading diagonal blocks of the Jacobian matrix stored as
+            numpy.ndarray of shape (n_blocks, n_comps, n_comps).
+        n_eqs : int
+            Number of equations.
+
+        Returns
+        -------
+        preconditioner : {scipy.sparse.linalg.LinearOperator, None}
+            Block-Jacobi preconditioner. Set to None if any diagonal block is
+            singular.
+        """
+        # Get number of blocks and number of components
+        n_blocks, n_comps, _ = precond_blocks.shape
+        n_block_eqs = n_blocks*n_comps
+        # Compute inverse of diagonal blocks
+        try:
+            inv_blocks = np.linalg.inv(precond_blocks)
+        except np.linalg.LinAlgError:
+            return None
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Set preconditioner action
+        def matvec(x):
+            y = np.array(x, dtype=float).reshape(-1)
+            y[:n_block_eqs] = np.matmul(
+                inv_blocks,
+                y[:n_block_eqs].reshape(n_blocks, n_comps, 1)).reshape(-1)
+            return y
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return scipy.sparse.linalg.LinearOperator((n_eqs, n_eqs),
+                                                  matvec=matvec, dtype=float)
+# =============================================================================
+class LUReuseLinearSolver(LinearSolver):
+    """LU factorization reuse direct linear solver.
+
+    The LU factorization of the Jacobian matrix is kept across Newton-Raphson
+    iterations and loading increments. A new Jacobian matrix is only required
+    when no factorization is available, when the number of equations changes
+    (e.g., clustering adaptivity) or when the convergence rate degrades, i.e.,
+    when the ratio between the norms of consecutive right-hand sides of the
+    same sequence exceeds a given threshold.
+
+    The factorized Jacobian matrix can be either used as is (modified
+    Newton-Raphson) or improved with Broyden's (good) rank-one updates of the
+    inverse Jacobian matrix, stored as a sequence of vector pairs and
+    discarded whenever the Jacobian matrix is refactorized or a new sequence
+    of systems of linear equations begins.
+
+    Attributes
+    ----------
+    _name : str
+        Linear solver name.
+    _update : {'modified_newton', 'broyden'}
+        Update of the factorized Jacobian matrix between refactorizations.
+    _rate_threshold : float
+        Convergence rate threshold above which a new Jacobian matrix is
+        required.
+    _lu_factorization : {tuple, None}
+        LU factorization of the Jacobian matrix (scipy.linalg.lu_factor).
+    _broyden_updates : list[tuple]
+        Broyden rank-one updates of the inverse Jacobian matrix, each stored
+        as a pair of vectors (numpy.ndarray (1d)).
+    _rhs_old : {numpy.ndarray (1d), None}
+        Right-hand side of the last system of linear equations solved in the
+        current sequence.
+    _solution_old : {numpy.ndarray (1d), None}
+        Solution of the last system of linear equations solved in the
+        current sequence.
+    _n_solves : int
+        Number of solved systems of linear equations.
+    _n_iterations : int
+        Total number of iterations performed by the linear solver (null for
+        direct linear solvers).
+    _n_factorizations : int
+        Number of Jacobian matrix factorizations.
+    _n_dense_fallbacks : int
+        Number of systems of linear equations solved with the dense direct
+        fallback linear solver.
+    _solve_time : float
+        Total time (s) associated with the solution of the systems of linear
+        equations.
+
+    Methods
+    -------
+    solve(self, jacobian, rhs, precond_blocks=None)
+        Solve system of linear equations.
+    is_jacobian_required(self, rhs)
+        Check if linear solver requires a new Jacobian matrix.
+    reset_sequence(self)
+        Reset sequence of systems of linear equations.
+    _apply_inverse(self, x, trans=0)
+        Apply (updated) inverse Jacobian matrix.
+    """
+    def __init__(self, update='modified_newton', rate_threshold=0.1):
+        """Constructor.
+
+        Parameters
+        ----------
+        update : {'modified_newton', 'broyden'}, default='modified_newton'
+            Update of the factorized Jacobian matrix between
+            refactorizations.
+        rate_threshold : float, default=0.1
+            Convergence rate threshold above which a new Jacobian matrix is
+            required.
+        """
+        if update not in ('modified_newton', 'broyden'):
+            raise RuntimeError('Unknown LU reuse linear solver update.')
+        self._name = 'lu_reuse'
+        self._update = update
+        self._rate_threshold = rate_threshold
+        self._lu_factorization = None
+        self._broyden_updates = []
+        self._rhs_old = None
+        self._solution_old = None
+        self._n_solves = 0
+        self._n_iterations = 0
+        self._n_factorizations = 0
+        self._n_dense_fallbacks = 0
+        self._solve_time = 0.0
+    # -------------------------------------------------------------------------
+    def solve(self, jacobian, rhs, precond_blocks=None):
+        """Solve system of linear equations.
+
+        Parameters
+        ----------
+        jacobian : {numpy.ndarray (2d), None}
+            Jacobian matrix. If None, then the last factorized Jacobian matrix
+            is reused.
+        rhs : numpy.ndarray (1d)
+            Right-hand side.
+        precond_blocks : numpy.ndarray (3d), default=None
+            Leading diagonal blocks of the Jacobian matrix stored as
+            numpy.ndarray of shape (n_blocks, n_comps, n_comps). Ignored by
+            LU reuse direct linear solver.
+
+        Returns
+        -------
+        solution : numpy.ndarray (1d)
+            Solution of system of linear equations.
+        """
+        # Set solution initial time
+        init_time = time.time()
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        if jacobian is not None:
+            # Compute LU factorization of the Jacobian matrix
+            self._lu_factorization = scipy.linalg.lu_factor(
+                jacobian, check_finite=False)
+            # Discard Broyden updates
+            self._broyden_updates = []
+            # Update number of factorizations
+            self._n_factorizations += 1
+        elif self._lu_factorization is None:
+            raise RuntimeError('The Jacobian matrix must be provided to '
+                               'compute the LU factorization.')
+        elif self._update == 'broyden' and self._rhs_old is not None:
+            # Get last iterative step and associated change of the residual
+            # (symmetric of the right-hand side)
+            step = self._solution_old
+            residual_change = self._rhs_old - rhs
+            # Compute Broyden rank-one update of the inverse Jacobian matrix
+            inv_residual_change = self._apply_inverse(residual_change)
+            denominator = np.dot(step, inv_residual_change)
+            if abs(denominator) > 1e-12*np.linalg.norm(step) \
+                    * np.linalg.norm(inv_residual_change):
+                self._broyden_updates.append(
+                    ((step - inv_residual_change)/denominator,
+                     self._apply_inverse(step, trans=1)))
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Solve system of linear equations
+        solution = self._apply_inverse(rhs)
+        # Store right-hand side and solution
+        self._rhs_old = np.array(rhs, dtype=float)
+        self._solution_old = solution
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        # Update linear solver profile
+        self._n_solves += 1
+        self._solve_time += time.time() - init_time
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return solution
+    # -------------------------------------------------------------------------
+    def is_jacobian_required(self, rhs):
+        """Check if linear solver requires a new Jacobian matrix.
+
+        Parameters
+        ----------
+        rhs : numpy.ndarray (1d)
+            Right-hand side of the system of linear equations to be solved.
+
+        Returns
+        -------
+        is_required : bool
+            True if the Jacobian matrix must be provided to solve the system
+            of linear equations, False if the last factorized Jacobian matrix
+            is reused.
+        """
+        # Require Jacobian matrix if factorization is not available
+        if self._lu_factorization is None \
+                or self._lu_factorization[0].shape[0] != rhs.shape[0]:
+            return True
+        # Require Jacobian matrix if convergence rate degrades
+        if self._rhs_old is not None \
+                and np.linalg.norm(rhs) \
+                > self._rate_threshold*np.linalg.norm(self._rhs_old):
+            return True
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return False
+    # -------------------------------------------------------------------------
+    def reset_sequence(self):
+        """Reset sequence of systems of linear equations.
+
+        The Broyden updates and the last right-hand side and solution are
+        discarded, while the LU factorization is kept.
+        """
+        self._broyden_updates = []
+        self._rhs_old = None
+        self._solution_old = None
+    # -------------------------------------------------------------------------
+    def _apply_inverse(self, x, trans=0):
+        """Apply (updated) inverse Jacobian matrix.
+
+        Parameters
+        ----------
+        x : numpy.ndarray (1d)
+            Vector.
+        trans : {0, 1}, default=0
+            Apply the inverse Jacobian matrix (0) or its transpose (1).
+
+        Returns
+        -------
+        y : numpy.ndarray (1d)
+            Inverse Jacobian matrix (or its transpose) applied to vector.
+        """
+        # Apply inverse of factorized Jacobian matrix
+        y = scipy.linalg.lu_solve(self._lu_factorization, x, trans=trans,
+                                  check_finite=False)
+        # Apply Broyden rank-one updates
+        for u, v in self._broyden_updates:
+            if trans == 0:
+                y += u*np.dot(v, x)
+            else:
+                y += v*np.dot(u, x)
+        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        return y
@@ -17,10 +17,22 @@ Functions
 ---------
 get_problem_type_parameters
     Get parameters dependent on the problem type.
+get_mf_index_tables
+    Get matricial form index tables and Kelvin notation coefficients.
+_build_mf_index_tables
+    Build matricial form index tables and Kelvin notation coefficients.
 get_tensor_mf
     Get tensor matricial form.
+get_tensor_mf_batch
+    Get matricial form of stack of tensors.
+_gather_tensor_mf
+    Gather tensor components into matricial form.
 get_tensor_from_mf
     Recover tensor from associated matricial form.
+get_tensor_from_mf_batch
+    Recover stack of tensors from associated matricial forms.
+_scatter_tensor_from_mf
+    Scatter matricial form components into tensor.
 kelvin_factor
     Get Kelvin notation coefficient of given strain/stress component.
 get_condensed_matrix
@@ -35,10 +47,11 @@ matrix_root
 #
 #                                                                       Modules
 # =============================================================================
+# Standard
+import functools
 # Third-party
 import numpy as np
 import scipy.linalg
-import itertools as it
 #
 #                                                          Authorship & Credits
 # =============================================================================
@@ -88,6 +101,102 @@ def get_problem_type_parameters(problem_type):
 #
 #                                        Tensorial - Matricial forms conversion
 # =============================================================================
+def get_mf_index_tables(n_dim, comp_order):
+    """Get matricial form index tables and Kelvin notation coefficients.
+
+    The index tables are computed only once for each pair of number of spatial
+    dimensions and ordered strain/stress components list and stored in a
+    cache. The returned arrays are read-only.
+
+    ----
+
+    Parameters
+    ----------
+    n_dim : int
+        Problem number of spatial dimensions.
+    comp_order : list
+        Strain/Stress components order associated to matricial form.
+
+    Returns
+    -------
+    so_rows : numpy.ndarray (1d)
+        Second-order tensor row index associated with each strain/stress
+        component.
+    so_cols : numpy.ndarray (1d)
+        Second-order tensor column index associated with each strain/stress
+        component.
+    so_factors : numpy.ndarray (1d)
+        Kelvin notation coefficient of each strain/stress component (unitary
+        if matricial form is nonsymmetric).
+    fo_factors : numpy.ndarray (2d)
+        Kelvin notation coefficient of each fourth-order tensor matricial form
+        element (unitary if matricial form is nonsymmetric).
+    """
+    return _build_mf_index_tables(n_dim, tuple(comp_order))
+# =============================================================================
+@functools.lru_cache(maxsize=None)
+def _build_mf_index_tables(n_dim, comp_order):
+    """Build matricial form index tables and Kelvin notation coefficients.
+
+    Parameters
+    ----------
+    n_dim : int
+        Problem number of spatial dimensions.
+    comp_order : tuple
+        Strain/Stress components order associated to matricial form.
+
+    Returns
+    -------
+    so_rows : numpy.ndarray (1d)
+        Second-order tensor row index associated with each strain/stress
+        component.
+    so_cols : numpy.ndarray (1d)
+        Second-order tensor column index associated with each strain/stress
+        component.
+    so_factors : numpy.ndarray (1d)
+        Kelvin notation coefficient of each strain/stress component (unitary
+        if matricial form is nonsymmetric).
+    fo_factors : numpy.ndarray (2d)
+        Kelvin notation coefficient of each fourth-order tensor matricial form
+        element (unitary if matricial form is nonsymmetric).
+    """
+    # Check strain/stress components order validity
+    if any([len(comp) != 2 for comp in comp_order]):
+        raise RuntimeError('Invalid component in strain/stress components '
+                           'order.')
+    elif any([int(x) not in range(1, n_dim + 1)
+              for x in list(''.join(comp_order))]):
+        raise RuntimeError('Invalid component in strain/stress components '
+                           'order.')
+    elif len(list(dict.fromkeys(comp_order))) != len(comp_order):
+        raise RuntimeError('Duplicated component in strain/stress components '
+                           'order.')
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Set Kelvin notation flag
+    if len(comp_order) == n_dim**2:
+        is_kelvin_notation = False
+    elif len(comp_order) == sum(range(n_dim + 1)):
+        is_kelvin_notation = True
+    else:
+        raise RuntimeError('Invalid number of components in strain/stress '
+                           'components order.')
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Set second-order tensor indexes associated with each strain/stress
+    # component
+    so_rows = np.array([int(comp[0]) - 1 for comp in comp_order], dtype=int)
+    so_cols = np.array([int(comp[1]) - 1 for comp in comp_order], dtype=int)
+    # Set Kelvin notation coefficients
+    so_factors = np.ones(len(comp_order))
+    if is_kelvin_notation:
+        so_factors[so_rows != so_cols] = np.sqrt(2)
+    fo_factors = np.outer(so_factors, so_factors)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Set cached arrays read-only
+    for array in (so_rows, so_cols, so_factors, fo_factors):
+        array.flags.writeable = False
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    return so_rows, so_cols, so_factors, fo_factors
+# =============================================================================
 def get_tensor_mf(tensor, n_dim, comp_order):
     """Get tensor matricial form.
 
@@ -121,88 +230,89 @@ def get_tensor_mf(tensor, n_dim, comp_order):
     """
     # Get tensor order
     tensor_order = len(tensor.shape)
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # Check input arguments validity
     if tensor_order not in [2, 4]:
         raise RuntimeError('Matricial form storage is only available for '
                            'second-order or fourth-order tensors.')
-    elif any([int(x) not in range(1, n_dim + 1)
-              for x in list(''.join(comp_order))]):
-        raise RuntimeError('Invalid component in strain/stress components '
-                           'order.')
     elif any([tensor.shape[i] != n_dim for i in range(len(tensor.shape))]):
         raise RuntimeError('Invalid tensor dimensions.')
-    elif any([len(comp) != 2 for comp in comp_order]):
-        raise RuntimeError('Invalid component in strain/stress components '
-                           'order.')
-    elif len(list(dict.fromkeys(comp_order))) != len(comp_order):
-        raise RuntimeError('Duplicated component in strain/stress components '
-                           'order.')
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Set Kelvin notation flag
-    if len(comp_order) == n_dim**2:
-        is_kelvin_notation = False
-    elif len(comp_order) == sum(range(n_dim + 1)):
-        is_kelvin_notation = True
-    else:
-        raise RuntimeError('Invalid number of components in strain/stress '
-                           'components order.')
+    # Return
+    return _gather_tensor_mf(tensor, tensor_order, n_dim, comp_order)
+# =============================================================================
+def get_tensor_mf_batch(tensors, n_dim, comp_order):
+    """Get matricial form of stack of tensors.
+
+    Batched counterpart of :py:func:`get_tensor_mf`, where the tensors are
+    stacked along the first dimension.
+
+    ----
+
+    Parameters
+    ----------
+    tensors : numpy.ndarray (3d or 5d)
+        Stack of second-order or fourth-order tensors to be stored in
+        matricial form, numpy.ndarray of shape (n_batch, n_dim, ...).
+    n_dim : int
+        Problem number of spatial dimensions.
+    comp_order : list
+        Strain/Stress components order associated to matricial form.
+
+    Returns
+    -------
+    tensors_mf : numpy.ndarray (2d or 3d)
+        Matricial form of each input tensor stacked along the first
+        dimension.
+    """
+    # Get tensor order
+    tensor_order = len(tensors.shape) - 1
+    # Check input arguments validity
+    if tensor_order not in [2, 4]:
+        raise RuntimeError('Matricial form storage is only available for '
+                           'second-order or fourth-order tensors.')
+    elif any([tensors.shape[i] != n_dim
+              for i in range(1, len(tensors.shape))]):
+        raise RuntimeError('Invalid tensor dimensions.')
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Store tensor according to tensor order
+    # Return
+    return _gather_tensor_mf(tensors, tensor_order, n_dim, comp_order)
+# =============================================================================
+def _gather_tensor_mf(tensor, tensor_order, n_dim, comp_order):
+    """Gather tensor components into matricial form.
+
+    Parameters
+    ----------
+    tensor : numpy.ndarray
+        Tensor (or stack of tensors along leading dimensions) to be stored in
+        matricial form.
+    tensor_order : {2, 4}
+        Tensor order.
+    n_dim : int
+        Problem number of spatial dimensions.
+    comp_order : list
+        Strain/Stress components order associated to matricial form.
+
+    Returns
+    -------
+    tensor_mf : numpy.ndarray
+        Matricial form of input tensor (or stack of tensors).
+    """
+    # Get matricial form index tables and Kelvin notation coefficients
+    so_rows, so_cols, so_factors, fo_factors = \
+        get_mf_index_tables(n_dim, comp_order)
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Store tensor in matricial form
     if tensor_order == 2:
-        # Set second-order and matricial form indexes
-        so_indexes = list()
-        mf_indexes = list()
-        for i in range(len(comp_order)):
-            so_indexes.append([int(x) - 1 for x in list(comp_order[i])])
-            mf_indexes.append(comp_order.index(comp_order[i]))
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize tensor matricial form
-        if tensor.dtype == 'complex':
-            tensor_mf = np.zeros(len(comp_order), dtype=complex)
-        else:
-            tensor_mf = np.zeros(len(comp_order))
-        # Store tensor in matricial form
-        for i in range(len(mf_indexes)):
-            mf_idx = mf_indexes[i]
-            so_idx = tuple(so_indexes[i])
-            factor = 1.0
-            if is_kelvin_notation and not so_idx[0] == so_idx[1]:
-                factor = np.sqrt(2)
-            tensor_mf[mf_idx] = factor*tensor[so_idx]
+        tensor_mf = so_factors*tensor[..., so_rows, so_cols]
+    else:
+        tensor_mf = fo_factors*tensor[..., so_rows[:, np.newaxis],
+                                      so_cols[:, np.newaxis], so_rows,
+                                      so_cols]
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    elif tensor_order == 4:
-        # Set cartesian product of component list
-        comps = list(it.product(comp_order, comp_order))
-        # Set fourth-order and matricial form indexes
-        fo_indexes = list()
-        mf_indexes = list()
-        for i in range(len(comp_order)**2):
-            fo_indexes.append([int(x) - 1 for x in
-                               list(comps[i][0] + comps[i][1])])
-            mf_indexes.append([x for x in [comp_order.index(comps[i][0]),
-                                           comp_order.index(comps[i][1])]])
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize tensor matricial form
-        if tensor.dtype == 'complex':
-            tensor_mf = np.zeros((len(comp_order), len(comp_order)),
-                                 dtype=complex)
-        else:
-            tensor_mf = np.zeros((len(comp_order), len(comp_order)))
-        # Store tensor in matricial form
-        for i in range(len(mf_indexes)):
-            mf_idx = tuple(mf_indexes[i])
-            fo_idx = tuple(fo_indexes[i])
-            factor = 1.0
-            if is_kelvin_notation and not (fo_idx[0] == fo_idx[1]
-                                           and fo_idx[2] == fo_idx[3]):
-                factor = \
-                    factor*np.sqrt(2) if fo_idx[0] != fo_idx[1] else factor
-                factor = \
-                    factor*np.sqrt(2) if fo_idx[2] != fo_idx[3] else factor
-            tensor_mf[mf_idx] = factor*tensor[fo_idx]
+    # Enforce floating-point matricial form
+    if not np.iscomplexobj(tensor_mf):
+        tensor_mf = tensor_mf.astype(float, copy=False)
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Return
     return tensor_mf
 # =============================================================================
 def get_tensor_from_mf(tensor_mf, n_dim, comp_order):
@@ -240,112 +350,123 @@ def get_tensor_from_mf(tensor_mf, n_dim, comp_order):
     # Set tensor order
     if len(tensor_mf.shape) == 1:
         tensor_order = 2
-        if tensor_mf.shape[0] != n_dim**2 and \
-                tensor_mf.shape[0] != sum(range(n_dim + 1)):
-            raise RuntimeError('Invalid number of components in tensor '
-                               'matricial form.')
     elif len(tensor_mf.shape) == 2:
         tensor_order = 4
-        if tensor_mf.shape[0] != tensor_mf.shape[1]:
-            raise RuntimeError('Fourth-order tensor matricial form must be a'
-                               'square matrix.')
-        elif tensor_mf.shape[0] != n_dim**2 and \
-                tensor_mf.shape[0] != sum(range(n_dim + 1)):
-            raise RuntimeError('Invalid number of components in tensor '
-                               'matricial form.')
     else:
         raise RuntimeError('Tensor matricial form must be a vector or a '
                            'matrix.')
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Check input arguments validity
-    if any([int(x) not in range(1, n_dim + 1)
-            for x in list(''.join(comp_order))]):
-        raise RuntimeError('Invalid component in strain/stress components '
-                           'order.')
-    elif any([len(comp) != 2 for comp in comp_order]):
-        raise RuntimeError('Invalid component in strain/stress components '
-                           'order.')
-    elif len(list(dict.fromkeys(comp_order))) != len(comp_order):
-        raise RuntimeError('Duplicated component in strain/stress components '
-                           'order.')
+    # Return
+    return _scatter_tensor_from_mf(tensor_mf, tensor_order, n_dim, comp_order)
+# =============================================================================
+def get_tensor_from_mf_batch(tensors_mf, n_dim, comp_order):
+    """Recover stack of tensors from associated matricial forms.
+
+    Batched counterpart of :py:func:`get_tensor_from_mf`, where the tensors
+    matricial forms are stacked along the first dimension.
+
+    ----
+
+    Parameters
+    ----------
+    tensors_mf : numpy.ndarray (2d or 3d)
+        Stack of tensors stored in matricial form, numpy.ndarray of shape
+        (n_batch, n_comps) or (n_batch, n_comps, n_comps).
+    n_dim : int
+        Problem number of spatial dimensions.
+    comp_order : list
+        Strain/Stress components order associated to matricial form.
+
+    Returns
+    -------
+    tensors : numpy.ndarray
+        Tensors recovered from matricial form stacked along the first
+        dimension.
+    """
+    # Set tensor order
+    if len(tensors_mf.shape) == 2:
+        tensor_order = 2
+    elif len(tensors_mf.shape) == 3:
+        tensor_order = 4
+    else:
+        raise RuntimeError('Stack of tensors matricial form must be a matrix '
+                           'or a 3d array.')
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Return
+    return _scatter_tensor_from_mf(tensors_mf, tensor_order, n_dim,
+                                   comp_order)
+# =============================================================================
+def _scatter_tensor_from_mf(tensor_mf, tensor_order, n_dim, comp_order):
+    """Scatter matricial form components into tensor.
+
+    Parameters
+    ----------
+    tensor_mf : numpy.ndarray
+        Tensor (or stack of tensors along leading dimensions) stored in
+        matricial form.
+    tensor_order : {2, 4}
+        Tensor order.
+    n_dim : int
+        Problem number of spatial dimensions.
+    comp_order : list
+        Strain/Stress components order associated to matricial form.
+
+    Returns
+    -------
+    tensor : numpy.ndarray
+        Tensor (or stack of tensors) recovered from matricial form.
+    """
+    # Get matricial form shape
+    if tensor_order == 2:
+        batch_shape = tensor_mf.shape[:-1]
+        mf_shape = tensor_mf.shape[-1:]
+    else:
+        batch_shape = tensor_mf.shape[:-2]
+        mf_shape = tensor_mf.shape[-2:]
+    # Check matricial form validity
+    if tensor_order == 4 and mf_shape[0] != mf_shape[1]:
+        raise RuntimeError('Fourth-order tensor matricial form must be a'
+                           'square matrix.')
+    elif mf_shape[0] != n_dim**2 and mf_shape[0] != sum(range(n_dim + 1)):
+        raise RuntimeError('Invalid number of components in tensor '
+                           'matricial form.')
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Get matricial form index tables and Kelvin notation coefficients
+    so_rows, so_cols, so_factors, fo_factors = \
+        get_mf_index_tables(n_dim, comp_order)
     # Set Kelvin notation flag
-    if len(comp_order) == n_dim**2:
-        is_kelvin_notation = False
-    elif len(comp_order) == sum(range(n_dim + 1)):
-        is_kelvin_notation = True
+    is_kelvin_notation = len(comp_order) != n_dim**2
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Initialize tensor
+    if np.iscomplexobj(tensor_mf):
+        tensor = np.zeros(batch_shape + tensor_order*(n_dim,), dtype=complex)
     else:
-        raise RuntimeError('Invalid number of components in strain/stress '
-                           'components order.')
+        tensor = np.zeros(batch_shape + tensor_order*(n_dim,))
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Get tensor according to tensor order
+    # Get tensor from matricial form
     if tensor_order == 2:
-        # Set second-order and matricial form indexes
-        so_indexes = list()
-        mf_indexes = list()
-        for i in range(len(comp_order)):
-            so_indexes.append([int(x) - 1 for x in list(comp_order[i])])
-            mf_indexes.append(comp_order.index(comp_order[i]))
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize tensor
-        if tensor_mf.dtype == 'complex':
-            tensor = np.zeros(tensor_order*(n_dim,), dtype=complex)
-        else:
-            tensor = np.zeros(tensor_order*(n_dim,))
-        # Get tensor from matricial form
-        for i in range(len(mf_indexes)):
-            mf_idx = mf_indexes[i]
-            so_idx = tuple(so_indexes[i])
-            factor = 1.0
-            if is_kelvin_notation and not so_idx[0] == so_idx[1]:
-                factor = np.sqrt(2)
-                tensor[so_idx[::-1]] = (1.0/factor)*tensor_mf[mf_idx]
-            tensor[so_idx] = (1.0/factor)*tensor_mf[mf_idx]
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    elif tensor_order == 4:
-        # Set cartesian product of component list
-        comps = list(it.product(comp_order, comp_order))
-        # Set fourth-order and matricial form indexes
-        mf_indexes = list()
-        fo_indexes = list()
-        for i in range(len(comp_order)**2):
-            fo_indexes.append([int(x) - 1
-                               for x in list(comps[i][0] + comps[i][1])])
-            mf_indexes.append([x for x in [comp_order.index(comps[i][0]),
-                                           comp_order.index(comps[i][1])]])
-        # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        # Initialize tensor
-        if tensor_mf.dtype == 'complex':
-            tensor = np.zeros(tensor_order*(n_dim, ), dtype=complex)
-        else:
-            tensor = np.zeros(tensor_order*(n_dim, ))
-        # Get tensor from matricial form
-        for i in range(len(mf_indexes)):
-            mf_idx = tuple(mf_indexes[i])
-            fo_idx = tuple(fo_indexes[i])
-            factor = 1.0
-            if is_kelvin_notation and not (fo_idx[0] == fo_idx[1]
-                                           and fo_idx[2] == fo_idx[3]):
-                factor = \
-                    factor*np.sqrt(2) if fo_idx[0] != fo_idx[1] else factor
-                factor = \
-                    factor*np.sqrt(2) if fo_idx[2] != fo_idx[3] else factor
-                if fo_idx[0] != fo_idx[1] and fo_idx[2] != fo_idx[3]:
-                    tensor[tuple(fo_idx[1::-1]+fo_idx[2:])] = \
-                        (1.0/factor)*tensor_mf[mf_idx]
-                    tensor[tuple(fo_idx[:2]+fo_idx[3:1:-1])] = \
-                        (1.0/factor)*tensor_mf[mf_idx]
-                    tensor[tuple(fo_idx[1::-1]+fo_idx[3:1:-1])] = \
-                        (1.0/factor)*tensor_mf[mf_idx]
-                elif fo_idx[0] != fo_idx[1]:
-                    tensor[tuple(fo_idx[1::-1]+fo_idx[2:])] = \
-                        (1.0/factor)*tensor_mf[mf_idx]
-                elif fo_idx[2] != fo_idx[3]:
-                    tensor[tuple(fo_idx[:2]+fo_idx[3:1:-1])] = \
-                        (1.0/factor)*tensor_mf[mf_idx]
-            tensor[fo_idx] = (1.0/factor)*tensor_mf[mf_idx]
+        # Get tensor components
+        values = tensor_mf/so_factors
+        # Set tensor components (enforce symmetry under Kelvin notation)
+        if is_kelvin_notation:
+            tensor[..., so_cols, so_rows] = values
+        tensor[..., so_rows, so_cols] = values
+    else:
+        # Get fourth-order tensor indexes
+        i = so_rows[:, np.newaxis]
+        j = so_cols[:, np.newaxis]
+        k = so_rows
+        m = so_cols
+        # Get tensor components
+        values = tensor_mf/fo_factors
+        # Set tensor components (enforce minor symmetries under Kelvin
+        # notation)
+        if is_kelvin_notation:
+            tensor[..., j, i, k, m] = values
+            tensor[..., i, j, m, k] = values
+            tensor[..., j, i, m, k] = values
+        tensor[..., i, j, k, m] = values
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Return
     return tensor
 # =============================================================================
 def kelvin_factor(idx, comp_order):
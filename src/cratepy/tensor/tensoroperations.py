@@ -44,6 +44,8 @@ dd
     Kronecker delta function.
 get_id_operators
     Set common second- and fourth-order identity operators.
+_build_id_operators
+    Build common second- and fourth-order identity operators.
 spectral_decomposition
     Perform spectral decomposition of symmetric second-order tensor.
 isotropic_tensor
@@ -62,6 +64,7 @@ rotation_tensor_from_euler_angles
 # =============================================================================
 # Standard
 import re
+import functools
 import itertools as it
 # Third-party
 import numpy as np
@@ -134,6 +137,11 @@ def dd(i, j):
 def get_id_operators(n_dim):
     """Set common second- and fourth-order identity operators.
 
+    Identity operators are cached for each number of dimensions and the
+    returned arrays are read-only (copy them before any in-place operation).
+
+    ----
+
     Parameters
     ----------
     n_dim : int
@@ -188,15 +196,45 @@ def get_id_operators(n_dim):
                       + \\delta_{il}\\delta_{jk})
                       - \\dfrac{1}{3} \\delta_{ij}\\delta_{kl}
     """
+    return _build_id_operators(n_dim)
+# =============================================================================
+@functools.lru_cache(maxsize=None)
+def _build_id_operators(n_dim):
+    """Build common second- and fourth-order identity operators.
+
+    The identity operators are computed only once for each number of
+    dimensions and stored in a cache. The returned arrays are read-only.
+
+    ----
+
+    Parameters
+    ----------
+    n_dim : int
+        Number of dimensions.
+
+    Returns
+    -------
+    soid : numpy.ndarray (2d)
+        Second-order identity tensor.
+    foid : numpy.ndarray (4d)
+        Fourth-order identity tensor.
+    fotransp : numpy.ndarray (4d)
+        Fourth-order transposition tensor.
+    fosym : numpy.ndarray (4d)
+        Fourth-order symmetric projection tensor.
+    fodiagtrace : numpy.ndarray (4d)
+        Fourth-order 'diagonal trace' tensor.
+    fodevproj : numpy.ndarray (4d)
+        Fourth-order deviatoric projection tensor.
+    fodevprojsym : numpy.ndarray (4d)
+        Fourth-order deviatoric projection tensor (second-order symmetric
+        tensors).
+    """
     # Set second-order identity tensor
     soid = np.eye(n_dim)
     # Set fourth-order identity tensor and fourth-order transposition tensor
-    foid = np.zeros((n_dim, n_dim, n_dim, n_dim))
-    fotransp = np.zeros((n_dim, n_dim, n_dim, n_dim))
-    for i in range(n_dim):
-        for j in range(n_dim):
-            foid[i, j, i, j] = 1.0
-            fotransp[i, j, j, i] = 1.0
+    foid = dyad22_2(soid, soid)
+    fotransp = dyad22_3(soid, soid)
     # Set fourth-order symmetric projection tensor
     fosym = 0.5*(foid + fotransp)
     # Set fourth-order 'diagonal trace' tensor
@@ -206,8 +244,15 @@ def get_id_operators(n_dim):
     # Set fourth-order deviatoric projection tensor (second order symmetric
     # tensors)
     fodevprojsym = fosym - (1.0/3.0)*fodiagtrace
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    # Set cached operators read-only
+    id_operators = (soid, foid, fotransp, fosym, fodiagtrace, fodevproj,
+                    fodevprojsym)
+    for operator in id_operators:
+        operator.flags.writeable = False
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # Return
-    return soid, foid, fotransp, fosym, fodiagtrace, fodevproj, fodevprojsym
+    return id_operators
 #
 #                                                        Spectral decomposition
 # =============================================================================